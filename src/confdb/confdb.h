@@ -200,6 +200,7 @@
 #define CONFDB_IFP_CONF_ENTRY "config/ifp"
 #define CONFDB_IFP_USER_ATTR_LIST "user_attributes"
 #define CONFDB_IFP_WILDCARD_LIMIT "wildcard_limit"
+#define CONFDB_IFP_METHOD_STATS "method_stats"
 
 /* Session Recording */
 #define CONFDB_SESSION_RECORDING_CONF_ENTRY "config/session_recording"
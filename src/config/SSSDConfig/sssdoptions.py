@@ -143,6 +143,7 @@ class SSSDOptions(object):
 
         # [ifp]
         'user_attributes': _('List of user attributes the InfoPipe is allowed to publish'),
+        'method_stats': _('Whether to collect per-method call statistics of the InfoPipe'),
 
         # [session_recording]
         'scope': _('One of the following strings specifying the scope of session recording: none - No users are '
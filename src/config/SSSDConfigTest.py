@@ -23,9 +23,11 @@ Created on Sep 18, 2009
 @author: sgallagh
 """
 import unittest
+import fcntl
 import os
 import shutil
 import tempfile
+import time
 from stat import ST_MODE, S_IMODE
 
 import sys
@@ -878,6 +880,23 @@ class SSSDConfigTestSSSDDomain(unittest.TestCase):
                             'Option [%s] unexpectedly found' %
                             option)
 
+    def testProviderTables(self):
+        domain = SSSDConfig.SSSDDomain('sssd', self.schema)
+
+        # The precomputed tables match what is listed from the schema
+        for (provider, ptype) in self.schema.provider_options:
+            options = domain.list_provider_options(provider, ptype)
+            self.assertEqual(self.schema.provider_options[(provider, ptype)],
+                             set(options.keys()))
+            for option in options:
+                self.assertTrue((provider, ptype) in
+                                self.schema.option_providers[option])
+
+        self.assertTrue(('krb5', 'auth') in
+                        self.schema.option_providers['krb5_server'])
+        self.assertFalse(('proxy', 'id') in
+                         self.schema.option_providers['krb5_server'])
+
     def testAddProvider(self):
         domain = SSSDConfig.SSSDDomain('sssd', self.schema)
 
@@ -1402,6 +1421,83 @@ class SSSDConfigTestSSSDConfig(unittest.TestCase):
         # TODO Write tests to compare output files
         pass
 
+    def testWriteAtomic(self):
+        sssdconfig = SSSDConfig.SSSDConfig(srcdir + "/etc/sssd.api.conf",
+                                           srcdir + "/etc/sssd.api.d")
+        sssdconfig.import_config(srcdir + "/testconfigs/sssd-valid.conf")
+
+        of = self.tmp_dir + '/testWriteAtomic.conf'
+
+        # A new file is created with restrictive permissions
+        self.assertTrue(sssdconfig.write(of, atomic=True))
+        mode = os.stat(of)[ST_MODE]
+        self.assertFalse(S_IMODE(mode) & 0o177)
+
+        # Nothing is written when the contents do not change
+        inode = os.stat(of).st_ino
+        self.assertFalse(sssdconfig.write(of, atomic=True))
+        self.assertEqual(os.stat(of).st_ino, inode)
+
+        # A changed file is replaced and keeps its mode
+        os.chmod(of, 0o640)
+        sssdconfig.deactivate_domain('IPA')
+        self.assertTrue(sssdconfig.write(of, atomic=True))
+        self.assertNotEqual(os.stat(of).st_ino, inode)
+        self.assertEqual(S_IMODE(os.stat(of)[ST_MODE]), 0o640)
+
+        # No temporary files are left behind
+        self.assertEqual(os.listdir(self.tmp_dir), ['testWriteAtomic.conf'])
+
+        config = SSSDConfig.SSSDConfig(srcdir + "/etc/sssd.api.conf",
+                                       srcdir + "/etc/sssd.api.d")
+        config.import_config(configfile=of)
+        self.assertFalse('IPA' in config.list_active_domains())
+
+    def testWriteAtomicConcurrent(self):
+        sssdconfig = SSSDConfig.SSSDConfig(srcdir + "/etc/sssd.api.conf",
+                                           srcdir + "/etc/sssd.api.d")
+        sssdconfig.import_config(srcdir + "/testconfigs/sssd-valid.conf")
+
+        of = self.tmp_dir + '/testWriteAtomicConcurrent.conf'
+        self.assertTrue(sssdconfig.write(of, atomic=True))
+
+        sssdconfig.deactivate_domain('IPA')
+        output = sssdconfig.dump(sssdconfig.opts)
+
+        # First writer holds the lock while the second one starts
+        lockfd = os.open(of, os.O_RDWR)
+        fcntl.lockf(lockfd, fcntl.LOCK_EX)
+
+        (rfd, wfd) = os.pipe()
+        pid = os.fork()
+        if pid == 0:
+            os.close(rfd)
+            try:
+                result = sssdconfig.write(of, atomic=True)
+                os.write(wfd, b'1' if result else b'0')
+            finally:
+                os._exit(0)
+        os.close(wfd)
+
+        # First writer replaces the file with the same contents the second
+        # writer wants and releases the lock
+        time.sleep(0.5)
+        tmpname = of + '.tmp'
+        with open(tmpname, 'w') as f:
+            f.write(output)
+        os.rename(tmpname, of)
+        os.close(lockfd)
+
+        with os.fdopen(rfd, 'rb') as f:
+            result = f.read()
+        os.waitpid(pid, 0)
+
+        # The second writer compared against the new file, not the
+        # replaced one, so it had nothing to write
+        self.assertEqual(result, b'0')
+        with open(of) as f:
+            self.assertEqual(f.read(), output)
+
     def testListActiveServices(self):
         sssdconfig = SSSDConfig.SSSDConfig(srcdir + "/etc/sssd.api.conf",
                                            srcdir + "/etc/sssd.api.d")
@@ -1775,6 +1871,54 @@ class SSSDConfigTestSSSDConfig(unittest.TestCase):
         domain = sssdconfig.get_domain('INVALIDOPTION')
         self.assertFalse('nosuchoption' in domain.options)
 
+    def testGetDomainView(self):
+        sssdconfig = SSSDConfig.SSSDConfig(srcdir + "/etc/sssd.api.conf",
+                                           srcdir + "/etc/sssd.api.d")
+
+        # Negative Test - Not initialized
+        self.assertRaises(SSSDConfig.NotInitializedError,
+                          sssdconfig.get_domain_view, 'sssd')
+
+        sssdconfig.import_config(srcdir + '/testconfigs/sssd-valid.conf')
+
+        view = sssdconfig.get_domain_view('IPA')
+        self.assertTrue(isinstance(view, SSSDConfig.SSSDDomainView))
+        self.assertEqual(view.get_name(), 'IPA')
+        self.assertTrue(view.active)
+        self.assertEqual(view.get_option('debug_level'), 0xff0)
+        self.assertEqual(view.get_option('auth_provider'), 'krb5')
+
+        view = sssdconfig.get_domain_view('LDAP')
+        self.assertFalse(view.active)
+        self.assertTrue(view.get_option('ldap_id_use_start_tls'))
+
+        self.assertRaises(SSSDConfig.NoOptionError,
+                          view.get_option, 'cache_credentials')
+
+        # Negative Test - No such domain
+        self.assertRaises(SSSDConfig.NoDomainError,
+                          sssdconfig.get_domain_view, 'nosuchdomain')
+
+        # Unknown providers and options are ignored like in get_domain()
+        view = sssdconfig.get_domain_view('INVALIDPROVIDER')
+        self.assertRaises(SSSDConfig.NoOptionError,
+                          view.get_option, 'chpass_provider')
+        view = sssdconfig.get_domain_view('INVALIDOPTION')
+        self.assertRaises(SSSDConfig.NoOptionError,
+                          view.get_option, 'nosuchoption')
+
+        # The view holds the same values as the full domain object
+        for name in sssdconfig.list_domains():
+            view = sssdconfig.get_domain_view(name)
+            domain = sssdconfig.get_domain(name)
+            self.assertEqual(view.get_all_options(),
+                             domain.get_all_options())
+            self.assertEqual(view.active, domain.active)
+
+        # A view can not be saved
+        self.assertRaises(TypeError, sssdconfig.save_domain,
+                          sssdconfig.get_domain_view('IPA'))
+
     def testNewDomain(self):
         sssdconfig = SSSDConfig.SSSDConfig(srcdir + "/etc/sssd.api.conf",
                                            srcdir + "/etc/sssd.api.d")
@@ -1945,6 +2089,95 @@ class SSSDConfigTestSSSDConfig(unittest.TestCase):
         self.assertTrue(domain2.get_option('ldap_krb5_init_creds'))
         self.assertFalse(domain2.get_option('ldap_id_use_start_tls'))
 
+    def testTransaction(self):
+        sssdconfig = SSSDConfig.SSSDConfig(srcdir + "/etc/sssd.api.conf",
+                                           srcdir + "/etc/sssd.api.d")
+
+        # Negative Test - Not initialized
+        self.assertRaises(SSSDConfig.NotInitializedError,
+                          sssdconfig.transaction().__enter__)
+
+        sssdconfig.import_config(srcdir + "/testconfigs/sssd-valid.conf")
+        control = SSSDConfig.SSSDConfig(srcdir + "/etc/sssd.api.conf",
+                                        srcdir + "/etc/sssd.api.d")
+        control.import_config(srcdir + "/testconfigs/sssd-valid.conf")
+
+        def edit(config):
+            for name in config.list_domains():
+                domain = config.get_domain(name)
+                domain.set_option('cache_credentials', True)
+                domain.set_option('debug_level', 3)
+                domain.remove_option('ldap_id_use_start_tls')
+                domain.set_active(name != 'IPA')
+                if name == 'PROXY':
+                    domain.set_name('RENAMED')
+                config.save_domain(domain)
+
+            domain = config.new_domain('NEW')
+            domain.add_provider('ldap', 'id')
+            domain.set_active(True)
+            config.save_domain(domain)
+
+            config.delete_domain('INVALIDOPTION')
+
+        # Changes are applied when the transaction is committed
+        with sssdconfig.transaction():
+            edit(sssdconfig)
+            self.assertFalse('NEW' in sssdconfig.list_domains())
+            self.assertTrue('IPA' in sssdconfig.list_active_domains())
+        edit(control)
+
+        self.assertEqual(sorted(sssdconfig.list_domains()),
+                         sorted(control.list_domains()))
+        self.assertEqual(sorted(sssdconfig.list_active_domains()),
+                         sorted(control.list_active_domains()))
+        for name in control.list_domains():
+            self.assertEqual(sssdconfig.get_domain(name).get_all_options(),
+                             control.get_domain(name).get_all_options())
+
+        # Changes are discarded if the transaction fails
+        try:
+            with sssdconfig.transaction():
+                sssdconfig.delete_domain('NEW')
+                raise ValueError
+        except ValueError:
+            pass
+        self.assertTrue('NEW' in sssdconfig.list_domains())
+        self.assertTrue('NEW' in sssdconfig.list_active_domains())
+
+        # Negative Test - Domains must exist in the transaction
+        with sssdconfig.transaction():
+            sssdconfig.delete_domain('NEW')
+            self.assertRaises(SSSDConfig.NoDomainError,
+                              sssdconfig.activate_domain, 'NEW')
+            self.assertRaises(SSSDConfig.DomainAlreadyExistsError,
+                              sssdconfig.new_domain, 'LDAP')
+
+    def testTransactionDeleteAndRename(self):
+        sssdconfig = SSSDConfig.SSSDConfig(srcdir + "/etc/sssd.api.conf",
+                                           srcdir + "/etc/sssd.api.d")
+        sssdconfig.import_config(srcdir + "/testconfigs/sssd-valid.conf")
+
+        # Negative Test - Same as outside of a transaction
+        self.assertRaises(SSSDConfig.NoDomainError,
+                          sssdconfig.delete_domain, 'nosuchdomain')
+        with sssdconfig.transaction():
+            self.assertRaises(SSSDConfig.NoDomainError,
+                              sssdconfig.delete_domain, 'nosuchdomain')
+
+        # A renamed domain keeps the position of its section
+        sections = [x['name'] for x in sssdconfig.sections()]
+        with sssdconfig.transaction():
+            domain = sssdconfig.get_domain('PROXY')
+            domain.set_name('RENAMED')
+            sssdconfig.save_domain(domain)
+
+        expected = ['domain/RENAMED' if x == 'domain/PROXY' else x
+                    for x in sections]
+        self.assertEqual([x['name'] for x in sssdconfig.sections()], expected)
+        self.assertFalse('PROXY' in sssdconfig.list_domains())
+        self.assertTrue('RENAMED' in sssdconfig.list_domains())
+
     def testActivateDomain(self):
         sssdconfig = SSSDConfig.SSSDConfig(srcdir + "/etc/sssd.api.conf",
                                            srcdir + "/etc/sssd.api.d")
@@ -2045,6 +2278,77 @@ class SSSDConfigTestSSSDConfig(unittest.TestCase):
                                                'name': 'debug_level',
                                                'value': '0xfC10'}]})
 
+    def testValidateMany(self):
+        paths = [srcdir + "/testconfigs/sssd-valid.conf",
+                 srcdir + "/testconfigs/sssd-enabled-option.conf",
+                 srcdir + "/testconfigs/sssd-invalid-badbool.conf",
+                 srcdir + "/testconfigs/sssd-invalid.conf",
+                 srcdir + "/testconfigs/nosuchfile.conf"]
+
+        for workers in (None, 2):
+            results = SSSDConfig.SSSDConfig.validate_many(
+                paths, workers=workers,
+                schemafile=srcdir + "/etc/sssd.api.conf",
+                schemaplugindir=srcdir + "/etc/sssd.api.d")
+
+            # Results keep the order of the paths
+            self.assertEqual(list(results.keys()), paths)
+
+            # No diagnostics for a valid file
+            self.assertEqual(results[paths[1]], [])
+
+            errors = [(d.section, d.option) for d in results[paths[0]]
+                      if d.severity == 'error']
+            self.assertTrue(('domain/INVALIDPROVIDER', 'chpass_provider')
+                            in errors)
+            self.assertTrue(('domain/INVALIDOPTION', 'nosuchoption')
+                            in errors)
+            self.assertTrue(('pam', 'nosuchoption') in errors)
+            self.assertFalse(('domain/LDAP', 'ldap_id_use_start_tls')
+                             in errors)
+
+            errors = [(d.section, d.option) for d in results[paths[2]]
+                      if d.severity == 'error']
+            self.assertTrue(('domain/IPA', 'ldap_id_use_start_tls') in errors)
+
+            # Unreadable and unparsable files are reported, not raised
+            for path in paths[3:]:
+                self.assertEqual(len(results[path]), 1)
+                self.assertEqual(results[path][0].severity, 'error')
+                self.assertEqual(results[path][0].section, None)
+
+    def testValidateManyPluginAndExtraSections(self):
+        # A plugin provider that only describes a subtype section
+        plugindir = self.tmp_dir + "/sssd.api.d"
+        shutil.copytree(srcdir + "/etc/sssd.api.d", plugindir)
+        with open(plugindir + "/sssd-plugin.conf", "w") as f:
+            f.write("[provider/plugin/id]\n"
+                    "plugin_server = str, None, false\n")
+
+        configfile = self.tmp_dir + "/sssd-plugin.conf"
+        with open(configfile, "w") as f:
+            f.write("[sssd]\n"
+                    "services = nss\n"
+                    "domains = PLUGIN\n"
+                    "\n"
+                    "[domain/PLUGIN]\n"
+                    "id_provider = plugin\n"
+                    "plugin_server = plugin.example.com\n"
+                    "\n"
+                    "[application/APP]\n"
+                    "inherit_from = PLUGIN\n"
+                    "\n"
+                    "[certmap/PLUGIN/rule]\n"
+                    "matchrule = <SUBJECT>.*\n"
+                    "\n"
+                    "[prompting/password]\n"
+                    "password_prompt = Password\n")
+
+        results = SSSDConfig.SSSDConfig.validate_many(
+            [configfile], schemafile=srcdir + "/etc/sssd.api.conf",
+            schemaplugindir=plugindir)
+        self.assertEqual(results[configfile], [])
+
     def testEnabledOption(self):
         """Test the new enabled option."""
         # Positive Test
@@ -700,6 +700,13 @@ errno_t sysdb_search_user_override_by_uid(TALLOC_CTX *mem_ctx,
                                            struct ldb_result **override_obj,
                                            struct ldb_result **orig_obj);
 
+errno_t sysdb_search_user_override_attrs_by_uid(TALLOC_CTX *mem_ctx,
+                                                struct sss_domain_info *domain,
+                                                uid_t uid,
+                                                const char **attrs,
+                                                struct ldb_result **override_obj,
+                                                struct ldb_result **orig_obj);
+
 errno_t sysdb_search_group_override_by_gid(TALLOC_CTX *mem_ctx,
                                             struct sss_domain_info *domain,
                                             gid_t gid,
@@ -732,6 +739,14 @@ errno_t sysdb_getpwuid_with_views(TALLOC_CTX *mem_ctx,
                                   uid_t uid,
                                   struct ldb_result **res);
 
+/* Same as sysdb_getpwuid_with_views() but returns the given attributes
+ * instead of SYSDB_PW_ATTRS. */
+errno_t sysdb_get_user_attr_by_uid_with_views(TALLOC_CTX *mem_ctx,
+                                              struct sss_domain_info *domain,
+                                              uid_t uid,
+                                              const char **attributes,
+                                              struct ldb_result **res);
+
 int sysdb_getgrnam_with_views(TALLOC_CTX *mem_ctx,
                               struct sss_domain_info *domain,
                               const char *name,
@@ -911,6 +926,11 @@ int sysdb_initgroups_with_views(TALLOC_CTX *mem_ctx,
                                 const char *name,
                                 struct ldb_result **res);
 
+/* Append the groups of the single user entry in @res to @res, the same way
+ * sysdb_initgroups_with_views() returns them after the user entry. */
+errno_t sysdb_initgroups_append_with_views(struct sss_domain_info *domain,
+                                           struct ldb_result *res);
+
 int sysdb_get_user_attr(TALLOC_CTX *mem_ctx,
                         struct sss_domain_info *domain,
                         const char *name,
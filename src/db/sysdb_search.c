@@ -418,14 +418,14 @@ done:
     return ret;
 }
 
-int sysdb_getpwuid(TALLOC_CTX *mem_ctx,
-                   struct sss_domain_info *domain,
-                   uid_t uid,
-                   struct ldb_result **_res)
+static int sysdb_getpwuid_attrs(TALLOC_CTX *mem_ctx,
+                                struct sss_domain_info *domain,
+                                uid_t uid,
+                                const char **attrs,
+                                struct ldb_result **_res)
 {
     TALLOC_CTX *tmp_ctx;
     unsigned long int ul_uid = uid;
-    static const char *attrs[] = SYSDB_PW_ATTRS;
     struct ldb_dn *base_dn;
     struct ldb_result *res;
     int ret;
@@ -463,14 +463,36 @@ done:
     return ret;
 }
 
+int sysdb_getpwuid(TALLOC_CTX *mem_ctx,
+                   struct sss_domain_info *domain,
+                   uid_t uid,
+                   struct ldb_result **_res)
+{
+    static const char *attrs[] = SYSDB_PW_ATTRS;
+
+    return sysdb_getpwuid_attrs(mem_ctx, domain, uid, attrs, _res);
+}
+
 errno_t sysdb_getpwuid_with_views(TALLOC_CTX *mem_ctx,
                                   struct sss_domain_info *domain,
                                   uid_t uid,
                                   struct ldb_result **res)
+{
+    return sysdb_get_user_attr_by_uid_with_views(mem_ctx, domain, uid, NULL,
+                                                 res);
+}
+
+errno_t sysdb_get_user_attr_by_uid_with_views(TALLOC_CTX *mem_ctx,
+                                              struct sss_domain_info *domain,
+                                              uid_t uid,
+                                              const char **attributes,
+                                              struct ldb_result **res)
 {
     int ret;
     struct ldb_result *orig_obj = NULL;
     struct ldb_result *override_obj = NULL;
+    static const char *default_attrs[] = SYSDB_PW_ATTRS;
+    const char **attrs;
     TALLOC_CTX *tmp_ctx;
 
     tmp_ctx = talloc_new(NULL);
@@ -479,13 +501,16 @@ errno_t sysdb_getpwuid_with_views(TALLOC_CTX *mem_ctx,
         return ENOMEM;
     }
 
+    attrs = attributes != NULL ? attributes : default_attrs;
+
     /* If there are views we first have to search the overrides for matches */
     if (DOM_HAS_VIEWS(domain)) {
-        ret = sysdb_search_user_override_by_uid(tmp_ctx, domain, uid,
-                                                &override_obj, &orig_obj);
+        ret = sysdb_search_user_override_attrs_by_uid(tmp_ctx, domain, uid,
+                                                      attrs, &override_obj,
+                                                      &orig_obj);
         if (ret != EOK && ret != ENOENT) {
             DEBUG(SSSDBG_OP_FAILURE,
-                  "sysdb_search_user_override_by_uid failed.\n");
+                  "sysdb_search_user_override_attrs_by_uid failed.\n");
             goto done;
         }
     }
@@ -493,7 +518,7 @@ errno_t sysdb_getpwuid_with_views(TALLOC_CTX *mem_ctx,
     /* If there are no views or nothing was found in the overrides the
      * original objects are searched. */
     if (orig_obj == NULL) {
-        ret = sysdb_getpwuid(tmp_ctx, domain, uid, &orig_obj);
+        ret = sysdb_getpwuid_attrs(tmp_ctx, domain, uid, attrs, &orig_obj);
         if (ret != EOK) {
             DEBUG(SSSDBG_OP_FAILURE, "sysdb_getpwuid failed.\n");
             goto done;
@@ -505,7 +530,7 @@ errno_t sysdb_getpwuid_with_views(TALLOC_CTX *mem_ctx,
     if (DOM_HAS_VIEWS(domain) && orig_obj->count == 1) {
         ret = sysdb_add_overrides_to_object(domain, orig_obj->msgs[0],
                            override_obj == NULL ? NULL : override_obj->msgs[0],
-                           NULL);
+                           attributes);
         if (ret != EOK && ret != ENOENT) {
             DEBUG(SSSDBG_OP_FAILURE, "sysdb_add_overrides_to_object failed.\n");
             goto done;
@@ -1817,13 +1842,10 @@ done:
     return ret;
 }
 
-int sysdb_initgroups_with_views(TALLOC_CTX *mem_ctx,
-                                struct sss_domain_info *domain,
-                                const char *name,
-                                struct ldb_result **_res)
+errno_t sysdb_initgroups_append_with_views(struct sss_domain_info *domain,
+                                           struct ldb_result *res)
 {
     TALLOC_CTX *tmp_ctx;
-    struct ldb_result *res;
     struct ldb_dn *user_dn;
     struct ldb_request *req;
     struct ldb_control **ctrl;
@@ -1832,37 +1854,23 @@ int sysdb_initgroups_with_views(TALLOC_CTX *mem_ctx,
     int ret;
     size_t c;
 
+    if (res->count != 1) {
+        DEBUG(SSSDBG_CRIT_FAILURE,
+              "Expected one user entry, got [%d]\n", res->count);
+        return EINVAL;
+    }
+
     tmp_ctx = talloc_new(NULL);
     if (!tmp_ctx) {
         return ENOMEM;
     }
 
-    ret = sysdb_getpwnam_with_views(tmp_ctx, domain, name, &res);
-    if (ret != EOK) {
-        DEBUG(SSSDBG_CRIT_FAILURE, "sysdb_getpwnam failed: [%d][%s]\n",
-                  ret, strerror(ret));
-        goto done;
-    }
-
-    if (res->count == 0) {
-        /* User is not cached yet */
-        *_res = talloc_steal(mem_ctx, res);
-        ret = EOK;
-        goto done;
-
-    } else if (res->count != 1) {
-        ret = EIO;
-        DEBUG(SSSDBG_CRIT_FAILURE,
-              "sysdb_getpwnam returned count: [%d]\n", res->count);
-        goto done;
-    }
-
     /* no need to steal the dn, we are not freeing the result */
     user_dn = res->msgs[0]->dn;
 
     /* note we count on the fact that the default search callback
      * will just keep appending values. This is by design and can't
-     * change so it is ok to already have a result (from the getpwnam)
+     * change so it is ok to already have a result (the user entry)
      * even before we call the next search */
 
     ctrl = talloc_array(tmp_ctx, struct ldb_control *, 2);
@@ -1924,6 +1932,52 @@ int sysdb_initgroups_with_views(TALLOC_CTX *mem_ctx,
         }
     }
 
+    ret = EOK;
+
+done:
+    talloc_zfree(tmp_ctx);
+    return ret;
+}
+
+int sysdb_initgroups_with_views(TALLOC_CTX *mem_ctx,
+                                struct sss_domain_info *domain,
+                                const char *name,
+                                struct ldb_result **_res)
+{
+    TALLOC_CTX *tmp_ctx;
+    struct ldb_result *res;
+    int ret;
+
+    tmp_ctx = talloc_new(NULL);
+    if (!tmp_ctx) {
+        return ENOMEM;
+    }
+
+    ret = sysdb_getpwnam_with_views(tmp_ctx, domain, name, &res);
+    if (ret != EOK) {
+        DEBUG(SSSDBG_CRIT_FAILURE, "sysdb_getpwnam failed: [%d][%s]\n",
+                  ret, strerror(ret));
+        goto done;
+    }
+
+    if (res->count == 0) {
+        /* User is not cached yet */
+        *_res = talloc_steal(mem_ctx, res);
+        ret = EOK;
+        goto done;
+
+    } else if (res->count != 1) {
+        ret = EIO;
+        DEBUG(SSSDBG_CRIT_FAILURE,
+              "sysdb_getpwnam returned count: [%d]\n", res->count);
+        goto done;
+    }
+
+    ret = sysdb_initgroups_append_with_views(domain, res);
+    if (ret != EOK) {
+        goto done;
+    }
+
     *_res = talloc_steal(mem_ctx, res);
 
 done:
@@ -1248,6 +1248,7 @@ static errno_t sysdb_search_override_by_id(TALLOC_CTX *mem_ctx,
                                            struct sss_domain_info *domain,
                                            unsigned long int id,
                                            enum override_object_type type,
+                                           const char **req_attrs,
                                            struct ldb_result **override_obj,
                                            struct ldb_result **orig_obj)
 {
@@ -1279,11 +1280,11 @@ static errno_t sysdb_search_override_by_id(TALLOC_CTX *mem_ctx,
     switch(type) {
     case OO_TYPE_USER:
         filter = SYSDB_USER_UID_OVERRIDE_FILTER;
-        attrs = user_attrs;
+        attrs = req_attrs != NULL ? req_attrs : user_attrs;
         break;
     case OO_TYPE_GROUP:
         filter = SYSDB_GROUP_GID_OVERRIDE_FILTER;
-        attrs = group_attrs;
+        attrs = req_attrs != NULL ? req_attrs : group_attrs;
         break;
     default:
         DEBUG(SSSDBG_CRIT_FAILURE, "Unexpected override object type [%d].\n",
@@ -1375,7 +1376,18 @@ errno_t sysdb_search_user_override_by_uid(TALLOC_CTX *mem_ctx,
                                            struct ldb_result **orig_obj)
 {
     return sysdb_search_override_by_id(mem_ctx, domain, uid, OO_TYPE_USER,
-                                       override_obj, orig_obj);
+                                       NULL, override_obj, orig_obj);
+}
+
+errno_t sysdb_search_user_override_attrs_by_uid(TALLOC_CTX *mem_ctx,
+                                                struct sss_domain_info *domain,
+                                                uid_t uid,
+                                                const char **attrs,
+                                                struct ldb_result **override_obj,
+                                                struct ldb_result **orig_obj)
+{
+    return sysdb_search_override_by_id(mem_ctx, domain, uid, OO_TYPE_USER,
+                                       attrs, override_obj, orig_obj);
 }
 
 errno_t sysdb_search_group_override_by_gid(TALLOC_CTX *mem_ctx,
@@ -1385,7 +1397,7 @@ errno_t sysdb_search_group_override_by_gid(TALLOC_CTX *mem_ctx,
                                             struct ldb_result **orig_obj)
 {
     return sysdb_search_override_by_id(mem_ctx, domain, gid, OO_TYPE_GROUP,
-                                       override_obj, orig_obj);
+                                       NULL, override_obj, orig_obj);
 }
 
 /**
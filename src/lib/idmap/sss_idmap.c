@@ -58,6 +58,70 @@ struct idmap_domain_info {
 
     idmap_store_cb cb;
     void *pvt;
+
+    /* Position in the domain list, the most recently added domain has the
+     * highest sequence number. */
+    uint32_t seq;
+};
+
+/* The domain list is always searched from the most recently added domain
+ * on. The index below gives the same results without walking the list: of
+ * several matching domains the one with the highest sequence number wins. */
+
+/* ID range of a domain or of a helper, lo <= hi even if the range itself is
+ * inverted. */
+struct idmap_range_entry {
+    uint32_t lo;
+    uint32_t hi;
+    /* highest hi of this and all preceding entries */
+    uint32_t max_hi;
+    /* max_id < min_id, the range does not contain any ID */
+    bool inverted;
+    uint64_t prio;
+    struct idmap_domain_info *dom;
+    struct idmap_range_params *range;
+};
+
+/* Ranges sorted by lo */
+struct idmap_range_index {
+    struct idmap_range_entry *entries;
+    size_t count;
+    size_t size;
+};
+
+/* All domains with the same SID */
+struct idmap_sid_entry {
+    char *sid;
+    size_t sid_len;
+    uint32_t hash;
+
+    /* Domains with a valid range sorted by first_rid */
+    struct idmap_domain_info **doms;
+    size_t count;
+    size_t size;
+    /* RID ranges of some of the domains overlap */
+    bool rid_overlap;
+
+    struct idmap_domain_info *newest;
+    struct idmap_domain_info *oldest;
+
+    struct idmap_sid_entry *next;
+};
+
+struct idmap_index {
+    uint32_t seq;
+
+    /* Primary ranges of all domains */
+    struct idmap_range_index ranges;
+    /* Secondary ranges of domains which own helpers */
+    struct idmap_range_index helpers;
+
+    /* Domains with a SID hashed by SID */
+    struct idmap_sid_entry **sids;
+    size_t sids_size;
+    size_t sids_count;
+    size_t sid_min_len;
+    size_t sid_max_len;
 };
 
 static void *default_alloc(size_t size, void *pvt)
@@ -151,6 +215,543 @@ static bool id_is_in_range(uint32_t id,
     return false;
 }
 
+static bool check_overlap(struct idmap_range_params *range,
+                          id_t min, id_t max)
+{
+    return ((range->min_id <= min && range->max_id >= max)
+                || (range->min_id >= min && range->min_id <= max)
+                || (range->max_id >= min && range->max_id <= max));
+}
+
+static bool comp_id(struct idmap_range_params *range_params, long long rid,
+                    uint32_t *_id)
+{
+    uint32_t id;
+
+    if (rid >= range_params->first_rid
+            && ((UINT32_MAX - range_params->min_id) >
+               (rid - range_params->first_rid))) {
+        id = range_params->min_id + (rid - range_params->first_rid);
+        if (id <= range_params->max_id) {
+            *_id = id;
+            return true;
+        }
+    }
+    return false;
+}
+
+/* Make sure the array can hold at least needed elements. Returns the
+ * (possibly new) array or NULL if memory is exhausted, the old array is
+ * still valid in this case. */
+static void *idmap_array_reserve(struct sss_idmap_ctx *ctx,
+                                 void *array,
+                                 size_t elem_size,
+                                 size_t *_size,
+                                 size_t needed)
+{
+    void *new_array;
+    size_t size;
+
+    if (needed <= *_size) {
+        return array;
+    }
+
+    size = (*_size == 0) ? 8 : *_size;
+    while (size < needed) {
+        size *= 2;
+    }
+
+    new_array = ctx->alloc_func(size * elem_size, ctx->alloc_pvt);
+    if (new_array == NULL) {
+        return NULL;
+    }
+
+    if (array != NULL) {
+        memcpy(new_array, array, *_size * elem_size);
+        ctx->free_func(array, ctx->alloc_pvt);
+    }
+
+    *_size = size;
+    return new_array;
+}
+
+static enum idmap_error_code
+idmap_range_index_reserve(struct sss_idmap_ctx *ctx,
+                          struct idmap_range_index *idx,
+                          size_t num)
+{
+    struct idmap_range_entry *entries;
+
+    entries = idmap_array_reserve(ctx, idx->entries,
+                                  sizeof(struct idmap_range_entry),
+                                  &idx->size, idx->count + num);
+    if (entries == NULL) {
+        return IDMAP_OUT_OF_MEMORY;
+    }
+
+    idx->entries = entries;
+    return IDMAP_SUCCESS;
+}
+
+/* Position of the first entry with lo > id */
+static size_t idmap_range_index_upper(struct idmap_range_index *idx,
+                                      uint32_t id)
+{
+    size_t lo = 0;
+    size_t hi = idx->count;
+    size_t mid;
+
+    while (lo < hi) {
+        mid = lo + (hi - lo) / 2;
+        if (idx->entries[mid].lo <= id) {
+            lo = mid + 1;
+        } else {
+            hi = mid;
+        }
+    }
+
+    return lo;
+}
+
+/* The caller must reserve space with idmap_range_index_reserve() first. */
+static void idmap_range_index_insert(struct idmap_range_index *idx,
+                                     struct idmap_domain_info *dom,
+                                     struct idmap_range_params *range,
+                                     uint64_t prio)
+{
+    struct idmap_range_entry entry;
+    uint32_t max_hi;
+    size_t pos;
+    size_t i;
+
+    entry.inverted = (range->min_id > range->max_id);
+    entry.lo = entry.inverted ? range->max_id : range->min_id;
+    entry.hi = entry.inverted ? range->min_id : range->max_id;
+    entry.prio = prio;
+    entry.dom = dom;
+    entry.range = range;
+
+    pos = idmap_range_index_upper(idx, entry.lo);
+    memmove(&idx->entries[pos + 1], &idx->entries[pos],
+            (idx->count - pos) * sizeof(struct idmap_range_entry));
+    idx->entries[pos] = entry;
+    idx->count++;
+
+    max_hi = (pos == 0) ? 0 : idx->entries[pos - 1].max_hi;
+    for (i = pos; i < idx->count; i++) {
+        if (idx->entries[i].hi > max_hi) {
+            max_hi = idx->entries[i].hi;
+        }
+        idx->entries[i].max_hi = max_hi;
+    }
+}
+
+/* Find the range with the highest priority containing id. Only entries
+ * with lo <= id are candidates and the walk stops at the first entry where
+ * no preceding range reaches id, so unless ranges are nested the search is
+ * logarithmic. */
+static struct idmap_range_entry *
+idmap_range_index_find(struct idmap_range_index *idx, uint32_t id)
+{
+    struct idmap_range_entry *found = NULL;
+    struct idmap_range_entry *entry;
+    size_t i;
+
+    if (id == 0) {
+        return NULL;
+    }
+
+    for (i = idmap_range_index_upper(idx, id); i > 0; i--) {
+        entry = &idx->entries[i - 1];
+        if (entry->max_hi < id) {
+            break;
+        }
+
+        if (entry->inverted || entry->hi < id) {
+            continue;
+        }
+
+        if (found == NULL || entry->prio > found->prio) {
+            found = entry;
+        }
+    }
+
+    return found;
+}
+
+/* Check if any range overlaps [min, max] in the sense of check_overlap() */
+static bool idmap_range_index_overlaps(struct idmap_range_index *idx,
+                                       id_t min, id_t max)
+{
+    struct idmap_range_entry *entry;
+    size_t i;
+
+    for (i = idmap_range_index_upper(idx, max); i > 0; i--) {
+        entry = &idx->entries[i - 1];
+        if (entry->max_hi < min) {
+            break;
+        }
+
+        if (entry->hi < min) {
+            continue;
+        }
+
+        if (!entry->inverted || check_overlap(entry->range, min, max)) {
+            return true;
+        }
+    }
+
+    return false;
+}
+
+static uint32_t idmap_sid_hash(const char *sid, size_t len)
+{
+    return murmurhash3(sid, len, 0xdeadbeef);
+}
+
+static struct idmap_sid_entry *
+idmap_sid_index_get(struct idmap_index *index,
+                    const char *sid, size_t len, uint32_t hash)
+{
+    struct idmap_sid_entry *entry;
+
+    if (index->sids_size == 0) {
+        return NULL;
+    }
+
+    for (entry = index->sids[hash & (index->sids_size - 1)];
+         entry != NULL;
+         entry = entry->next) {
+        if (entry->hash == hash && entry->sid_len == len
+                && strncmp(entry->sid, sid, len) == 0) {
+            return entry;
+        }
+    }
+
+    return NULL;
+}
+
+/* Find the domains the SID belongs to. Returns false if the domain SIDs of
+ * more than one entry are a prefix of the SID, the caller has to search the
+ * domain list in this case. */
+static bool idmap_sid_index_lookup(struct idmap_index *index,
+                                   const char *sid,
+                                   struct idmap_sid_entry **_entry)
+{
+    struct idmap_sid_entry *found = NULL;
+    struct idmap_sid_entry *entry;
+    size_t len;
+
+    *_entry = NULL;
+
+    if (index->sids_count == 0
+            || strncmp(sid, DOM_SID_PREFIX, DOM_SID_PREFIX_LEN) != 0) {
+        /* All indexed SIDs are domain SIDs, see is_domain_sid(). */
+        return true;
+    }
+
+    for (len = DOM_SID_PREFIX_LEN;
+         sid[len] != '\0' && len <= index->sid_max_len;
+         len++) {
+        if (sid[len] != '-' || len < index->sid_min_len) {
+            continue;
+        }
+
+        entry = idmap_sid_index_get(index, sid, len, idmap_sid_hash(sid, len));
+        if (entry == NULL) {
+            continue;
+        }
+
+        if (found != NULL) {
+            return false;
+        }
+        found = entry;
+    }
+
+    *_entry = found;
+    return true;
+}
+
+static uint64_t rid_span_end(struct idmap_domain_info *dom)
+{
+    return (uint64_t) dom->range_params.first_rid
+               + (dom->range_params.max_id - dom->range_params.min_id);
+}
+
+static size_t idmap_sid_entry_upper(struct idmap_sid_entry *entry,
+                                    long long rid)
+{
+    size_t lo = 0;
+    size_t hi = entry->count;
+    size_t mid;
+
+    while (lo < hi) {
+        mid = lo + (hi - lo) / 2;
+        if (entry->doms[mid]->range_params.first_rid <= rid) {
+            lo = mid + 1;
+        } else {
+            hi = mid;
+        }
+    }
+
+    return lo;
+}
+
+/* Map the RID with the matching domain with the highest sequence number. */
+static bool idmap_sid_entry_find(struct idmap_sid_entry *entry,
+                                 long long rid,
+                                 uint32_t *_id)
+{
+    struct idmap_domain_info *found = NULL;
+    uint32_t found_id = 0;
+    uint32_t id;
+    size_t pos;
+    size_t i;
+
+    if (!entry->rid_overlap) {
+        /* Only the domain with the closest first_rid can contain rid. */
+        pos = idmap_sid_entry_upper(entry, rid);
+        if (pos == 0) {
+            return false;
+        }
+
+        return comp_id(&entry->doms[pos - 1]->range_params, rid, _id);
+    }
+
+    for (i = 0; i < entry->count; i++) {
+        if (comp_id(&entry->doms[i]->range_params, rid, &id)
+                && (found == NULL || entry->doms[i]->seq > found->seq)) {
+            found = entry->doms[i];
+            found_id = id;
+        }
+    }
+
+    if (found == NULL) {
+        return false;
+    }
+
+    *_id = found_id;
+    return true;
+}
+
+static void idmap_sid_entry_insert(struct idmap_sid_entry *entry,
+                                   struct idmap_domain_info *dom)
+{
+    size_t pos;
+
+    if (entry->oldest == NULL) {
+        entry->oldest = dom;
+    }
+    entry->newest = dom;
+
+    if (dom->range_params.min_id > dom->range_params.max_id) {
+        /* comp_id() never succeeds for this domain. */
+        return;
+    }
+
+    pos = idmap_sid_entry_upper(entry, dom->range_params.first_rid);
+    memmove(&entry->doms[pos + 1], &entry->doms[pos],
+            (entry->count - pos) * sizeof(struct idmap_domain_info *));
+    entry->doms[pos] = dom;
+    entry->count++;
+
+    if ((pos > 0 && rid_span_end(entry->doms[pos - 1])
+                        >= dom->range_params.first_rid)
+            || (pos + 1 < entry->count && rid_span_end(dom)
+                        >= entry->doms[pos + 1]->range_params.first_rid)) {
+        entry->rid_overlap = true;
+    }
+}
+
+static void idmap_sid_entry_free(struct sss_idmap_ctx *ctx,
+                                 struct idmap_sid_entry *entry)
+{
+    if (entry == NULL) {
+        return;
+    }
+
+    ctx->free_func(entry->doms, ctx->alloc_pvt);
+    ctx->free_func(entry->sid, ctx->alloc_pvt);
+    ctx->free_func(entry, ctx->alloc_pvt);
+}
+
+/* Grow the hash table when it gets full. Failing to do so only makes the
+ * chains longer. */
+static void idmap_sid_index_rehash(struct sss_idmap_ctx *ctx,
+                                   struct idmap_index *index)
+{
+    struct idmap_sid_entry **sids;
+    struct idmap_sid_entry *entry;
+    struct idmap_sid_entry *next;
+    size_t size;
+    size_t i;
+
+    if (index->sids_count < index->sids_size) {
+        return;
+    }
+
+    size = (index->sids_size == 0) ? 16 : index->sids_size * 2;
+    sids = ctx->alloc_func(size * sizeof(struct idmap_sid_entry *),
+                           ctx->alloc_pvt);
+    if (sids == NULL) {
+        return;
+    }
+    memset(sids, 0, size * sizeof(struct idmap_sid_entry *));
+
+    for (i = 0; i < index->sids_size; i++) {
+        for (entry = index->sids[i]; entry != NULL; entry = next) {
+            next = entry->next;
+            entry->next = sids[entry->hash & (size - 1)];
+            sids[entry->hash & (size - 1)] = entry;
+        }
+    }
+
+    ctx->free_func(index->sids, ctx->alloc_pvt);
+    index->sids = sids;
+    index->sids_size = size;
+}
+
+/* Add a new domain to the index. Nothing is changed if an error is
+ * returned. */
+static enum idmap_error_code idmap_index_add_domain(struct sss_idmap_ctx *ctx,
+                                                    struct idmap_domain_info *dom)
+{
+    struct idmap_index *index = ctx->index;
+    struct idmap_sid_entry *entry = NULL;
+    struct idmap_domain_info **doms;
+    enum idmap_error_code err;
+    bool new_entry = false;
+    uint32_t hash = 0;
+    size_t len = 0;
+    size_t bucket;
+
+    err = idmap_range_index_reserve(ctx, &index->ranges, 1);
+    if (err != IDMAP_SUCCESS) {
+        return err;
+    }
+
+    if (dom->sid != NULL) {
+        idmap_sid_index_rehash(ctx, index);
+        if (index->sids_size == 0) {
+            return IDMAP_OUT_OF_MEMORY;
+        }
+
+        len = strlen(dom->sid);
+        hash = idmap_sid_hash(dom->sid, len);
+        entry = idmap_sid_index_get(index, dom->sid, len, hash);
+        if (entry == NULL) {
+            entry = ctx->alloc_func(sizeof(struct idmap_sid_entry),
+                                    ctx->alloc_pvt);
+            if (entry == NULL) {
+                return IDMAP_OUT_OF_MEMORY;
+            }
+            memset(entry, 0, sizeof(struct idmap_sid_entry));
+            new_entry = true;
+
+            entry->sid = idmap_strdup(ctx, dom->sid);
+            if (entry->sid == NULL) {
+                err = IDMAP_OUT_OF_MEMORY;
+                goto fail;
+            }
+            entry->sid_len = len;
+            entry->hash = hash;
+        }
+
+        doms = idmap_array_reserve(ctx, entry->doms,
+                                   sizeof(struct idmap_domain_info *),
+                                   &entry->size, entry->count + 1);
+        if (doms == NULL) {
+            err = IDMAP_OUT_OF_MEMORY;
+            goto fail;
+        }
+        entry->doms = doms;
+    }
+
+    dom->seq = ++index->seq;
+    idmap_range_index_insert(&index->ranges, dom, &dom->range_params,
+                             dom->seq);
+
+    if (entry != NULL) {
+        idmap_sid_entry_insert(entry, dom);
+    }
+
+    if (new_entry) {
+        bucket = hash & (index->sids_size - 1);
+        entry->next = index->sids[bucket];
+        index->sids[bucket] = entry;
+
+        if (index->sids_count == 0 || len < index->sid_min_len) {
+            index->sid_min_len = len;
+        }
+        if (len > index->sid_max_len) {
+            index->sid_max_len = len;
+        }
+        index->sids_count++;
+    }
+
+    return IDMAP_SUCCESS;
+
+fail:
+    if (new_entry) {
+        idmap_sid_entry_free(ctx, entry);
+    }
+
+    return err;
+}
+
+/* Add the helpers of a domain which owns them to the index. Helpers are
+ * searched in the order of the domains and then in list order. */
+static enum idmap_error_code
+idmap_index_add_helpers(struct sss_idmap_ctx *ctx,
+                        struct idmap_domain_info *dom)
+{
+    struct idmap_range_params *it;
+    enum idmap_error_code err;
+    uint32_t pos;
+    size_t num = 0;
+
+    for (it = dom->helpers; it != NULL; it = it->next) {
+        num++;
+    }
+
+    err = idmap_range_index_reserve(ctx, &ctx->index->helpers, num);
+    if (err != IDMAP_SUCCESS) {
+        return err;
+    }
+
+    for (it = dom->helpers, pos = 0; it != NULL; it = it->next, pos++) {
+        idmap_range_index_insert(&ctx->index->helpers, dom, it,
+                                 ((uint64_t) dom->seq << 32)
+                                     | (UINT32_MAX - pos));
+    }
+
+    return IDMAP_SUCCESS;
+}
+
+static void idmap_index_free(struct sss_idmap_ctx *ctx,
+                             struct idmap_index *index)
+{
+    struct idmap_sid_entry *entry;
+    struct idmap_sid_entry *next;
+    size_t i;
+
+    if (index == NULL) {
+        return;
+    }
+
+    for (i = 0; i < index->sids_size; i++) {
+        for (entry = index->sids[i]; entry != NULL; entry = next) {
+            next = entry->next;
+            idmap_sid_entry_free(ctx, entry);
+        }
+    }
+
+    ctx->free_func(index->sids, ctx->alloc_pvt);
+    ctx->free_func(index->ranges.entries, ctx->alloc_pvt);
+    ctx->free_func(index->helpers.entries, ctx->alloc_pvt);
+    ctx->free_func(index, ctx->alloc_pvt);
+}
+
 const char *idmap_error_string(enum idmap_error_code err)
 {
     switch (err) {
@@ -258,6 +859,13 @@ enum idmap_error_code sss_idmap_init(idmap_alloc_func *alloc_func,
     ctx->alloc_pvt = alloc_pvt;
     ctx->free_func = (free_func == NULL) ? default_free : free_func;
 
+    ctx->index = alloc_func(sizeof(struct idmap_index), alloc_pvt);
+    if (ctx->index == NULL) {
+        ctx->free_func(ctx, alloc_pvt);
+        return IDMAP_OUT_OF_MEMORY;
+    }
+    memset(ctx->index, 0, sizeof(struct idmap_index));
+
     /* Set default values. */
     ctx->idmap_opts.autorid_mode = SSS_IDMAP_DEFAULT_AUTORID;
     ctx->idmap_opts.idmap_lower = SSS_IDMAP_DEFAULT_LOWER;
@@ -335,6 +943,7 @@ enum idmap_error_code sss_idmap_free(struct sss_idmap_ctx *ctx)
         sss_idmap_free_domain(ctx, dom);
     }
 
+    idmap_index_free(ctx, ctx->index);
     ctx->free_func(ctx, ctx->alloc_pvt);
 
     return IDMAP_SUCCESS;
@@ -376,22 +985,6 @@ enum idmap_error_code sss_idmap_free_bin_sid(struct sss_idmap_ctx *ctx,
     return sss_idmap_free_ptr(ctx, bin_sid);
 }
 
-static bool check_overlap(struct idmap_range_params *range,
-                          id_t min, id_t max)
-{
-    return ((range->min_id <= min && range->max_id >= max)
-                || (range->min_id >= min && range->min_id <= max)
-                || (range->max_id >= min && range->max_id <= max));
-}
-
-static bool check_dom_overlap(struct idmap_range_params *prim_range,
-                              /* struct idmap_range_params *sec_ranges, */
-                              id_t min,
-                              id_t max)
-{
-    return check_overlap(prim_range, min, max);
-}
-
 enum idmap_error_code sss_idmap_calculate_range(struct sss_idmap_ctx *ctx,
                                                 const char *range_id,
                                                 id_t *slice_num,
@@ -407,7 +1000,6 @@ enum idmap_error_code sss_idmap_calculate_range(struct sss_idmap_ctx *ctx,
     id_t rangesize;
     bool autorid_mode;
     uint32_t hash_val;
-    struct idmap_domain_info *dom;
 
     CHECK_IDMAP_CTX(ctx, IDMAP_CONTEXT_INVALID);
 
@@ -428,13 +1020,11 @@ enum idmap_error_code sss_idmap_calculate_range(struct sss_idmap_ctx *ctx,
         new_slice = *slice_num;
         min = (rangesize * new_slice) + idmap_lower;
         max = min + rangesize - 1;
-        for (dom = ctx->idmap_domain_info; dom != NULL; dom = dom->next) {
-                if (check_dom_overlap(&dom->range_params,min, max)) {
-                    /* This range overlaps one already registered
-                     * Fail, because the slice was manually configured
-                     */
-                    return IDMAP_COLLISION;
-                }
+        if (idmap_range_index_overlaps(&ctx->index->ranges, min, max)) {
+            /* This range overlaps one already registered
+             * Fail, because the slice was manually configured
+             */
+            return IDMAP_COLLISION;
         }
     } else {
         /* If slice is -1, we're being asked to pick a new slice */
@@ -458,35 +1048,23 @@ enum idmap_error_code sss_idmap_calculate_range(struct sss_idmap_ctx *ctx,
         min = (rangesize * new_slice) + idmap_lower;
         max = min + rangesize - 1;
         /* Verify that this slice is not already in use */
-        do {
-            for (dom = ctx->idmap_domain_info; dom != NULL; dom = dom->next) {
-
-                if (check_dom_overlap(&dom->range_params,
-                                      min, max)) {
-                    /* This range overlaps one already registered
-                     * We'll try the next available slot
-                     */
-                    new_slice++;
-                    if (new_slice >= max_slices) {
-                        /* loop around to the beginning if necessary */
-                        new_slice = 0;
-                    }
-
-                    min = (rangesize * new_slice) + idmap_lower;
-                    max = min + rangesize - 1;
-                    break;
-                }
+        while (idmap_range_index_overlaps(&ctx->index->ranges, min, max)) {
+            /* This range overlaps one already registered
+             * We'll try the next available slot
+             */
+            new_slice++;
+            if (new_slice >= max_slices) {
+                /* loop around to the beginning if necessary */
+                new_slice = 0;
             }
 
-            /* Keep trying until dom is NULL (meaning we got to the end
-             * without matching) or we have run out of slices and gotten
-             * back to the first one we tried.
-             */
-        } while (dom && new_slice != orig_slice);
+            if (new_slice == orig_slice) {
+                /* We looped all the way through and found no empty slots */
+                return IDMAP_OUT_OF_SLICES;
+            }
 
-        if (dom) {
-            /* We looped all the way through and found no empty slots */
-            return IDMAP_OUT_OF_SLICES;
+            min = (rangesize * new_slice) + idmap_lower;
+            max = min + rangesize - 1;
         }
     }
 
@@ -793,6 +1371,11 @@ enum idmap_error_code sss_idmap_add_domain_ex(struct sss_idmap_ctx *ctx,
         goto fail;
     }
 
+    err = idmap_index_add_domain(ctx, dom);
+    if (err != IDMAP_SUCCESS) {
+        goto fail;
+    }
+
     dom->next = ctx->idmap_domain_info;
     ctx->idmap_domain_info = dom;
 
@@ -850,6 +1433,15 @@ sss_idmap_add_auto_domain_ex(struct sss_idmap_ctx *ctx,
     if (err == IDMAP_SUCCESS) {
         ctx->idmap_domain_info->auto_add_ranges = true;
         ctx->idmap_domain_info->helpers_owner = true;
+
+        err = idmap_index_add_helpers(ctx, ctx->idmap_domain_info);
+        if (err != IDMAP_SUCCESS) {
+            /* Helpers which can not be found by ID must not be used. */
+            free_helpers(ctx, ctx->idmap_domain_info->helpers, true);
+            ctx->idmap_domain_info->helpers = NULL;
+            ctx->idmap_domain_info->auto_add_ranges = false;
+            ctx->idmap_domain_info->helpers_owner = false;
+        }
     } else {
         /* Running out of slices for secondary mapping is a non-fatal
          * problem. */
@@ -918,23 +1510,6 @@ static bool is_sid_from_dom(const char *dom_sid, const char *sid,
     return strncmp(sid, dom_sid, dom_sid_len) == 0;
 }
 
-static bool comp_id(struct idmap_range_params *range_params, long long rid,
-                    uint32_t *_id)
-{
-    uint32_t id;
-
-    if (rid >= range_params->first_rid
-            && ((UINT32_MAX - range_params->min_id) >
-               (rid - range_params->first_rid))) {
-        id = range_params->min_id + (rid - range_params->first_rid);
-        if (id <= range_params->max_id) {
-            *_id = id;
-            return true;
-        }
-    }
-    return false;
-}
-
 static enum idmap_error_code
 get_range(struct sss_idmap_ctx *ctx,
           struct idmap_range_params *helpers,
@@ -1078,27 +1653,17 @@ done:
     return err;
 }
 
-enum idmap_error_code sss_idmap_sid_to_unix(struct sss_idmap_ctx *ctx,
-                                            const char *sid,
-                                            uint32_t *_id)
+static enum idmap_error_code sid_to_unix_scan(struct sss_idmap_ctx *ctx,
+                                              const char *sid,
+                                              uint32_t *_id)
 {
     struct idmap_domain_info *idmap_domain_info;
     struct idmap_domain_info *matched_dom = NULL;
     size_t dom_len;
     long long rid;
 
-    if (sid == NULL || _id == NULL) {
-        return IDMAP_ERROR;
-    }
-
-    CHECK_IDMAP_CTX(ctx, IDMAP_CONTEXT_INVALID);
-
     idmap_domain_info = ctx->idmap_domain_info;
 
-    if (sss_idmap_sid_is_builtin(sid)) {
-        return IDMAP_BUILTIN_SID;
-    }
-
     /* Try primary slices */
     while (idmap_domain_info != NULL) {
 
@@ -1129,6 +1694,52 @@ enum idmap_error_code sss_idmap_sid_to_unix(struct sss_idmap_ctx *ctx,
     return matched_dom ? IDMAP_NO_RANGE : IDMAP_NO_DOMAIN;
 }
 
+enum idmap_error_code sss_idmap_sid_to_unix(struct sss_idmap_ctx *ctx,
+                                            const char *sid,
+                                            uint32_t *_id)
+{
+    struct idmap_sid_entry *entry;
+    long long rid;
+
+    if (sid == NULL || _id == NULL) {
+        return IDMAP_ERROR;
+    }
+
+    CHECK_IDMAP_CTX(ctx, IDMAP_CONTEXT_INVALID);
+
+    if (sss_idmap_sid_is_builtin(sid)) {
+        return IDMAP_BUILTIN_SID;
+    }
+
+    if (!idmap_sid_index_lookup(ctx->index, sid, &entry)) {
+        return sid_to_unix_scan(ctx, sid, _id);
+    }
+
+    if (entry == NULL) {
+        return IDMAP_NO_DOMAIN;
+    }
+
+    /* Domains with the same SID have the same name and type of mapping,
+     * see sss_idmap_check_collision_ex(). */
+    if (entry->newest->external_mapping == true) {
+        return IDMAP_EXTERNAL;
+    }
+
+    if (parse_rid(sid, entry->sid_len, &rid) == false) {
+        return IDMAP_SID_INVALID;
+    }
+
+    if (idmap_sid_entry_find(entry, rid, _id)) {
+        return IDMAP_SUCCESS;
+    }
+
+    if (entry->oldest->auto_add_ranges) {
+        return add_dom_for_sid(ctx, entry->oldest, sid, _id);
+    }
+
+    return IDMAP_NO_RANGE;
+}
+
 enum idmap_error_code sss_idmap_check_sid_unix(struct sss_idmap_ctx *ctx,
                                                const char *sid,
                                                uint32_t id)
@@ -1208,57 +1819,47 @@ enum idmap_error_code sss_idmap_unix_to_sid(struct sss_idmap_ctx *ctx,
                                             char **_sid)
 {
     struct idmap_domain_info *idmap_domain_info;
+    struct idmap_range_entry *entry;
     uint32_t rid;
     enum idmap_error_code err;
 
     CHECK_IDMAP_CTX(ctx, IDMAP_CONTEXT_INVALID);
 
-    idmap_domain_info = ctx->idmap_domain_info;
-
-    while (idmap_domain_info != NULL) {
-        if (id_is_in_range(id, &idmap_domain_info->range_params, &rid)) {
-
-            if (idmap_domain_info->external_mapping == true
-                    || idmap_domain_info->sid == NULL) {
-                return IDMAP_EXTERNAL;
-            }
+    entry = idmap_range_index_find(&ctx->index->ranges, id);
+    if (entry != NULL) {
+        idmap_domain_info = entry->dom;
+        /* The index does not exclude id 0, which is never mapped. */
+        if (!id_is_in_range(id, &idmap_domain_info->range_params, &rid)) {
+            return IDMAP_NO_DOMAIN;
+        }
 
-            return generate_sid(ctx, idmap_domain_info->sid, rid, _sid);
+        if (idmap_domain_info->external_mapping == true
+                || idmap_domain_info->sid == NULL) {
+            return IDMAP_EXTERNAL;
         }
 
-        idmap_domain_info = idmap_domain_info->next;
+        return generate_sid(ctx, idmap_domain_info->sid, rid, _sid);
     }
 
-    /* Check secondary ranges. */
-    idmap_domain_info = ctx->idmap_domain_info;
-    while (idmap_domain_info != NULL) {
-
-        for (struct idmap_range_params *it = idmap_domain_info->helpers;
-             it != NULL;
-             it = it->next) {
-
-            if (idmap_domain_info->helpers_owner == false) {
-                /* Checking helpers on owner is sufficient. */
-                continue;
-            }
-
-            if (id_is_in_range(id, it, &rid)) {
-
-                if (idmap_domain_info->external_mapping == true
-                    || idmap_domain_info->sid == NULL) {
-                    return IDMAP_EXTERNAL;
-                }
+    /* Check secondary ranges. Only helpers of their owner are indexed. */
+    entry = idmap_range_index_find(&ctx->index->helpers, id);
+    if (entry != NULL) {
+        idmap_domain_info = entry->dom;
+        if (!id_is_in_range(id, entry->range, &rid)) {
+            return IDMAP_NO_DOMAIN;
+        }
 
-                err = spawn_dom(ctx, idmap_domain_info, it);
-                if (err != IDMAP_SUCCESS) {
-                    return err;
-                }
+        if (idmap_domain_info->external_mapping == true
+            || idmap_domain_info->sid == NULL) {
+            return IDMAP_EXTERNAL;
+        }
 
-                return generate_sid(ctx, idmap_domain_info->sid, rid, _sid);
-            }
+        err = spawn_dom(ctx, idmap_domain_info, entry->range);
+        if (err != IDMAP_SUCCESS) {
+            return err;
         }
 
-        idmap_domain_info = idmap_domain_info->next;
+        return generate_sid(ctx, idmap_domain_info->sid, rid, _sid);
     }
 
     return IDMAP_NO_DOMAIN;
@@ -60,6 +60,8 @@ struct sss_idmap_ctx {
     idmap_free_func *free_func;
     struct sss_idmap_opts idmap_opts;
     struct idmap_domain_info *idmap_domain_info;
+    /* lookup index over idmap_domain_info */
+    struct idmap_index *index;
 };
 
 /* This is a copy of the definition in the samba gen_ndr/security.h header
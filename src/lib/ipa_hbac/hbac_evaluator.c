@@ -356,6 +356,789 @@ static errno_t hbac_evaluate_element(struct hbac_rule_element *rule_el,
     return EOK;
 }
 
+/* Compiled rule set
+ *
+ * Names and groups of all rule elements are case folded and stored in hash
+ * tables that map them to the list of rules that contain them. A request is
+ * then resolved by looking up its names and groups, the element with the
+ * smallest number of candidate rules is used to drive the evaluation and
+ * only those candidates are checked against the remaining elements. The
+ * result is the same as the result of hbac_evaluate() with the same rules.
+ */
+
+#define HBAC_RULESET_MIN_BUCKETS 16
+#define HBAC_RULESET_FOLD_BUFSIZE 256
+
+enum hbac_ruleset_element {
+    HBAC_RULESET_USERS,
+    HBAC_RULESET_SERVICES,
+    HBAC_RULESET_TARGETHOSTS,
+    HBAC_RULESET_SRCHOSTS,
+
+    HBAC_RULESET_ELEMENTS /* keep last */
+};
+
+struct hbac_ruleset_entry {
+    uint8_t *key;
+    size_t len;
+    uint32_t hash;
+
+    /* Indexes of rules that contain this key in ascending order. */
+    size_t *rules;
+    size_t num_rules;
+    size_t alloc_rules;
+
+    struct hbac_ruleset_entry *next;
+};
+
+struct hbac_ruleset_map {
+    struct hbac_ruleset_entry **buckets;
+    size_t num_buckets;
+};
+
+struct hbac_ruleset_index {
+    struct hbac_ruleset_map names;
+    struct hbac_ruleset_map groups;
+
+    /* Indexes of rules with category all in ascending order. */
+    size_t *all;
+    size_t num_all;
+};
+
+struct hbac_ruleset {
+    /* All enabled rules, NULL terminated. */
+    struct hbac_rule **rules;
+
+    /* Number of rules that are indexed. The first rule that is not complete
+     * or has a name that can not be case folded and all rules after it are
+     * evaluated one by one with hbac_evaluate_rule(). */
+    size_t num_rules;
+
+    /* Bitmask of elements with category all for each rule. */
+    unsigned char *all;
+
+    struct hbac_ruleset_index index[HBAC_RULESET_ELEMENTS];
+};
+
+/* Request element resolved against one index. */
+struct hbac_ruleset_match {
+    struct hbac_ruleset_entry **entries;
+    size_t num_entries;
+
+    /* Upper bound of rules that match this element. */
+    size_t num_candidates;
+};
+
+static struct hbac_rule_element *
+hbac_ruleset_rule_element(struct hbac_rule *rule,
+                          enum hbac_ruleset_element element)
+{
+    switch (element) {
+    case HBAC_RULESET_USERS:
+        return rule->users;
+    case HBAC_RULESET_SERVICES:
+        return rule->services;
+    case HBAC_RULESET_TARGETHOSTS:
+        return rule->targethosts;
+    case HBAC_RULESET_SRCHOSTS:
+        return rule->srchosts;
+    case HBAC_RULESET_ELEMENTS:
+        break;
+    }
+
+    return NULL;
+}
+
+static struct hbac_request_element *
+hbac_ruleset_request_element(struct hbac_eval_req *hbac_req,
+                             enum hbac_ruleset_element element)
+{
+    switch (element) {
+    case HBAC_RULESET_USERS:
+        return hbac_req->user;
+    case HBAC_RULESET_SERVICES:
+        return hbac_req->service;
+    case HBAC_RULESET_TARGETHOSTS:
+        return hbac_req->targethost;
+    case HBAC_RULESET_SRCHOSTS:
+        return hbac_req->srchost;
+    case HBAC_RULESET_ELEMENTS:
+        break;
+    }
+
+    return NULL;
+}
+
+/* 32-bit FNV-1a */
+static uint32_t hbac_ruleset_hash(const uint8_t *key, size_t len)
+{
+    uint32_t hash = 2166136261U;
+    size_t i;
+
+    for (i = 0; i < len; i++) {
+        hash ^= key[i];
+        hash *= 16777619U;
+    }
+
+    return hash;
+}
+
+static errno_t hbac_ruleset_append(size_t **_array,
+                                   size_t *_count,
+                                   size_t *_alloc,
+                                   size_t value)
+{
+    size_t *array;
+    size_t alloc;
+
+    if (*_count == *_alloc) {
+        alloc = *_alloc == 0 ? 4 : *_alloc * 2;
+        array = realloc(*_array, alloc * sizeof(size_t));
+        if (array == NULL) {
+            return ENOMEM;
+        }
+
+        *_array = array;
+        *_alloc = alloc;
+    }
+
+    (*_array)[*_count] = value;
+    (*_count)++;
+
+    return EOK;
+}
+
+static errno_t hbac_ruleset_map_init(struct hbac_ruleset_map *map,
+                                     size_t count)
+{
+    size_t num_buckets = HBAC_RULESET_MIN_BUCKETS;
+
+    while (num_buckets < count) {
+        num_buckets <<= 1;
+    }
+
+    map->buckets = calloc(num_buckets, sizeof(struct hbac_ruleset_entry *));
+    if (map->buckets == NULL) {
+        return ENOMEM;
+    }
+
+    map->num_buckets = num_buckets;
+
+    return EOK;
+}
+
+static void hbac_ruleset_map_free(struct hbac_ruleset_map *map)
+{
+    struct hbac_ruleset_entry *entry;
+    struct hbac_ruleset_entry *next;
+    size_t i;
+
+    if (map->buckets == NULL) {
+        return;
+    }
+
+    for (i = 0; i < map->num_buckets; i++) {
+        for (entry = map->buckets[i]; entry != NULL; entry = next) {
+            next = entry->next;
+            free(entry->key);
+            free(entry->rules);
+            free(entry);
+        }
+    }
+
+    free(map->buckets);
+    map->buckets = NULL;
+    map->num_buckets = 0;
+}
+
+static struct hbac_ruleset_entry *
+hbac_ruleset_map_lookup(struct hbac_ruleset_map *map,
+                        const uint8_t *key,
+                        size_t len,
+                        uint32_t hash)
+{
+    struct hbac_ruleset_entry *entry;
+
+    for (entry = map->buckets[hash & (map->num_buckets - 1)];
+         entry != NULL;
+         entry = entry->next) {
+        if (entry->hash == hash && entry->len == len
+                && memcmp(entry->key, key, len) == 0) {
+            return entry;
+        }
+    }
+
+    return NULL;
+}
+
+static errno_t hbac_ruleset_map_add(struct hbac_ruleset_map *map,
+                                    const char *name,
+                                    size_t rule)
+{
+    struct hbac_ruleset_entry *entry;
+    uint8_t *key;
+    uint32_t hash;
+    size_t bucket;
+    size_t len = 0;
+
+    key = sss_utf8_casefold((const uint8_t *) name, NULL, &len);
+    if (key == NULL) {
+        return errno;
+    }
+
+    hash = hbac_ruleset_hash(key, len);
+    entry = hbac_ruleset_map_lookup(map, key, len, hash);
+    if (entry != NULL) {
+        free(key);
+    } else {
+        entry = calloc(1, sizeof(struct hbac_ruleset_entry));
+        if (entry == NULL) {
+            free(key);
+            return ENOMEM;
+        }
+
+        entry->key = key;
+        entry->len = len;
+        entry->hash = hash;
+
+        bucket = hash & (map->num_buckets - 1);
+        entry->next = map->buckets[bucket];
+        map->buckets[bucket] = entry;
+    }
+
+    /* Rules are added in ascending order so a name that is listed more
+     * than once in the same rule is always the last one. */
+    if (entry->num_rules > 0 && entry->rules[entry->num_rules - 1] == rule) {
+        return EOK;
+    }
+
+    return hbac_ruleset_append(&entry->rules, &entry->num_rules,
+                               &entry->alloc_rules, rule);
+}
+
+static size_t hbac_ruleset_list_size(const char **list)
+{
+    size_t i;
+
+    if (list == NULL) {
+        return 0;
+    }
+
+    for (i = 0; list[i] != NULL; i++) {
+        /* just count */
+    }
+
+    return i;
+}
+
+/* If a name of a rule can not be case folded, the index of the rule is
+ * stored in _rule and the error is returned. */
+static errno_t hbac_ruleset_index_init(struct hbac_ruleset *ruleset,
+                                       enum hbac_ruleset_element element,
+                                       size_t *_rule)
+{
+    struct hbac_ruleset_index *idx = &ruleset->index[element];
+    struct hbac_rule_element *el;
+    size_t num_names = 0;
+    size_t num_groups = 0;
+    size_t i, j;
+    errno_t ret;
+
+    for (i = 0; i < ruleset->num_rules; i++) {
+        el = hbac_ruleset_rule_element(ruleset->rules[i], element);
+        num_names += hbac_ruleset_list_size(el->names);
+        num_groups += hbac_ruleset_list_size(el->groups);
+    }
+
+    ret = hbac_ruleset_map_init(&idx->names, num_names);
+    if (ret != EOK) {
+        return ret;
+    }
+
+    ret = hbac_ruleset_map_init(&idx->groups, num_groups);
+    if (ret != EOK) {
+        return ret;
+    }
+
+    idx->all = calloc(ruleset->num_rules + 1, sizeof(size_t));
+    if (idx->all == NULL) {
+        return ENOMEM;
+    }
+
+    for (i = 0; i < ruleset->num_rules; i++) {
+        el = hbac_ruleset_rule_element(ruleset->rules[i], element);
+
+        /* Names and groups are not needed if the rule applies to all. */
+        if (el->category & HBAC_CATEGORY_ALL) {
+            ruleset->all[i] |= 1 << element;
+            idx->all[idx->num_all] = i;
+            idx->num_all++;
+            continue;
+        }
+
+        for (j = 0; el->names != NULL && el->names[j] != NULL; j++) {
+            ret = hbac_ruleset_map_add(&idx->names, el->names[j], i);
+            if (ret != EOK) {
+                *_rule = i;
+                return ret;
+            }
+        }
+
+        for (j = 0; el->groups != NULL && el->groups[j] != NULL; j++) {
+            ret = hbac_ruleset_map_add(&idx->groups, el->groups[j], i);
+            if (ret != EOK) {
+                *_rule = i;
+                return ret;
+            }
+        }
+    }
+
+    return EOK;
+}
+
+static void hbac_ruleset_index_free(struct hbac_ruleset *ruleset)
+{
+    int i;
+
+    for (i = 0; i < HBAC_RULESET_ELEMENTS; i++) {
+        hbac_ruleset_map_free(&ruleset->index[i].names);
+        hbac_ruleset_map_free(&ruleset->index[i].groups);
+        free(ruleset->index[i].all);
+    }
+
+    memset(ruleset->index, 0, sizeof(ruleset->index));
+}
+
+void hbac_ruleset_free(struct hbac_ruleset *ruleset)
+{
+    if (ruleset == NULL) return;
+
+    hbac_ruleset_index_free(ruleset);
+    free(ruleset->all);
+    free(ruleset->rules);
+    free(ruleset);
+}
+
+enum hbac_error_code hbac_ruleset_compile(struct hbac_rule **rules,
+                                          struct hbac_ruleset **_ruleset)
+{
+    struct hbac_ruleset *ruleset;
+    size_t count;
+    size_t num_enabled;
+    size_t rule;
+    size_t i;
+    int el;
+    errno_t ret;
+
+    ruleset = calloc(1, sizeof(struct hbac_ruleset));
+    if (ruleset == NULL) {
+        HBAC_DEBUG(HBAC_DBG_ERROR, "Out of memory.\n");
+        return HBAC_ERROR_OUT_OF_MEMORY;
+    }
+
+    for (count = 0; rules[count] != NULL; count++) {
+        /* just count */
+    }
+
+    ruleset->rules = calloc(count + 1, sizeof(struct hbac_rule *));
+    ruleset->all = calloc(count + 1, sizeof(unsigned char));
+    if (ruleset->rules == NULL || ruleset->all == NULL) {
+        ret = ENOMEM;
+        goto done;
+    }
+
+    num_enabled = 0;
+    ruleset->num_rules = SIZE_MAX;
+    for (i = 0; rules[i] != NULL; i++) {
+        if (!rules[i]->enabled) {
+            continue;
+        }
+
+        if (ruleset->num_rules == SIZE_MAX
+                && (!rules[i]->users
+                    || !rules[i]->services
+                    || !rules[i]->targethosts
+                    || !rules[i]->srchosts)) {
+            HBAC_DEBUG(HBAC_DBG_INFO,
+                       "Rule [%s] cannot be parsed, some elements are empty\n",
+                       rules[i]->name);
+            ruleset->num_rules = num_enabled;
+        }
+
+        ruleset->rules[num_enabled] = rules[i];
+        num_enabled++;
+    }
+
+    if (ruleset->num_rules == SIZE_MAX) {
+        ruleset->num_rules = num_enabled;
+    }
+
+    for (el = 0; el < HBAC_RULESET_ELEMENTS; el++) {
+        ret = hbac_ruleset_index_init(ruleset, el, &rule);
+        if (ret == ENOMEM) {
+            goto done;
+        } else if (ret != EOK) {
+            /* Whether hbac_evaluate() fails on this rule depends on the
+             * request. Evaluate it and the rules after it one by one and
+             * index the rest again. */
+            HBAC_DEBUG(HBAC_DBG_INFO,
+                       "Rule [%s] cannot be indexed, names cannot be "
+                       "case folded [%d]: %s\n", ruleset->rules[rule]->name,
+                       ret, strerror(ret));
+            ruleset->num_rules = rule;
+
+            hbac_ruleset_index_free(ruleset);
+            memset(ruleset->all, 0, (count + 1) * sizeof(unsigned char));
+            el = -1;
+        }
+    }
+
+    HBAC_DEBUG(HBAC_DBG_TRACE, "Compiled %lu enabled rules out of %lu, "
+               "%lu are indexed.\n", (unsigned long) num_enabled,
+               (unsigned long) count, (unsigned long) ruleset->num_rules);
+
+    *_ruleset = ruleset;
+    ret = EOK;
+
+done:
+    if (ret != EOK) {
+        HBAC_DEBUG(HBAC_DBG_ERROR, "Out of memory.\n");
+        hbac_ruleset_free(ruleset);
+        return HBAC_ERROR_OUT_OF_MEMORY;
+    }
+
+    return HBAC_SUCCESS;
+}
+
+static errno_t hbac_ruleset_match_add(struct hbac_ruleset_match *match,
+                                      struct hbac_ruleset_map *map,
+                                      const char *name)
+{
+    struct hbac_ruleset_entry *entry;
+    uint8_t buf[HBAC_RULESET_FOLD_BUFSIZE];
+    uint8_t *key;
+    size_t len;
+
+    len = sizeof(buf);
+    key = sss_utf8_casefold((const uint8_t *) name, buf, &len);
+    if (key == NULL) {
+        return errno;
+    }
+
+    entry = hbac_ruleset_map_lookup(map, key, len,
+                                    hbac_ruleset_hash(key, len));
+    if (key != buf) {
+        free(key);
+    }
+
+    if (entry != NULL) {
+        match->entries[match->num_entries] = entry;
+        match->num_entries++;
+        match->num_candidates += entry->num_rules;
+    }
+
+    return EOK;
+}
+
+/* Lower *_limit to the first rule that lists names (or groups) for the
+ * element. hbac_evaluate() may fail from that rule on when a name of the
+ * request can not be compared, so the rules are evaluated one by one. */
+static void hbac_ruleset_limit(struct hbac_ruleset *ruleset,
+                               enum hbac_ruleset_element element,
+                               bool groups,
+                               size_t *_limit)
+{
+    struct hbac_rule_element *el;
+    const char **list;
+    size_t i;
+
+    for (i = 0; i < *_limit; i++) {
+        el = hbac_ruleset_rule_element(ruleset->rules[i], element);
+        if (el->category & HBAC_CATEGORY_ALL) {
+            continue;
+        }
+
+        list = groups ? el->groups : el->names;
+        if (list != NULL && list[0] != NULL) {
+            *_limit = i;
+            return;
+        }
+    }
+}
+
+static errno_t hbac_ruleset_match_init(struct hbac_ruleset *ruleset,
+                                       struct hbac_eval_req *hbac_req,
+                                       enum hbac_ruleset_element element,
+                                       struct hbac_ruleset_match *match,
+                                       size_t *_limit)
+{
+    struct hbac_ruleset_index *idx = &ruleset->index[element];
+    struct hbac_request_element *req_el;
+    size_t num_groups;
+    size_t i;
+    errno_t ret;
+
+    req_el = hbac_ruleset_request_element(hbac_req, element);
+    num_groups = req_el == NULL ? 0 : hbac_ruleset_list_size(req_el->groups);
+
+    match->entries = malloc((num_groups + 1)
+                            * sizeof(struct hbac_ruleset_entry *));
+    if (match->entries == NULL) {
+        return ENOMEM;
+    }
+
+    match->num_entries = 0;
+    match->num_candidates = idx->num_all;
+
+    if (req_el == NULL) {
+        return EOK;
+    }
+
+    if (req_el->name != NULL) {
+        ret = hbac_ruleset_match_add(match, &idx->names, req_el->name);
+        if (ret == ENOMEM) {
+            return ret;
+        } else if (ret != EOK) {
+            HBAC_DEBUG(HBAC_DBG_ERROR, "Cannot case fold name [%s] [%d]: "
+                       "%s\n", req_el->name, ret, strerror(ret));
+            hbac_ruleset_limit(ruleset, element, false, _limit);
+        }
+    }
+
+    for (i = 0; i < num_groups; i++) {
+        ret = hbac_ruleset_match_add(match, &idx->groups, req_el->groups[i]);
+        if (ret == ENOMEM) {
+            return ret;
+        } else if (ret != EOK) {
+            HBAC_DEBUG(HBAC_DBG_ERROR, "Cannot case fold group [%s] [%d]: "
+                       "%s\n", req_el->groups[i], ret, strerror(ret));
+            hbac_ruleset_limit(ruleset, element, true, _limit);
+        }
+    }
+
+    return EOK;
+}
+
+static bool hbac_ruleset_list_contains(const size_t *list,
+                                       size_t count,
+                                       size_t rule)
+{
+    size_t low = 0;
+    size_t high = count;
+    size_t mid;
+
+    while (low < high) {
+        mid = low + (high - low) / 2;
+        if (list[mid] == rule) {
+            return true;
+        } else if (list[mid] < rule) {
+            low = mid + 1;
+        } else {
+            high = mid;
+        }
+    }
+
+    return false;
+}
+
+static bool hbac_ruleset_match_rule(struct hbac_ruleset *ruleset,
+                                    struct hbac_ruleset_match *match,
+                                    enum hbac_ruleset_element element,
+                                    size_t rule)
+{
+    size_t i;
+
+    if (ruleset->all[rule] & (1 << element)) {
+        return true;
+    }
+
+    for (i = 0; i < match->num_entries; i++) {
+        if (hbac_ruleset_list_contains(match->entries[i]->rules,
+                                       match->entries[i]->num_rules,
+                                       rule)) {
+            return true;
+        }
+    }
+
+    return false;
+}
+
+static int hbac_ruleset_compare(const void *a, const void *b)
+{
+    size_t ra = *(const size_t *) a;
+    size_t rb = *(const size_t *) b;
+
+    return ra < rb ? -1 : ra > rb;
+}
+
+/* Find the first rule below limit that matches all elements. */
+static errno_t hbac_ruleset_find(struct hbac_ruleset *ruleset,
+                                 struct hbac_ruleset_match *matches,
+                                 size_t limit,
+                                 struct hbac_rule **_rule)
+{
+    struct hbac_ruleset_match *driver;
+    size_t *candidates;
+    size_t num_candidates;
+    size_t i;
+    int el;
+
+    *_rule = NULL;
+
+    driver = &matches[0];
+    for (el = 1; el < HBAC_RULESET_ELEMENTS; el++) {
+        if (matches[el].num_candidates < driver->num_candidates) {
+            driver = &matches[el];
+        }
+    }
+
+    if (driver->num_candidates == 0) {
+        return EOK;
+    }
+
+    candidates = malloc(driver->num_candidates * sizeof(size_t));
+    if (candidates == NULL) {
+        return ENOMEM;
+    }
+
+    el = driver - matches;
+    num_candidates = ruleset->index[el].num_all;
+    memcpy(candidates, ruleset->index[el].all,
+           num_candidates * sizeof(size_t));
+
+    for (i = 0; i < driver->num_entries; i++) {
+        memcpy(&candidates[num_candidates], driver->entries[i]->rules,
+               driver->entries[i]->num_rules * sizeof(size_t));
+        num_candidates += driver->entries[i]->num_rules;
+    }
+
+    qsort(candidates, num_candidates, sizeof(size_t), hbac_ruleset_compare);
+
+    for (i = 0; i < num_candidates && candidates[i] < limit; i++) {
+        if (i > 0 && candidates[i] == candidates[i - 1]) {
+            continue;
+        }
+
+        for (el = 0; el < HBAC_RULESET_ELEMENTS; el++) {
+            if (&matches[el] == driver) {
+                continue;
+            }
+
+            if (!hbac_ruleset_match_rule(ruleset, &matches[el], el,
+                                         candidates[i])) {
+                break;
+            }
+        }
+
+        if (el == HBAC_RULESET_ELEMENTS) {
+            *_rule = ruleset->rules[candidates[i]];
+            break;
+        }
+    }
+
+    free(candidates);
+    return EOK;
+}
+
+enum hbac_eval_result hbac_ruleset_evaluate(struct hbac_ruleset *ruleset,
+                                            struct hbac_eval_req *hbac_req,
+                                            struct hbac_info **info)
+{
+    struct hbac_ruleset_match matches[HBAC_RULESET_ELEMENTS];
+    struct hbac_rule *rule = NULL;
+    enum hbac_eval_result_int rule_result = HBAC_EVAL_UNMATCHED;
+    enum hbac_eval_result result;
+    enum hbac_error_code code;
+    size_t limit;
+    size_t i;
+    int el;
+    errno_t ret;
+
+    HBAC_DEBUG(HBAC_DBG_INFO, "[< hbac_ruleset_evaluate()\n");
+    hbac_req_debug_print(hbac_req);
+
+    if (info) {
+        *info = malloc(sizeof(struct hbac_info));
+        if (!*info) {
+            HBAC_DEBUG(HBAC_DBG_ERROR, "Out of memory.\n");
+            return HBAC_EVAL_OOM;
+        }
+        (*info)->code = HBAC_ERROR_UNKNOWN;
+        (*info)->rule_name = NULL;
+    }
+
+    /* Only rules before limit are looked up in the index. */
+    limit = ruleset->num_rules;
+
+    memset(matches, 0, sizeof(matches));
+    for (el = 0; el < HBAC_RULESET_ELEMENTS; el++) {
+        ret = hbac_ruleset_match_init(ruleset, hbac_req, el, &matches[el],
+                                      &limit);
+        if (ret != EOK) {
+            goto done;
+        }
+    }
+
+    ret = hbac_ruleset_find(ruleset, matches, limit, &rule);
+    if (ret != EOK) {
+        goto done;
+    }
+
+    if (rule != NULL) {
+        rule_result = HBAC_EVAL_MATCHED;
+        code = HBAC_SUCCESS;
+    } else {
+        /* No indexed rule matched, evaluate the rest as hbac_evaluate()
+         * does. */
+        for (i = limit; ruleset->rules[i] != NULL; i++) {
+            rule_result = hbac_evaluate_rule(ruleset->rules[i], hbac_req,
+                                             &code);
+            if (rule_result != HBAC_EVAL_UNMATCHED) {
+                rule = ruleset->rules[i];
+                break;
+            }
+        }
+    }
+
+done:
+    for (el = 0; el < HBAC_RULESET_ELEMENTS; el++) {
+        free(matches[el].entries);
+    }
+
+    if (ret != EOK) {
+        HBAC_DEBUG(HBAC_DBG_ERROR, "Out of memory.\n");
+        result = HBAC_EVAL_ERROR;
+        code = HBAC_ERROR_OUT_OF_MEMORY;
+    } else if (rule_result == HBAC_EVAL_MATCHED) {
+        HBAC_DEBUG(HBAC_DBG_INFO, "ALLOWED by rule [%s].\n", rule->name);
+        result = HBAC_EVAL_ALLOW;
+        code = HBAC_SUCCESS;
+    } else if (rule_result == HBAC_EVAL_MATCH_ERROR) {
+        HBAC_DEBUG(HBAC_DBG_ERROR,
+                   "Error %d occurred during evaluating of rule [%s].\n",
+                   code, rule->name);
+        result = HBAC_EVAL_ERROR;
+    } else {
+        result = HBAC_EVAL_DENY;
+        code = HBAC_ERROR_UNKNOWN;
+    }
+
+    if (info) {
+        (*info)->code = code;
+        if (rule != NULL) {
+            (*info)->rule_name = strdup(rule->name);
+            if (!(*info)->rule_name && result == HBAC_EVAL_ALLOW) {
+                HBAC_DEBUG(HBAC_DBG_ERROR, "Out of memory.\n");
+                result = HBAC_EVAL_ERROR;
+                (*info)->code = HBAC_ERROR_OUT_OF_MEMORY;
+            }
+        }
+    }
+
+    HBAC_DEBUG(HBAC_DBG_INFO, "hbac_ruleset_evaluate() >]\n");
+    return result;
+}
+
 const char *hbac_result_string(enum hbac_eval_result result)
 {
     switch (result) {
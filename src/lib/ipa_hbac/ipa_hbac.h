@@ -338,6 +338,66 @@ void hbac_free_info(struct hbac_info *info);
  */
 bool hbac_rule_is_complete(struct hbac_rule *rule, uint32_t *missing_attrs);
 
+/**
+ * Compiled form of a list of HBAC rules
+ *
+ * The structure is opaque, it is created by #hbac_ruleset_compile and
+ * freed by #hbac_ruleset_free.
+ */
+struct hbac_ruleset;
+
+/**
+ * @brief Compile a list of HBAC rules for repeated evaluation
+ *
+ * Names and groups of all rule elements are indexed so the cost of
+ * #hbac_ruleset_evaluate depends on the number of rules that may match
+ * the request rather than on the total number of rules.
+ *
+ * @param[in] rules     A NULL-terminated list of rules to compile
+ * @param[out] ruleset  The compiled rule set
+ *
+ * @return
+ *  - #HBAC_SUCCESS:             The rules were compiled
+ *  - #HBAC_ERROR_OUT_OF_MEMORY: Insufficient memory to compile the rules
+ *
+ * Rules that can not be parsed, because some elements are missing or names
+ * are not valid, do not make the compilation fail. Evaluation of the rule
+ * set then fails with #HBAC_ERROR_UNPARSEABLE_RULE and the name of the rule
+ * as #hbac_evaluate does.
+ *
+ * @note The rules are not copied. They must not be modified or freed until
+ * the rule set is freed with #hbac_ruleset_free.
+ */
+enum hbac_error_code hbac_ruleset_compile(struct hbac_rule **rules,
+                                          struct hbac_ruleset **ruleset);
+
+/**
+ * @brief Evaluate an authorization request against a compiled rule set
+ *
+ * The result is the same as the result of #hbac_evaluate called with the
+ * rules the set was compiled from. The rule set is not modified so it can
+ * be used by several threads at the same time.
+ *
+ * @param[in] ruleset  A rule set created by #hbac_ruleset_compile
+ * @param[in] hbac_req A user authorization request
+ * @param[out] info    Extended information (including the name of the
+ *                     rule that allowed access (or caused a parse error)
+ * @return
+ *  - #HBAC_EVAL_ERROR: An error occurred
+ *  - #HBAC_EVAL_ALLOW: Access is granted
+ *  - #HBAC_EVAL_DENY:  Access is denied
+ *  - #HBAC_EVAL_OOM:   Insufficient memory to complete the evaluation
+ */
+enum hbac_eval_result hbac_ruleset_evaluate(struct hbac_ruleset *ruleset,
+                                            struct hbac_eval_req *hbac_req,
+                                            struct hbac_info **info);
+
+/**
+ * @brief Free a rule set created by #hbac_ruleset_compile
+ * @param ruleset The rule set to free, may be NULL
+ */
+void hbac_ruleset_free(struct hbac_ruleset *ruleset);
+
 /**
  * @}
  */
@@ -487,7 +487,9 @@ errno_t ipa_hbac_evaluate_rules(struct be_ctx *be_ctx,
     TALLOC_CTX *tmp_ctx;
     struct hbac_ctx hbac_ctx;
     struct hbac_rule **hbac_rules;
+    struct hbac_ruleset *ruleset = NULL;
     struct hbac_eval_req *eval_req;
+    enum hbac_error_code code;
     enum hbac_eval_result result;
     struct hbac_info *info = NULL;
     const char **attrs_get_cached_rules;
@@ -532,7 +534,17 @@ errno_t ipa_hbac_evaluate_rules(struct be_ctx *be_ctx,
 
     hbac_enable_debug(hbac_debug_messages);
 
-    result = hbac_evaluate(hbac_rules, eval_req, &info);
+    /* Users from trusted domains may be members of hundreds of groups,
+     * compiling the rules avoids comparing each group with each rule. */
+    code = hbac_ruleset_compile(hbac_rules, &ruleset);
+    if (code != HBAC_SUCCESS) {
+        DEBUG(SSSDBG_CRIT_FAILURE, "Could not compile HBAC rules [%s]\n",
+              hbac_error_string(code));
+        ret = code == HBAC_ERROR_OUT_OF_MEMORY ? ENOMEM : EIO;
+        goto done;
+    }
+
+    result = hbac_ruleset_evaluate(ruleset, eval_req, &info);
     if (result == HBAC_EVAL_ALLOW) {
         DEBUG(SSSDBG_MINOR_FAILURE, "Access granted by HBAC rule [%s]\n",
               info->rule_name);
@@ -554,6 +566,7 @@ errno_t ipa_hbac_evaluate_rules(struct be_ctx *be_ctx,
 
 done:
     hbac_free_info(info);
+    hbac_ruleset_free(ruleset);
     talloc_free(tmp_ctx);
     return ret;
 }
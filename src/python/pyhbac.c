@@ -1548,38 +1548,37 @@ free_hbac_rule_list(struct hbac_rule **rules)
 static void
 free_hbac_eval_req(struct hbac_eval_req *req);
 
-static PyObject *
-py_hbac_evaluate(HbacRequest *self, PyObject *args)
+static struct hbac_rule **
+HbacRuleList_to_native(PyObject *py_rules_list)
 {
-    PyObject *py_rules_list = NULL;
     PyObject *py_rule = NULL;
     Py_ssize_t num_rules;
     struct hbac_rule **rules = NULL;
-    struct hbac_eval_req *hbac_req = NULL;
-    enum hbac_eval_result eres;
-    struct hbac_info *info = NULL;
-    PyObject *ret = NULL;
-    long i;
-
-    if (!PyArg_ParseTuple(args, sss_py_const_p(char, "O"), &py_rules_list)) {
-        goto fail;
-    }
+    Py_ssize_t i;
 
     if (!PySequence_Check(py_rules_list)) {
         PyErr_Format(PyExc_TypeError,
                      "The parameter rules must be a sequence\n");
-        goto fail;
+        return NULL;
     }
 
     num_rules = PySequence_Size(py_rules_list);
+    if (num_rules == -1) {
+        return NULL;
+    }
+
     rules = PyMem_New(struct hbac_rule *, num_rules+1);
     if (!rules) {
         PyErr_NoMemory();
-        goto fail;
+        return NULL;
     }
+    rules[0] = NULL;
 
     for (i=0; i < num_rules; i++) {
         py_rule = PySequence_GetItem(py_rules_list, i);
+        if (py_rule == NULL) {
+            goto fail;
+        }
 
         if (!PyObject_IsInstance(py_rule,
                                  (PyObject *) &pyhbac_hbacrule_type)) {
@@ -1597,52 +1596,87 @@ py_hbac_evaluate(HbacRequest *self, PyObject *args)
             }
             goto fail;
         }
-    }
-    rules[num_rules] = NULL;
+        rules[i+1] = NULL;
 
-    hbac_req = HbacRequest_to_native(self);
-    if (!hbac_req) {
-        if (!PyErr_Occurred()) {
-            PyErr_Format(PyExc_IOError,
-                         "Could not convert HbacRequest to native type\n");
-        }
-        goto fail;
+        Py_CLEAR(py_rule);
     }
 
+    return rules;
+
+fail:
+    Py_XDECREF(py_rule);
+    free_hbac_rule_list(rules);
+    return NULL;
+}
+
+/* Store the result of evaluation in the request the same way evaluate()
+ * does and return it as a Python integer. */
+static PyObject *
+HbacRequest_set_result(HbacRequest *self,
+                       enum hbac_eval_result eres,
+                       struct hbac_info *info)
+{
     Py_XDECREF(self->rule_name);
     self->rule_name = NULL;
 
-    eres = hbac_evaluate(rules, hbac_req, &info);
     switch (eres) {
     case HBAC_EVAL_ALLOW:
         self->rule_name = PyUnicode_FromString(info->rule_name);
         if (!self->rule_name) {
             PyErr_NoMemory();
-            goto fail;
+            return NULL;
         }
         /* FALLTHROUGH */
         SSS_ATTRIBUTE_FALLTHROUGH;
     case HBAC_EVAL_DENY:
-        ret = PYNUMBER_FROMLONG(eres);
-        break;
+        return PYNUMBER_FROMLONG(eres);
     case HBAC_EVAL_ERROR:
         set_hbac_exception(PyExc_HbacError, info);
-        goto fail;
+        return NULL;
     case HBAC_EVAL_OOM:
-        PyErr_NoMemory();
+        break;
+    }
+
+    PyErr_NoMemory();
+    return NULL;
+}
+
+static PyObject *
+py_hbac_evaluate(HbacRequest *self, PyObject *args)
+{
+    PyObject *py_rules_list = NULL;
+    struct hbac_rule **rules = NULL;
+    struct hbac_eval_req *hbac_req = NULL;
+    enum hbac_eval_result eres;
+    struct hbac_info *info = NULL;
+    PyObject *ret = NULL;
+
+    if (!PyArg_ParseTuple(args, sss_py_const_p(char, "O"), &py_rules_list)) {
         goto fail;
     }
 
-    free_hbac_eval_req(hbac_req);
-    free_hbac_rule_list(rules);
-    hbac_free_info(info);
-    return ret;
+    rules = HbacRuleList_to_native(py_rules_list);
+    if (!rules) {
+        goto fail;
+    }
+
+    hbac_req = HbacRequest_to_native(self);
+    if (!hbac_req) {
+        if (!PyErr_Occurred()) {
+            PyErr_Format(PyExc_IOError,
+                         "Could not convert HbacRequest to native type\n");
+        }
+        goto fail;
+    }
+
+    eres = hbac_evaluate(rules, hbac_req, &info);
+    ret = HbacRequest_set_result(self, eres, info);
 
 fail:
     hbac_free_info(info);
     free_hbac_eval_req(hbac_req);
     free_hbac_rule_list(rules);
-    return NULL;
+    return ret;
 }
 
 static PyObject *
@@ -1838,6 +1872,283 @@ fail:
     return NULL;
 }
 
+/* ==================== HBAC Rule Set ========================*/
+typedef struct {
+    PyObject_HEAD
+
+    /* NULL terminated list of enabled rules and their compiled form. They
+     * are never modified after the object is created so they can be read
+     * without holding the GIL. */
+    struct hbac_rule **rules;
+    Py_ssize_t num_rules;
+    struct hbac_ruleset *ruleset;
+} HbacRuleSet;
+
+static PyObject *
+HbacRuleSet_new(PyTypeObject *type, PyObject *args, PyObject *kwargs)
+{
+    const char * const kwlist[] = { "rules", NULL };
+    PyObject *py_rules_list = NULL;
+    struct hbac_rule **rules;
+    struct hbac_ruleset *ruleset;
+    enum hbac_error_code code;
+    HbacRuleSet *self;
+    Py_ssize_t i, j;
+
+    if (!PyArg_ParseTupleAndKeywords(args, kwargs,
+                                     sss_py_const_p(char, "O"),
+                                     discard_const_p(char *, kwlist),
+                                     &py_rules_list)) {
+        return NULL;
+    }
+
+    rules = HbacRuleList_to_native(py_rules_list);
+    if (rules == NULL) {
+        return NULL;
+    }
+
+    /* Disabled rules never match, there is no need to walk them on
+     * every evaluation. */
+    for (i = 0, j = 0; rules[i]; i++) {
+        if (!rules[i]->enabled) {
+            free_hbac_rule(rules[i]);
+            continue;
+        }
+
+        rules[j] = rules[i];
+        j++;
+    }
+    rules[j] = NULL;
+
+    code = hbac_ruleset_compile(rules, &ruleset);
+    if (code != HBAC_SUCCESS) {
+        free_hbac_rule_list(rules);
+        PyErr_NoMemory();
+        return NULL;
+    }
+
+    self = (HbacRuleSet *) type->tp_alloc(type, 0);
+    if (self == NULL) {
+        hbac_ruleset_free(ruleset);
+        free_hbac_rule_list(rules);
+        PyErr_NoMemory();
+        return NULL;
+    }
+
+    self->rules = rules;
+    self->num_rules = j;
+    self->ruleset = ruleset;
+
+    return (PyObject *) self;
+}
+
+static void
+HbacRuleSet_dealloc(HbacRuleSet *self)
+{
+    hbac_ruleset_free(self->ruleset);
+    free_hbac_rule_list(self->rules);
+    Py_TYPE(self)->tp_free((PyObject*) self);
+}
+
+static Py_ssize_t
+HbacRuleSet_length(HbacRuleSet *self)
+{
+    return self->num_rules;
+}
+
+static PyObject *
+HbacRuleSet_repr(HbacRuleSet *self)
+{
+    return PyUnicode_FromFormat("<HbacRuleSet with %zd enabled rules>",
+                                self->num_rules);
+}
+
+static struct hbac_eval_req *
+HbacRuleSet_request_to_native(PyObject *py_req)
+{
+    struct hbac_eval_req *hbac_req;
+
+    if (!PyObject_IsInstance(py_req, (PyObject *) &pyhbac_hbacrequest_type)) {
+        PyErr_Format(PyExc_TypeError,
+                     "A request must be of type HbacRequest\n");
+        return NULL;
+    }
+
+    hbac_req = HbacRequest_to_native((HbacRequest *) py_req);
+    if (hbac_req == NULL && !PyErr_Occurred()) {
+        PyErr_Format(PyExc_IOError,
+                     "Could not convert HbacRequest to native type\n");
+    }
+
+    return hbac_req;
+}
+
+PyDoc_STRVAR(py_hbac_rule_set_evaluate__doc__,
+"evaluate(request) -> int\n\n"
+"Evaluate a single HbacRequest against the rule set.\n"
+"The return value and the rule_name attribute of the request are set\n"
+"the same way as with HbacRequest.evaluate(). The GIL is released while\n"
+"the rules are evaluated.\n");
+
+static PyObject *
+py_hbac_rule_set_evaluate(HbacRuleSet *self, PyObject *args)
+{
+    PyObject *py_req = NULL;
+    struct hbac_eval_req *hbac_req = NULL;
+    enum hbac_eval_result eres;
+    struct hbac_info *info = NULL;
+    PyObject *ret;
+
+    if (!PyArg_ParseTuple(args, sss_py_const_p(char, "O"), &py_req)) {
+        return NULL;
+    }
+
+    hbac_req = HbacRuleSet_request_to_native(py_req);
+    if (hbac_req == NULL) {
+        return NULL;
+    }
+
+    Py_BEGIN_ALLOW_THREADS
+    eres = hbac_ruleset_evaluate(self->ruleset, hbac_req, &info);
+    Py_END_ALLOW_THREADS
+
+    ret = HbacRequest_set_result((HbacRequest *) py_req, eres, info);
+
+    hbac_free_info(info);
+    free_hbac_eval_req(hbac_req);
+    return ret;
+}
+
+PyDoc_STRVAR(py_hbac_rule_set_evaluate_many__doc__,
+"evaluate_many(requests) -> list of int\n\n"
+"Evaluate a sequence of HbacRequest objects against the rule set.\n"
+"All requests are converted first and then evaluated with the GIL\n"
+"released. The returned list contains one HBAC_EVAL_* value for each\n"
+"request and the rule_name attribute of every request is set as with\n"
+"HbacRequest.evaluate(). If evaluation of any request fails, HbacError\n"
+"is raised for the first failed request. The results of the requests\n"
+"before it are already set on those requests when the error is raised.\n");
+
+static PyObject *
+py_hbac_rule_set_evaluate_many(HbacRuleSet *self, PyObject *args)
+{
+    PyObject *py_reqs_list = NULL;
+    PyObject *py_reqs = NULL;
+    PyObject *py_result;
+    struct hbac_eval_req **hbac_reqs = NULL;
+    enum hbac_eval_result *eres = NULL;
+    struct hbac_info **infos = NULL;
+    PyObject *ret = NULL;
+    Py_ssize_t num_reqs = 0;
+    Py_ssize_t i;
+
+    if (!PyArg_ParseTuple(args, sss_py_const_p(char, "O"), &py_reqs_list)) {
+        return NULL;
+    }
+
+    /* Work on a private copy so the requests stay referenced even if the
+     * caller's list is modified while the GIL is released. */
+    py_reqs = PySequence_Tuple(py_reqs_list);
+    if (py_reqs == NULL) {
+        return NULL;
+    }
+
+    num_reqs = PyTuple_GET_SIZE(py_reqs);
+    hbac_reqs = PyMem_New(struct hbac_eval_req *, num_reqs + 1);
+    eres = PyMem_New(enum hbac_eval_result, num_reqs + 1);
+    infos = PyMem_New(struct hbac_info *, num_reqs + 1);
+    if (hbac_reqs == NULL || eres == NULL || infos == NULL) {
+        PyErr_NoMemory();
+        num_reqs = 0;
+        goto done;
+    }
+
+    for (i = 0; i < num_reqs; i++) {
+        hbac_reqs[i] = NULL;
+        infos[i] = NULL;
+    }
+
+    for (i = 0; i < num_reqs; i++) {
+        hbac_reqs[i] = HbacRuleSet_request_to_native(
+                                PyTuple_GET_ITEM(py_reqs, i));
+        if (hbac_reqs[i] == NULL) {
+            goto done;
+        }
+    }
+
+    Py_BEGIN_ALLOW_THREADS
+    for (i = 0; i < num_reqs; i++) {
+        eres[i] = hbac_ruleset_evaluate(self->ruleset, hbac_reqs[i],
+                                        &infos[i]);
+    }
+    Py_END_ALLOW_THREADS
+
+    ret = PyList_New(num_reqs);
+    if (ret == NULL) {
+        goto done;
+    }
+
+    for (i = 0; i < num_reqs; i++) {
+        py_result = HbacRequest_set_result(
+                            (HbacRequest *) PyTuple_GET_ITEM(py_reqs, i),
+                            eres[i], infos[i]);
+        if (py_result == NULL) {
+            Py_CLEAR(ret);
+            goto done;
+        }
+
+        PyList_SET_ITEM(ret, i, py_result);
+    }
+
+done:
+    for (i = 0; i < num_reqs; i++) {
+        hbac_free_info(infos[i]);
+        free_hbac_eval_req(hbac_reqs[i]);
+    }
+    PyMem_Free(hbac_reqs);
+    PyMem_Free(eres);
+    PyMem_Free(infos);
+    Py_DECREF(py_reqs);
+    return ret;
+}
+
+static PyMethodDef py_hbac_rule_set_methods[] = {
+    { sss_py_const_p(char, "evaluate"),
+      (PyCFunction) py_hbac_rule_set_evaluate,
+      METH_VARARGS, py_hbac_rule_set_evaluate__doc__
+    },
+    { sss_py_const_p(char, "evaluate_many"),
+      (PyCFunction) py_hbac_rule_set_evaluate_many,
+      METH_VARARGS, py_hbac_rule_set_evaluate_many__doc__
+    },
+    { NULL, NULL, 0, NULL }        /* Sentinel */
+};
+
+static PySequenceMethods py_hbac_rule_set_sequence = {
+    .sq_length = (lenfunc) HbacRuleSet_length,
+};
+
+PyDoc_STRVAR(HbacRuleSet__doc__,
+"IPA HBAC Rule Set\n\n"
+"HbacRuleSet(rules) -> convert and index a sequence of HbacRule objects\n"
+"once so they can be used to evaluate many requests. Only rules that may\n"
+"match a request are evaluated. The rules are copied when the set is\n"
+"created, later changes of the HbacRule objects do not affect the set.\n"
+"Disabled rules are left out, len() returns the number of enabled rules.\n");
+
+static PyTypeObject pyhbac_hbacruleset_type = {
+    PyVarObject_HEAD_INIT(NULL, 0)
+    .tp_name = sss_py_const_p(char, "pyhbac.HbacRuleSet"),
+    .tp_basicsize = sizeof(HbacRuleSet),
+    .tp_new = HbacRuleSet_new,
+    .tp_dealloc = (destructor) HbacRuleSet_dealloc,
+    .tp_repr = (reprfunc) HbacRuleSet_repr,
+    .tp_as_sequence = &py_hbac_rule_set_sequence,
+    .tp_methods = py_hbac_rule_set_methods,
+    .tp_flags = Py_TPFLAGS_DEFAULT,
+    .tp_doc   = HbacRuleSet__doc__
+};
+
 /* =================== the pyhbac module initialization =====================*/
 PyDoc_STRVAR(py_hbac_result_string__doc__,
 "hbac_result_string(code) -> string\n"
@@ -2023,6 +2334,7 @@ initpyhbac(void)
     TYPE_READY(m, pyhbac_hbacrule_element_type, "HbacRuleElement");
     TYPE_READY(m, pyhbac_hbacrequest_element_type, "HbacRequestElement");
     TYPE_READY(m, pyhbac_hbacrequest_type, "HbacRequest");
+    TYPE_READY(m, pyhbac_hbacruleset_type, "HbacRuleSet");
 
 #ifdef IS_PY3K
     return m;
@@ -26,6 +26,8 @@
 #include <talloc.h>
 #include <pwd.h>
 #include <grp.h>
+#include <time.h>
+#include <unistd.h>
 
 #include "util/util.h"
 #include "util/sss_python.h"
@@ -215,85 +217,436 @@ static PyTypeObject pysss_password_type = {
 };
 
 /*
- * Get list of groups user belongs to
+ * Group names resolved by getgrouplist(), maps gid to tuple (name, time the
+ * name was resolved). Only accessed with the GIL held. Expired names are
+ * dropped when they are looked up and when the cache is full.
  */
-PyDoc_STRVAR(py_sss_getgrouplist__doc__,
-    "Get list of groups user belongs to.\n\n"
-    "NOTE: The interface uses the system NSS calls and is not limited to "
-    "users served by the SSSD!\n"
-    ":param username: name of user to get list for\n");
+#define GROUP_CACHE_MAX_SIZE 4096
 
-static PyObject *py_sss_getgrouplist(PyObject *self, PyObject *args)
+static PyObject *group_cache = NULL;
+static double group_cache_ttl = 0;
+static Py_ssize_t group_cache_max_size = GROUP_CACHE_MAX_SIZE;
+
+static double monotonic_time(void)
 {
-    char *username = NULL;
+    struct timespec ts;
+
+    clock_gettime(CLOCK_MONOTONIC, &ts);
+
+    return ts.tv_sec + ts.tv_nsec / 1e9;
+}
+
+static size_t nss_buffer_size(int name)
+{
+    long size;
+
+    size = sysconf(name);
+    if (size <= 0) {
+        size = 1024;
+    }
+
+    return size;
+}
+
+/*
+ * Get the IDs of all groups the user belongs to. Uses only reentrant NSS
+ * calls so it can be called without holding the GIL.
+ */
+static int get_user_groups(const char *username,
+                           gid_t **_groups, int *_ngroups)
+{
+    struct passwd pwd;
+    struct passwd *pw = NULL;
     gid_t *groups = NULL;
-    struct passwd *pw;
-    struct group *gr;
+    gid_t *tmp_groups;
+    char *buf = NULL;
+    char *tmp_buf;
+    size_t buflen;
+    gid_t gid;
     int ngroups;
     int ret;
-    Py_ssize_t i, idx;
-    PyObject *groups_tuple;
 
-    if(!PyArg_ParseTuple(args, discard_const_p(char, "s"), &username)) {
-        goto fail;
+    buflen = nss_buffer_size(_SC_GETPW_R_SIZE_MAX);
+    do {
+        tmp_buf = realloc(buf, buflen);
+        if (tmp_buf == NULL) {
+            ret = ENOMEM;
+            goto done;
+        }
+        buf = tmp_buf;
+
+        ret = getpwnam_r(username, &pwd, buf, buflen, &pw);
+        buflen *= 2;
+    } while (ret == ERANGE);
+
+    if (ret != 0) {
+        goto done;
     }
 
-    pw = getpwnam(username);
     if (pw == NULL) {
-        goto fail;
+        ret = ENOENT;
+        goto done;
     }
+    gid = pw->pw_gid;
 
     ngroups = 32;
     groups = malloc(sizeof(gid_t) * ngroups);
     if (groups == NULL) {
-        goto fail;
+        ret = ENOMEM;
+        goto done;
     }
 
     do {
-        ret = getgrouplist(username, pw->pw_gid, groups, &ngroups);
+        ret = getgrouplist(username, gid, groups, &ngroups);
         if (ret < ngroups) {
-            gid_t *tmp_groups = realloc(groups, ngroups * sizeof(gid_t));
+            tmp_groups = realloc(groups, ngroups * sizeof(gid_t));
             if (tmp_groups == NULL) {
-                goto fail;
+                ret = ENOMEM;
+                goto done;
             }
             groups = tmp_groups;
         }
     } while (ret != ngroups);
 
+    *_groups = groups;
+    groups = NULL;
+    *_ngroups = ngroups;
+    ret = 0;
+
+done:
+    free(groups);
+    free(buf);
+    return ret;
+}
+
+/*
+ * Resolve the names of the groups which are not in the cache. Names of
+ * groups which can not be resolved are left NULL. Can be called without
+ * holding the GIL.
+ */
+static int get_group_names(const gid_t *groups, const bool *resolve,
+                           int ngroups, char **names)
+{
+    struct group grp;
+    struct group *gr;
+    char *buf = NULL;
+    char *tmp_buf;
+    size_t buflen;
+    int ret;
+    int i;
+
+    buflen = nss_buffer_size(_SC_GETGR_R_SIZE_MAX);
+    buf = malloc(buflen);
+    if (buf == NULL) {
+        return ENOMEM;
+    }
+
+    for (i = 0; i < ngroups; i++) {
+        if (!resolve[i]) {
+            continue;
+        }
+
+        while ((ret = getgrgid_r(groups[i], &grp, buf, buflen, &gr))
+                == ERANGE) {
+            tmp_buf = realloc(buf, buflen * 2);
+            if (tmp_buf == NULL) {
+                ret = ENOMEM;
+                goto done;
+            }
+            buf = tmp_buf;
+            buflen *= 2;
+        }
+
+        if (ret != 0 || gr == NULL) {
+            continue;
+        }
+
+        names[i] = strdup(gr->gr_name);
+        if (names[i] == NULL) {
+            ret = ENOMEM;
+            goto done;
+        }
+    }
+
+    ret = 0;
+
+done:
+    free(buf);
+    return ret;
+}
+
+static PyObject *group_cache_get(gid_t gid, double ttl, double now)
+{
+    PyObject *key;
+    PyObject *entry;
+    PyObject *name = NULL;
+
+    if (ttl <= 0 || group_cache == NULL) {
+        return NULL;
+    }
+
+    key = PyLong_FromUnsignedLong(gid);
+    if (key == NULL) {
+        PyErr_Clear();
+        return NULL;
+    }
+
+    entry = PyDict_GetItem(group_cache, key);
+    if (entry != NULL) {
+        if (now - PyFloat_AsDouble(PyTuple_GET_ITEM(entry, 1)) < ttl) {
+            name = PyTuple_GET_ITEM(entry, 0);
+            Py_INCREF(name);
+        } else if (PyDict_DelItem(group_cache, key) != 0) {
+            PyErr_Clear();
+        }
+    }
+
+    Py_DECREF(key);
+    return name;
+}
+
+/*
+ * Make room for a new name, drop expired names first and all names if
+ * none has expired.
+ */
+static void group_cache_prune(double ttl, double now)
+{
+    PyObject *expired;
+    PyObject *key;
+    PyObject *entry;
+    Py_ssize_t pos = 0;
+    Py_ssize_t i;
+
+    expired = PyList_New(0);
+    if (expired == NULL) {
+        PyErr_Clear();
+        PyDict_Clear(group_cache);
+        return;
+    }
+
+    /* The dictionary must not change while it is iterated. */
+    while (PyDict_Next(group_cache, &pos, &key, &entry)) {
+        if (now - PyFloat_AsDouble(PyTuple_GET_ITEM(entry, 1)) >= ttl
+                && PyList_Append(expired, key) != 0) {
+            PyErr_Clear();
+            break;
+        }
+    }
+
+    for (i = 0; i < PyList_GET_SIZE(expired); i++) {
+        if (PyDict_DelItem(group_cache, PyList_GET_ITEM(expired, i)) != 0) {
+            PyErr_Clear();
+        }
+    }
+
+    Py_DECREF(expired);
+
+    if (PyDict_Size(group_cache) >= group_cache_max_size) {
+        PyDict_Clear(group_cache);
+    }
+}
+
+static void group_cache_set(gid_t gid, PyObject *name, double ttl, double now)
+{
+    PyObject *key;
+    PyObject *entry;
+
+    if (group_cache == NULL) {
+        group_cache = PyDict_New();
+        if (group_cache == NULL) {
+            PyErr_Clear();
+            return;
+        }
+    }
+
+    key = PyLong_FromUnsignedLong(gid);
+    if (key != NULL && PyDict_Size(group_cache) >= group_cache_max_size
+            && PyDict_GetItem(group_cache, key) == NULL) {
+        group_cache_prune(ttl, now);
+    }
+
+    entry = Py_BuildValue(discard_const_p(char, "(Od)"), name, now);
+    if (key == NULL || entry == NULL || PyDict_SetItem(group_cache, key,
+                                                       entry) != 0) {
+        /* Failing to cache the name is not an error */
+        PyErr_Clear();
+    }
+
+    Py_XDECREF(key);
+    Py_XDECREF(entry);
+}
+
+/*
+ * Get list of groups user belongs to
+ */
+PyDoc_STRVAR(py_sss_getgrouplist__doc__,
+    "Get list of groups user belongs to.\n\n"
+    "NOTE: The interface uses the system NSS calls and is not limited to "
+    "users served by the SSSD!\n"
+    "The NSS calls are made without holding the global interpreter lock so "
+    "other threads can run in the meantime.\n"
+    ":param username: name of user to get list for\n"
+    ":param cache_ttl: group names resolved less than cache_ttl seconds ago "
+    "are reused, defaults to the value set with set_group_cache_ttl()\n");
+
+static PyObject *py_sss_getgrouplist(PyObject *self, PyObject *args)
+{
+    char *username = NULL;
+    double ttl = group_cache_ttl;
+    double now;
+    gid_t *groups = NULL;
+    bool *resolve = NULL;
+    char **names = NULL;
+    PyObject **py_names = NULL;
+    int ngroups = 0;
+    int ret;
+    Py_ssize_t i, idx;
+    PyObject *groups_tuple = NULL;
+
+    if(!PyArg_ParseTuple(args, discard_const_p(char, "s|d"),
+                         &username, &ttl)) {
+        return NULL;
+    }
+
+    if (ttl < 0) {
+        PyErr_SetString(PyExc_ValueError, "cache_ttl must not be negative");
+        return NULL;
+    }
+
+    Py_BEGIN_ALLOW_THREADS
+    ret = get_user_groups(username, &groups, &ngroups);
+    Py_END_ALLOW_THREADS
+    if (ret == ENOENT) {
+        PyErr_Format(PyExc_KeyError, "user not found: %s", username);
+        goto done;
+    } else if (ret != 0) {
+        PyErr_SetSssError(ret);
+        goto done;
+    }
+
+    resolve = calloc(ngroups, sizeof(bool));
+    names = calloc(ngroups, sizeof(char *));
+    py_names = calloc(ngroups, sizeof(PyObject *));
+    if (ngroups > 0 && (resolve == NULL || names == NULL || py_names == NULL)) {
+        PyErr_NoMemory();
+        goto done;
+    }
+
+    now = monotonic_time();
+    for (i = 0; i < ngroups; i++) {
+        py_names[i] = group_cache_get(groups[i], ttl, now);
+        resolve[i] = (py_names[i] == NULL);
+    }
+
+    /* Resolve all remaining groups at once */
+    Py_BEGIN_ALLOW_THREADS
+    ret = get_group_names(groups, resolve, ngroups, names);
+    Py_END_ALLOW_THREADS
+    if (ret != 0) {
+        PyErr_SetSssError(ret);
+        goto done;
+    }
+
     groups_tuple = PyTuple_New((Py_ssize_t) ngroups);
     if (groups_tuple == NULL) {
-        goto fail;
+        goto done;
     }
 
     /* Populate a tuple with names of groups
      * In unlikely case of group not being able to resolve, skip it
      * We also need to resize resulting tuple to avoid empty elements there */
+    now = monotonic_time();
     idx = 0;
     for (i = 0; i < ngroups; i++) {
-        gr = getgrgid(groups[i]);
-        if (gr) {
-            PyTuple_SetItem(groups_tuple, idx,
+        if (py_names[i] == NULL && names[i] != NULL) {
 #ifdef IS_PY3K
-                    PyUnicode_FromString(gr->gr_name)
+            py_names[i] = PyUnicode_FromString(names[i]);
 #else
-                    PyString_FromString(gr->gr_name)
+            py_names[i] = PyString_FromString(names[i]);
 #endif
-                    );
+            if (py_names[i] == NULL) {
+                Py_CLEAR(groups_tuple);
+                goto done;
+            }
+
+            if (ttl > 0) {
+                group_cache_set(groups[i], py_names[i], ttl, now);
+            }
+        }
+
+        if (py_names[i] != NULL) {
+            PyTuple_SET_ITEM(groups_tuple, idx, py_names[i]);
+            py_names[i] = NULL;
             idx++;
         }
     }
-    free(groups);
-    groups = NULL;
 
     if (i != idx) {
         _PyTuple_Resize(&groups_tuple, idx);
     }
 
+done:
+    for (i = 0; i < ngroups; i++) {
+        if (py_names != NULL) {
+            Py_XDECREF(py_names[i]);
+        }
+        if (names != NULL) {
+            free(names[i]);
+        }
+    }
+    free(py_names);
+    free(names);
+    free(resolve);
+    free(groups);
     return groups_tuple;
+}
 
-fail:
-    free(groups);
-    return NULL;
+PyDoc_STRVAR(py_sss_set_group_cache_ttl__doc__,
+    "Set the default time in seconds group names resolved by getgrouplist() "
+    "are reused. The default is 0 which disables the cache, setting it to 0 "
+    "also drops all cached names. At most max_size names are kept, expired "
+    "names are dropped first when the cache is full.\n"
+    ":param cache_ttl: time in seconds\n"
+    ":param max_size: number of names kept, defaults to 4096\n");
+
+static PyObject *py_sss_set_group_cache_ttl(PyObject *self, PyObject *args)
+{
+    double ttl;
+    Py_ssize_t max_size = GROUP_CACHE_MAX_SIZE;
+
+    if(!PyArg_ParseTuple(args, discard_const_p(char, "d|n"),
+                         &ttl, &max_size)) {
+        return NULL;
+    }
+
+    if (ttl < 0) {
+        PyErr_SetString(PyExc_ValueError, "cache_ttl must not be negative");
+        return NULL;
+    }
+
+    if (max_size < 1) {
+        PyErr_SetString(PyExc_ValueError, "max_size must be positive");
+        return NULL;
+    }
+
+    group_cache_ttl = ttl;
+    group_cache_max_size = max_size;
+    if (ttl == 0 || (group_cache != NULL
+                     && PyDict_Size(group_cache) > max_size)) {
+        Py_CLEAR(group_cache);
+    }
+
+    Py_RETURN_NONE;
+}
+
+PyDoc_STRVAR(py_sss_clear_group_cache__doc__,
+    "Drop all group names cached by getgrouplist().\n");
+
+static PyObject *py_sss_clear_group_cache(PyObject *self, PyObject *args)
+{
+    Py_CLEAR(group_cache);
+
+    Py_RETURN_NONE;
 }
 
 /* ==================== the sss module initialization =======================*/
@@ -303,6 +656,10 @@ fail:
  */
 static PyMethodDef module_methods[] = {
         {"getgrouplist", py_sss_getgrouplist, METH_VARARGS, py_sss_getgrouplist__doc__},
+        {"set_group_cache_ttl", py_sss_set_group_cache_ttl, METH_VARARGS,
+         py_sss_set_group_cache_ttl__doc__},
+        {"clear_group_cache", py_sss_clear_group_cache, METH_NOARGS,
+         py_sss_clear_group_cache__doc__},
         {NULL, NULL, 0, NULL}  /* Sentinel */
 };
 
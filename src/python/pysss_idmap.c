@@ -0,0 +1,908 @@
+/*
+    Copyright (C) 2026 Red Hat
+
+    Python bindings for libsss_idmap
+
+    This program is free software; you can redistribute it and/or modify
+    it under the terms of the GNU General Public License as published by
+    the Free Software Foundation; either version 3 of the License, or
+    (at your option) any later version.
+
+    This program is distributed in the hope that it will be useful,
+    but WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+    GNU General Public License for more details.
+
+    You should have received a copy of the GNU General Public License
+    along with this program.  If not, see <http://www.gnu.org/licenses/>.
+*/
+
+#include "config.h"
+
+#define PY_SSIZE_T_CLEAN 1
+#include <Python.h>
+#include <ctype.h>
+
+#include "util/sss_python.h"
+#include "lib/idmap/sss_idmap.h"
+
+#define PYTHON_MODULE_NAME  "pysss_idmap"
+
+/* Defaults of the ldap_idmap_* options */
+#define DEFAULT_RANGE_MIN 200000
+#define DEFAULT_RANGE_MAX 2000200000
+#define DEFAULT_RANGE_SIZE 200000
+#define DEFAULT_HELPER_TABLE_SIZE 10
+
+static PyObject *PyExc_IdmapError;
+
+static void
+set_idmap_exception(enum idmap_error_code err)
+{
+    PyObject *obj;
+
+    obj = Py_BuildValue(sss_py_const_p(char, "(i,s)"), err,
+                        idmap_error_string(err));
+
+    PyErr_SetObject(PyExc_IdmapError, obj);
+    Py_XDECREF(obj);
+}
+
+/* Returns a new reference to a UTF-8 encoded bytes object or NULL with an
+ * exception set. */
+static PyObject *
+py_string_as_utf8(PyObject *obj, const char *what)
+{
+    if (PyUnicode_Check(obj)) {
+        return PyUnicode_AsUTF8String(obj);
+    }
+
+    if (PyBytes_Check(obj)) {
+        Py_INCREF(obj);
+        return obj;
+    }
+
+    PyErr_Format(PyExc_TypeError, "%s must be a string\n", what);
+    return NULL;
+}
+
+static int
+py_long_as_id(PyObject *obj, uint32_t *_id)
+{
+    long long id;
+
+    id = PyLong_AsLongLong(obj);
+    if (id == -1 && PyErr_Occurred()) {
+        return -1;
+    }
+
+    if (id < 0 || id > UINT32_MAX) {
+        PyErr_Format(PyExc_ValueError, "%lld is not a valid POSIX ID\n", id);
+        return -1;
+    }
+
+    *_id = (uint32_t) id;
+    return 0;
+}
+
+/* Errors that only say that the given value can not be mapped. The bulk
+ * functions return None for such values instead of raising IdmapError. */
+static bool
+is_unmappable(enum idmap_error_code err)
+{
+    switch (err) {
+    case IDMAP_NO_DOMAIN:
+    case IDMAP_SID_INVALID:
+    case IDMAP_SID_UNKNOWN:
+    case IDMAP_NO_RANGE:
+    case IDMAP_BUILTIN_SID:
+    case IDMAP_EXTERNAL:
+        return true;
+    default:
+        return false;
+    }
+}
+
+/* ==================== Idmap Context ========================*/
+typedef struct {
+    PyObject_HEAD
+
+    struct sss_idmap_ctx *ctx;
+} IdmapContext;
+
+static int
+IdmapContext_add_domain_native(IdmapContext *self,
+                               const char *name,
+                               const char *sid,
+                               id_t *_slice)
+{
+    struct sss_idmap_range range;
+    enum idmap_error_code err;
+    id_t upper;
+
+    err = sss_idmap_calculate_range(self->ctx, sid, _slice, &range);
+    if (err != IDMAP_SUCCESS) {
+        set_idmap_exception(err);
+        return -1;
+    }
+
+    err = sss_idmap_ctx_get_upper(self->ctx, &upper);
+    if (err != IDMAP_SUCCESS) {
+        set_idmap_exception(err);
+        return -1;
+    }
+
+    /* An explicitly selected slice is not checked by libsss_idmap */
+    if (range.max > upper) {
+        PyErr_Format(PyExc_ValueError,
+                     "Slice %lu exceeds the configured range_max\n",
+                     (unsigned long) *_slice);
+        return -1;
+    }
+
+    err = sss_idmap_add_auto_domain_ex(self->ctx, name, sid, &range, NULL, 0,
+                                       false, NULL, NULL);
+    if (err != IDMAP_SUCCESS) {
+        set_idmap_exception(err);
+        return -1;
+    }
+
+    return 0;
+}
+
+static PyObject *
+IdmapContext_new(PyTypeObject *type, PyObject *args, PyObject *kwargs)
+{
+    const char * const kwlist[] = { "range_min", "range_max", "range_size",
+                                    "autorid_compat", "helper_table_size",
+                                    "default_domain", "default_domain_sid",
+                                    NULL };
+    long long lower = DEFAULT_RANGE_MIN;
+    long long upper = DEFAULT_RANGE_MAX;
+    long long rangesize = DEFAULT_RANGE_SIZE;
+    int autorid = 0;
+    int helper_table_size = DEFAULT_HELPER_TABLE_SIZE;
+    const char *default_domain = NULL;
+    const char *default_domain_sid = NULL;
+    enum idmap_error_code err;
+    IdmapContext *self;
+    id_t slice;
+
+    if (!PyArg_ParseTupleAndKeywords(args, kwargs,
+                                     sss_py_const_p(char, "|LLLiizz"),
+                                     discard_const_p(char *, kwlist),
+                                     &lower, &upper, &rangesize, &autorid,
+                                     &helper_table_size, &default_domain,
+                                     &default_domain_sid)) {
+        return NULL;
+    }
+
+    /* Same checks as done for the ldap_idmap_* options by the providers */
+    if (lower < 0 || upper > UINT32_MAX || rangesize <= 0
+            || upper <= lower || (upper - lower) < rangesize
+            || helper_table_size < 0) {
+        PyErr_Format(PyExc_ValueError,
+                     "Invalid settings for range selection: "
+                     "[%lld][%lld][%lld]\n", lower, upper, rangesize);
+        return NULL;
+    }
+
+    self = (IdmapContext *) type->tp_alloc(type, 0);
+    if (self == NULL) {
+        PyErr_NoMemory();
+        return NULL;
+    }
+
+    err = sss_idmap_init(NULL, NULL, NULL, &self->ctx);
+    if (err != IDMAP_SUCCESS) {
+        set_idmap_exception(err);
+        goto fail;
+    }
+
+    err = sss_idmap_ctx_set_autorid(self->ctx, autorid ? true : false);
+    err |= sss_idmap_ctx_set_lower(self->ctx, lower);
+    err |= sss_idmap_ctx_set_upper(self->ctx, upper);
+    err |= sss_idmap_ctx_set_rangesize(self->ctx, rangesize);
+    err |= sss_idmap_ctx_set_extra_slice_init(self->ctx, helper_table_size);
+    if (err != IDMAP_SUCCESS) {
+        set_idmap_exception(IDMAP_CONTEXT_INVALID);
+        goto fail;
+    }
+
+    if (default_domain_sid != NULL) {
+        /* The default domain is always stored as slice 0 */
+        slice = 0;
+        if (IdmapContext_add_domain_native(self,
+                                           default_domain ? default_domain
+                                                          : default_domain_sid,
+                                           default_domain_sid,
+                                           &slice) != 0) {
+            goto fail;
+        }
+    }
+
+    return (PyObject *) self;
+
+fail:
+    Py_DECREF(self);
+    return NULL;
+}
+
+static void
+IdmapContext_dealloc(IdmapContext *self)
+{
+    if (self->ctx != NULL) {
+        sss_idmap_free(self->ctx);
+    }
+    Py_TYPE(self)->tp_free((PyObject*) self);
+}
+
+PyDoc_STRVAR(py_idmap_calculate_range__doc__,
+"calculate_range(sid, slice=-1) -> (slice, min, max)\n\n"
+"Calculate the range of POSIX IDs the domain with the given SID would get.\n"
+"If slice is -1 the slice number is calculated from the SID. The context\n"
+"is not modified.\n");
+
+static PyObject *
+py_idmap_calculate_range(IdmapContext *self, PyObject *args,
+                         PyObject *kwargs)
+{
+    const char * const kwlist[] = { "sid", "slice", NULL };
+    const char *sid;
+    long long slice_num = -1;
+    struct sss_idmap_range range;
+    enum idmap_error_code err;
+    id_t slice;
+
+    if (!PyArg_ParseTupleAndKeywords(args, kwargs,
+                                     sss_py_const_p(char, "s|L"),
+                                     discard_const_p(char *, kwlist),
+                                     &sid, &slice_num)) {
+        return NULL;
+    }
+
+    if (slice_num < -1 || slice_num > UINT32_MAX) {
+        PyErr_Format(PyExc_ValueError, "Invalid slice number\n");
+        return NULL;
+    }
+
+    slice = (id_t) slice_num;
+    err = sss_idmap_calculate_range(self->ctx, sid, &slice, &range);
+    if (err != IDMAP_SUCCESS) {
+        set_idmap_exception(err);
+        return NULL;
+    }
+
+    return Py_BuildValue(sss_py_const_p(char, "(kkk)"),
+                         (unsigned long) slice,
+                         (unsigned long) range.min,
+                         (unsigned long) range.max);
+}
+
+PyDoc_STRVAR(py_idmap_add_domain__doc__,
+"add_domain(name, sid, slice=-1) -> slice\n\n"
+"Add a domain with algorithmic mapping the same way the LDAP and AD\n"
+"providers do when ldap_id_mapping is enabled. If slice is -1 the slice\n"
+"number is calculated from the SID. Returns the slice number that was\n"
+"used. On error, IdmapError is raised.\n");
+
+static PyObject *
+py_idmap_add_domain(IdmapContext *self, PyObject *args, PyObject *kwargs)
+{
+    const char * const kwlist[] = { "name", "sid", "slice", NULL };
+    const char *name;
+    const char *sid;
+    long long slice_num = -1;
+    id_t slice;
+
+    if (!PyArg_ParseTupleAndKeywords(args, kwargs,
+                                     sss_py_const_p(char, "ss|L"),
+                                     discard_const_p(char *, kwlist),
+                                     &name, &sid, &slice_num)) {
+        return NULL;
+    }
+
+    if (slice_num < -1 || slice_num > UINT32_MAX) {
+        PyErr_Format(PyExc_ValueError, "Invalid slice number\n");
+        return NULL;
+    }
+
+    slice = (id_t) slice_num;
+    if (IdmapContext_add_domain_native(self, name, sid, &slice) != 0) {
+        return NULL;
+    }
+
+    return PyLong_FromUnsignedLong((unsigned long) slice);
+}
+
+PyDoc_STRVAR(py_idmap_add_range__doc__,
+"add_range(name, sid, min, max, range_id=None, first_rid=0, "
+"external=False)\n\n"
+"Add an explicit range of POSIX IDs for the domain, e.g. an IPA ID range.\n"
+"The RID first_rid is mapped to min. If external is True the domain is\n"
+"not mapped algorithmically and lookups of its SIDs and IDs fail with\n"
+"IDMAP_EXTERNAL. On error, IdmapError is raised.\n");
+
+static PyObject *
+py_idmap_add_range(IdmapContext *self, PyObject *args, PyObject *kwargs)
+{
+    const char * const kwlist[] = { "name", "sid", "min", "max", "range_id",
+                                    "first_rid", "external", NULL };
+    const char *name;
+    const char *sid;
+    long long min;
+    long long max;
+    const char *range_id = NULL;
+    long long first_rid = 0;
+    int external = 0;
+    struct sss_idmap_range range;
+    enum idmap_error_code err;
+
+    if (!PyArg_ParseTupleAndKeywords(args, kwargs,
+                                     sss_py_const_p(char, "ssLL|zLi"),
+                                     discard_const_p(char *, kwlist),
+                                     &name, &sid, &min, &max, &range_id,
+                                     &first_rid, &external)) {
+        return NULL;
+    }
+
+    if (min < 0 || max > UINT32_MAX || min > max
+            || first_rid < 0 || first_rid > UINT32_MAX) {
+        PyErr_Format(PyExc_ValueError, "Invalid range\n");
+        return NULL;
+    }
+
+    range.min = (uint32_t) min;
+    range.max = (uint32_t) max;
+
+    err = sss_idmap_add_domain_ex(self->ctx, name, sid, &range, range_id,
+                                  (uint32_t) first_rid,
+                                  external ? true : false);
+    if (err != IDMAP_SUCCESS) {
+        set_idmap_exception(err);
+        return NULL;
+    }
+
+    Py_RETURN_NONE;
+}
+
+PyDoc_STRVAR(py_idmap_sid_to_unix__doc__,
+"sid_to_unix(sid) -> int\n\n"
+"Map a SID to a POSIX ID. On error, IdmapError is raised.\n");
+
+static PyObject *
+py_idmap_sid_to_unix(IdmapContext *self, PyObject *args)
+{
+    const char *sid;
+    enum idmap_error_code err;
+    uint32_t id;
+
+    if (!PyArg_ParseTuple(args, sss_py_const_p(char, "s"), &sid)) {
+        return NULL;
+    }
+
+    err = sss_idmap_sid_to_unix(self->ctx, sid, &id);
+    if (err != IDMAP_SUCCESS) {
+        set_idmap_exception(err);
+        return NULL;
+    }
+
+    return PyLong_FromUnsignedLong((unsigned long) id);
+}
+
+PyDoc_STRVAR(py_idmap_unix_to_sid__doc__,
+"unix_to_sid(id) -> string\n\n"
+"Map a POSIX ID to a SID. On error, IdmapError is raised.\n");
+
+static PyObject *
+py_idmap_unix_to_sid(IdmapContext *self, PyObject *args)
+{
+    PyObject *py_id;
+    enum idmap_error_code err;
+    PyObject *ret;
+    uint32_t id;
+    char *sid;
+
+    if (!PyArg_ParseTuple(args, sss_py_const_p(char, "O"), &py_id)) {
+        return NULL;
+    }
+
+    if (py_long_as_id(py_id, &id) != 0) {
+        return NULL;
+    }
+
+    err = sss_idmap_unix_to_sid(self->ctx, id, &sid);
+    if (err != IDMAP_SUCCESS) {
+        set_idmap_exception(err);
+        return NULL;
+    }
+
+    ret = PyUnicode_FromString(sid);
+    sss_idmap_free_sid(self->ctx, sid);
+    return ret;
+}
+
+static PyObject *
+sid_to_unix_item(IdmapContext *self, const char *sid)
+{
+    enum idmap_error_code err;
+    uint32_t id;
+
+    err = sss_idmap_sid_to_unix(self->ctx, sid, &id);
+    if (err == IDMAP_SUCCESS) {
+        return PyLong_FromUnsignedLong((unsigned long) id);
+    }
+
+    if (is_unmappable(err)) {
+        Py_RETURN_NONE;
+    }
+
+    set_idmap_exception(err);
+    return NULL;
+}
+
+/* Map whitespace separated SIDs from a bytes buffer. */
+static PyObject *
+sids_to_unix_buffer(IdmapContext *self, PyObject *py_buffer)
+{
+    PyObject *ret;
+    PyObject *py_id;
+    char *buf;
+    char *start;
+    char *end;
+    char saved;
+    int iret;
+
+    ret = PyList_New(0);
+    if (ret == NULL) {
+        return NULL;
+    }
+
+    /* Copy the buffer so each SID can be terminated in place. */
+    buf = PyMem_Malloc(PyBytes_GET_SIZE(py_buffer) + 1);
+    if (buf == NULL) {
+        Py_DECREF(ret);
+        return PyErr_NoMemory();
+    }
+    memcpy(buf, PyBytes_AS_STRING(py_buffer), PyBytes_GET_SIZE(py_buffer));
+    buf[PyBytes_GET_SIZE(py_buffer)] = '\0';
+
+    start = buf;
+    while (*start != '\0') {
+        while (isspace((unsigned char) *start)) {
+            start++;
+        }
+        if (*start == '\0') {
+            break;
+        }
+
+        end = start;
+        while (*end != '\0' && !isspace((unsigned char) *end)) {
+            end++;
+        }
+        saved = *end;
+        *end = '\0';
+
+        py_id = sid_to_unix_item(self, start);
+        if (py_id == NULL) {
+            goto fail;
+        }
+
+        iret = PyList_Append(ret, py_id);
+        Py_DECREF(py_id);
+        if (iret != 0) {
+            goto fail;
+        }
+
+        *end = saved;
+        start = end;
+    }
+
+    PyMem_Free(buf);
+    return ret;
+
+fail:
+    PyMem_Free(buf);
+    Py_DECREF(ret);
+    return NULL;
+}
+
+PyDoc_STRVAR(py_idmap_sids_to_unix__doc__,
+"sids_to_unix(sids) -> list of int\n\n"
+"Map many SIDs to POSIX IDs in one call. The argument is either a\n"
+"sequence of strings or a bytes object with SIDs separated by whitespace,\n"
+"e.g. the content of a file with one SID per line. The returned list\n"
+"contains the POSIX ID of each SID or None if the SID can not be mapped,\n"
+"e.g. because its domain was not added. IdmapError is raised only for\n"
+"errors that are not specific to a single SID, e.g. out of memory.\n");
+
+static PyObject *
+py_idmap_sids_to_unix(IdmapContext *self, PyObject *args)
+{
+    PyObject *py_sids;
+    PyObject *py_seq;
+    PyObject *py_sid;
+    PyObject *py_id;
+    PyObject *ret;
+    Py_ssize_t count;
+    Py_ssize_t i;
+
+    if (!PyArg_ParseTuple(args, sss_py_const_p(char, "O"), &py_sids)) {
+        return NULL;
+    }
+
+    if (PyBytes_Check(py_sids)) {
+        return sids_to_unix_buffer(self, py_sids);
+    }
+
+    if (PyUnicode_Check(py_sids)) {
+        PyErr_Format(PyExc_TypeError,
+                     "sids must be a sequence of strings or bytes\n");
+        return NULL;
+    }
+
+    py_seq = PySequence_Fast(py_sids, "sids must be a sequence");
+    if (py_seq == NULL) {
+        return NULL;
+    }
+
+    count = PySequence_Fast_GET_SIZE(py_seq);
+    ret = PyList_New(count);
+    if (ret == NULL) {
+        goto done;
+    }
+
+    for (i = 0; i < count; i++) {
+        py_sid = py_string_as_utf8(PySequence_Fast_GET_ITEM(py_seq, i),
+                                   "SID");
+        if (py_sid == NULL) {
+            Py_CLEAR(ret);
+            goto done;
+        }
+
+        py_id = sid_to_unix_item(self, PyBytes_AS_STRING(py_sid));
+        Py_DECREF(py_sid);
+        if (py_id == NULL) {
+            Py_CLEAR(ret);
+            goto done;
+        }
+
+        PyList_SET_ITEM(ret, i, py_id);
+    }
+
+done:
+    Py_DECREF(py_seq);
+    return ret;
+}
+
+static PyObject *
+unix_to_sid_item(IdmapContext *self, uint32_t id)
+{
+    enum idmap_error_code err;
+    PyObject *ret;
+    char *sid;
+
+    err = sss_idmap_unix_to_sid(self->ctx, id, &sid);
+    if (err == IDMAP_SUCCESS) {
+        ret = PyUnicode_FromString(sid);
+        sss_idmap_free_sid(self->ctx, sid);
+        return ret;
+    }
+
+    if (is_unmappable(err)) {
+        Py_RETURN_NONE;
+    }
+
+    set_idmap_exception(err);
+    return NULL;
+}
+
+/* Map POSIX IDs from an object that exports a buffer of unsigned 32bit
+ * integers, e.g. array.array('I'). Returns -1 if the object does not
+ * export such buffer. */
+static int
+unix_to_sids_buffer(IdmapContext *self, PyObject *py_ids, PyObject **_ret)
+{
+    Py_buffer view;
+    const uint32_t *ids;
+    PyObject *ret;
+    PyObject *py_sid;
+    Py_ssize_t count;
+    Py_ssize_t i;
+
+    if (!PyObject_CheckBuffer(py_ids)) {
+        return -1;
+    }
+
+    if (PyObject_GetBuffer(py_ids, &view,
+                           PyBUF_FORMAT | PyBUF_C_CONTIGUOUS) != 0) {
+        PyErr_Clear();
+        return -1;
+    }
+
+    if (view.itemsize != sizeof(uint32_t) || view.format == NULL
+            || (strcmp(view.format, "I") != 0
+                && strcmp(view.format, "=I") != 0
+                && strcmp(view.format, "@I") != 0)) {
+        PyBuffer_Release(&view);
+        return -1;
+    }
+
+    ids = view.buf;
+    count = view.len / view.itemsize;
+
+    ret = PyList_New(count);
+    if (ret == NULL) {
+        goto done;
+    }
+
+    for (i = 0; i < count; i++) {
+        py_sid = unix_to_sid_item(self, ids[i]);
+        if (py_sid == NULL) {
+            Py_CLEAR(ret);
+            goto done;
+        }
+
+        PyList_SET_ITEM(ret, i, py_sid);
+    }
+
+done:
+    PyBuffer_Release(&view);
+    *_ret = ret;
+    return 0;
+}
+
+PyDoc_STRVAR(py_idmap_unix_to_sids__doc__,
+"unix_to_sids(ids) -> list of string\n\n"
+"Map many POSIX IDs to SIDs in one call. The argument is either a\n"
+"sequence of integers or a buffer of unsigned 32bit integers such as\n"
+"array.array('I'). The returned list contains the SID of each ID or None\n"
+"if the ID can not be mapped. IdmapError is raised only for errors that\n"
+"are not specific to a single ID, e.g. out of memory.\n");
+
+static PyObject *
+py_idmap_unix_to_sids(IdmapContext *self, PyObject *args)
+{
+    PyObject *py_ids;
+    PyObject *py_seq;
+    PyObject *py_sid;
+    PyObject *ret = NULL;
+    Py_ssize_t count;
+    Py_ssize_t i;
+    uint32_t id;
+
+    if (!PyArg_ParseTuple(args, sss_py_const_p(char, "O"), &py_ids)) {
+        return NULL;
+    }
+
+    if (unix_to_sids_buffer(self, py_ids, &ret) == 0) {
+        return ret;
+    }
+
+    py_seq = PySequence_Fast(py_ids, "ids must be a sequence");
+    if (py_seq == NULL) {
+        return NULL;
+    }
+
+    count = PySequence_Fast_GET_SIZE(py_seq);
+    ret = PyList_New(count);
+    if (ret == NULL) {
+        goto done;
+    }
+
+    for (i = 0; i < count; i++) {
+        if (py_long_as_id(PySequence_Fast_GET_ITEM(py_seq, i), &id) != 0) {
+            Py_CLEAR(ret);
+            goto done;
+        }
+
+        py_sid = unix_to_sid_item(self, id);
+        if (py_sid == NULL) {
+            Py_CLEAR(ret);
+            goto done;
+        }
+
+        PyList_SET_ITEM(ret, i, py_sid);
+    }
+
+done:
+    Py_DECREF(py_seq);
+    return ret;
+}
+
+static PyMethodDef py_idmap_context_methods[] = {
+    { sss_py_const_p(char, "calculate_range"),
+      (PyCFunction) py_idmap_calculate_range,
+      METH_VARARGS | METH_KEYWORDS, py_idmap_calculate_range__doc__
+    },
+    { sss_py_const_p(char, "add_domain"),
+      (PyCFunction) py_idmap_add_domain,
+      METH_VARARGS | METH_KEYWORDS, py_idmap_add_domain__doc__
+    },
+    { sss_py_const_p(char, "add_range"),
+      (PyCFunction) py_idmap_add_range,
+      METH_VARARGS | METH_KEYWORDS, py_idmap_add_range__doc__
+    },
+    { sss_py_const_p(char, "sid_to_unix"),
+      (PyCFunction) py_idmap_sid_to_unix,
+      METH_VARARGS, py_idmap_sid_to_unix__doc__
+    },
+    { sss_py_const_p(char, "unix_to_sid"),
+      (PyCFunction) py_idmap_unix_to_sid,
+      METH_VARARGS, py_idmap_unix_to_sid__doc__
+    },
+    { sss_py_const_p(char, "sids_to_unix"),
+      (PyCFunction) py_idmap_sids_to_unix,
+      METH_VARARGS, py_idmap_sids_to_unix__doc__
+    },
+    { sss_py_const_p(char, "unix_to_sids"),
+      (PyCFunction) py_idmap_unix_to_sids,
+      METH_VARARGS, py_idmap_unix_to_sids__doc__
+    },
+    { NULL, NULL, 0, NULL }        /* Sentinel */
+};
+
+PyDoc_STRVAR(IdmapContext__doc__,
+"SSSD ID mapping context\n\n"
+"IdmapContext(range_min=200000, range_max=2000200000, range_size=200000,\n"
+"             autorid_compat=False, helper_table_size=10,\n"
+"             default_domain=None, default_domain_sid=None)\n\n"
+"Create a context that maps SIDs to POSIX IDs and back the same way as\n"
+"the LDAP and AD providers with ldap_id_mapping enabled. The arguments\n"
+"have the meaning of the ldap_idmap_* options with the same name. If\n"
+"default_domain_sid is set, the domain is added as slice 0. No running\n"
+"SSSD is required.\n\n"
+"The context is not thread-safe, lookups may add secondary slices to the\n"
+"domains.\n");
+
+static PyTypeObject pysss_idmap_context_type = {
+    PyVarObject_HEAD_INIT(NULL, 0)
+    .tp_name = sss_py_const_p(char, "pysss_idmap.IdmapContext"),
+    .tp_basicsize = sizeof(IdmapContext),
+    .tp_new = IdmapContext_new,
+    .tp_dealloc = (destructor) IdmapContext_dealloc,
+    .tp_methods = py_idmap_context_methods,
+    .tp_flags = Py_TPFLAGS_DEFAULT,
+    .tp_doc   = IdmapContext__doc__
+};
+
+/* ================ the pysss_idmap module initialization ==================*/
+PyDoc_STRVAR(py_idmap_error_string__doc__,
+"idmap_error_string(code) -> string\n"
+"Returns a string representation of the idmap error code");
+
+static PyObject *
+py_idmap_error_string(PyObject *module, PyObject *args)
+{
+    int code;
+
+    if (!PyArg_ParseTuple(args, sss_py_const_p(char, "i"), &code)) {
+        return NULL;
+    }
+
+    return PyUnicode_FromString(idmap_error_string(code));
+}
+
+static PyMethodDef pysss_idmap_module_methods[] = {
+    { sss_py_const_p(char, "idmap_error_string"),
+      (PyCFunction) py_idmap_error_string,
+      METH_VARARGS,
+      py_idmap_error_string__doc__,
+    },
+
+    {NULL, NULL, 0, NULL}  /* Sentinel */
+};
+
+PyDoc_STRVAR(IdmapError__doc__,
+"An ID mapping exception\n\n"
+"IdmapError.args argument is a tuple that contains the IDMAP_* error code\n"
+"and its text representation.");
+
+#ifdef IS_PY3K
+static struct PyModuleDef pysss_idmapdef = {
+    PyModuleDef_HEAD_INIT,
+    PYTHON_MODULE_NAME,
+    NULL,
+    -1,
+    pysss_idmap_module_methods,
+    NULL,
+    NULL,
+    NULL,
+    NULL
+};
+
+PyMODINIT_FUNC
+PyInit_pysss_idmap(void)
+#else
+PyMODINIT_FUNC
+initpysss_idmap(void)
+#endif
+{
+    PyObject *m;
+    int ret;
+
+#ifdef IS_PY3K
+    m = PyModule_Create(&pysss_idmapdef);
+#else
+    m = Py_InitModule3(sss_py_const_p(char, PYTHON_MODULE_NAME),
+                       pysss_idmap_module_methods,
+                       sss_py_const_p(char, "SSSD ID mapping functions"));
+#endif
+    if (m == NULL) {
+        MODINITERROR(NULL);
+    }
+
+    PyExc_IdmapError = sss_exception_with_doc(
+                        "pysss_idmap.IdmapError", IdmapError__doc__,
+                        PyExc_EnvironmentError, NULL);
+    Py_INCREF(PyExc_IdmapError);
+    ret = PyModule_AddObject(m, sss_py_const_p(char, "IdmapError"),
+                             PyExc_IdmapError);
+    if (ret == -1) {
+        Py_XDECREF(PyExc_IdmapError);
+        MODINITERROR(m);
+    }
+
+    ret = PyModule_AddIntMacro(m, IDMAP_SUCCESS);
+    if (ret == -1) {
+        MODINITERROR(m);
+    }
+    ret = PyModule_AddIntMacro(m, IDMAP_NOT_IMPLEMENTED);
+    if (ret == -1) {
+        MODINITERROR(m);
+    }
+    ret = PyModule_AddIntMacro(m, IDMAP_ERROR);
+    if (ret == -1) {
+        MODINITERROR(m);
+    }
+    ret = PyModule_AddIntMacro(m, IDMAP_OUT_OF_MEMORY);
+    if (ret == -1) {
+        MODINITERROR(m);
+    }
+    ret = PyModule_AddIntMacro(m, IDMAP_NO_DOMAIN);
+    if (ret == -1) {
+        MODINITERROR(m);
+    }
+    ret = PyModule_AddIntMacro(m, IDMAP_CONTEXT_INVALID);
+    if (ret == -1) {
+        MODINITERROR(m);
+    }
+    ret = PyModule_AddIntMacro(m, IDMAP_SID_INVALID);
+    if (ret == -1) {
+        MODINITERROR(m);
+    }
+    ret = PyModule_AddIntMacro(m, IDMAP_SID_UNKNOWN);
+    if (ret == -1) {
+        MODINITERROR(m);
+    }
+    ret = PyModule_AddIntMacro(m, IDMAP_NO_RANGE);
+    if (ret == -1) {
+        MODINITERROR(m);
+    }
+    ret = PyModule_AddIntMacro(m, IDMAP_BUILTIN_SID);
+    if (ret == -1) {
+        MODINITERROR(m);
+    }
+    ret = PyModule_AddIntMacro(m, IDMAP_OUT_OF_SLICES);
+    if (ret == -1) {
+        MODINITERROR(m);
+    }
+    ret = PyModule_AddIntMacro(m, IDMAP_COLLISION);
+    if (ret == -1) {
+        MODINITERROR(m);
+    }
+    ret = PyModule_AddIntMacro(m, IDMAP_EXTERNAL);
+    if (ret == -1) {
+        MODINITERROR(m);
+    }
+    ret = PyModule_AddIntMacro(m, IDMAP_NAME_UNKNOWN);
+    if (ret == -1) {
+        MODINITERROR(m);
+    }
+
+    TYPE_READY(m, pysss_idmap_context_type, "IdmapContext");
+
+#ifdef IS_PY3K
+    return m;
+#endif
+}
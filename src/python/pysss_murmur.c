@@ -22,6 +22,7 @@
 
 #define PY_SSIZE_T_CLEAN 1
 #include <Python.h>
+#include <stdbool.h>
 
 #include "util/sss_python.h"
 #include "shared/murmurhash3.h"
@@ -58,9 +59,316 @@ static PyObject * py_murmurhash3(PyObject *module, PyObject *args)
     return PyLong_FromUnsignedLong((unsigned long) hash);
 }
 
+struct murmur_key {
+    const char *key;
+    int len;
+};
+
+/* Create array.array('I') with count zeros the hashes are stored in. */
+static PyObject *new_hash_array(Py_ssize_t count)
+{
+    PyObject *array_module;
+    PyObject *one;
+    PyObject *ret;
+
+    array_module = PyImport_ImportModule("array");
+    if (array_module == NULL) {
+        return NULL;
+    }
+
+    one = PyObject_CallMethod(array_module, sss_py_const_p(char, "array"),
+                              sss_py_const_p(char, "s[i]"), "I", 0);
+    Py_DECREF(array_module);
+    if (one == NULL) {
+        return NULL;
+    }
+
+    ret = PySequence_Repeat(one, count);
+    Py_DECREF(one);
+
+    return ret;
+}
+
+static int get_hash_buffer(PyObject *py_array, Py_buffer *view)
+{
+    if (PyObject_GetBuffer(py_array, view, PyBUF_WRITABLE) != 0) {
+        return -1;
+    }
+
+    if (view->itemsize != sizeof(uint32_t)) {
+        PyBuffer_Release(view);
+        PyErr_Format(PyExc_SystemError,
+                     "array('I') does not hold 32bit integers\n");
+        return -1;
+    }
+
+    return 0;
+}
+
+/* Hash keys given as a sequence of strings or bytes */
+static PyObject *murmurhash3_seq(PyObject *py_keys, uint32_t seed)
+{
+    PyObject *py_seq;
+    PyObject *py_encoded = NULL;
+    PyObject *py_key;
+    PyObject *ret = NULL;
+    struct murmur_key *keys = NULL;
+    uint32_t *hashes;
+    Py_buffer view;
+    Py_ssize_t count;
+    Py_ssize_t i;
+
+    if (PyBytes_Check(py_keys) || PyUnicode_Check(py_keys)) {
+        PyErr_Format(PyExc_TypeError,
+                     "keys must be a sequence of strings or bytes\n");
+        return NULL;
+    }
+
+    py_seq = PySequence_Fast(py_keys, "keys must be a sequence");
+    if (py_seq == NULL) {
+        return NULL;
+    }
+
+    count = PySequence_Fast_GET_SIZE(py_seq);
+
+    /* Keep references to all keys, the sequence may be modified while the
+     * GIL is released. */
+    py_encoded = PyTuple_New(count);
+    if (py_encoded == NULL) {
+        goto done;
+    }
+
+    keys = PyMem_New(struct murmur_key, count == 0 ? 1 : count);
+    if (keys == NULL) {
+        PyErr_NoMemory();
+        goto done;
+    }
+
+    for (i = 0; i < count; i++) {
+        py_key = PySequence_Fast_GET_ITEM(py_seq, i);
+        if (PyUnicode_Check(py_key)) {
+            py_key = PyUnicode_AsUTF8String(py_key);
+            if (py_key == NULL) {
+                goto done;
+            }
+        } else if (PyBytes_Check(py_key)) {
+            Py_INCREF(py_key);
+        } else {
+            PyErr_Format(PyExc_TypeError,
+                         "keys must be a sequence of strings or bytes\n");
+            goto done;
+        }
+        PyTuple_SET_ITEM(py_encoded, i, py_key);
+
+        if (PyBytes_GET_SIZE(py_key) > INT_MAX) {
+            PyErr_Format(PyExc_ValueError, "Invalid value\n");
+            goto done;
+        }
+
+        keys[i].key = PyBytes_AS_STRING(py_key);
+        keys[i].len = PyBytes_GET_SIZE(py_key);
+    }
+
+    ret = new_hash_array(count);
+    if (ret == NULL || get_hash_buffer(ret, &view) != 0) {
+        Py_CLEAR(ret);
+        goto done;
+    }
+    hashes = view.buf;
+
+    Py_BEGIN_ALLOW_THREADS
+    for (i = 0; i < count; i++) {
+        hashes[i] = murmurhash3(keys[i].key, keys[i].len, seed);
+    }
+    Py_END_ALLOW_THREADS
+
+    PyBuffer_Release(&view);
+
+done:
+    PyMem_Free(keys);
+    Py_XDECREF(py_encoded);
+    Py_DECREF(py_seq);
+    return ret;
+}
+
+/* Convert offsets given as a sequence of integers */
+static uint32_t *offsets_from_seq(PyObject *py_offsets, Py_ssize_t *_count)
+{
+    PyObject *py_seq;
+    uint32_t *offsets;
+    unsigned long long val;
+    Py_ssize_t count;
+    Py_ssize_t i;
+
+    py_seq = PySequence_Fast(py_offsets, "offsets must be a sequence");
+    if (py_seq == NULL) {
+        return NULL;
+    }
+
+    count = PySequence_Fast_GET_SIZE(py_seq);
+    offsets = PyMem_New(uint32_t, count == 0 ? 1 : count);
+    if (offsets == NULL) {
+        Py_DECREF(py_seq);
+        PyErr_NoMemory();
+        return NULL;
+    }
+
+    for (i = 0; i < count; i++) {
+        val = PyLong_AsUnsignedLongLong(PySequence_Fast_GET_ITEM(py_seq, i));
+        if (PyErr_Occurred() || val > UINT32_MAX) {
+            PyErr_Clear();
+            PyErr_Format(PyExc_ValueError, "Invalid offset\n");
+            PyMem_Free(offsets);
+            Py_DECREF(py_seq);
+            return NULL;
+        }
+        offsets[i] = val;
+    }
+
+    Py_DECREF(py_seq);
+    *_count = count;
+    return offsets;
+}
+
+/* Hash keys stored one after another in a single buffer. Key i is
+ * data[offsets[i]:offsets[i + 1]]. */
+static PyObject *murmurhash3_buffer(PyObject *py_data,
+                                    PyObject *py_offsets,
+                                    uint32_t seed)
+{
+    Py_buffer data;
+    Py_buffer offsets_view;
+    Py_buffer view;
+    bool offsets_buffer = false;
+    uint32_t *offsets = NULL;
+    uint32_t *hashes;
+    uint32_t start;
+    uint32_t end;
+    Py_ssize_t count = 0;
+    Py_ssize_t invalid = -1;
+    Py_ssize_t i;
+    PyObject *ret = NULL;
+
+    if (PyObject_GetBuffer(py_data, &data, PyBUF_SIMPLE) != 0) {
+        return NULL;
+    }
+
+    if (PyObject_CheckBuffer(py_offsets)
+            && PyObject_GetBuffer(py_offsets, &offsets_view,
+                                  PyBUF_FORMAT | PyBUF_C_CONTIGUOUS) == 0) {
+        offsets_buffer = true;
+        if (offsets_view.itemsize != sizeof(uint32_t)
+                || offsets_view.format == NULL
+                || (strcmp(offsets_view.format, "I") != 0
+                    && strcmp(offsets_view.format, "=I") != 0
+                    && strcmp(offsets_view.format, "@I") != 0)) {
+            PyErr_Format(PyExc_TypeError,
+                         "offsets buffer must contain unsigned 32bit "
+                         "integers\n");
+            goto done;
+        }
+        offsets = offsets_view.buf;
+        count = offsets_view.len / offsets_view.itemsize;
+    } else {
+        PyErr_Clear();
+        offsets = offsets_from_seq(py_offsets, &count);
+        if (offsets == NULL) {
+            goto done;
+        }
+    }
+
+    if (count == 0) {
+        PyErr_Format(PyExc_ValueError,
+                     "offsets must contain at least one value\n");
+        goto done;
+    }
+    count--;
+
+    ret = new_hash_array(count);
+    if (ret == NULL || get_hash_buffer(ret, &view) != 0) {
+        Py_CLEAR(ret);
+        goto done;
+    }
+    hashes = view.buf;
+
+    /* The offsets buffer can be changed by other threads while the GIL is
+     * released, so every offset is read only once and checked before it is
+     * used. */
+    Py_BEGIN_ALLOW_THREADS
+    start = offsets[0];
+    for (i = 0; i < count; i++) {
+        end = offsets[i + 1];
+        if (end < start || end > data.len || end - start > INT_MAX) {
+            invalid = i;
+            break;
+        }
+
+        hashes[i] = murmurhash3((const char *) data.buf + start,
+                                end - start, seed);
+        start = end;
+    }
+    Py_END_ALLOW_THREADS
+
+    PyBuffer_Release(&view);
+
+    if (invalid != -1) {
+        PyErr_Format(PyExc_ValueError, "Invalid offsets of key %zd\n",
+                     invalid);
+        Py_CLEAR(ret);
+    }
+
+done:
+    if (offsets_buffer) {
+        PyBuffer_Release(&offsets_view);
+    } else {
+        PyMem_Free(offsets);
+    }
+    PyBuffer_Release(&data);
+    return ret;
+}
+
+PyDoc_STRVAR(murmurhash3_many_doc,
+"murmurhash3_many(keys, seed[, offsets]) -> array('I') of hashes\n\
+\n\
+Calculate the murmur hash version 3 of many keys using the given seed.\n\
+Without offsets keys is a sequence of strings or bytes and each of them is\n\
+hashed completely, strings are encoded with UTF-8. With offsets keys is a\n\
+bytes-like object holding all keys one after another and offsets is a\n\
+sequence of integers or an array('I') with one more value than there are\n\
+keys, key i is keys[offsets[i]:offsets[i + 1]]. The hashes are the same\n\
+as murmurhash3() returns for each key and are calculated without holding\n\
+the global interpreter lock."
+);
+
+static PyObject * py_murmurhash3_many(PyObject *module, PyObject *args)
+{
+    PyObject *py_keys;
+    PyObject *py_offsets = Py_None;
+    long long seed;
+
+    if (!PyArg_ParseTuple(args, sss_py_const_p(char, "OL|O"),
+                          &py_keys, &seed, &py_offsets)) {
+        return NULL;
+    }
+
+    if (seed > UINT32_MAX) {
+        PyErr_Format(PyExc_ValueError, "Invalid value\n");
+        return NULL;
+    }
+
+    if (py_offsets == Py_None) {
+        return murmurhash3_seq(py_keys, seed);
+    }
+
+    return murmurhash3_buffer(py_keys, py_offsets, seed);
+}
+
 static PyMethodDef methods[] = {
     { sss_py_const_p(char, "murmurhash3"), (PyCFunction) py_murmurhash3,
       METH_VARARGS, murmurhash3_doc },
+    { sss_py_const_p(char, "murmurhash3_many"),
+      (PyCFunction) py_murmurhash3_many,
+      METH_VARARGS, murmurhash3_many_doc },
     { NULL,NULL, 0, NULL }
 };
 
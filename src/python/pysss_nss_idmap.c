@@ -22,6 +22,7 @@
 #include "config.h"
 
 #include <Python.h>
+#include <stdbool.h>
 
 #include "util/sss_python.h"
 #include "sss_client/idmap/sss_nss_idmap.h"
@@ -425,6 +426,255 @@ static PyObject *check_args(enum lookup_type type, PyObject *args)
 
 }
 
+/* One element of a batch lookup. The input is converted while holding the
+ * GIL, the lookup itself is done with the GIL released. */
+struct batch_item {
+    /* UTF-8 encoded input string, owns inp.str */
+    PyObject *py_str;
+    union {
+        const char *str;
+        uint32_t id;
+    } inp;
+
+    int ret;
+    enum sss_id_type id_type;
+    union {
+        char *str;
+        uint32_t id;
+    } out;
+};
+
+static bool is_lookup_by_id(enum lookup_type type)
+{
+    return type == SIDBYID || type == SIDBYUID || type == SIDBYGID;
+}
+
+/* Returns 0 on success, an errno code if the item can not be looked up and
+ * -1 if a Python exception was raised. */
+static int batch_item_init(enum lookup_type type,
+                           struct batch_item *item,
+                           PyObject *py_inp)
+{
+    PyObject *py_str;
+    long id;
+    char *endptr;
+
+    if (PyUnicode_Check(py_inp)) {
+        py_str = PyUnicode_AsUTF8String(py_inp);
+        if (py_str == NULL) {
+            return -1;
+        }
+    } else if (PyBytes_Check(py_inp)) {
+        py_str = py_inp;
+        Py_INCREF(py_str);
+    } else if (is_lookup_by_id(type) && PYNUMBER_CHECK(py_inp)) {
+        py_str = NULL;
+    } else {
+        return EINVAL;
+    }
+
+    if (!is_lookup_by_id(type)) {
+        item->py_str = py_str;
+        item->inp.str = PyBytes_AS_STRING(py_str);
+        return 0;
+    }
+
+    if (py_str == NULL) {
+        id = PYNUMBER_ASLONG(py_inp);
+        if (id == -1 && PyErr_Occurred()) {
+            PyErr_Clear();
+            return EINVAL;
+        }
+    } else {
+        errno = 0;
+        id = strtol(PyBytes_AS_STRING(py_str), &endptr, 10);
+        if (errno != 0 || *endptr != '\0') {
+            Py_DECREF(py_str);
+            return EINVAL;
+        }
+        Py_DECREF(py_str);
+    }
+
+    if (id < 0 || id > UINT32_MAX) {
+        return EINVAL;
+    }
+
+    item->inp.id = (uint32_t) id;
+    return 0;
+}
+
+/* Called without the GIL. The NSS client keeps its connection to the
+ * responder open so all lookups reuse the same socket. */
+static void do_batch_lookup(enum lookup_type type,
+                            struct batch_item *items,
+                            Py_ssize_t count)
+{
+    struct batch_item *item;
+    Py_ssize_t i;
+
+    for (i = 0; i < count; i++) {
+        item = &items[i];
+        if (item->ret != 0) {
+            continue;
+        }
+
+        switch (type) {
+        case SIDBYNAME:
+            item->ret = sss_nss_getsidbyname(item->inp.str, &item->out.str,
+                                             &item->id_type);
+            break;
+        case SIDBYUSERNAME:
+            item->ret = sss_nss_getsidbyusername(item->inp.str,
+                                                 &item->out.str,
+                                                 &item->id_type);
+            break;
+        case SIDBYGROUPNAME:
+            item->ret = sss_nss_getsidbygroupname(item->inp.str,
+                                                  &item->out.str,
+                                                  &item->id_type);
+            break;
+        case SIDBYID:
+            item->ret = sss_nss_getsidbyid(item->inp.id, &item->out.str,
+                                           &item->id_type);
+            break;
+        case SIDBYUID:
+            item->ret = sss_nss_getsidbyuid(item->inp.id, &item->out.str,
+                                            &item->id_type);
+            break;
+        case SIDBYGID:
+            item->ret = sss_nss_getsidbygid(item->inp.id, &item->out.str,
+                                            &item->id_type);
+            break;
+        case NAMEBYSID:
+            item->ret = sss_nss_getnamebysid(item->inp.str, &item->out.str,
+                                             &item->id_type);
+            break;
+        case IDBYSID:
+            item->ret = sss_nss_getidbysid(item->inp.str, &item->out.id,
+                                           &item->id_type);
+            break;
+        default:
+            item->ret = ENOSYS;
+            break;
+        }
+    }
+}
+
+static PyObject *batch_result(enum lookup_type type,
+                              struct batch_item *items,
+                              Py_ssize_t count)
+{
+    PyObject *py_values;
+    PyObject *py_types;
+    PyObject *py_value;
+    PyObject *py_type;
+    Py_ssize_t i;
+
+    py_values = PyList_New(count);
+    py_types = PyList_New(count);
+    if (py_values == NULL || py_types == NULL) {
+        goto fail;
+    }
+
+    for (i = 0; i < count; i++) {
+        if (items[i].ret != 0) {
+            Py_INCREF(Py_None);
+            Py_INCREF(Py_None);
+            PyList_SET_ITEM(py_values, i, Py_None);
+            PyList_SET_ITEM(py_types, i, Py_None);
+            continue;
+        }
+
+        if (type == IDBYSID) {
+            py_value = PYNUMBER_FROMLONG(items[i].out.id);
+        } else {
+            py_value = PyUnicode_FromString(items[i].out.str);
+        }
+        py_type = PYNUMBER_FROMLONG(items[i].id_type);
+        if (py_value == NULL || py_type == NULL) {
+            Py_XDECREF(py_value);
+            Py_XDECREF(py_type);
+            goto fail;
+        }
+
+        PyList_SET_ITEM(py_values, i, py_value);
+        PyList_SET_ITEM(py_types, i, py_type);
+    }
+
+    return Py_BuildValue(sss_py_const_p(char, "(NN)"), py_values, py_types);
+
+fail:
+    Py_XDECREF(py_values);
+    Py_XDECREF(py_types);
+    return NULL;
+}
+
+static PyObject *check_args_many(enum lookup_type type, PyObject *args)
+{
+    PyObject *obj;
+    PyObject *py_seq;
+    PyObject *py_result = NULL;
+    struct batch_item *items = NULL;
+    Py_ssize_t count = 0;
+    Py_ssize_t i;
+    int ret;
+
+    if (!PyArg_ParseTuple(args, sss_py_const_p(char, "O"), &obj)) {
+        PyErr_Format(PyExc_ValueError, "Unable to retrieve argument\n");
+        return NULL;
+    }
+
+    if (!(PyList_Check(obj) || PyTuple_Check(obj))) {
+        PyErr_Format(PyExc_ValueError,
+                     "Only lists or tuples of strings or longs " \
+                     "are accepted\n");
+        return NULL;
+    }
+
+    py_seq = PySequence_Fast(obj, "Unable to retrieve argument");
+    if (py_seq == NULL) {
+        return NULL;
+    }
+
+    count = PySequence_Fast_GET_SIZE(py_seq);
+    items = PyMem_New(struct batch_item, count + 1);
+    if (items == NULL) {
+        PyErr_NoMemory();
+        count = 0;
+        goto done;
+    }
+    memset(items, 0, sizeof(struct batch_item) * (count + 1));
+
+    for (i = 0; i < count; i++) {
+        ret = batch_item_init(type, &items[i],
+                              PySequence_Fast_GET_ITEM(py_seq, i));
+        if (ret == -1) {
+            goto done;
+        }
+
+        /* Items that can not be looked up are reported as not found. */
+        items[i].ret = ret;
+    }
+
+    Py_BEGIN_ALLOW_THREADS
+    do_batch_lookup(type, items, count);
+    Py_END_ALLOW_THREADS
+
+    py_result = batch_result(type, items, count);
+
+done:
+    for (i = 0; i < count; i++) {
+        Py_XDECREF(items[i].py_str);
+        if (type != IDBYSID) {
+            free(items[i].out.str);
+        }
+    }
+    PyMem_Free(items);
+    Py_DECREF(py_seq);
+
+    return py_result;
+}
+
 PyDoc_STRVAR(getsidbyname_doc,
 "getsidbyname(name or list/tuple of names) -> dict(name => dict(results))\n\
 \n\
@@ -586,6 +836,80 @@ static PyObject * py_getlistbycert(PyObject *module, PyObject *args)
     return check_args(LISTBYCERT, args);
 }
 
+#define BATCH_DOC(name, input, output) \
+name "(list/tuple of " input ") -> (list of " output ", list of types)\n\
+\n\
+Batch version of " name "() for large number of lookups. The lookups are\n\
+done in one pass without holding the GIL and the results are returned as\n\
+two lists that are parallel to the input list. The first one contains the\n\
+" output " and the second one the type of the object for each input\n\
+element. Both contain None for elements that were not found or that are\n\
+not valid."
+
+PyDoc_STRVAR(getsidbyname_many_doc,
+             BATCH_DOC("getsidbyname", "names", "SIDs"));
+
+static PyObject * py_getsidbyname_many(PyObject *module, PyObject *args)
+{
+    return check_args_many(SIDBYNAME, args);
+}
+
+PyDoc_STRVAR(getsidbyusername_many_doc,
+             BATCH_DOC("getsidbyusername", "names", "SIDs"));
+
+static PyObject * py_getsidbyusername_many(PyObject *module, PyObject *args)
+{
+    return check_args_many(SIDBYUSERNAME, args);
+}
+
+PyDoc_STRVAR(getsidbygroupname_many_doc,
+             BATCH_DOC("getsidbygroupname", "names", "SIDs"));
+
+static PyObject * py_getsidbygroupname_many(PyObject *module, PyObject *args)
+{
+    return check_args_many(SIDBYGROUPNAME, args);
+}
+
+PyDoc_STRVAR(getsidbyid_many_doc,
+             BATCH_DOC("getsidbyid", "ids", "SIDs"));
+
+static PyObject * py_getsidbyid_many(PyObject *module, PyObject *args)
+{
+    return check_args_many(SIDBYID, args);
+}
+
+PyDoc_STRVAR(getsidbyuid_many_doc,
+             BATCH_DOC("getsidbyuid", "uids", "SIDs"));
+
+static PyObject * py_getsidbyuid_many(PyObject *module, PyObject *args)
+{
+    return check_args_many(SIDBYUID, args);
+}
+
+PyDoc_STRVAR(getsidbygid_many_doc,
+             BATCH_DOC("getsidbygid", "gids", "SIDs"));
+
+static PyObject * py_getsidbygid_many(PyObject *module, PyObject *args)
+{
+    return check_args_many(SIDBYGID, args);
+}
+
+PyDoc_STRVAR(getnamebysid_many_doc,
+             BATCH_DOC("getnamebysid", "SIDs", "names"));
+
+static PyObject * py_getnamebysid_many(PyObject *module, PyObject *args)
+{
+    return check_args_many(NAMEBYSID, args);
+}
+
+PyDoc_STRVAR(getidbysid_many_doc,
+             BATCH_DOC("getidbysid", "SIDs", "POSIX IDs"));
+
+static PyObject * py_getidbysid_many(PyObject *module, PyObject *args)
+{
+    return check_args_many(IDBYSID, args);
+}
+
 static PyMethodDef methods[] = {
     { sss_py_const_p(char, "getsidbyname"), (PyCFunction) py_getsidbyname,
       METH_VARARGS, getsidbyname_doc },
@@ -607,6 +931,30 @@ static PyMethodDef methods[] = {
       METH_VARARGS, getnamebycert_doc },
     { sss_py_const_p(char, "getlistbycert"), (PyCFunction) py_getlistbycert,
       METH_VARARGS, getlistbycert_doc },
+    { sss_py_const_p(char, "getsidbyname_many"),
+      (PyCFunction) py_getsidbyname_many,
+      METH_VARARGS, getsidbyname_many_doc },
+    { sss_py_const_p(char, "getsidbyusername_many"),
+      (PyCFunction) py_getsidbyusername_many,
+      METH_VARARGS, getsidbyusername_many_doc },
+    { sss_py_const_p(char, "getsidbygroupname_many"),
+      (PyCFunction) py_getsidbygroupname_many,
+      METH_VARARGS, getsidbygroupname_many_doc },
+    { sss_py_const_p(char, "getsidbyid_many"),
+      (PyCFunction) py_getsidbyid_many,
+      METH_VARARGS, getsidbyid_many_doc },
+    { sss_py_const_p(char, "getsidbyuid_many"),
+      (PyCFunction) py_getsidbyuid_many,
+      METH_VARARGS, getsidbyuid_many_doc },
+    { sss_py_const_p(char, "getsidbygid_many"),
+      (PyCFunction) py_getsidbygid_many,
+      METH_VARARGS, getsidbygid_many_doc },
+    { sss_py_const_p(char, "getnamebysid_many"),
+      (PyCFunction) py_getnamebysid_many,
+      METH_VARARGS, getnamebysid_many_doc },
+    { sss_py_const_p(char, "getidbysid_many"),
+      (PyCFunction) py_getidbysid_many,
+      METH_VARARGS, getidbysid_many_doc },
     { NULL,NULL, 0, NULL }
 };
 
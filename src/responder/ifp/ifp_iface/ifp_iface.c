@@ -57,6 +57,11 @@ ifp_access_check(struct sbus_request *sbus_req,
     switch (sbus_req->type) {
     case SBUS_REQUEST_PROPERTY_GET:
         if (strcmp(sbus_req->interface, "org.freedesktop.sssd.infopipe.Users.User") == 0) {
+            /* GetAll handler checks each attribute on its own. */
+            if (strcmp(sbus_req->property, SBUS_PROPERTY_GETALL_NAME) == 0) {
+                return EOK;
+            }
+
             if (!ifp_is_user_attr_allowed(ifp_ctx, sbus_req->property)) {
                 DEBUG(SSSDBG_TRACE_ALL, "Attribute %s is not allowed\n",
                       sbus_req->property);
@@ -176,7 +181,8 @@ ifp_register_sbus_interface(struct sbus_connection *conn,
             SBUS_SYNC(GETTER, org_freedesktop_sssd_infopipe_Users_User, groups, ifp_users_user_get_groups, ctx),
             SBUS_SYNC(GETTER, org_freedesktop_sssd_infopipe_Users_User, domain, ifp_users_user_get_domain, ctx),
             SBUS_SYNC(GETTER, org_freedesktop_sssd_infopipe_Users_User, domainname, ifp_users_user_get_domainname, ctx),
-            SBUS_SYNC(GETTER, org_freedesktop_sssd_infopipe_Users_User, extraAttributes, ifp_users_user_get_extra_attributes, ctx)
+            SBUS_SYNC(GETTER, org_freedesktop_sssd_infopipe_Users_User, extraAttributes, ifp_users_user_get_extra_attributes, ctx),
+            SBUS_GETALL_SYNC(org_freedesktop_sssd_infopipe_Users_User, ifp_users_user_get_all, ctx)
         )
     );
 
@@ -28,3 +28,178 @@
 #include "responder/ifp/ifp_iface/sbus_ifp_arguments.h"
 #include "responder/ifp/ifp_iface/sbus_ifp_keygens.h"
 #include "responder/ifp/ifp_iface/sbus_ifp_client_properties.h"
+
+struct sbus_method_in_s_out_as_state {
+    struct _sbus_ifp_invoker_args_s in;
+    struct _sbus_ifp_invoker_args_as *out;
+};
+
+static void sbus_method_in_s_out_as_done(struct tevent_req *subreq);
+
+static struct tevent_req *
+sbus_method_in_s_out_as_send
+    (TALLOC_CTX *mem_ctx,
+     struct sbus_connection *conn,
+     sbus_invoker_keygen keygen,
+     const char *bus,
+     const char *path,
+     const char *iface,
+     const char *method,
+     const char * arg0)
+{
+    struct sbus_method_in_s_out_as_state *state;
+    struct tevent_req *subreq;
+    struct tevent_req *req;
+    errno_t ret;
+
+    req = tevent_req_create(mem_ctx, &state, struct sbus_method_in_s_out_as_state);
+    if (req == NULL) {
+        DEBUG(SSSDBG_CRIT_FAILURE, "Unable to create tevent request!\n");
+        return NULL;
+    }
+
+    state->out = talloc_zero(state, struct _sbus_ifp_invoker_args_as);
+    if (state->out == NULL) {
+        DEBUG(SSSDBG_CRIT_FAILURE,
+              "Unable to allocate space for output parameters!\n");
+        ret = ENOMEM;
+        goto done;
+    }
+
+    state->in.arg0 = arg0;
+
+    subreq = sbus_call_method_send(state, conn, NULL, keygen,
+                                   (sbus_invoker_writer_fn)_sbus_ifp_invoker_write_s,
+                                   bus, path, iface, method, &state->in);
+    if (subreq == NULL) {
+        DEBUG(SSSDBG_CRIT_FAILURE, "Unable to create subrequest!\n");
+        ret = ENOMEM;
+        goto done;
+    }
+
+    tevent_req_set_callback(subreq, sbus_method_in_s_out_as_done, req);
+
+    ret = EAGAIN;
+
+done:
+    if (ret != EAGAIN) {
+        tevent_req_error(req, ret);
+        tevent_req_post(req, conn->ev);
+    }
+
+    return req;
+}
+
+static void sbus_method_in_s_out_as_done(struct tevent_req *subreq)
+{
+    struct sbus_method_in_s_out_as_state *state;
+    struct tevent_req *req;
+    DBusMessage *reply;
+    errno_t ret;
+
+    req = tevent_req_callback_data(subreq, struct tevent_req);
+    state = tevent_req_data(req, struct sbus_method_in_s_out_as_state);
+
+    ret = sbus_call_method_recv(state, subreq, &reply);
+    talloc_zfree(subreq);
+    if (ret != EOK) {
+        tevent_req_error(req, ret);
+        return;
+    }
+
+    ret = sbus_read_output(state->out, reply, (sbus_invoker_reader_fn)_sbus_ifp_invoker_read_as, state->out);
+    if (ret != EOK) {
+        tevent_req_error(req, ret);
+        return;
+    }
+
+    tevent_req_done(req);
+    return;
+}
+
+static errno_t
+sbus_method_in_s_out_as_recv
+    (TALLOC_CTX *mem_ctx,
+     struct tevent_req *req,
+     const char *** _arg0)
+{
+    struct sbus_method_in_s_out_as_state *state;
+    state = tevent_req_data(req, struct sbus_method_in_s_out_as_state);
+
+    TEVENT_REQ_RETURN_ON_ERROR(req);
+
+    *_arg0 = talloc_steal(mem_ctx, state->out->arg0);
+
+    return EOK;
+}
+
+struct tevent_req *
+sbus_call_ifp_GetUserGroups_send
+    (TALLOC_CTX *mem_ctx,
+     struct sbus_connection *conn,
+     const char *busname,
+     const char *object_path,
+     const char * arg_user)
+{
+    return sbus_method_in_s_out_as_send(mem_ctx, conn, _sbus_ifp_key_s_0,
+        busname, object_path, "org.freedesktop.sssd.infopipe", "GetUserGroups", arg_user);
+}
+
+errno_t
+sbus_call_ifp_GetUserGroups_recv
+    (TALLOC_CTX *mem_ctx,
+     struct tevent_req *req,
+     const char *** _values)
+{
+    return sbus_method_in_s_out_as_recv(mem_ctx, req, _values);
+}
+
+struct tevent_req *
+sbus_call_ifp_GetUserGroups_batch_send
+    (TALLOC_CTX *mem_ctx,
+     struct sbus_connection *conn,
+     const char *busname,
+     unsigned int count,
+     const char **object_paths,
+     const char ** args_user)
+{
+    struct tevent_req *subreq;
+    struct tevent_req *req;
+    unsigned int i;
+    errno_t ret;
+
+    req = sbus_batch_send(mem_ctx, conn);
+    if (req == NULL) {
+        return NULL;
+    }
+
+    for (i = 0; i < count; i++) {
+        subreq = sbus_call_ifp_GetUserGroups_send(req, conn, busname, object_paths[i], args_user[i]);
+        ret = sbus_batch_add(req, subreq);
+        if (ret != EOK) {
+            return req;
+        }
+    }
+
+    sbus_batch_seal(req);
+
+    return req;
+}
+
+errno_t
+sbus_call_ifp_GetUserGroups_batch_recv
+    (TALLOC_CTX *mem_ctx,
+     struct tevent_req *req,
+     unsigned int index,
+     const char *** _values)
+{
+    struct tevent_req *subreq;
+    errno_t ret;
+
+    ret = sbus_batch_item(req, index, &subreq);
+    if (ret != EOK) {
+        return ret;
+    }
+
+    return sbus_call_ifp_GetUserGroups_recv(mem_ctx, subreq, _values);
+}
@@ -28,4 +28,34 @@
 #include "responder/ifp/ifp_iface/sbus_ifp_client_properties.h"
 #include "responder/ifp/ifp_iface/ifp_iface_types.h"
 
+struct tevent_req *
+sbus_call_ifp_GetUserGroups_send
+    (TALLOC_CTX *mem_ctx,
+     struct sbus_connection *conn,
+     const char *busname,
+     const char *object_path,
+     const char * arg_user);
+
+errno_t
+sbus_call_ifp_GetUserGroups_recv
+    (TALLOC_CTX *mem_ctx,
+     struct tevent_req *req,
+     const char *** _values);
+
+struct tevent_req *
+sbus_call_ifp_GetUserGroups_batch_send
+    (TALLOC_CTX *mem_ctx,
+     struct sbus_connection *conn,
+     const char *busname,
+     unsigned int count,
+     const char **object_paths,
+     const char ** args_user);
+
+errno_t
+sbus_call_ifp_GetUserGroups_batch_recv
+    (TALLOC_CTX *mem_ctx,
+     struct tevent_req *req,
+     unsigned int index,
+     const char *** _values);
+
 #endif /* _SBUS_IFP_CLIENT_ASYNC_H_ */
@@ -2080,4 +2080,22 @@
        (handler_send), (handler_recv), (data)); \
 })
 
+/* GetAll: org.freedesktop.sssd.infopipe.Users.User */
+#define SBUS_GETALL_SYNC_org_freedesktop_sssd_infopipe_Users_User(handler, data) ({ \
+    SBUS_CHECK_SYNC((handler), (data), struct sbus_getall_org_freedesktop_sssd_infopipe_Users_User *); \
+    sbus_property_sync(SBUS_PROPERTY_GETALL_NAME, "a{sv}", SBUS_PROPERTY_GETALL, \
+       NULL, \
+       _sbus_ifp_getall_invoke_org_freedesktop_sssd_infopipe_Users_User_send, \
+       (handler), (data)); \
+})
+
+#define SBUS_GETALL_ASYNC_org_freedesktop_sssd_infopipe_Users_User(handler_send, handler_recv, data) ({ \
+    SBUS_CHECK_SEND((handler_send), (data)); \
+    SBUS_CHECK_RECV((handler_recv), struct sbus_getall_org_freedesktop_sssd_infopipe_Users_User *); \
+    sbus_property_async(SBUS_PROPERTY_GETALL_NAME, "a{sv}", SBUS_PROPERTY_GETALL, \
+       NULL, \
+       _sbus_ifp_getall_invoke_org_freedesktop_sssd_infopipe_Users_User_send, \
+       (handler_send), (handler_recv), (data)); \
+})
+
 #endif /* _SBUS_IFP_INTERFACE_H_ */
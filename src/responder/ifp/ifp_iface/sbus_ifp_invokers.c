@@ -24,6 +24,7 @@
 
 #include "sbus/sbus_private.h"
 #include "sbus/sbus_interface_declarations.h"
+#include "sbus/interface/sbus_iterator_writers.h"
 #include "responder/ifp/ifp_iface/sbus_ifp_arguments.h"
 #include "responder/ifp/ifp_iface/sbus_ifp_invokers.h"
 
@@ -88,11 +89,10 @@ _sbus_ifp_invoke_in__out__send
     const struct sbus_handler *handler,
     DBusMessageIter *read_iterator,
     DBusMessageIter *write_iterator,
-    const char **_key)
+    struct sbus_request_key *key)
 {
     struct _sbus_ifp_invoke_in__out__state *state;
     struct tevent_req *req;
-    const char *key;
     errno_t ret;
 
     req = tevent_req_create(mem_ctx, &state, struct _sbus_ifp_invoke_in__out__state);
@@ -116,13 +116,11 @@ _sbus_ifp_invoke_in__out__send
         goto done;
     }
 
-    ret = sbus_request_key(state, keygen, sbus_req, NULL, &key);
-    if (ret != EOK) {
-        goto done;
-    }
-
-    if (_key != NULL) {
-        *_key = talloc_steal(mem_ctx, key);
+    if (key != NULL) {
+        ret = sbus_request_key(keygen, sbus_req, NULL, key);
+        if (ret != EOK) {
+            goto done;
+        }
     }
 
     ret = EAGAIN;
@@ -248,11 +246,10 @@ _sbus_ifp_invoke_in__out_ao_send
     const struct sbus_handler *handler,
     DBusMessageIter *read_iterator,
     DBusMessageIter *write_iterator,
-    const char **_key)
+    struct sbus_request_key *key)
 {
     struct _sbus_ifp_invoke_in__out_ao_state *state;
     struct tevent_req *req;
-    const char *key;
     errno_t ret;
 
     req = tevent_req_create(mem_ctx, &state, struct _sbus_ifp_invoke_in__out_ao_state);
@@ -276,13 +273,11 @@ _sbus_ifp_invoke_in__out_ao_send
         goto done;
     }
 
-    ret = sbus_request_key(state, keygen, sbus_req, NULL, &key);
-    if (ret != EOK) {
-        goto done;
-    }
-
-    if (_key != NULL) {
-        *_key = talloc_steal(mem_ctx, key);
+    if (key != NULL) {
+        ret = sbus_request_key(keygen, sbus_req, NULL, key);
+        if (ret != EOK) {
+            goto done;
+        }
     }
 
     ret = EAGAIN;
@@ -415,11 +410,10 @@ _sbus_ifp_invoke_in__out_as_send
     const struct sbus_handler *handler,
     DBusMessageIter *read_iterator,
     DBusMessageIter *write_iterator,
-    const char **_key)
+    struct sbus_request_key *key)
 {
     struct _sbus_ifp_invoke_in__out_as_state *state;
     struct tevent_req *req;
-    const char *key;
     errno_t ret;
 
     req = tevent_req_create(mem_ctx, &state, struct _sbus_ifp_invoke_in__out_as_state);
@@ -443,13 +437,11 @@ _sbus_ifp_invoke_in__out_as_send
         goto done;
     }
 
-    ret = sbus_request_key(state, keygen, sbus_req, NULL, &key);
-    if (ret != EOK) {
-        goto done;
-    }
-
-    if (_key != NULL) {
-        *_key = talloc_steal(mem_ctx, key);
+    if (key != NULL) {
+        ret = sbus_request_key(keygen, sbus_req, NULL, key);
+        if (ret != EOK) {
+            goto done;
+        }
     }
 
     ret = EAGAIN;
@@ -582,11 +574,10 @@ _sbus_ifp_invoke_in__out_b_send
     const struct sbus_handler *handler,
     DBusMessageIter *read_iterator,
     DBusMessageIter *write_iterator,
-    const char **_key)
+    struct sbus_request_key *key)
 {
     struct _sbus_ifp_invoke_in__out_b_state *state;
     struct tevent_req *req;
-    const char *key;
     errno_t ret;
 
     req = tevent_req_create(mem_ctx, &state, struct _sbus_ifp_invoke_in__out_b_state);
@@ -610,13 +601,11 @@ _sbus_ifp_invoke_in__out_b_send
         goto done;
     }
 
-    ret = sbus_request_key(state, keygen, sbus_req, NULL, &key);
-    if (ret != EOK) {
-        goto done;
-    }
-
-    if (_key != NULL) {
-        *_key = talloc_steal(mem_ctx, key);
+    if (key != NULL) {
+        ret = sbus_request_key(keygen, sbus_req, NULL, key);
+        if (ret != EOK) {
+            goto done;
+        }
     }
 
     ret = EAGAIN;
@@ -749,11 +738,10 @@ _sbus_ifp_invoke_in__out_ifp_extra_send
     const struct sbus_handler *handler,
     DBusMessageIter *read_iterator,
     DBusMessageIter *write_iterator,
-    const char **_key)
+    struct sbus_request_key *key)
 {
     struct _sbus_ifp_invoke_in__out_ifp_extra_state *state;
     struct tevent_req *req;
-    const char *key;
     errno_t ret;
 
     req = tevent_req_create(mem_ctx, &state, struct _sbus_ifp_invoke_in__out_ifp_extra_state);
@@ -777,13 +765,11 @@ _sbus_ifp_invoke_in__out_ifp_extra_send
         goto done;
     }
 
-    ret = sbus_request_key(state, keygen, sbus_req, NULL, &key);
-    if (ret != EOK) {
-        goto done;
-    }
-
-    if (_key != NULL) {
-        *_key = talloc_steal(mem_ctx, key);
+    if (key != NULL) {
+        ret = sbus_request_key(keygen, sbus_req, NULL, key);
+        if (ret != EOK) {
+            goto done;
+        }
     }
 
     ret = EAGAIN;
@@ -916,11 +902,10 @@ _sbus_ifp_invoke_in__out_o_send
     const struct sbus_handler *handler,
     DBusMessageIter *read_iterator,
     DBusMessageIter *write_iterator,
-    const char **_key)
+    struct sbus_request_key *key)
 {
     struct _sbus_ifp_invoke_in__out_o_state *state;
     struct tevent_req *req;
-    const char *key;
     errno_t ret;
 
     req = tevent_req_create(mem_ctx, &state, struct _sbus_ifp_invoke_in__out_o_state);
@@ -944,13 +929,11 @@ _sbus_ifp_invoke_in__out_o_send
         goto done;
     }
 
-    ret = sbus_request_key(state, keygen, sbus_req, NULL, &key);
-    if (ret != EOK) {
-        goto done;
-    }
-
-    if (_key != NULL) {
-        *_key = talloc_steal(mem_ctx, key);
+    if (key != NULL) {
+        ret = sbus_request_key(keygen, sbus_req, NULL, key);
+        if (ret != EOK) {
+            goto done;
+        }
     }
 
     ret = EAGAIN;
@@ -1083,11 +1066,10 @@ _sbus_ifp_invoke_in__out_s_send
     const struct sbus_handler *handler,
     DBusMessageIter *read_iterator,
     DBusMessageIter *write_iterator,
-    const char **_key)
+    struct sbus_request_key *key)
 {
     struct _sbus_ifp_invoke_in__out_s_state *state;
     struct tevent_req *req;
-    const char *key;
     errno_t ret;
 
     req = tevent_req_create(mem_ctx, &state, struct _sbus_ifp_invoke_in__out_s_state);
@@ -1111,13 +1093,11 @@ _sbus_ifp_invoke_in__out_s_send
         goto done;
     }
 
-    ret = sbus_request_key(state, keygen, sbus_req, NULL, &key);
-    if (ret != EOK) {
-        goto done;
-    }
-
-    if (_key != NULL) {
-        *_key = talloc_steal(mem_ctx, key);
+    if (key != NULL) {
+        ret = sbus_request_key(keygen, sbus_req, NULL, key);
+        if (ret != EOK) {
+            goto done;
+        }
     }
 
     ret = EAGAIN;
@@ -1250,11 +1230,10 @@ _sbus_ifp_invoke_in__out_u_send
     const struct sbus_handler *handler,
     DBusMessageIter *read_iterator,
     DBusMessageIter *write_iterator,
-    const char **_key)
+    struct sbus_request_key *key)
 {
     struct _sbus_ifp_invoke_in__out_u_state *state;
     struct tevent_req *req;
-    const char *key;
     errno_t ret;
 
     req = tevent_req_create(mem_ctx, &state, struct _sbus_ifp_invoke_in__out_u_state);
@@ -1278,13 +1257,11 @@ _sbus_ifp_invoke_in__out_u_send
         goto done;
     }
 
-    ret = sbus_request_key(state, keygen, sbus_req, NULL, &key);
-    if (ret != EOK) {
-        goto done;
-    }
-
-    if (_key != NULL) {
-        *_key = talloc_steal(mem_ctx, key);
+    if (key != NULL) {
+        ret = sbus_request_key(keygen, sbus_req, NULL, key);
+        if (ret != EOK) {
+            goto done;
+        }
     }
 
     ret = EAGAIN;
@@ -1418,11 +1395,10 @@ _sbus_ifp_invoke_in_s_out_ao_send
     const struct sbus_handler *handler,
     DBusMessageIter *read_iterator,
     DBusMessageIter *write_iterator,
-    const char **_key)
+    struct sbus_request_key *key)
 {
     struct _sbus_ifp_invoke_in_s_out_ao_state *state;
     struct tevent_req *req;
-    const char *key;
     errno_t ret;
 
     req = tevent_req_create(mem_ctx, &state, struct _sbus_ifp_invoke_in_s_out_ao_state);
@@ -1459,13 +1435,11 @@ _sbus_ifp_invoke_in_s_out_ao_send
         goto done;
     }
 
-    ret = sbus_request_key(state, keygen, sbus_req, state->in, &key);
-    if (ret != EOK) {
-        goto done;
-    }
-
-    if (_key != NULL) {
-        *_key = talloc_steal(mem_ctx, key);
+    if (key != NULL) {
+        ret = sbus_request_key(keygen, sbus_req, state->in, key);
+        if (ret != EOK) {
+            goto done;
+        }
     }
 
     ret = EAGAIN;
@@ -1599,11 +1573,10 @@ _sbus_ifp_invoke_in_s_out_as_send
     const struct sbus_handler *handler,
     DBusMessageIter *read_iterator,
     DBusMessageIter *write_iterator,
-    const char **_key)
+    struct sbus_request_key *key)
 {
     struct _sbus_ifp_invoke_in_s_out_as_state *state;
     struct tevent_req *req;
-    const char *key;
     errno_t ret;
 
     req = tevent_req_create(mem_ctx, &state, struct _sbus_ifp_invoke_in_s_out_as_state);
@@ -1640,13 +1613,11 @@ _sbus_ifp_invoke_in_s_out_as_send
         goto done;
     }
 
-    ret = sbus_request_key(state, keygen, sbus_req, state->in, &key);
-    if (ret != EOK) {
-        goto done;
-    }
-
-    if (_key != NULL) {
-        *_key = talloc_steal(mem_ctx, key);
+    if (key != NULL) {
+        ret = sbus_request_key(keygen, sbus_req, state->in, key);
+        if (ret != EOK) {
+            goto done;
+        }
     }
 
     ret = EAGAIN;
@@ -1780,11 +1751,10 @@ _sbus_ifp_invoke_in_s_out_o_send
     const struct sbus_handler *handler,
     DBusMessageIter *read_iterator,
     DBusMessageIter *write_iterator,
-    const char **_key)
+    struct sbus_request_key *key)
 {
     struct _sbus_ifp_invoke_in_s_out_o_state *state;
     struct tevent_req *req;
-    const char *key;
     errno_t ret;
 
     req = tevent_req_create(mem_ctx, &state, struct _sbus_ifp_invoke_in_s_out_o_state);
@@ -1821,13 +1791,11 @@ _sbus_ifp_invoke_in_s_out_o_send
         goto done;
     }
 
-    ret = sbus_request_key(state, keygen, sbus_req, state->in, &key);
-    if (ret != EOK) {
-        goto done;
-    }
-
-    if (_key != NULL) {
-        *_key = talloc_steal(mem_ctx, key);
+    if (key != NULL) {
+        ret = sbus_request_key(keygen, sbus_req, state->in, key);
+        if (ret != EOK) {
+            goto done;
+        }
     }
 
     ret = EAGAIN;
@@ -1961,11 +1929,10 @@ _sbus_ifp_invoke_in_s_out_s_send
     const struct sbus_handler *handler,
     DBusMessageIter *read_iterator,
     DBusMessageIter *write_iterator,
-    const char **_key)
+    struct sbus_request_key *key)
 {
     struct _sbus_ifp_invoke_in_s_out_s_state *state;
     struct tevent_req *req;
-    const char *key;
     errno_t ret;
 
     req = tevent_req_create(mem_ctx, &state, struct _sbus_ifp_invoke_in_s_out_s_state);
@@ -2002,13 +1969,11 @@ _sbus_ifp_invoke_in_s_out_s_send
         goto done;
     }
 
-    ret = sbus_request_key(state, keygen, sbus_req, state->in, &key);
-    if (ret != EOK) {
-        goto done;
-    }
-
-    if (_key != NULL) {
-        *_key = talloc_steal(mem_ctx, key);
+    if (key != NULL) {
+        ret = sbus_request_key(keygen, sbus_req, state->in, key);
+        if (ret != EOK) {
+            goto done;
+        }
     }
 
     ret = EAGAIN;
@@ -2141,11 +2106,10 @@ _sbus_ifp_invoke_in_sas_out_raw_send
     const struct sbus_handler *handler,
     DBusMessageIter *read_iterator,
     DBusMessageIter *write_iterator,
-    const char **_key)
+    struct sbus_request_key *key)
 {
     struct _sbus_ifp_invoke_in_sas_out_raw_state *state;
     struct tevent_req *req;
-    const char *key;
     errno_t ret;
 
     req = tevent_req_create(mem_ctx, &state, struct _sbus_ifp_invoke_in_sas_out_raw_state);
@@ -2182,13 +2146,11 @@ _sbus_ifp_invoke_in_sas_out_raw_send
         goto done;
     }
 
-    ret = sbus_request_key(state, keygen, sbus_req, state->in, &key);
-    if (ret != EOK) {
-        goto done;
-    }
-
-    if (_key != NULL) {
-        *_key = talloc_steal(mem_ctx, key);
+    if (key != NULL) {
+        ret = sbus_request_key(keygen, sbus_req, state->in, key);
+        if (ret != EOK) {
+            goto done;
+        }
     }
 
     ret = EAGAIN;
@@ -2315,11 +2277,10 @@ _sbus_ifp_invoke_in_ss_out_o_send
     const struct sbus_handler *handler,
     DBusMessageIter *read_iterator,
     DBusMessageIter *write_iterator,
-    const char **_key)
+    struct sbus_request_key *key)
 {
     struct _sbus_ifp_invoke_in_ss_out_o_state *state;
     struct tevent_req *req;
-    const char *key;
     errno_t ret;
 
     req = tevent_req_create(mem_ctx, &state, struct _sbus_ifp_invoke_in_ss_out_o_state);
@@ -2356,13 +2317,11 @@ _sbus_ifp_invoke_in_ss_out_o_send
         goto done;
     }
 
-    ret = sbus_request_key(state, keygen, sbus_req, state->in, &key);
-    if (ret != EOK) {
-        goto done;
-    }
-
-    if (_key != NULL) {
-        *_key = talloc_steal(mem_ctx, key);
+    if (key != NULL) {
+        ret = sbus_request_key(keygen, sbus_req, state->in, key);
+        if (ret != EOK) {
+            goto done;
+        }
     }
 
     ret = EAGAIN;
@@ -2496,11 +2455,10 @@ _sbus_ifp_invoke_in_ssu_out_ao_send
     const struct sbus_handler *handler,
     DBusMessageIter *read_iterator,
     DBusMessageIter *write_iterator,
-    const char **_key)
+    struct sbus_request_key *key)
 {
     struct _sbus_ifp_invoke_in_ssu_out_ao_state *state;
     struct tevent_req *req;
-    const char *key;
     errno_t ret;
 
     req = tevent_req_create(mem_ctx, &state, struct _sbus_ifp_invoke_in_ssu_out_ao_state);
@@ -2537,13 +2495,11 @@ _sbus_ifp_invoke_in_ssu_out_ao_send
         goto done;
     }
 
-    ret = sbus_request_key(state, keygen, sbus_req, state->in, &key);
-    if (ret != EOK) {
-        goto done;
-    }
-
-    if (_key != NULL) {
-        *_key = talloc_steal(mem_ctx, key);
+    if (key != NULL) {
+        ret = sbus_request_key(keygen, sbus_req, state->in, key);
+        if (ret != EOK) {
+            goto done;
+        }
     }
 
     ret = EAGAIN;
@@ -2677,11 +2633,10 @@ _sbus_ifp_invoke_in_su_out_ao_send
     const struct sbus_handler *handler,
     DBusMessageIter *read_iterator,
     DBusMessageIter *write_iterator,
-    const char **_key)
+    struct sbus_request_key *key)
 {
     struct _sbus_ifp_invoke_in_su_out_ao_state *state;
     struct tevent_req *req;
-    const char *key;
     errno_t ret;
 
     req = tevent_req_create(mem_ctx, &state, struct _sbus_ifp_invoke_in_su_out_ao_state);
@@ -2718,13 +2673,11 @@ _sbus_ifp_invoke_in_su_out_ao_send
         goto done;
     }
 
-    ret = sbus_request_key(state, keygen, sbus_req, state->in, &key);
-    if (ret != EOK) {
-        goto done;
-    }
-
-    if (_key != NULL) {
-        *_key = talloc_steal(mem_ctx, key);
+    if (key != NULL) {
+        ret = sbus_request_key(keygen, sbus_req, state->in, key);
+        if (ret != EOK) {
+            goto done;
+        }
     }
 
     ret = EAGAIN;
@@ -2858,11 +2811,10 @@ _sbus_ifp_invoke_in_u_out_o_send
     const struct sbus_handler *handler,
     DBusMessageIter *read_iterator,
     DBusMessageIter *write_iterator,
-    const char **_key)
+    struct sbus_request_key *key)
 {
     struct _sbus_ifp_invoke_in_u_out_o_state *state;
     struct tevent_req *req;
-    const char *key;
     errno_t ret;
 
     req = tevent_req_create(mem_ctx, &state, struct _sbus_ifp_invoke_in_u_out_o_state);
@@ -2899,13 +2851,11 @@ _sbus_ifp_invoke_in_u_out_o_send
         goto done;
     }
 
-    ret = sbus_request_key(state, keygen, sbus_req, state->in, &key);
-    if (ret != EOK) {
-        goto done;
-    }
-
-    if (_key != NULL) {
-        *_key = talloc_steal(mem_ctx, key);
+    if (key != NULL) {
+        ret = sbus_request_key(keygen, sbus_req, state->in, key);
+        if (ret != EOK) {
+            goto done;
+        }
     }
 
     ret = EAGAIN;
@@ -3002,3 +2952,174 @@ static void _sbus_ifp_invoke_in_u_out_o_done(struct tevent_req *subreq)
     tevent_req_done(req);
     return;
 }
+
+static errno_t
+_sbus_ifp_getall_write_org_freedesktop_sssd_infopipe_Users_User(DBusMessageIter *dict, void *data)
+{
+    struct sbus_getall_org_freedesktop_sssd_infopipe_Users_User *all = data;
+    DBusMessageIter variant;
+    DBusMessageIter entry;
+    errno_t ret;
+
+    if (all->domain.is_set) {
+        ret = sbus_property_open_entry(dict, &entry, &variant, "domain", "o");
+        if (ret != EOK) {
+            return ret;
+        }
+
+        ret = sbus_iterator_write_o(&variant, all->domain.value);
+        ret = sbus_property_close_entry(dict, &entry, &variant, ret);
+        if (ret != EOK) {
+            return ret;
+        }
+    }
+
+    if (all->domainname.is_set) {
+        ret = sbus_property_open_entry(dict, &entry, &variant, "domainname", "s");
+        if (ret != EOK) {
+            return ret;
+        }
+
+        ret = sbus_iterator_write_s(&variant, all->domainname.value);
+        ret = sbus_property_close_entry(dict, &entry, &variant, ret);
+        if (ret != EOK) {
+            return ret;
+        }
+    }
+
+    if (all->extraAttributes.is_set) {
+        ret = sbus_property_open_entry(dict, &entry, &variant, "extraAttributes", "a{sas}");
+        if (ret != EOK) {
+            return ret;
+        }
+
+        ret = sbus_iterator_write_ifp_extra(&variant, all->extraAttributes.value);
+        ret = sbus_property_close_entry(dict, &entry, &variant, ret);
+        if (ret != EOK) {
+            return ret;
+        }
+    }
+
+    if (all->gecos.is_set) {
+        ret = sbus_property_open_entry(dict, &entry, &variant, "gecos", "s");
+        if (ret != EOK) {
+            return ret;
+        }
+
+        ret = sbus_iterator_write_s(&variant, all->gecos.value);
+        ret = sbus_property_close_entry(dict, &entry, &variant, ret);
+        if (ret != EOK) {
+            return ret;
+        }
+    }
+
+    if (all->gidNumber.is_set) {
+        ret = sbus_property_open_entry(dict, &entry, &variant, "gidNumber", "u");
+        if (ret != EOK) {
+            return ret;
+        }
+
+        ret = sbus_iterator_write_u(&variant, all->gidNumber.value);
+        ret = sbus_property_close_entry(dict, &entry, &variant, ret);
+        if (ret != EOK) {
+            return ret;
+        }
+    }
+
+    if (all->groups.is_set) {
+        ret = sbus_property_open_entry(dict, &entry, &variant, "groups", "ao");
+        if (ret != EOK) {
+            return ret;
+        }
+
+        ret = sbus_iterator_write_ao(&variant, all->groups.value);
+        ret = sbus_property_close_entry(dict, &entry, &variant, ret);
+        if (ret != EOK) {
+            return ret;
+        }
+    }
+
+    if (all->homeDirectory.is_set) {
+        ret = sbus_property_open_entry(dict, &entry, &variant, "homeDirectory", "s");
+        if (ret != EOK) {
+            return ret;
+        }
+
+        ret = sbus_iterator_write_s(&variant, all->homeDirectory.value);
+        ret = sbus_property_close_entry(dict, &entry, &variant, ret);
+        if (ret != EOK) {
+            return ret;
+        }
+    }
+
+    if (all->loginShell.is_set) {
+        ret = sbus_property_open_entry(dict, &entry, &variant, "loginShell", "s");
+        if (ret != EOK) {
+            return ret;
+        }
+
+        ret = sbus_iterator_write_s(&variant, all->loginShell.value);
+        ret = sbus_property_close_entry(dict, &entry, &variant, ret);
+        if (ret != EOK) {
+            return ret;
+        }
+    }
+
+    if (all->name.is_set) {
+        ret = sbus_property_open_entry(dict, &entry, &variant, "name", "s");
+        if (ret != EOK) {
+            return ret;
+        }
+
+        ret = sbus_iterator_write_s(&variant, all->name.value);
+        ret = sbus_property_close_entry(dict, &entry, &variant, ret);
+        if (ret != EOK) {
+            return ret;
+        }
+    }
+
+    if (all->uidNumber.is_set) {
+        ret = sbus_property_open_entry(dict, &entry, &variant, "uidNumber", "u");
+        if (ret != EOK) {
+            return ret;
+        }
+
+        ret = sbus_iterator_write_u(&variant, all->uidNumber.value);
+        ret = sbus_property_close_entry(dict, &entry, &variant, ret);
+        if (ret != EOK) {
+            return ret;
+        }
+    }
+
+    if (all->uniqueID.is_set) {
+        ret = sbus_property_open_entry(dict, &entry, &variant, "uniqueID", "s");
+        if (ret != EOK) {
+            return ret;
+        }
+
+        ret = sbus_iterator_write_s(&variant, all->uniqueID.value);
+        ret = sbus_property_close_entry(dict, &entry, &variant, ret);
+        if (ret != EOK) {
+            return ret;
+        }
+    }
+
+    return EOK;
+}
+
+struct tevent_req *
+_sbus_ifp_getall_invoke_org_freedesktop_sssd_infopipe_Users_User_send
+   (TALLOC_CTX *mem_ctx,
+    struct tevent_context *ev,
+    struct sbus_request *sbus_req,
+    sbus_invoker_keygen keygen,
+    const struct sbus_handler *handler,
+    DBusMessageIter *read_iterator,
+    DBusMessageIter *write_iterator,
+    struct sbus_request_key *key)
+{
+    return sbus_invoke_getall_send(mem_ctx, ev, sbus_req, handler,
+                                   write_iterator,
+                                   sizeof(struct sbus_getall_org_freedesktop_sssd_infopipe_Users_User),
+                                   _sbus_ifp_getall_write_org_freedesktop_sssd_infopipe_Users_User);
+}
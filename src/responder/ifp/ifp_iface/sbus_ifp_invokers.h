@@ -37,7 +37,7 @@
          const struct sbus_handler *handler,                              \
          DBusMessageIter *read_iterator,                                  \
          DBusMessageIter *write_iterator,                                 \
-         const char **_key)
+         struct sbus_request_key *key)
 
 _sbus_ifp_declare_invoker(, );
 _sbus_ifp_declare_invoker(, ao);
@@ -57,4 +57,62 @@ _sbus_ifp_declare_invoker(ssu, ao);
 _sbus_ifp_declare_invoker(su, ao);
 _sbus_ifp_declare_invoker(u, o);
 
+struct sbus_getall_org_freedesktop_sssd_infopipe_Users_User {
+    struct {
+        bool is_set;
+        const char * value;
+    } domain;
+    struct {
+        bool is_set;
+        const char * value;
+    } domainname;
+    struct {
+        bool is_set;
+        hash_table_t * value;
+    } extraAttributes;
+    struct {
+        bool is_set;
+        const char * value;
+    } gecos;
+    struct {
+        bool is_set;
+        uint32_t value;
+    } gidNumber;
+    struct {
+        bool is_set;
+        const char ** value;
+    } groups;
+    struct {
+        bool is_set;
+        const char * value;
+    } homeDirectory;
+    struct {
+        bool is_set;
+        const char * value;
+    } loginShell;
+    struct {
+        bool is_set;
+        const char * value;
+    } name;
+    struct {
+        bool is_set;
+        uint32_t value;
+    } uidNumber;
+    struct {
+        bool is_set;
+        const char * value;
+    } uniqueID;
+};
+
+struct tevent_req *
+_sbus_ifp_getall_invoke_org_freedesktop_sssd_infopipe_Users_User_send
+    (TALLOC_CTX *mem_ctx,
+     struct tevent_context *ev,
+     struct sbus_request *sbus_req,
+     sbus_invoker_keygen keygen,
+     const struct sbus_handler *handler,
+     DBusMessageIter *read_iterator,
+     DBusMessageIter *write_iterator,
+     struct sbus_request_key *key);
+
 #endif /* _SBUS_IFP_INVOKERS_H_ */
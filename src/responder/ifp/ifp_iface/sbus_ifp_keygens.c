@@ -17,91 +17,57 @@
     along with this program.  If not, see <http://www.gnu.org/licenses/>.
 */
 
-#include <inttypes.h>
-#include <talloc.h>
-
 #include "sbus/sbus_request.h"
 #include "responder/ifp/ifp_iface/sbus_ifp_arguments.h"
 #include "responder/ifp/ifp_iface/sbus_ifp_keygens.h"
 
-const char *
+void
 _sbus_ifp_key_
-   (TALLOC_CTX *mem_ctx,
+   (struct sbus_request_key *key,
     struct sbus_request *sbus_req)
 {
-    if (sbus_req->sender == NULL) {
-        return talloc_asprintf(mem_ctx, "-:%u:%s.%s:%s",
-            sbus_req->type, sbus_req->interface, sbus_req->member, sbus_req->path);
-    }
-
-    return talloc_asprintf(mem_ctx, "%"PRIi64":%u:%s.%s:%s",
-        sbus_req->sender->uid, sbus_req->type, sbus_req->interface, sbus_req->member, sbus_req->path);
+    sbus_request_key_init(key, sbus_req);
 }
 
-const char *
+void
 _sbus_ifp_key_s_0
-   (TALLOC_CTX *mem_ctx,
+   (struct sbus_request_key *key,
     struct sbus_request *sbus_req,
     struct _sbus_ifp_invoker_args_s *args)
 {
-    if (sbus_req->sender == NULL) {
-        return talloc_asprintf(mem_ctx, "-:%u:%s.%s:%s:%s",
-            sbus_req->type, sbus_req->interface, sbus_req->member,
-            sbus_req->path, args->arg0);
-    }
-
-    return talloc_asprintf(mem_ctx, "%"PRIi64":%u:%s.%s:%s:%s",
-        sbus_req->sender->uid, sbus_req->type, sbus_req->interface, sbus_req->member,
-        sbus_req->path, args->arg0);
+    sbus_request_key_init(key, sbus_req);
+    sbus_request_key_add_string(key, args->arg0);
 }
 
-const char *
+void
 _sbus_ifp_key_ssu_0_1_2
-   (TALLOC_CTX *mem_ctx,
+   (struct sbus_request_key *key,
     struct sbus_request *sbus_req,
     struct _sbus_ifp_invoker_args_ssu *args)
 {
-    if (sbus_req->sender == NULL) {
-        return talloc_asprintf(mem_ctx, "-:%u:%s.%s:%s:%s:%s:%" PRIu32 "",
-            sbus_req->type, sbus_req->interface, sbus_req->member,
-            sbus_req->path, args->arg0, args->arg1, args->arg2);
-    }
-
-    return talloc_asprintf(mem_ctx, "%"PRIi64":%u:%s.%s:%s:%s:%s:%" PRIu32 "",
-        sbus_req->sender->uid, sbus_req->type, sbus_req->interface, sbus_req->member,
-        sbus_req->path, args->arg0, args->arg1, args->arg2);
+    sbus_request_key_init(key, sbus_req);
+    sbus_request_key_add_string(key, args->arg0);
+    sbus_request_key_add_string(key, args->arg1);
+    sbus_request_key_add_value(key, args->arg2);
 }
 
-const char *
+void
 _sbus_ifp_key_su_0_1
-   (TALLOC_CTX *mem_ctx,
+   (struct sbus_request_key *key,
     struct sbus_request *sbus_req,
     struct _sbus_ifp_invoker_args_su *args)
 {
-    if (sbus_req->sender == NULL) {
-        return talloc_asprintf(mem_ctx, "-:%u:%s.%s:%s:%s:%" PRIu32 "",
-            sbus_req->type, sbus_req->interface, sbus_req->member,
-            sbus_req->path, args->arg0, args->arg1);
-    }
-
-    return talloc_asprintf(mem_ctx, "%"PRIi64":%u:%s.%s:%s:%s:%" PRIu32 "",
-        sbus_req->sender->uid, sbus_req->type, sbus_req->interface, sbus_req->member,
-        sbus_req->path, args->arg0, args->arg1);
+    sbus_request_key_init(key, sbus_req);
+    sbus_request_key_add_string(key, args->arg0);
+    sbus_request_key_add_value(key, args->arg1);
 }
 
-const char *
+void
 _sbus_ifp_key_u_0
-   (TALLOC_CTX *mem_ctx,
+   (struct sbus_request_key *key,
     struct sbus_request *sbus_req,
     struct _sbus_ifp_invoker_args_u *args)
 {
-    if (sbus_req->sender == NULL) {
-        return talloc_asprintf(mem_ctx, "-:%u:%s.%s:%s:%" PRIu32 "",
-            sbus_req->type, sbus_req->interface, sbus_req->member,
-            sbus_req->path, args->arg0);
-    }
-
-    return talloc_asprintf(mem_ctx, "%"PRIi64":%u:%s.%s:%s:%" PRIu32 "",
-        sbus_req->sender->uid, sbus_req->type, sbus_req->interface, sbus_req->member,
-        sbus_req->path, args->arg0);
+    sbus_request_key_init(key, sbus_req);
+    sbus_request_key_add_value(key, args->arg0);
 }
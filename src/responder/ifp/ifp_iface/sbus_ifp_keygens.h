@@ -20,37 +20,35 @@
 #ifndef _SBUS_IFP_KEYGENS_H_
 #define _SBUS_IFP_KEYGENS_H_
 
-#include <talloc.h>
-
 #include "sbus/sbus_request.h"
 #include "responder/ifp/ifp_iface/sbus_ifp_arguments.h"
 
-const char *
+void
 _sbus_ifp_key_
-   (TALLOC_CTX *mem_ctx,
+   (struct sbus_request_key *key,
     struct sbus_request *sbus_req);
 
-const char *
+void
 _sbus_ifp_key_s_0
-   (TALLOC_CTX *mem_ctx,
+   (struct sbus_request_key *key,
     struct sbus_request *sbus_req,
     struct _sbus_ifp_invoker_args_s *args);
 
-const char *
+void
 _sbus_ifp_key_ssu_0_1_2
-   (TALLOC_CTX *mem_ctx,
+   (struct sbus_request_key *key,
     struct sbus_request *sbus_req,
     struct _sbus_ifp_invoker_args_ssu *args);
 
-const char *
+void
 _sbus_ifp_key_su_0_1
-   (TALLOC_CTX *mem_ctx,
+   (struct sbus_request_key *key,
     struct sbus_request *sbus_req,
     struct _sbus_ifp_invoker_args_su *args);
 
-const char *
+void
 _sbus_ifp_key_u_0
-   (TALLOC_CTX *mem_ctx,
+   (struct sbus_request_key *key,
     struct sbus_request *sbus_req,
     struct _sbus_ifp_invoker_args_u *args);
 
@@ -42,6 +42,7 @@ struct ifp_ctx {
     struct sbus_connection *sysbus;
     const char **user_whitelist;
     uint32_t wildcard_limit;
+    bool method_stats;
 };
 
 errno_t
@@ -1693,6 +1693,54 @@ ifp_users_user_get_unique_id(TALLOC_CTX *mem_ctx,
     return ifp_users_get_as_string(mem_ctx, sbus_req, ctx, SYSDB_UUID, _out, NULL);
 }
 
+/* Build group object paths from an initgroups result. */
+static errno_t
+ifp_users_groups_from_res(TALLOC_CTX *mem_ctx,
+                          struct sss_domain_info *domain,
+                          struct ldb_result *res,
+                          const char ***_out)
+{
+    const char **out;
+    int num_groups;
+    gid_t gid;
+    int i;
+
+    if (res->count == 0) {
+        *_out = NULL;
+        return EOK;
+    }
+
+    out = talloc_zero_array(mem_ctx, const char *, res->count + 1);
+    if (out == NULL) {
+        DEBUG(SSSDBG_CRIT_FAILURE, "talloc_zero_array() failed\n");
+        return ENOMEM;
+    }
+
+    num_groups = 0;
+    for (i = 0; i < res->count; i++) {
+        gid = sss_view_ldb_msg_find_attr_as_uint64(domain, res->msgs[i],
+                                                   SYSDB_GIDNUM, 0);
+        if (gid == 0 && domain->type == DOM_TYPE_POSIX) {
+            continue;
+        }
+
+        out[num_groups] = ifp_groups_build_path_from_msg(out,
+                                                         domain,
+                                                         res->msgs[i]);
+        if (out[num_groups] == NULL) {
+            DEBUG(SSSDBG_CRIT_FAILURE, "ifp_groups_build_path() failed\n");
+            talloc_free(out);
+            return ENOMEM;
+        }
+
+        num_groups++;
+    }
+
+    *_out = out;
+
+    return EOK;
+}
+
 errno_t
 ifp_users_user_get_groups(TALLOC_CTX *mem_ctx,
                           struct sbus_request *sbus_req,
@@ -1705,10 +1753,7 @@ ifp_users_user_get_groups(TALLOC_CTX *mem_ctx,
     struct ldb_message *user;
     struct ldb_result *res;
     const char **out;
-    int num_groups;
-    gid_t gid;
     errno_t ret;
-    int i;
 
     tmp_ctx = talloc_new(NULL);
     if (tmp_ctx == NULL) {
@@ -1735,39 +1780,11 @@ ifp_users_user_get_groups(TALLOC_CTX *mem_ctx,
         goto done;
     }
 
-    if (res->count == 0) {
-        *_out = NULL;
-        ret = EOK;
-        goto done;
-    }
-
-    out = talloc_zero_array(tmp_ctx, const char *, res->count + 1);
-    if (out == NULL) {
-        DEBUG(SSSDBG_CRIT_FAILURE, "talloc_zero_array() failed\n");
-        ret = ENOMEM;
+    ret = ifp_users_groups_from_res(tmp_ctx, domain, res, &out);
+    if (ret != EOK) {
         goto done;
     }
 
-    num_groups = 0;
-    for (i = 0; i < res->count; i++) {
-        gid = sss_view_ldb_msg_find_attr_as_uint64(domain, res->msgs[i],
-                                                   SYSDB_GIDNUM, 0);
-        if (gid == 0 && domain->type == DOM_TYPE_POSIX) {
-            continue;
-        }
-
-        out[num_groups] = ifp_groups_build_path_from_msg(out,
-                                                         domain,
-                                                         res->msgs[i]);
-        if (out[num_groups] == NULL) {
-            DEBUG(SSSDBG_CRIT_FAILURE, "ifp_groups_build_path() failed\n");
-            ret = ENOMEM;
-            goto done;
-        }
-
-        num_groups++;
-    }
-
     *_out = talloc_steal(mem_ctx, out);
 
     ret = EOK;
@@ -1821,6 +1838,76 @@ ifp_users_user_get_domain(TALLOC_CTX *mem_ctx,
     return EOK;
 }
 
+/* Build the extraAttributes table from a user entry. */
+static errno_t
+ifp_users_extra_from_msg(TALLOC_CTX *mem_ctx,
+                         const char **extra,
+                         struct ldb_message *user,
+                         hash_table_t **_table)
+{
+    struct ldb_message_element *el;
+    hash_table_t *table;
+    hash_key_t key;
+    hash_value_t value;
+    const char **values;
+    errno_t ret;
+    int hret;
+    int i;
+
+    ret = sss_hash_create(mem_ctx, 0, &table);
+    if (ret != EOK) {
+        DEBUG(SSSDBG_CRIT_FAILURE, "Unable to create hash table!\n");
+        return ret;
+    }
+
+    /* Read each extra attribute. */
+    for (i = 0; extra[i] != NULL; i++) {
+        el = ldb_msg_find_element(user, extra[i]);
+        if (el == NULL) {
+            DEBUG(SSSDBG_TRACE_ALL, "Attribute %s not found, skipping...\n",
+                  extra[i]);
+            continue;
+        }
+
+        values = sss_ldb_el_to_string_list(table, el);
+        if (values == NULL) {
+            DEBUG(SSSDBG_CRIT_FAILURE, "sss_ldb_el_to_string_list() failed\n");
+            ret = ENOMEM;
+            goto done;
+        }
+
+        key.type = HASH_KEY_STRING;
+        key.str = talloc_strdup(table, extra[i]);
+        if (key.str == NULL) {
+            DEBUG(SSSDBG_CRIT_FAILURE, "talloc_strdup() failed\n");
+            ret = ENOMEM;
+            goto done;
+        }
+
+        value.type = HASH_VALUE_PTR;
+        value.ptr = values;
+
+        hret = hash_enter(table, &key, &value);
+        if (hret != HASH_SUCCESS) {
+            DEBUG(SSSDBG_CRIT_FAILURE, "Unable to insert entry "
+                 "into hash table: %d\n", hret);
+            ret = EIO;
+            goto done;
+        }
+    }
+
+    *_table = table;
+
+    ret = EOK;
+
+done:
+    if (ret != EOK) {
+        talloc_free(table);
+    }
+
+    return ret;
+}
+
 errno_t
 ifp_users_user_get_extra_attributes(TALLOC_CTX *mem_ctx,
                                     struct sbus_request *sbus_req,
@@ -1832,18 +1919,12 @@ ifp_users_user_get_extra_attributes(TALLOC_CTX *mem_ctx,
     struct ldb_message *base_user;
     const char *name;
     struct ldb_message **user;
-    struct ldb_message_element *el;
     struct ldb_dn *basedn;
     size_t count;
     const char *filter;
     const char **extra;
     hash_table_t *table;
-    hash_key_t key;
-    hash_value_t value;
-    const char **values;
     errno_t ret;
-    int hret;
-    int i;
 
     tmp_ctx = talloc_new(NULL);
     if (tmp_ctx == NULL) {
@@ -1906,49 +1987,156 @@ ifp_users_user_get_extra_attributes(TALLOC_CTX *mem_ctx,
         goto done;
     }
 
-    ret = sss_hash_create(tmp_ctx, 0, &table);
+    ret = ifp_users_extra_from_msg(tmp_ctx, extra, user[0], &table);
     if (ret != EOK) {
-        DEBUG(SSSDBG_CRIT_FAILURE, "Unable to create hash table!\n");
         goto done;
     }
 
-    /* Read each extra attribute. */
-    for (i = 0; extra[i] != NULL; i++) {
-        el = ldb_msg_find_element(user[0], extra[i]);
-        if (el == NULL) {
-            DEBUG(SSSDBG_TRACE_ALL, "Attribute %s not found, skipping...\n",
-                  extra[i]);
-            continue;
-        }
+    *_out = talloc_steal(mem_ctx, table);
 
-        values = sss_ldb_el_to_string_list(table, el);
-        if (values == NULL) {
-            DEBUG(SSSDBG_CRIT_FAILURE, "sss_ldb_el_to_string_list() failed\n");
-            ret = ENOMEM;
+    ret = EOK;
+
+done:
+    talloc_free(tmp_ctx);
+
+    return ret;
+}
+
+static void
+ifp_users_user_get_all_string(struct ifp_ctx *ifp_ctx,
+                              struct sss_domain_info *domain,
+                              struct ldb_message *user,
+                              const char *property,
+                              const char *attr,
+                              bool *_is_set,
+                              const char **_value)
+{
+    const char *value;
+
+    if (user == NULL || !ifp_is_user_attr_allowed(ifp_ctx, property)) {
+        return;
+    }
+
+    value = sss_view_ldb_msg_find_attr_as_string(domain, user, attr, NULL);
+    if (value == NULL) {
+        return;
+    }
+
+    *_is_set = true;
+    *_value = value;
+}
+
+static void
+ifp_users_user_get_all_uint32(struct ifp_ctx *ifp_ctx,
+                              struct sss_domain_info *domain,
+                              struct ldb_message *user,
+                              const char *property,
+                              const char *attr,
+                              bool *_is_set,
+                              uint32_t *_value)
+{
+    if (user == NULL || !ifp_is_user_attr_allowed(ifp_ctx, property)) {
+        return;
+    }
+
+    *_is_set = true;
+    *_value = sss_view_ldb_msg_find_attr_as_uint64(domain, user, attr, 0);
+}
+
+/* Look up the user once with the standard and the extra attributes and
+ * append the groups the user is a member of to the same result. */
+static errno_t
+ifp_users_user_get_all_res(TALLOC_CTX *mem_ctx,
+                           struct sbus_request *sbus_req,
+                           struct ifp_ctx *ifp_ctx,
+                           const char **extra,
+                           bool with_groups,
+                           struct sss_domain_info **_domain,
+                           struct ldb_result **_res)
+{
+    static const char *pw_attrs[] = SYSDB_PW_ATTRS;
+    TALLOC_CTX *tmp_ctx;
+    struct sss_domain_info *domain;
+    struct ldb_result *res = NULL;
+    const char **attrs;
+    char *endptr;
+    char *key;
+    uid_t uid;
+    errno_t ret;
+
+    tmp_ctx = talloc_new(NULL);
+    if (tmp_ctx == NULL) {
+        DEBUG(SSSDBG_FATAL_FAILURE, "Out of memory!\n");
+        return ENOMEM;
+    }
+
+    ret = ifp_users_decompose_path(tmp_ctx,
+                                   ifp_ctx->rctx->domains, sbus_req->path,
+                                   &domain, &key);
+    if (ret != EOK) {
+        DEBUG(SSSDBG_CRIT_FAILURE, "Unable to decompose object path"
+              "[%s] [%d]: %s\n", sbus_req->path, ret, sss_strerror(ret));
+        goto done;
+    }
+
+    *_domain = domain;
+
+    attrs = pw_attrs;
+    if (extra != NULL) {
+        ret = add_strings_lists(tmp_ctx, pw_attrs, extra, false,
+                                discard_const(&attrs));
+        if (ret != EOK) {
+            DEBUG(SSSDBG_CRIT_FAILURE, "add_strings_lists() failed\n");
             goto done;
         }
+    }
 
-        key.type = HASH_KEY_STRING;
-        key.str = talloc_strdup(table, extra[i]);
-        if (key.str == NULL) {
-            DEBUG(SSSDBG_CRIT_FAILURE, "talloc_strdup() failed\n");
-            ret = ENOMEM;
+    switch (domain->type) {
+    case DOM_TYPE_POSIX:
+        uid = strtouint32(key, &endptr, 10);
+        if ((errno != 0) || *endptr || (key == endptr)) {
+            ret = errno ? errno : EINVAL;
+            DEBUG(SSSDBG_CRIT_FAILURE, "Invalid UID value\n");
             goto done;
         }
 
-        value.type = HASH_VALUE_PTR;
-        value.ptr = values;
+        ret = sysdb_get_user_attr_by_uid_with_views(tmp_ctx, domain, uid,
+                                                    attrs, &res);
+        break;
+    case DOM_TYPE_APPLICATION:
+        ret = sysdb_get_user_attr_with_views(tmp_ctx, domain, key, attrs,
+                                             &res);
+        break;
+    default:
+        ret = EINVAL;
+        break;
+    }
 
-        hret = hash_enter(table, &key, &value);
-        if (hret != HASH_SUCCESS) {
-            DEBUG(SSSDBG_CRIT_FAILURE, "Unable to insert entry "
-                 "into hash table: %d\n", hret);
-            ret = EIO;
+    if (ret != EOK) {
+        DEBUG(SSSDBG_CRIT_FAILURE, "Unable to lookup user %s@%s [%d]: %s\n",
+              key, domain->name, ret, sss_strerror(ret));
+        goto done;
+    }
+
+    if (res->count == 0) {
+        ret = ENOENT;
+        goto done;
+    } else if (res->count > 1) {
+        DEBUG(SSSDBG_CRIT_FAILURE, "More users matched by the single key\n");
+        ret = EIO;
+        goto done;
+    }
+
+    if (with_groups) {
+        ret = sysdb_initgroups_append_with_views(domain, res);
+        if (ret != EOK) {
+            DEBUG(SSSDBG_CRIT_FAILURE, "Unable to get groups for %s@%s "
+                  "[%d]: %s\n", key, domain->name, ret, sss_strerror(ret));
             goto done;
         }
     }
 
-    *_out = talloc_steal(mem_ctx, table);
+    *_res = talloc_steal(mem_ctx, res);
 
     ret = EOK;
 
@@ -1958,6 +2146,126 @@ done:
     return ret;
 }
 
+errno_t
+ifp_users_user_get_all(TALLOC_CTX *mem_ctx,
+                       struct sbus_request *sbus_req,
+                       struct ifp_ctx *ifp_ctx,
+                       struct sbus_getall_org_freedesktop_sssd_infopipe_Users_User *_all)
+{
+    struct sss_domain_info *domain = NULL;
+    struct ldb_result *res = NULL;
+    struct ldb_message *user = NULL;
+    const char **extra = NULL;
+    bool with_groups;
+    bool with_extra;
+    const char *name;
+    errno_t ret;
+
+    with_groups = ifp_is_user_attr_allowed(ifp_ctx, "groups");
+    with_extra = ifp_is_user_attr_allowed(ifp_ctx, "extraAttributes");
+
+    if (with_extra) {
+        extra = ifp_get_user_extra_attributes(mem_ctx, ifp_ctx);
+        if (extra == NULL) {
+            return ENOMEM;
+        }
+    }
+
+    /* All properties are read from this single result. The user entry is
+     * the first message, groups of the user follow it. */
+    ret = ifp_users_user_get_all_res(mem_ctx, sbus_req, ifp_ctx, extra,
+                                     with_groups, &domain, &res);
+    if (ret == ENOENT && domain != NULL) {
+        res = NULL;
+    } else if (ret != EOK) {
+        return ret;
+    }
+
+    if (res != NULL) {
+        user = res->msgs[0];
+    }
+
+    if (user != NULL && ifp_is_user_attr_allowed(ifp_ctx, "name")) {
+        name = sss_view_ldb_msg_find_attr_as_string(domain, user,
+                                                    SYSDB_NAME, NULL);
+        if (name != NULL) {
+            _all->name.value = ifp_format_name_attr(mem_ctx, ifp_ctx,
+                                                    name, domain);
+            if (_all->name.value == NULL) {
+                return ENOMEM;
+            }
+
+            _all->name.is_set = true;
+        }
+    }
+
+    ifp_users_user_get_all_uint32(ifp_ctx, domain, user, "uidNumber",
+                                  SYSDB_UIDNUM, &_all->uidNumber.is_set,
+                                  &_all->uidNumber.value);
+
+    ifp_users_user_get_all_uint32(ifp_ctx, domain, user, "gidNumber",
+                                  SYSDB_GIDNUM, &_all->gidNumber.is_set,
+                                  &_all->gidNumber.value);
+
+    ifp_users_user_get_all_string(ifp_ctx, domain, user, "gecos",
+                                  SYSDB_GECOS, &_all->gecos.is_set,
+                                  &_all->gecos.value);
+
+    ifp_users_user_get_all_string(ifp_ctx, domain, user, "homeDirectory",
+                                  SYSDB_HOMEDIR, &_all->homeDirectory.is_set,
+                                  &_all->homeDirectory.value);
+
+    ifp_users_user_get_all_string(ifp_ctx, domain, user, "loginShell",
+                                  SYSDB_SHELL, &_all->loginShell.is_set,
+                                  &_all->loginShell.value);
+
+    ifp_users_user_get_all_string(ifp_ctx, domain, user, "uniqueID",
+                                  SYSDB_UUID, &_all->uniqueID.is_set,
+                                  &_all->uniqueID.value);
+
+    if (ifp_is_user_attr_allowed(ifp_ctx, "domainname")) {
+        _all->domainname.is_set = true;
+        _all->domainname.value = domain->name;
+    }
+
+    if (ifp_is_user_attr_allowed(ifp_ctx, "domain")) {
+        _all->domain.value = sbus_opath_compose(mem_ctx, IFP_PATH_DOMAINS,
+                                                domain->name);
+        if (_all->domain.value == NULL) {
+            return ENOMEM;
+        }
+
+        _all->domain.is_set = true;
+    }
+
+    if (user != NULL && with_groups) {
+        ret = ifp_users_groups_from_res(mem_ctx, domain, res,
+                                        &_all->groups.value);
+        if (ret != EOK) {
+            return ret;
+        }
+
+        _all->groups.is_set = true;
+    }
+
+    if (user != NULL && with_extra) {
+        if (extra[0] == NULL) {
+            DEBUG(SSSDBG_TRACE_ALL, "No extra attributes to return\n");
+            _all->extraAttributes.value = NULL;
+        } else {
+            ret = ifp_users_extra_from_msg(mem_ctx, extra, user,
+                                           &_all->extraAttributes.value);
+            if (ret != EOK) {
+                return ret;
+            }
+        }
+
+        _all->extraAttributes.is_set = true;
+    }
+
+    return EOK;
+}
+
 errno_t
 ifp_cache_list_user(TALLOC_CTX *mem_ctx,
                     struct sbus_request *sbus_req,
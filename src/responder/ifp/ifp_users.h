@@ -209,6 +209,12 @@ ifp_users_user_get_extra_attributes(TALLOC_CTX *mem_ctx,
                                     struct ifp_ctx *ifp_ctx,
                                     hash_table_t **_out);
 
+errno_t
+ifp_users_user_get_all(TALLOC_CTX *mem_ctx,
+                       struct sbus_request *sbus_req,
+                       struct ifp_ctx *ifp_ctx,
+                       struct sbus_getall_org_freedesktop_sssd_infopipe_Users_User *_all);
+
 /* org.freedesktop.sssd.infopipe.Cache */
 
 errno_t
@@ -85,6 +85,14 @@ sysbus_init(TALLOC_CTX *mem_ctx,
         goto done;
     }
 
+    if (ifp_ctx->method_stats) {
+        ret = sbus_connection_enable_stats(sysbus);
+        if (ret != EOK) {
+            DEBUG(SSSDBG_FATAL_FAILURE, "Could not enable method statistics\n");
+            goto done;
+        }
+    }
+
     *_sysbus = sysbus;
 
     ret = EOK;
@@ -255,6 +263,16 @@ int ifp_process_init(TALLOC_CTX *mem_ctx,
         }
     }
 
+    ret = confdb_get_bool(ifp_ctx->rctx->cdb,
+                          CONFDB_IFP_CONF_ENTRY,
+                          CONFDB_IFP_METHOD_STATS,
+                          false, &ifp_ctx->method_stats);
+    if (ret != EOK) {
+        DEBUG(SSSDBG_FATAL_FAILURE,
+              "Failed to retrieve method statistics setting\n");
+        goto fail;
+    }
+
     /* Connect to the D-BUS system bus and set up methods */
     ret = sysbus_init(ifp_ctx, ifp_ctx->rctx->ev, IFP_BUS,
                       ifp_ctx, &ifp_ctx->sysbus);
@@ -19,11 +19,15 @@
 #
 
 import os
+import glob
+import json
+import hashlib
 import argparse
 from collections import OrderedDict
 from sbus_Introspection import Introspectable
 from sbus_Template import TemplateFile
 from sbus_Generator import Generator
+from sbus_Model import Model
 from sbus_DataType import DataType
 
 
@@ -56,28 +60,151 @@ class CodeGen:
         - codegen.AsyncCaller
           - boolean, default is true
           - Generate asynchronous callers
+
+        * Annotations on interfaces:
+        - codegen.GetAllHandler
+          - boolean, default is false
+          - Generate GetAll handler that fills all readable properties at
+            once instead of calling each property getter
+
+        * Annotations on interfaces or methods:
+        - codegen.Batch
+          - boolean, default is false
+          - Generate asynchronous batch callers that issue several calls
+            of the method at once, each with its own object path and
+            arguments
     """
     def __init__(self, options):
         # Temporarily change working directory so we can load the templates
         self.options = options
         self.templates = CodeGen.Templates(options)
         self.interfaces = OrderedDict()
+        self.model = None
         return
 
     def add(self, introspection_file):
         interfaces = Introspectable.Introspect(introspection_file)
-        merged = self.interfaces
 
         for name, interface in interfaces.items():
             if name in self.interfaces:
                 raise ValueError("Interface %s already exist!" % name)
-            merged[name] = interface
-
-        self.interfaces = OrderedDict(sorted(merged.items()))
+            self.interfaces[name] = interface
         return
 
+    def load(self, model):
+        self.model = model
+
     def generate(self):
-        Generator.GenerateCode(self.templates, self.interfaces)
+        if self.model is None:
+            self.model = Model.Build(self.interfaces)
+
+        Generator.GenerateCode(self.templates, self.model)
+
+    class Cache:
+        """
+            Cache manifest stored in the destination directory.
+
+            It contains a digest of everything that affects the generated
+            code: the generator sources, templates, options and introspection
+            files. When the digest matches and all generated files exist,
+            parsing and generation can be skipped completely.
+
+            The interface model is stored next to the manifest together with
+            a digest of the introspection files and the sources that build
+            the model. It is used instead of parsing the introspection files
+            when only the templates or options have changed.
+        """
+        ModelSources = [
+            "sbus_Introspection.py",
+            "sbus_Invoker.py",
+            "sbus_Model.py"
+        ]
+
+        def __init__(self, options, introspection_files):
+            self.options = options
+            self.introspection = introspection_files
+            self.path = "%s/.%scodegen.manifest" % \
+                (options.WritePath, options.FilePrefix)
+            self.modelPath = "%s/.%scodegen.model" % \
+                (options.WritePath, options.FilePrefix)
+
+        def digest(self):
+            sha = hashlib.sha256()
+
+            sources = sorted(glob.glob(self.options.path('*.py')))
+            sources += sorted(glob.glob(self.options.path('templates/*.tpl')))
+            for path in sources:
+                self.update(sha, os.path.basename(path), path)
+
+            sha.update(repr((self.options.SbusHeadersPath,
+                             self.options.UtilHeadersPath,
+                             self.options.GeneratedHeadersPath,
+                             self.options.FilePrefix,
+                             self.options.SymbolPrefix,
+                             self.options.IncludeHeaders)).encode('utf-8'))
+
+            for path in self.introspection:
+                self.update(sha, path, path)
+
+            return sha.hexdigest()
+
+        def modelDigest(self):
+            sha = hashlib.sha256()
+
+            for name in self.ModelSources:
+                self.update(sha, name, self.options.path(name))
+
+            for path in self.introspection:
+                self.update(sha, path, path)
+
+            return sha.hexdigest()
+
+        def update(self, sha, name, path):
+            sha.update(name.encode('utf-8') + b'\0')
+            with open(path, 'rb') as f:
+                sha.update(f.read())
+            sha.update(b'\0')
+
+        def outputs(self):
+            return ["%s/%s%s" % (self.options.WritePath,
+                                 self.options.FilePrefix, name)
+                    for name in CodeGen.Templates.GeneratedFiles]
+
+        def valid(self, digest):
+            try:
+                with open(self.path, 'r') as f:
+                    stored = f.read().strip()
+            except IOError:
+                return False
+
+            if stored != digest:
+                return False
+
+            return all(os.path.exists(path) for path in self.outputs())
+
+        def store(self, digest):
+            with open(self.path, 'w') as f:
+                f.write(digest + '\n')
+
+        def model(self, digest):
+            try:
+                with open(self.modelPath, 'r') as f:
+                    stored = json.load(f)
+            except (IOError, ValueError):
+                return None
+
+            if stored.get("digest") != digest:
+                return None
+
+            try:
+                return Model.FromDict(stored["model"])
+            except (KeyError, ValueError):
+                return None
+
+        def storeModel(self, digest, model):
+            with open(self.modelPath, 'w') as f:
+                json.dump({"digest": digest, "model": model.ToDict()}, f)
+                f.write('\n')
 
     class Options:
         def __init__(self,
@@ -211,21 +338,21 @@ def InitializeDataTypes():
     """Define which D-Bus types are supported by code generator."""
 
     # Standard types
-    DataType.Create("y", "uint8_t", '" PRIu8 "')
-    DataType.Create("b", "bool", "d")
-    DataType.Create("n", "int16_t", '" PRId16 "')
-    DataType.Create("q", "uint16_t", '" PRIu16 "')
-    DataType.Create("i", "int32_t", '" PRId32 "')
-    DataType.Create("u", "uint32_t", '" PRIu32 "')
-    DataType.Create("x", "int64_t", '" PRId64 "')
-    DataType.Create("t", "uint64_t", '" PRIu64 "')
-    DataType.Create("d", "double", "f")
+    DataType.Create("y", "uint8_t", "value")
+    DataType.Create("b", "bool", "value")
+    DataType.Create("n", "int16_t", "value")
+    DataType.Create("q", "uint16_t", "value")
+    DataType.Create("i", "int32_t", "value")
+    DataType.Create("u", "uint32_t", "value")
+    DataType.Create("x", "int64_t", "value")
+    DataType.Create("t", "uint64_t", "value")
+    DataType.Create("d", "double", "value")
 
     # String types
-    DataType.Create("s", "const char *", "s", DBusType="s", RequireTalloc=True)
-    DataType.Create("S", "char *", "s", DBusType="s", RequireTalloc=True)
-    DataType.Create("o", "const char *", "s", DBusType="o", RequireTalloc=True)
-    DataType.Create("O", "char *", "s", DBusType="o", RequireTalloc=True)
+    DataType.Create("s", "const char *", "string", DBusType="s", RequireTalloc=True)
+    DataType.Create("S", "char *", "string", DBusType="s", RequireTalloc=True)
+    DataType.Create("o", "const char *", "string", DBusType="o", RequireTalloc=True)
+    DataType.Create("O", "char *", "string", DBusType="o", RequireTalloc=True)
 
     # Array types
     DataType.Create("ay", "uint8_t *", RequireTalloc=True)
@@ -301,6 +428,11 @@ def main():
         help="Include header with definition of custom types",
         required=False
     )
+    optional.add_argument(
+        '--force', action='store_true', dest="force",
+        help="Ignore the cache and always parse and generate the code",
+        required=False
+    )
     cmdline = parser.parse_args()
 
     opts = CodeGen.Options(
@@ -313,11 +445,26 @@ def main():
         IncludeHeaders=cmdline.include
     )
 
+    cache = CodeGen.Cache(opts, cmdline.introspection)
+    digest = cache.digest()
+    if not cmdline.force and cache.valid(digest):
+        return
+
     codegen = CodeGen(opts)
-    for file in cmdline.introspection:
-        codegen.add(file)
+    model_digest = cache.modelDigest()
+    model = None if cmdline.force else cache.model(model_digest)
+    if model is not None:
+        codegen.load(model)
+    else:
+        for file in cmdline.introspection:
+            codegen.add(file)
+
     codegen.generate()
 
+    if model is None:
+        cache.storeModel(model_digest, codegen.model)
+    cache.store(digest)
+
 
 if __name__ == "__main__":
     main()
@@ -29,14 +29,15 @@ class DataType:
     """
     available = {}
 
-    def __init__(self, sbus_type, dbus_type, c_type, key_format,
+    def __init__(self, sbus_type, dbus_type, c_type, key_type,
                  require_talloc):
         self.sbus_type = sbus_type
         self.dbus_type = dbus_type
         self.RequireTalloc = require_talloc
 
-        # Printf formatter (without leading %) if the type supports keying
-        self.keyFormat = key_format
+        # Request key writer ("value" or "string") if the type supports
+        # keying
+        self.keyType = key_type
 
         # Input and output C types. For example 'int' and 'int*'
         self.CType = c_type
@@ -63,15 +64,15 @@ class DataType:
         return DataType.available[sbus_type]
 
     @staticmethod
-    def Create(sbus_type, c_type, KeyFormat=None, DBusType=None,
+    def Create(sbus_type, c_type, KeyType=None, DBusType=None,
                RequireTalloc=False):
         """ Create a new SBus type. Specify DBusType if it differs from
-            the SBus type. Specify printf formatter KeyFormat if this type
-            can be used as a key.
+            the SBus type. Specify KeyType if this type can be used as a key,
+            "value" for fixed size types and "string" for strings.
         """
         dbus_type = DBusType if DBusType is not None else sbus_type
 
-        type = DataType(sbus_type, dbus_type, c_type, KeyFormat, RequireTalloc)
+        type = DataType(sbus_type, dbus_type, c_type, KeyType, RequireTalloc)
         DataType.available[sbus_type] = type
 
         return type
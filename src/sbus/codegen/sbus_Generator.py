@@ -19,34 +19,33 @@
 #
 
 from collections import OrderedDict
-from sbus_Invoker import Invoker, InvokerArgumentType, InvokerCaller, InvokerKeygen
+from sbus_Invoker import Invoker
 from sbus_Introspection import SBus
 from sbus_DataType import DataType
 
 
 class Generator:
     @staticmethod
-    def GenerateCode(templates, interfaces):
+    def GenerateCode(templates, model):
         """
-            Generate asynchronous code for given interfaces.
+            Generate asynchronous code for interfaces of given model.
         """
 
         class Callers:
-            def __init__(self, interfaces, type):
-                self.Methods = InvokerCaller.GatherMethodInvokers(interfaces,
-                                                                  type)
-                self.Signals = InvokerCaller.GatherSignalInvokers(interfaces,
-                                                                  type)
-                self.Getters = InvokerCaller.GatherGetInvokers(interfaces,
-                                                               type)
-                self.Setters = InvokerCaller.GatherSetInvokers(interfaces,
-                                                               type)
-
-        invokers = Invoker.GatherInvokers(interfaces)
-        arguments = InvokerArgumentType.GatherArgumentTypes(interfaces)
-        keygens = InvokerKeygen.GatherKeygens(interfaces)
-        sync_callers = Callers(interfaces, "sync")
-        async_callers = Callers(interfaces, "async")
+            def __init__(self, model, type):
+                tables = model.callers[type]
+
+                self.Methods = model.values(tables["methods"])
+                self.Signals = model.values(tables["signals"])
+                self.Getters = model.values(tables["getters"])
+                self.Setters = model.values(tables["setters"])
+
+        interfaces = model.interfaces
+        invokers = model.values(model.invokers)
+        arguments = model.values(model.arguments)
+        keygens = model.values(model.keygens)
+        sync_callers = Callers(model, "sync")
+        async_callers = Callers(model, "async")
 
         generators = [
             Generator.Interfaces(templates.get("interface.h"),
@@ -62,7 +61,7 @@ class Generator:
 
             Generator.Invokers(templates.get("invokers.c"),
                                templates.get("invokers.h"),
-                               invokers),
+                               invokers, interfaces),
 
             Generator.Keygens(templates.get("keygens.c"),
                               templates.get("keygens.h"),
@@ -147,6 +146,16 @@ class Generator:
 
             return name.strip('.').replace('.', '_')
 
+        def isWanted(self, member, type):
+            """
+                Return True if member has a sync or async caller. Any other
+                type means that either of them is enough.
+            """
+            if type in ["sync", "async"]:
+                return type in member.callers
+
+            return "sync" in member.callers or "async" in member.callers
+
         def setInputArguments(self, tpl, sbus_signature):
             """
                 Set input arguments in template.
@@ -221,6 +230,26 @@ class Generator:
             return self.tokenizeValue(self.getInterfaceName(iface),
                                       member_name)
 
+        def getAllProperties(self, iface):
+            """
+                Return readable properties of an interface that is annotated
+                with codegen.GetAllHandler or None if it is not annotated.
+            """
+            annotation = "codegen.GetAllHandler"
+            if not SBus.Annotation.FindBool(iface.annotations, annotation):
+                return None
+
+            properties = [property for property in iface.properties.values()
+                          if property.isReadable()]
+
+            if not properties:
+                raise ValueError(
+                    ('Interface "%s" has no readable properties to '
+                     'generate GetAll handler for') % iface.name
+                )
+
+            return properties
+
         def hasEmpty(self, invoker_signature):
             """
                 Return true if the invoker signature has empty argument list.
@@ -279,7 +308,7 @@ class Generator:
             if not tpl.hasToggle("keygen"):
                 return
 
-            args = InvokerKeygen.GatherKeyArguments(member, sbus_signature)
+            args = member.keyArguments
 
             if args is None:
                 tpl.show("keygen", False)
@@ -290,7 +319,7 @@ class Generator:
             for idx, arg in args.items():
                 type = DataType.Find(arg.signature)
 
-                if type.keyFormat is None:
+                if type.keyType is None:
                     raise ValueError(
                         ('Data type "%s" does not '
                          'support key generator') % type.sbus_type
@@ -298,7 +327,7 @@ class Generator:
 
                 tpl.add('key-argument', {
                     'key-index': idx,
-                    'key-format': type.keyFormat
+                    'key-type': type.keyType
                 })
 
             keys['key-signature'] = sbus_signature.signature
@@ -320,7 +349,7 @@ class Generator:
         def setMember(self, template_name, interface, member):
             tpl = self.header.get(template_name)
 
-            invoker = Invoker(member.input, member.output)
+            invoker = member.invoker
 
             keys = {
                 'interface': interface.name,
@@ -365,6 +394,9 @@ class Generator:
                 for property in interface.properties.values():
                     self.setMember('property', interface, property)
 
+                if self.getAllProperties(interface) is not None:
+                    self.setInterface('getall', interface)
+
     class Symbols(Base):
         """
             Generator for:
@@ -491,16 +523,19 @@ class Generator:
             - invokers.h
         """
 
-        def __init__(self, source, header, invokers):
+        def __init__(self, source, header, invokers, interfaces):
             super(Generator.Invokers, self).__init__()
 
             self.source = source
             self.header = header
             self.invokers = invokers
+            self.interfaces = interfaces
 
         def generate(self):
             self.generateSource()
             self.generateHeader()
+            self.generateGetAll(self.source.get("getall"))
+            self.generateGetAll(self.header.get("getall"))
 
         def generateSource(self):
             tpl = self.source.get("invoker")
@@ -525,6 +560,23 @@ class Generator:
                         "output-signature": invoker.output.invokerSignature}
                 tpl.set(keys)
 
+        def generateGetAll(self, tpl):
+            for iface in self.interfaces.values():
+                properties = self.getAllProperties(iface)
+                if properties is None:
+                    continue
+
+                for property in properties:
+                    type = DataType.Find(property.type)
+                    tpl.add("property", {'name': property.name,
+                                         'signature': property.type,
+                                         'type': type.dbus_type,
+                                         'input-type': type.inputCType})
+
+                keys = {"token": self.tokenizeName(iface)}
+
+                tpl.set(keys)
+
     class Keygens(Base):
         """
             Generator for:
@@ -554,7 +606,7 @@ class Generator:
             for idx, arg in args.items():
                 type = DataType.Find(arg.signature)
 
-                if type.keyFormat is None:
+                if type.keyType is None:
                     raise ValueError(
                         ('Data type "%s" does not '
                          'support key generator') % type.sbus_type
@@ -562,7 +614,7 @@ class Generator:
 
                 tpl.add('key-argument', {
                     'key-index': idx,
-                    'key-format': type.keyFormat
+                    'key-type': type.keyType
                 })
 
             tpl.set({'key-signature': signature})
@@ -592,7 +644,7 @@ class Generator:
                     if not property.isReadable():
                         continue
 
-                    if not InvokerCaller.IsWanted(iface, property, "either"):
+                    if not self.isWanted(property, "either"):
                         continue
 
                     added = True
@@ -630,6 +682,12 @@ class Generator:
             self.generateCallers(self.source.get("method-caller"))
             self.generateCallers(self.header.get("method-caller"))
 
+            if self.source.has("method-batch-caller"):
+                self.generateCallers(self.source.get("method-batch-caller"),
+                                     Batch=True)
+                self.generateCallers(self.header.get("method-batch-caller"),
+                                     Batch=True)
+
         def generateInvokers(self):
             tpl = self.source.get("method-invoker")
             for invoker in self.invokers.values():
@@ -658,13 +716,16 @@ class Generator:
 
                 tpl.set(keys)
 
-        def generateCallers(self, tpl):
+        def generateCallers(self, tpl, Batch=False):
             for iface in self.interfaces.values():
                 for method in iface.methods.values():
-                    if not InvokerCaller.IsWanted(iface, method, self.type):
+                    if not self.isWanted(method, self.type):
+                        continue
+
+                    if Batch and "batch" not in method.callers:
                         continue
 
-                    invoker = Invoker(method.input, method.output)
+                    invoker = method.invoker
                     tpl.show("if-raw-input",
                              self.hasRaw(invoker.input))
                     tpl.show("if-raw-output",
@@ -677,8 +738,7 @@ class Generator:
                     self.setInputArguments(tpl, invoker.input)
                     self.setOutputArguments(tpl, invoker.output)
 
-                    keygen = InvokerKeygen.BuildKeygenName(method,
-                                                           method.input)
+                    keygen = method.keygen
                     keys = {
                         "token": self.getMemberName(iface, method),
                         "iface": iface.name,
@@ -729,10 +789,10 @@ class Generator:
         def generateCallers(self, tpl):
             for iface in self.interfaces.values():
                 for signal in iface.signals.values():
-                    if not InvokerCaller.IsWanted(iface, signal, self.type):
+                    if not self.isWanted(signal, self.type):
                         continue
 
-                    invoker = Invoker(signal.input, signal.output)
+                    invoker = signal.invoker
                     tpl.show("if-raw-input", self.hasRaw(invoker.input))
 
                     self.setInputArguments(tpl, invoker.input)
@@ -799,7 +859,7 @@ class Generator:
         def generateCallers(self, tpl):
             for iface in self.interfaces.values():
                 for property in iface.properties.values():
-                    if not InvokerCaller.IsWanted(iface, property, self.type):
+                    if not self.isWanted(property, self.type):
                         continue
 
                     if property.isReadable():
@@ -808,7 +868,7 @@ class Generator:
                     if property.isWritable():
                         tpl.show("set", True)
 
-                    invoker = Invoker(property.input, property.output)
+                    invoker = property.invoker
                     type = DataType.Find(property.type)
 
                     tpl.show("get-static", not type.RequireTalloc)
@@ -837,13 +897,13 @@ class Generator:
                     if not property.isReadable():
                         continue
 
-                    if not InvokerCaller.IsWanted(iface, property, self.type):
+                    if not self.isWanted(property, self.type):
                         continue
 
                     added = True
 
                     type = DataType.Find(property.type)
-                    invoker = Invoker(property.input, property.output)
+                    invoker = property.invoker
 
                     loop_name = 'property-static'
                     if type.RequireTalloc:
@@ -53,43 +53,33 @@ class Invoker:
         if is_custom_handler:
             invoker_signature = "raw"
 
+        return self.createSignature(sbus_signature, invoker_signature)
+
+    def createSignature(self, sbus_signature, invoker_signature):
+        if sbus_signature is None:
+            return InvokerSignature(invoker_signature, {}, {})
+
         return InvokerSignature(invoker_signature,
                                 sbus_signature.arguments,
                                 sbus_signature.annotations)
 
     @staticmethod
-    def GatherInvokers(interfaces):
+    def FromSignatures(sbus_input, sbus_output, input, output):
         """
-            Gather all required invokers for given interfaces.
+            Create invoker with already known invoker signatures.
         """
-        dict = {}
-        for iface in interfaces.values():
-            for method in iface.methods.values():
-                Invoker.Add(dict, method.input, method.output)
-
-            for signal in iface.signals.values():
-                Invoker.Add(dict, signal.input, signal.output)
-
-            for property in iface.properties.values():
-                if property.isReadable():
-                    Invoker.Add(dict, None, property.output)
-                if property.isWritable():
-                    Invoker.Add(dict, property.input, None)
-
-        return OrderedDict(sorted(dict.items()))
+        invoker = Invoker.__new__(Invoker)
+        invoker.input = invoker.createSignature(sbus_input, input)
+        invoker.output = invoker.createSignature(sbus_output, output)
+        return invoker
 
     @staticmethod
-    def Add(dict, input, output):
+    def BuildKey(invoker):
         """
-            Add a new invoker to dictionary if possible.
+            Return dictionary key for given invoker.
         """
-        invoker = Invoker(input, output)
-        key = "in:%s, out:%s" % (invoker.input.invokerSignature,
-                                 invoker.output.invokerSignature)
-        if key in dict:
-            return
-
-        dict[key] = invoker
+        return "in:%s, out:%s" % (invoker.input.invokerSignature,
+                                  invoker.output.invokerSignature)
 
     @staticmethod
     def IsCustomHandler(type, sbus_signature):
@@ -141,42 +131,20 @@ class InvokerArgumentType:
         signature.
     """
     @staticmethod
-    def GatherArgumentTypes(interfaces):
+    def IsWanted(type, sbus_signature):
         """
-            Gather all invoker argument types for given interfaces.
-        """
-        dict = {}
-        for iface in interfaces.values():
-            InvokerArgumentType.AddObjects(dict, iface.methods)
-            InvokerArgumentType.AddObjects(dict, iface.signals)
-            InvokerArgumentType.AddObjects(dict, iface.properties)
-
-        return OrderedDict(sorted(dict.items()))
-
-    @staticmethod
-    def AddObjects(dict, objects):
-        for object in objects.values():
-            InvokerArgumentType.AddType(dict, "input", object.input)
-            InvokerArgumentType.AddType(dict, "output", object.output)
-
-    @staticmethod
-    def AddType(dict, type, sbus_signature):
-        """
-            Add a new argument type to dictionary if possible.
+            Return True if an argument reader or writer is generated for
+            given signature.
         """
         # We don't generate readers and writers for empty arguments
         if sbus_signature is None or not sbus_signature.arguments:
-            return
+            return False
 
         # We don't generate readers and writers for custom handlers
         if Invoker.IsCustomHandler(type, sbus_signature):
-            return
-
-        # We generate each reader and writer only once
-        if sbus_signature.signature in dict:
-            return
+            return False
 
-        dict[sbus_signature.signature] = sbus_signature.arguments
+        return True
 
 
 class InvokerKeygen:
@@ -193,7 +161,7 @@ class InvokerKeygen:
             Return dictionary key for given SBUS member and signature or None
             if no keying is supported for this member.
         """
-        args = Args if not None else \
+        args = Args if Args is not None else \
             InvokerKeygen.GatherKeyArguments(sbus_member, sbus_signature)
 
         if args is None:
@@ -207,8 +175,9 @@ class InvokerKeygen:
         return key
 
     @staticmethod
-    def BuildKeygenName(sbus_member, sbus_signature):
-        args = InvokerKeygen.GatherKeyArguments(sbus_member, sbus_signature)
+    def BuildKeygenName(sbus_member, sbus_signature, Args=None):
+        args = Args if Args is not None else \
+            InvokerKeygen.GatherKeyArguments(sbus_member, sbus_signature)
 
         if args is None:
             return "NULL"
@@ -245,34 +214,6 @@ class InvokerKeygen:
         return OrderedDict(sorted(keys.items(),
                            key=lambda p: p[1].key))
 
-    @staticmethod
-    def GatherKeygens(interfaces):
-        """
-            Gather all keygens needed to implement given interfaces.
-        """
-        dict = {}
-        for iface in interfaces.values():
-            for method in iface.methods.values():
-                InvokerKeygen.Add(dict, method, method.input)
-
-            for signal in iface.signals.values():
-                InvokerKeygen.Add(dict, signal, signal.input)
-
-        return OrderedDict(sorted(dict.items()))
-
-    @staticmethod
-    def Add(dict, sbus_member, sbus_signature):
-        """
-            Add a new keygen to dictionary if possible.
-        """
-        args = InvokerKeygen.GatherKeyArguments(sbus_member, sbus_signature)
-
-        if args is None:
-            return
-
-        key = InvokerKeygen.BuildKey(sbus_member, sbus_signature, Args=args)
-        dict[key] = InvokerKeygen.KeygenPair(sbus_signature, args)
-
     class KeygenPair:
         def __init__(self, sbus_signature, arguments):
             self.signature = sbus_signature.signature
@@ -288,85 +229,6 @@ class InvokerCaller:
         invoker for each input and output signature type is generated only
         once.
     """
-    @staticmethod
-    def GatherMethodInvokers(interfaces, type):
-        """
-            Gather all required method invokers for given interfaces.
-        """
-        dict = {}
-        for iface in interfaces.values():
-            for method in iface.methods.values():
-                if not InvokerCaller.IsWanted(iface, method, type):
-                    continue
-
-                InvokerCaller.Add(dict, method.input, method.output)
-
-        return OrderedDict(sorted(dict.items()))
-
-    @staticmethod
-    def GatherSignalInvokers(interfaces, type):
-        """
-            Gather all required signal invokers for given interfaces.
-        """
-        dict = {}
-        for iface in interfaces.values():
-            for signal in iface.signals.values():
-                if not InvokerCaller.IsWanted(iface, signal, type):
-                    continue
-
-                InvokerCaller.Add(dict, signal.input, signal.output)
-
-        return OrderedDict(sorted(dict.items()))
-
-    @staticmethod
-    def GatherGetInvokers(interfaces, type):
-        """
-            Gather all required property getters for given interfaces.
-        """
-        dict = {}
-        for iface in interfaces.values():
-            for property in iface.properties.values():
-                if not InvokerCaller.IsWanted(iface, property, type):
-                    continue
-
-                if not property.isReadable():
-                    continue
-
-                InvokerCaller.Add(dict, None, property.output)
-
-        return OrderedDict(sorted(dict.items()))
-
-    @staticmethod
-    def GatherSetInvokers(interfaces, type):
-        """
-            Gather all required property setters for given interfaces.
-        """
-        dict = {}
-        for iface in interfaces.values():
-            for property in iface.properties.values():
-                if not InvokerCaller.IsWanted(iface, property, type):
-                    continue
-
-                if not property.isWritable():
-                    continue
-
-                InvokerCaller.Add(dict, property.input, None)
-
-        return OrderedDict(sorted(dict.items()))
-
-    @staticmethod
-    def Add(dict, input, output):
-        """
-            Add a new invoker to dictionary if possible.
-        """
-        invoker = Invoker(input, output)
-        key = "in:%s, out:%s" % (invoker.input.invokerSignature,
-                                 invoker.output.invokerSignature)
-        if key in dict:
-            return
-
-        dict[key] = invoker
-
     @staticmethod
     def IsWantedSync(interface, member):
         names = ["codegen.Caller", "codegen.SyncCaller"]
@@ -387,13 +249,15 @@ class InvokerCaller:
         return SBus.Annotation.CheckIfFalse(names, interface.annotations)
 
     @staticmethod
-    def IsWanted(interface, member, type):
-        if type == "sync":
-            return InvokerCaller.IsWantedSync(interface, member)
-        elif type == "async":
-            return InvokerCaller.IsWantedAsync(interface, member)
+    def IsWantedBatch(interface, member):
+        names = ["codegen.Batch"]
 
-        wanted_sync = InvokerCaller.IsWantedSync(interface, member)
-        wanted_async = InvokerCaller.IsWantedAsync(interface, member)
+        # Raw input messages can not be issued for multiple object paths.
+        if Invoker.IsCustomInputHandler(member.input):
+            return False
+
+        # First see if the member has one of these annotations
+        if SBus.Annotation.AtleastOneIsSet(names, member.annotations):
+            return SBus.Annotation.CheckIfTrue(names, member.annotations)
 
-        return wanted_sync or wanted_async
+        return SBus.Annotation.CheckIfTrue(names, interface.annotations)
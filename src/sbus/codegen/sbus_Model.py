@@ -0,0 +1,403 @@
+#
+#   Copyright (C) 2026 Red Hat
+#
+#   This program is free software; you can redistribute it and/or modify
+#   it under the terms of the GNU General Public License as published by
+#   the Free Software Foundation; either version 3 of the License, or
+#   (at your option) any later version.
+#
+#   This program is distributed in the hope that it will be useful,
+#   but WITHOUT ANY WARRANTY; without even the implied warranty of
+#   MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#   GNU General Public License for more details.
+#
+#   You should have received a copy of the GNU General Public License
+#   along with this program.  If not, see <http://www.gnu.org/licenses/>.
+#
+
+from collections import OrderedDict
+import xml.etree.ElementTree as etree
+from sbus_Introspection import Introspectable, SBus
+from sbus_Invoker import Invoker, InvokerArgumentType, InvokerCaller, \
+    InvokerKeygen
+
+
+class Model:
+    """
+        Normalized interface model used by the generator.
+
+        The model is built in a single pass over the interfaces. Each member
+        gets its invoker, keygen and the callers that are wanted for it
+        precomputed:
+
+        - invoker : Invoker -- invoker of the member
+        - getter, setter : Invoker -- property getter and setter invokers
+        - keyArguments : OrderedDict -- key arguments or None if the member
+          does not allow keying
+        - keygen : str -- name of the keygen function or "NULL"
+        - callers : set -- "sync", "async" and "batch" callers to generate
+
+        The model also gathers the tables of invokers, argument types,
+        keygens and callers that the generator needs. The first member that
+        needs an invoker or argument type provides it.
+
+        A model can be converted to a JSON compatible dictionary with
+        ToDict() and created again with FromDict(), so it can be stored
+        in the generation cache and read by other tools. Increase Version
+        whenever the dictionary format changes.
+    """
+    Version = 1
+
+    Kinds = ["methods", "signals", "properties"]
+    CallerTypes = ["sync", "async"]
+    CallerTables = ["methods", "signals", "getters", "setters"]
+
+    def __init__(self, interfaces):
+        self.interfaces = OrderedDict(sorted(interfaces.items()))
+
+        self.invokers = OrderedDict()
+        self.arguments = OrderedDict()
+        self.keygens = OrderedDict()
+        self.callers = {type: {table: OrderedDict()
+                               for table in self.CallerTables}
+                        for type in self.CallerTypes}
+
+    @staticmethod
+    def Build(interfaces):
+        """
+            Build model from given interfaces.
+        """
+        model = Model(interfaces)
+
+        for iface in model.interfaces.values():
+            for method in iface.methods.values():
+                model.buildMember(iface, method, "methods")
+
+            for signal in iface.signals.values():
+                model.buildMember(iface, signal, "signals")
+
+            for property in iface.properties.values():
+                model.buildProperty(iface, property)
+
+        model.sort()
+        return model
+
+    def buildMember(self, iface, member, kind):
+        member.invoker = Invoker(member.input, member.output)
+        member.keyArguments = InvokerKeygen.GatherKeyArguments(member,
+                                                               member.input)
+        member.keygen = InvokerKeygen.BuildKeygenName(member, member.input,
+                                                      member.keyArguments)
+        member.callers = self.wantedCallers(iface, member)
+
+        ref = (iface.name, kind, member.name)
+        self.addInvoker(self.invokers, member.invoker, ref + ("invoker",))
+        self.addArguments(member, ref)
+        self.addKeygen(member, ref)
+
+        for type in self.CallerTypes:
+            if type in member.callers:
+                self.addInvoker(self.callers[type][kind], member.invoker,
+                                ref + ("invoker",))
+
+    def buildProperty(self, iface, property):
+        property.invoker = Invoker(property.input, property.output)
+        property.getter = None
+        property.setter = None
+        property.keyArguments = None
+        property.keygen = "NULL"
+        property.callers = self.wantedCallers(iface, property)
+
+        ref = (iface.name, "properties", property.name)
+        if property.isReadable():
+            property.getter = Invoker(None, property.output)
+            self.addInvoker(self.invokers, property.getter, ref + ("getter",))
+
+        if property.isWritable():
+            property.setter = Invoker(property.input, None)
+            self.addInvoker(self.invokers, property.setter, ref + ("setter",))
+
+        self.addArguments(property, ref)
+
+        for type in self.CallerTypes:
+            if type not in property.callers:
+                continue
+
+            tables = self.callers[type]
+            if property.getter is not None:
+                self.addInvoker(tables["getters"], property.getter,
+                                ref + ("getter",))
+
+            if property.setter is not None:
+                self.addInvoker(tables["setters"], property.setter,
+                                ref + ("setter",))
+
+    def wantedCallers(self, iface, member):
+        callers = set()
+        if InvokerCaller.IsWantedSync(iface, member):
+            callers.add("sync")
+
+        if InvokerCaller.IsWantedAsync(iface, member):
+            callers.add("async")
+
+        if isinstance(member, SBus.Method) and \
+                InvokerCaller.IsWantedBatch(iface, member):
+            callers.add("batch")
+
+        return callers
+
+    def addInvoker(self, table, invoker, ref):
+        key = Invoker.BuildKey(invoker)
+        if key not in table:
+            table[key] = Model.Entry(invoker, ref)
+
+    def addArguments(self, member, ref):
+        for type in ["input", "output"]:
+            signature = getattr(member, type)
+            if not InvokerArgumentType.IsWanted(type, signature):
+                continue
+
+            if signature.signature not in self.arguments:
+                self.arguments[signature.signature] = \
+                    Model.Entry(signature.arguments, ref + (type,))
+
+    def addKeygen(self, member, ref):
+        if member.keyArguments is None:
+            return
+
+        key = InvokerKeygen.BuildKey(member, member.input,
+                                     member.keyArguments)
+        pair = InvokerKeygen.KeygenPair(member.input, member.keyArguments)
+        self.keygens[key] = Model.Entry(pair, ref + ("keygen",))
+
+    def sort(self):
+        self.invokers = self.sortTable(self.invokers)
+        self.arguments = self.sortTable(self.arguments)
+        self.keygens = self.sortTable(self.keygens)
+        for tables in self.callers.values():
+            for name, table in tables.items():
+                tables[name] = self.sortTable(table)
+
+    def sortTable(self, table):
+        return OrderedDict(sorted(table.items()))
+
+    def tables(self):
+        """
+            Return list of (name, table) of all tables in the model.
+        """
+        tables = [("invokers", self.invokers),
+                  ("arguments", self.arguments),
+                  ("keygens", self.keygens)]
+
+        for type in self.CallerTypes:
+            for name in self.CallerTables:
+                tables.append(("%s-%s" % (type, name),
+                               self.callers[type][name]))
+
+        return tables
+
+    def values(self, table):
+        """
+            Return the table with the entries replaced by their values,
+            as the generator expects it.
+        """
+        return OrderedDict((key, entry.value) for key, entry in table.items())
+
+    class Entry:
+        """
+            Value of a table together with the reference to the member it
+            was created from: (interface, kind, member, role).
+        """
+        def __init__(self, value, ref):
+            self.value = value
+            self.ref = ref
+
+    def ToDict(self):
+        """
+            Return JSON compatible dictionary describing the model.
+        """
+        return {
+            "version": Model.Version,
+            "interfaces": [self.interfaceToDict(iface)
+                           for iface in self.interfaces.values()],
+            "tables": OrderedDict((name, [[key, list(entry.ref)]
+                                          for key, entry in table.items()])
+                                  for name, table in self.tables())
+        }
+
+    def interfaceToDict(self, iface):
+        return {
+            "name": iface.name,
+            "annotations": self.annotationsToDict(iface.annotations),
+            "methods": [self.memberToDict(member)
+                        for member in iface.methods.values()],
+            "signals": [self.memberToDict(member)
+                        for member in iface.signals.values()],
+            "properties": [self.propertyToDict(property)
+                           for property in iface.properties.values()]
+        }
+
+    def memberToDict(self, member):
+        keys = None
+        if member.keyArguments is not None:
+            keys = list(member.keyArguments.keys())
+
+        return {
+            "name": member.name,
+            "key": member.key,
+            "annotations": self.annotationsToDict(member.annotations),
+            "arguments": [{"name": arg.name,
+                           "type": arg.signature,
+                           "direction": arg.direction,
+                           "key": arg.key}
+                          for arg in member.arguments.values()],
+            "invoker": self.invokerToDict(member.invoker),
+            "key-arguments": keys,
+            "keygen": member.keygen,
+            "callers": sorted(member.callers)
+        }
+
+    def propertyToDict(self, property):
+        return {
+            "name": property.name,
+            "type": property.type,
+            "access": property.access,
+            "annotations": self.annotationsToDict(property.annotations),
+            "invoker": self.invokerToDict(property.invoker),
+            "getter": self.invokerToDict(property.getter),
+            "setter": self.invokerToDict(property.setter),
+            "callers": sorted(property.callers)
+        }
+
+    def invokerToDict(self, invoker):
+        if invoker is None:
+            return None
+
+        return [invoker.input.invokerSignature,
+                invoker.output.invokerSignature]
+
+    def annotationsToDict(self, annotations):
+        return [[name, annotation.value]
+                for name, annotation in annotations.items()]
+
+    @staticmethod
+    def FromDict(data):
+        """
+            Create model from a dictionary that was returned by ToDict().
+            The precomputed values are used as they are.
+        """
+        if data.get("version") != Model.Version:
+            raise ValueError("Unsupported model version: %s"
+                             % data.get("version"))
+
+        root = etree.Element("node")
+        for iface in data["interfaces"]:
+            Model.LoadInterface(root, iface)
+
+        model = Model(Introspectable.FindElements(root, SBus.Interface))
+
+        for iface in data["interfaces"]:
+            sbus_iface = model.interfaces[iface["name"]]
+            for member in iface["methods"]:
+                Model.LoadPrecomputed(sbus_iface.methods[member["name"]],
+                                      member)
+
+            for member in iface["signals"]:
+                Model.LoadPrecomputed(sbus_iface.signals[member["name"]],
+                                      member)
+
+            for property in iface["properties"]:
+                Model.LoadPrecomputed(
+                    sbus_iface.properties[property["name"]], property)
+
+        for name, table in model.tables():
+            for key, ref in data["tables"][name]:
+                ref = tuple(ref)
+                table[key] = Model.Entry(model.resolve(ref), ref)
+
+        return model
+
+    def resolve(self, ref):
+        iface, kind, name, role = ref
+        member = getattr(self.interfaces[iface], kind)[name]
+
+        if role in ["input", "output"]:
+            return getattr(member, role).arguments
+
+        if role == "keygen":
+            return InvokerKeygen.KeygenPair(member.input, member.keyArguments)
+
+        return getattr(member, role)
+
+    @staticmethod
+    def LoadPrecomputed(member, data):
+        member.invoker = Model.LoadInvoker(member.input, member.output,
+                                           data["invoker"])
+        member.callers = set(data["callers"])
+
+        if "getter" in data:
+            member.getter = Model.LoadInvoker(None, member.output,
+                                              data["getter"])
+            member.setter = Model.LoadInvoker(member.input, None,
+                                              data["setter"])
+            member.keyArguments = None
+            member.keygen = "NULL"
+            return
+
+        member.keyArguments = None
+        if data["key-arguments"] is not None:
+            args = list(member.input.arguments.values())
+            member.keyArguments = OrderedDict(
+                (idx, args[idx]) for idx in data["key-arguments"])
+
+        member.keygen = data["keygen"]
+
+    @staticmethod
+    def LoadInvoker(input, output, signatures):
+        if signatures is None:
+            return None
+
+        return Invoker.FromSignatures(input, output, *signatures)
+
+    @staticmethod
+    def LoadInterface(parent, iface):
+        element = Model.LoadElement(parent, "interface", iface)
+
+        for method in iface["methods"]:
+            Model.LoadMember(element, "method", method)
+
+        for signal in iface["signals"]:
+            Model.LoadMember(element, "signal", signal)
+
+        for property in iface["properties"]:
+            Model.LoadElement(element, "property", property,
+                              type=property["type"],
+                              access=property["access"])
+
+    @staticmethod
+    def LoadMember(parent, tag, member):
+        element = Model.LoadElement(parent, tag, member, key=member["key"])
+
+        for arg in member["arguments"]:
+            Model.SubElement(element, "arg",
+                             name=arg["name"],
+                             type=arg["type"],
+                             direction=arg["direction"],
+                             key=arg["key"])
+
+    @staticmethod
+    def LoadElement(parent, tag, object, **attrs):
+        element = Model.SubElement(parent, tag, name=object["name"], **attrs)
+
+        for name, value in object["annotations"]:
+            Model.SubElement(element, "annotation", name=name, value=value)
+
+        return element
+
+    @staticmethod
+    def SubElement(parent, tag, **attrs):
+        # Attributes that are not set are omitted as they are in the XML.
+        attrib = {name: value for name, value in attrs.items()
+                  if value is not None}
+
+        return etree.SubElement(parent, tag, attrib)
@@ -34,7 +34,7 @@ class Template:
         self.loops = {}
         self.toggles = {}
         self.template = self.parse(template)
-        self.output = ""
+        self.segments = self.compile(self.template)
 
     def parse(self, template):
         template = self.parseLoops(template)
@@ -72,6 +72,33 @@ class Template:
         index = self.toggles[name].addTemplate(if_visible, if_hidden)
         return '$${toggle:%s:%d}' % (name, index)
 
+    def compile(self, template):
+        """Split parsed template into a list of literal strings and
+           placeholder segments so it can be rendered in a single pass.
+        """
+        segments = []
+        position = 0
+        for match in self.Pattern.Placeholder.finditer(template):
+            if match.start() > position:
+                segments.append(template[position:match.start()])
+
+            kind, name, index, key = match.groups()
+            if kind == 'loop':
+                segments.append(self.loops[name].templates[int(index)])
+            elif kind == 'toggle':
+                toggletpl = self.toggles[name].templates[int(index)]
+                toggletpl.compile(self)
+                segments.append(toggletpl)
+            else:
+                segments.append(self.Key(key))
+
+            position = match.end()
+
+        if position < len(template):
+            segments.append(template[position:])
+
+        return segments
+
     def add(self, loop_name, values):
         """Add new item into <loop name="$loop_name"> template.
            Setting its attributes to $values.
@@ -100,14 +127,7 @@ class Template:
         """Set template attributes to $values, push generated content into
            the output file and reset this template.
         """
-        template = self.template
-        for key, toggle in self.toggles.items():
-            for idx, toggletpl in enumerate(toggle.templates):
-                pattern = "$${toggle:%s:%d}" % (key, idx)
-                template = template.replace(pattern, toggletpl.generate())
-
-        self.output = self.Set(template, values)
-        self.templateFile.push(self.generate())
+        self.templateFile.push(self.Render(self.segments, values))
         self.clear()
 
     def pushOriginal(self):
@@ -122,22 +142,31 @@ class Template:
         for toggle in self.toggles.values():
             toggle.show(False)
 
-        self.output = ""
+    @staticmethod
+    def CompileKeys(template):
+        """Split template that contains only ${key} placeholders."""
+        segments = []
+        position = 0
+        for match in Template.Pattern.Key.finditer(template):
+            if match.start() > position:
+                segments.append(template[position:match.start()])
+            segments.append(Template.Key(match.group(1)))
+            position = match.end()
+
+        if position < len(template):
+            segments.append(template[position:])
 
-    def generate(self):
-        output = self.output
-        for key, loop in self.loops.items():
-            for idx, content in enumerate(loop.templates):
-                pattern = "$${loop:%s:%d}" % (key, idx)
-                output = output.replace(pattern, loop.get(idx), 1)
-        return output
+        return segments
 
     @staticmethod
-    def Set(content, values):
-        output = content
-        for key, value in values.items():
-            output = output.replace("${" + key + "}", str(value))
-        return output
+    def Render(segments, values):
+        output = []
+        for segment in segments:
+            if isinstance(segment, str):
+                output.append(segment)
+            else:
+                segment.render(output, values)
+        return ''.join(output)
 
     def removeLines(self, content):
         """Remove unneeded lines and spaces. There are some additional lines
@@ -178,10 +207,26 @@ class Template:
             re.MULTILINE | re.DOTALL
         )
 
+        Placeholder = re.compile(
+            r'\$\$\{(loop|toggle):(\S+?):(\d+)\}|\$\{([^}]*)\}'
+        )
+
+        Key = re.compile(r'\$\{([^}]*)\}')
+
         NewLine = re.compile('^\r?\n')
 
         EmptyLine = re.compile('^ *$', re.MULTILINE)
 
+    class Key:
+        def __init__(self, name):
+            self.name = name
+
+        def render(self, output, values):
+            if self.name in values:
+                output.append(str(values[self.name]))
+            else:
+                output.append("${%s}" % self.name)
+
     class Loop:
         def __init__(self):
             self.templates = []
@@ -206,16 +251,20 @@ class Template:
         class LoopTemplate:
             def __init__(self, template):
                 self.template = template
-                self.output = ""
+                self.segments = Template.CompileKeys(template)
+                self.output = []
 
             def set(self, values):
-                self.output += Template.Set(self.template, values)
+                self.output.append(Template.Render(self.segments, values))
 
             def clear(self):
-                self.output = ""
+                self.output = []
 
             def generate(self):
-                return self.output
+                return ''.join(self.output)
+
+            def render(self, output, values):
+                output.append(self.generate())
 
     class Toggle:
         def __init__(self):
@@ -237,14 +286,25 @@ class Template:
                 self.toggle = toggle
                 self.if_visible = if_visible
                 self.if_hidden = if_hidden
+                self.visible_segments = []
+                self.hidden_segments = []
 
-            def generate(self):
+            def compile(self, template):
+                self.visible_segments = template.compile(self.if_visible)
+                if self.if_hidden is not None:
+                    self.hidden_segments = template.compile(self.if_hidden)
+
+            def render(self, output, values):
                 if self.toggle.visible:
-                    return self.if_visible
-                elif self.if_hidden is not None:
-                    return self.if_hidden
+                    segments = self.visible_segments
+                else:
+                    segments = self.hidden_segments
 
-                return ''
+                for segment in segments:
+                    if isinstance(segment, str):
+                        output.append(segment)
+                    else:
+                        segment.render(output, values)
 
 
 class TemplateFile:
@@ -260,7 +320,7 @@ class TemplateFile:
             contents = file.read()
 
         self.templates = {}
-        self.output = ""
+        self.output = []
         self.parse(contents)
 
     def parse(self, template):
@@ -275,10 +335,10 @@ class TemplateFile:
         return name in self.templates
 
     def push(self, content):
-        self.output += content
+        self.output.append(content)
 
     def generate(self):
-        return self.output
+        return ''.join(self.output)
 
     def write(self, filename, postprocess=None):
         dirname = os.path.dirname(filename)
@@ -243,6 +243,63 @@
 
 </template>
 
+<template name="method-batch-caller">
+    struct tevent_req *
+    sbus_call_${token}_batch_send
+        (TALLOC_CTX *mem_ctx,
+         struct sbus_connection *conn,
+         const char *busname,
+         unsigned int count,
+         const char **object_paths<loop name="in">,
+         ${type}* args_${name}</loop>)
+    {
+        struct tevent_req *subreq;
+        struct tevent_req *req;
+        unsigned int i;
+        errno_t ret;
+
+        req = sbus_batch_send(mem_ctx, conn);
+        if (req == NULL) {
+            return NULL;
+        }
+
+        for (i = 0; i < count; i++) {
+            subreq = sbus_call_${token}_send(req, conn, busname, object_paths[i]<loop name="in">, args_${name}[i]</loop>);
+            ret = sbus_batch_add(req, subreq);
+            if (ret != EOK) {
+                return req;
+            }
+        }
+
+        sbus_batch_seal(req);
+
+        return req;
+    }
+
+    errno_t
+    sbus_call_${token}_batch_recv
+        (<toggle name="if-use-talloc">TALLOC_CTX *mem_ctx,
+         struct tevent_req *req,
+         unsigned int index<or>struct tevent_req *req,
+         unsigned int index</toggle><toggle name="if-raw-output">,
+         DBusMessage **_reply)
+         <or><loop name="out">,
+         ${type} _${name}</loop>)
+         </toggle>
+    {
+        struct tevent_req *subreq;
+        errno_t ret;
+
+        ret = sbus_batch_item(req, index, &subreq);
+        if (ret != EOK) {
+            return ret;
+        }
+
+        return sbus_call_${token}_recv(<toggle name="if-use-talloc">mem_ctx, </toggle>subreq<toggle line name="if-raw-output">, _reply<or><loop name="out">, _${name}</loop></toggle>);
+    }
+
+</template>
+
 <template name="signal-invoker">
     static void
     sbus_emit_signal_${input-signature}
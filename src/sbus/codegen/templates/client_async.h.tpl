@@ -57,6 +57,29 @@
 
 </template>
 
+<template name="method-batch-caller">
+    struct tevent_req *
+    sbus_call_${token}_batch_send
+        (TALLOC_CTX *mem_ctx,
+         struct sbus_connection *conn,
+         const char *busname,
+         unsigned int count,
+         const char **object_paths<loop name="in">,
+         ${type}* args_${name}</loop>);
+
+    errno_t
+    sbus_call_${token}_batch_recv
+        (<toggle name="if-use-talloc">TALLOC_CTX *mem_ctx,
+         struct tevent_req *req,
+         unsigned int index<or>struct tevent_req *req,
+         unsigned int index</toggle><toggle name="if-raw-output">,
+         DBusMessage **_reply);
+         <or><loop name="out">,
+         ${type} _${name}</loop>);
+         </toggle>
+
+</template>
+
 <template name="signal-caller">
     void
     sbus_emit_${token}
@@ -127,6 +127,27 @@
 
 </template>
 
+<template name="getall">
+    /* GetAll: ${name} */
+    #define SBUS_GETALL_SYNC_${token}(handler, data) ({ \
+        SBUS_CHECK_SYNC((handler), (data), struct sbus_getall_${token} *); \
+        sbus_property_sync(SBUS_PROPERTY_GETALL_NAME, "a{sv}", SBUS_PROPERTY_GETALL, \
+           NULL, \
+           _sbus_getall_invoke_${token}_send, \
+           (handler), (data)); \
+    })
+
+    #define SBUS_GETALL_ASYNC_${token}(handler_send, handler_recv, data) ({ \
+        SBUS_CHECK_SEND((handler_send), (data)); \
+        SBUS_CHECK_RECV((handler_recv), struct sbus_getall_${token} *); \
+        sbus_property_async(SBUS_PROPERTY_GETALL_NAME, "a{sv}", SBUS_PROPERTY_GETALL, \
+           NULL, \
+           _sbus_getall_invoke_${token}_send, \
+           (handler_send), (handler_recv), (data)); \
+    })
+
+</template>
+
 <template name="file-footer">
     #endif /* ${file-guard} */
 </template>
@@ -25,6 +25,7 @@
 
     #include "${sbus-path}/sbus_private.h"
     #include "${sbus-path}/sbus_interface_declarations.h"
+    #include "${sbus-path}/interface/sbus_iterator_writers.h"
     #include "${header:arguments}"
     #include "${header:invokers}"
 
@@ -98,11 +99,10 @@
         const struct sbus_handler *handler,
         DBusMessageIter *read_iterator,
         DBusMessageIter *write_iterator,
-        const char **_key)
+        struct sbus_request_key *key)
     {
         struct _sbus_invoke_in_${input-signature}_out_${output-signature}_state *state;
         struct tevent_req *req;
-        const char *key;
         errno_t ret;
 
         req = tevent_req_create(mem_ctx, &state, struct _sbus_invoke_in_${input-signature}_out_${output-signature}_state);
@@ -141,13 +141,11 @@
             goto done;
         }
 
-        ret = sbus_request_key(state, keygen, sbus_req,<toggle name="if-input-arguments"> state->in<or> NULL</toggle>, &key);
-        if (ret != EOK) {
-            goto done;
-        }
-
-        if (_key != NULL) {
-            *_key = talloc_steal(mem_ctx, key);
+        if (key != NULL) {
+            ret = sbus_request_key(keygen, sbus_req,<toggle name="if-input-arguments"> state->in<or> NULL</toggle>, key);
+            if (ret != EOK) {
+                goto done;
+            }
         }
 
         ret = EAGAIN;
@@ -250,3 +248,49 @@
     }
 
 </template>
+
+<template name="getall">
+    static errno_t
+    _sbus_getall_write_${token}(DBusMessageIter *dict, void *data)
+    {
+        struct sbus_getall_${token} *all = data;
+        DBusMessageIter variant;
+        DBusMessageIter entry;
+        errno_t ret;
+
+        <loop name="property">
+        if (all->${name}.is_set) {
+            ret = sbus_property_open_entry(dict, &entry, &variant, "${name}", "${type}");
+            if (ret != EOK) {
+                return ret;
+            }
+
+            ret = sbus_iterator_write_${signature}(&variant, all->${name}.value);
+            ret = sbus_property_close_entry(dict, &entry, &variant, ret);
+            if (ret != EOK) {
+                return ret;
+            }
+        }
+
+        </loop>
+        return EOK;
+    }
+
+    struct tevent_req *
+    _sbus_getall_invoke_${token}_send
+       (TALLOC_CTX *mem_ctx,
+        struct tevent_context *ev,
+        struct sbus_request *sbus_req,
+        sbus_invoker_keygen keygen,
+        const struct sbus_handler *handler,
+        DBusMessageIter *read_iterator,
+        DBusMessageIter *write_iterator,
+        struct sbus_request_key *key)
+    {
+        return sbus_invoke_getall_send(mem_ctx, ev, sbus_req, handler,
+                                       write_iterator,
+                                       sizeof(struct sbus_getall_${token}),
+                                       _sbus_getall_write_${token});
+    }
+
+</template>
@@ -38,7 +38,7 @@
              const struct sbus_handler *handler,                              \
              DBusMessageIter *read_iterator,                                  \
              DBusMessageIter *write_iterator,                                 \
-             const char **_key)
+             struct sbus_request_key *key)
 
 </template>
 
@@ -46,6 +46,29 @@
     _sbus_declare_invoker(${input-signature}, ${output-signature});
 </template>
 
+<template name="getall">
+
+    struct sbus_getall_${token} {
+        <loop name="property">
+        struct {
+            bool is_set;
+            ${input-type} value;
+        } ${name};
+        </loop>
+    };
+
+    struct tevent_req *
+    _sbus_getall_invoke_${token}_send
+        (TALLOC_CTX *mem_ctx,
+         struct tevent_context *ev,
+         struct sbus_request *sbus_req,
+         sbus_invoker_keygen keygen,
+         const struct sbus_handler *handler,
+         DBusMessageIter *read_iterator,
+         DBusMessageIter *write_iterator,
+         struct sbus_request_key *key);
+</template>
+
 <template name="file-footer">
 
     #endif /* ${file-guard} */
@@ -18,9 +18,6 @@
         along with this program.  If not, see <http://www.gnu.org/licenses/>.
     */
 
-    #include <inttypes.h>
-    #include <talloc.h>
-
     #include "${sbus-path}/sbus_request.h"
     #include "${header:arguments}"
     #include "${header:keygens}"
@@ -28,38 +25,27 @@
 </template>
 
 <template name="key">
-    const char *
+    void
     _sbus_key_${key-signature}<loop line name="key-argument">_${key-index}</loop>
-       (TALLOC_CTX *mem_ctx,
+       (struct sbus_request_key *key,
         struct sbus_request *sbus_req,
         struct _sbus_invoker_args_${key-signature} *args)
     {
-        if (sbus_req->sender == NULL) {
-            return talloc_asprintf(mem_ctx, "-:%u:%s.%s:%s<loop name="key-argument">:%${key-format}</loop>",
-                sbus_req->type, sbus_req->interface, sbus_req->member,
-                sbus_req->path<loop name="key-argument">, args->arg${key-index}</loop>);
-        }
-
-        return talloc_asprintf(mem_ctx, "%"PRIi64":%u:%s.%s:%s<loop name="key-argument">:%${key-format}</loop>",
-            sbus_req->sender->uid, sbus_req->type, sbus_req->interface, sbus_req->member,
-            sbus_req->path<loop name="key-argument">, args->arg${key-index}</loop>);
+        sbus_request_key_init(key, sbus_req);
+        <loop name="key-argument">
+        sbus_request_key_add_${key-type}(key, args->arg${key-index});
+        </loop>
     }
 
 </template>
 
 <template name="key-no-arguments">
-    const char *
+    void
     _sbus_key_${key-signature}
-       (TALLOC_CTX *mem_ctx,
+       (struct sbus_request_key *key,
         struct sbus_request *sbus_req)
     {
-        if (sbus_req->sender == NULL) {
-            return talloc_asprintf(mem_ctx, "-:%u:%s.%s:%s",
-                sbus_req->type, sbus_req->interface, sbus_req->member, sbus_req->path);
-        }
-
-        return talloc_asprintf(mem_ctx, "%"PRIi64":%u:%s.%s:%s",
-            sbus_req->sender->uid, sbus_req->type, sbus_req->interface, sbus_req->member, sbus_req->path);
+        sbus_request_key_init(key, sbus_req);
     }
 
 </template>
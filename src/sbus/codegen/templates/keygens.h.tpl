@@ -21,26 +21,24 @@
     #ifndef ${file-guard}
     #define ${file-guard}
 
-    #include <talloc.h>
-
     #include "${sbus-path}/sbus_request.h"
     #include "${header:arguments}"
 
 </template>
 
 <template name="key">
-    const char *
+    void
     _sbus_key_${key-signature}<loop line name="key-argument">_${key-index}</loop>
-       (TALLOC_CTX *mem_ctx,
+       (struct sbus_request_key *key,
         struct sbus_request *sbus_req,
         struct _sbus_invoker_args_${key-signature} *args);
 
 </template>
 
 <template name="key-no-arguments">
-    const char *
+    void
     _sbus_key_${key-signature}
-       (TALLOC_CTX *mem_ctx,
+       (struct sbus_request_key *key,
         struct sbus_request *sbus_req);
 
 </template>
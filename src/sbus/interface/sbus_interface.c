@@ -19,6 +19,7 @@
 */
 
 #include <talloc.h>
+#include <stdlib.h>
 #include <string.h>
 
 #include "sbus/sbus_annotations.h"
@@ -231,6 +232,84 @@ sbus_interface(const char *name,
     return object;
 }
 
+static int
+sbus_method_compare(const void *a, const void *b)
+{
+    const struct sbus_method *ma = *(const struct sbus_method * const *)a;
+    const struct sbus_method *mb = *(const struct sbus_method * const *)b;
+
+    return strcmp(ma->name, mb->name);
+}
+
+static int
+sbus_property_compare(const void *a, const void *b)
+{
+    const struct sbus_property *pa = *(const struct sbus_property * const *)a;
+    const struct sbus_property *pb = *(const struct sbus_property * const *)b;
+    int ret;
+
+    ret = strcmp(pa->name, pb->name);
+    if (ret != 0) {
+        return ret;
+    }
+
+    return (int)pa->access - (int)pb->access;
+}
+
+static const struct sbus_method **
+sbus_method_index(TALLOC_CTX *mem_ctx,
+                  const struct sbus_method *methods,
+                  size_t *_count)
+{
+    const struct sbus_method **index;
+    size_t count;
+    size_t i;
+
+    for (count = 0; methods[count].name != NULL; count++);
+
+    index = talloc_zero_array(mem_ctx, const struct sbus_method *, count + 1);
+    if (index == NULL) {
+        return NULL;
+    }
+
+    for (i = 0; i < count; i++) {
+        index[i] = &methods[i];
+    }
+
+    qsort(index, count, sizeof(struct sbus_method *), sbus_method_compare);
+
+    *_count = count;
+    return index;
+}
+
+static const struct sbus_property **
+sbus_property_index(TALLOC_CTX *mem_ctx,
+                    const struct sbus_property *properties,
+                    size_t *_count)
+{
+    const struct sbus_property **index;
+    size_t count;
+    size_t i;
+
+    for (count = 0; properties[count].name != NULL; count++);
+
+    index = talloc_zero_array(mem_ctx, const struct sbus_property *,
+                              count + 1);
+    if (index == NULL) {
+        return NULL;
+    }
+
+    for (i = 0; i < count; i++) {
+        index[i] = &properties[i];
+    }
+
+    qsort(index, count, sizeof(struct sbus_property *),
+          sbus_property_compare);
+
+    *_count = count;
+    return index;
+}
+
 struct sbus_interface *
 sbus_interface_copy(TALLOC_CTX *mem_ctx,
                     const struct sbus_interface *input)
@@ -256,6 +335,18 @@ sbus_interface_copy(TALLOC_CTX *mem_ctx,
         return NULL;
     }
 
+    /* The arrays keep their declared order for introspection and GetAll,
+     * lookups go through the sorted indexes. */
+    copy->sorted_methods = sbus_method_index(copy, copy->methods,
+                                             &copy->num_methods);
+    copy->sorted_properties = sbus_property_index(copy, copy->properties,
+                                                  &copy->num_properties);
+
+    if (copy->sorted_methods == NULL || copy->sorted_properties == NULL) {
+        talloc_free(copy);
+        return NULL;
+    }
+
     return copy;
 }
 
@@ -263,8 +354,18 @@ const struct sbus_method *
 sbus_interface_find_method(struct sbus_interface *iface,
                            const char *method_name)
 {
+    const struct sbus_method key = {.name = method_name};
+    const struct sbus_method *keyptr = &key;
+    const struct sbus_method **found;
     unsigned int i;
 
+    if (iface->sorted_methods != NULL) {
+        found = bsearch(&keyptr, iface->sorted_methods, iface->num_methods,
+                        sizeof(struct sbus_method *), sbus_method_compare);
+
+        return found == NULL ? NULL : *found;
+    }
+
     for (i = 0; iface->methods[i].name != NULL; i++) {
         if (strcmp(iface->methods[i].name, method_name) == 0) {
             return &iface->methods[i];
@@ -279,8 +380,19 @@ sbus_interface_find_property(struct sbus_interface *iface,
                              enum sbus_property_access access,
                              const char *property_name)
 {
+    const struct sbus_property key = {.name = property_name, .access = access};
+    const struct sbus_property *keyptr = &key;
+    const struct sbus_property **found;
     unsigned int i;
 
+    if (iface->sorted_properties != NULL) {
+        found = bsearch(&keyptr, iface->sorted_properties,
+                        iface->num_properties, sizeof(struct sbus_property *),
+                        sbus_property_compare);
+
+        return found == NULL ? NULL : *found;
+    }
+
     for (i = 0; iface->properties[i].name != NULL; i++) {
         if (iface->properties[i].access != access) {
             continue;
@@ -272,6 +272,11 @@ sbus_introspect_properties(FILE *file,
     }
 
     for (i = 0; properties[i].name != NULL; i++) {
+        /* GetAll handler is not a property. */
+        if (properties[i].access == SBUS_PROPERTY_GETALL) {
+            continue;
+        }
+
         sbus_introspect_property_set(props, &properties[i]);
     }
 
@@ -19,6 +19,7 @@
 */
 
 #include <errno.h>
+#include <string.h>
 #include <dbus/dbus.h>
 
 #include "util/util.h"
@@ -59,6 +60,33 @@ sbus_iterator_read_basic(TALLOC_CTX *mem_ctx,
     return EOK;
 }
 
+static errno_t
+sbus_iterator_read_fixed_elements(DBusMessageIter *subiter,
+                                  int dbus_type,
+                                  int element_size,
+                                  int count,
+                                  void *array)
+{
+    void *fixed = NULL;
+    int fixed_count;
+
+    /* Empty arrays are handled by the caller. */
+    if (dbus_message_iter_get_arg_type(subiter) != dbus_type) {
+        return ERR_SBUS_INVALID_TYPE;
+    }
+
+    /* Copy the whole array at once instead of reading it element by
+     * element. The data is owned by the message so we still need a copy. */
+    dbus_message_iter_get_fixed_array(subiter, &fixed, &fixed_count);
+    if (fixed_count != count) {
+        return ERR_SBUS_INVALID_TYPE;
+    }
+
+    memcpy(array, fixed, (size_t)count * element_size);
+
+    return EOK;
+}
+
 static errno_t
 _sbus_iterator_read_basic_array(TALLOC_CTX *mem_ctx,
                                 DBusMessageIter *iterator,
@@ -114,6 +142,18 @@ _sbus_iterator_read_basic_array(TALLOC_CTX *mem_ctx,
         break;
     }
 
+    /* D-Bus boolean is stored as 32 bit integer so only types with the same
+     * size on the wire and in the C array can be copied at once. */
+    if (dbus_type != DBUS_TYPE_STRING && dbus_type != DBUS_TYPE_OBJECT_PATH
+            && dbus_type != DBUS_TYPE_BOOLEAN) {
+        ret = sbus_iterator_read_fixed_elements(&subiter, dbus_type,
+                                                element_size, count, array);
+        if (ret != EOK) {
+            talloc_free(array);
+        }
+        goto done;
+    }
+
     arrayptr = array;
     for (i = 0; i < count; i++) {
         ret = sbus_iterator_read_basic(array, &subiter, dbus_type, arrayptr);
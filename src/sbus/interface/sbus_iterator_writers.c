@@ -101,6 +101,7 @@ sbus_iterator_write_fixed_elements(DBusMessageIter *iterator,
                                    int array_length,
                                    void *value_ptr)
 {
+    dbus_bool_t dbret;
     errno_t ret;
     uint8_t *element_ptr;
     int count;
@@ -113,6 +114,17 @@ sbus_iterator_write_fixed_elements(DBusMessageIter *iterator,
         count = array_length;
     }
 
+    /* D-Bus boolean is stored as 32 bit integer so only types with the same
+     * size on the wire and in the C array can be appended at once. */
+    if (dbus_type != DBUS_TYPE_BOOLEAN) {
+        if (count == 0) {
+            return EOK;
+        }
+
+        dbret = dbus_message_iter_append_fixed_array(iterator, dbus_type,
+                                                     &element_ptr, count);
+        return dbret ? EOK : EIO;
+    }
 
     for (i = 0; i < count; i++) {
         ret = sbus_iterator_write_basic(iterator, dbus_type, element_ptr);
@@ -362,6 +362,9 @@ sbus_request_property(TALLOC_CTX *mem_ctx,
     case SBUS_PROPERTY_WRITABLE:
         type = SBUS_REQUEST_PROPERTY_SET;
         break;
+    case SBUS_PROPERTY_GETALL:
+        type = SBUS_REQUEST_PROPERTY_GET;
+        break;
     default:
         return EINVAL;
     }
@@ -529,6 +532,8 @@ struct sbus_properties_getall_state {
     } property;
 };
 
+static errno_t sbus_properties_getall_handler(struct tevent_req *req);
+static void sbus_properties_getall_handler_done(struct tevent_req *subreq);
 static errno_t sdap_properties_getall_next(struct tevent_req *req);
 static void sbus_properties_getall_done(struct tevent_req *subreq);
 
@@ -570,6 +575,12 @@ sbus_properties_getall_send(TALLOC_CTX *mem_ctx,
     state->properties = iface->properties;
     state->iter.root = write_iterator;
 
+    /* Fetch all properties at once if the interface provides a handler. */
+    ret = sbus_properties_getall_handler(req);
+    if (ret != ENOENT) {
+        goto done;
+    }
+
     /* Open array of <key, value> pairs. */
     ret = sbus_open_dict(state->iter.root, &state->iter.dict);
     if (ret != EOK) {
@@ -601,6 +612,69 @@ done:
     return req;
 }
 
+static errno_t
+sbus_properties_getall_handler(struct tevent_req *req)
+{
+    struct sbus_properties_getall_state *state;
+    const struct sbus_property *property;
+    struct sbus_request *property_req;
+    struct tevent_req *subreq;
+    errno_t ret;
+
+    state = tevent_req_data(req, struct sbus_properties_getall_state);
+
+    ret = sbus_request_property(state, state->sbus_req->conn, state->router,
+                                state->sbus_req->sender, SBUS_PROPERTY_GETALL,
+                                state->sbus_req->destination,
+                                state->sbus_req->path, state->interface_name,
+                                SBUS_PROPERTY_GETALL_NAME,
+                                &property_req, &property);
+    if (ret == ERR_SBUS_UNKNOWN_PROPERTY) {
+        /* Fall back to calling each getter separately. */
+        return ENOENT;
+    } else if (ret != EOK) {
+        return ret;
+    }
+
+    ret = sbus_check_access(state->router->conn, property_req);
+    if (ret != EOK) {
+        return ret;
+    }
+
+    subreq = property->invoker.issue(state, state->ev, property_req,
+                                     NULL, /* no keygen */
+                                     &property->handler,
+                                     NULL, /* no read iterator*/
+                                     state->iter.root,
+                                     NULL  /* no key */);
+    if (subreq == NULL) {
+        DEBUG(SSSDBG_CRIT_FAILURE, "Unable to create subrequest!\n");
+        return ENOMEM;
+    }
+
+    tevent_req_set_callback(subreq, sbus_properties_getall_handler_done, req);
+
+    return EAGAIN;
+}
+
+static void
+sbus_properties_getall_handler_done(struct tevent_req *subreq)
+{
+    struct tevent_req *req;
+    errno_t ret;
+
+    req = tevent_req_callback_data(subreq, struct tevent_req);
+
+    ret = sbus_invoker_recv(subreq);
+    talloc_zfree(subreq);
+    if (ret != EOK) {
+        tevent_req_error(req, ret);
+        return;
+    }
+
+    tevent_req_done(req);
+}
+
 static errno_t
 sdap_properties_getall_next(struct tevent_req *req)
 {
@@ -718,6 +792,205 @@ sbus_properties_getall_recv(TALLOC_CTX *mem_ctx,
     return EOK;
 }
 
+errno_t
+sbus_property_open_entry(DBusMessageIter *dict,
+                         DBusMessageIter *entry,
+                         DBusMessageIter *variant,
+                         const char *name,
+                         const char *type)
+{
+    errno_t ret;
+
+    ret = sbus_open_dict_entry(dict, entry);
+    if (ret != EOK) {
+        return ret;
+    }
+
+    ret = sbus_iterator_write_s(entry, name);
+    if (ret != EOK) {
+        goto done;
+    }
+
+    ret = sbus_open_variant(entry, variant, type);
+
+done:
+    if (ret != EOK) {
+        dbus_message_iter_abandon_container(dict, entry);
+    }
+
+    return ret;
+}
+
+errno_t
+sbus_property_close_entry(DBusMessageIter *dict,
+                          DBusMessageIter *entry,
+                          DBusMessageIter *variant,
+                          errno_t status)
+{
+    errno_t ret;
+
+    if (status != EOK) {
+        dbus_message_iter_abandon_container(entry, variant);
+        dbus_message_iter_abandon_container(dict, entry);
+        return status;
+    }
+
+    ret = sbus_close_iterator(entry, variant);
+    if (ret != EOK) {
+        dbus_message_iter_abandon_container(dict, entry);
+        return ret;
+    }
+
+    return sbus_close_iterator(dict, entry);
+}
+
+struct sbus_invoke_getall_state {
+    struct {
+        enum sbus_handler_type type;
+        void *data;
+        errno_t (*sync)(TALLOC_CTX *, struct sbus_request *, void *, void *);
+        struct tevent_req * (*send)(TALLOC_CTX *, struct tevent_context *,
+                                    struct sbus_request *, void *);
+        errno_t (*recv)(TALLOC_CTX *, struct tevent_req *, void *);
+    } handler;
+
+    void *all;
+    sbus_getall_writer writer;
+    DBusMessageIter *write_iterator;
+};
+
+static errno_t sbus_invoke_getall_write(struct sbus_invoke_getall_state *state);
+static void sbus_invoke_getall_done(struct tevent_req *subreq);
+
+struct tevent_req *
+sbus_invoke_getall_send(TALLOC_CTX *mem_ctx,
+                        struct tevent_context *ev,
+                        struct sbus_request *sbus_req,
+                        const struct sbus_handler *handler,
+                        DBusMessageIter *write_iterator,
+                        size_t size,
+                        sbus_getall_writer writer)
+{
+    struct sbus_invoke_getall_state *state;
+    struct tevent_req *subreq;
+    struct tevent_req *req;
+    errno_t ret;
+
+    req = tevent_req_create(mem_ctx, &state, struct sbus_invoke_getall_state);
+    if (req == NULL) {
+        DEBUG(SSSDBG_CRIT_FAILURE, "Unable to create tevent request!\n");
+        return NULL;
+    }
+
+    state->handler.type = handler->type;
+    state->handler.data = handler->data;
+    state->handler.sync = handler->sync;
+    state->handler.send = handler->async_send;
+    state->handler.recv = handler->async_recv;
+
+    state->writer = writer;
+    state->write_iterator = write_iterator;
+
+    state->all = talloc_zero_size(state, size);
+    if (state->all == NULL) {
+        ret = ENOMEM;
+        goto done;
+    }
+
+    switch (state->handler.type) {
+    case SBUS_HANDLER_SYNC:
+        if (state->handler.sync == NULL) {
+            DEBUG(SSSDBG_CRIT_FAILURE, "Bug: sync handler is not specified!\n");
+            ret = ERR_INTERNAL;
+            goto done;
+        }
+
+        ret = state->handler.sync(state, sbus_req, state->handler.data,
+                                  state->all);
+        if (ret != EOK) {
+            goto done;
+        }
+
+        ret = sbus_invoke_getall_write(state);
+        goto done;
+    case SBUS_HANDLER_ASYNC:
+        if (state->handler.send == NULL || state->handler.recv == NULL) {
+            DEBUG(SSSDBG_CRIT_FAILURE, "Bug: async handler is not specified!\n");
+            ret = ERR_INTERNAL;
+            goto done;
+        }
+
+        subreq = state->handler.send(state, ev, sbus_req, state->handler.data);
+        if (subreq == NULL) {
+            DEBUG(SSSDBG_CRIT_FAILURE, "Unable to create subrequest!\n");
+            ret = ENOMEM;
+            goto done;
+        }
+
+        tevent_req_set_callback(subreq, sbus_invoke_getall_done, req);
+        ret = EAGAIN;
+        goto done;
+    }
+
+    ret = ERR_INTERNAL;
+
+done:
+    if (ret == EOK) {
+        tevent_req_done(req);
+        tevent_req_post(req, ev);
+    } else if (ret != EAGAIN) {
+        tevent_req_error(req, ret);
+        tevent_req_post(req, ev);
+    }
+
+    return req;
+}
+
+static void sbus_invoke_getall_done(struct tevent_req *subreq)
+{
+    struct sbus_invoke_getall_state *state;
+    struct tevent_req *req;
+    errno_t ret;
+
+    req = tevent_req_callback_data(subreq, struct tevent_req);
+    state = tevent_req_data(req, struct sbus_invoke_getall_state);
+
+    ret = state->handler.recv(state, subreq, state->all);
+    talloc_zfree(subreq);
+    if (ret != EOK) {
+        tevent_req_error(req, ret);
+        return;
+    }
+
+    ret = sbus_invoke_getall_write(state);
+    if (ret != EOK) {
+        tevent_req_error(req, ret);
+        return;
+    }
+
+    tevent_req_done(req);
+}
+
+static errno_t
+sbus_invoke_getall_write(struct sbus_invoke_getall_state *state)
+{
+    DBusMessageIter dict;
+    errno_t ret;
+
+    ret = sbus_open_dict(state->write_iterator, &dict);
+    if (ret != EOK) {
+        return ret;
+    }
+
+    ret = state->writer(&dict, state->all);
+    if (ret != EOK) {
+        dbus_message_iter_abandon_container(state->write_iterator, &dict);
+        return ret;
+    }
+
+    return sbus_close_iterator(state->write_iterator, &dict);
+}
+
 static errno_t
 sbus_properties_set_parse(TALLOC_CTX *mem_ctx,
                           DBusMessageIter *read_iter,
@@ -0,0 +1,251 @@
+/*
+    Copyright (C) 2026 Red Hat
+
+    This program is free software; you can redistribute it and/or modify
+    it under the terms of the GNU General Public License as published by
+    the Free Software Foundation; either version 3 of the License, or
+    (at your option) any later version.
+
+    This program is distributed in the hope that it will be useful,
+    but WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+    GNU General Public License for more details.
+
+    You should have received a copy of the GNU General Public License
+    along with this program.  If not, see <http://www.gnu.org/licenses/>.
+*/
+
+#include <stdio.h>
+#include <stdint.h>
+#include <string.h>
+#include <talloc.h>
+#include <tevent.h>
+#include <dhash.h>
+
+#include "util/util.h"
+#include "sbus/sbus_request.h"
+#include "sbus/sbus_private.h"
+#include "sbus/sbus_interface.h"
+#include "sbus/interface_dbus/sbus_dbus_server.h"
+
+/* D-Bus limits interface and member names to 255 characters each. */
+#define SBUS_STATS_NAME_MAX (2 * 255 + 2)
+
+struct sbus_method_stats {
+    const char *name;
+    uint64_t calls;
+    uint64_t errors;
+    uint64_t histogram[SBUS_STATS_BUCKETS];
+};
+
+struct sbus_method_stats *
+sbus_stats_get(struct sbus_connection *conn,
+               const struct sbus_interface *iface,
+               const struct sbus_method *method)
+{
+    struct sbus_method_stats *stats;
+    char name[SBUS_STATS_NAME_MAX];
+    hash_key_t key;
+    hash_value_t value;
+    int hret;
+    int len;
+
+    if (conn->stats == NULL) {
+        return NULL;
+    }
+
+    /* The router keeps a copy of an interface for each object path, so
+     * the same method is identified by its name, not by its address. */
+    len = snprintf(name, sizeof(name), "%s.%s", iface->name, method->name);
+    if (len < 0 || (size_t)len >= sizeof(name)) {
+        DEBUG(SSSDBG_OP_FAILURE, "Method name is too long: %s.%s\n",
+              iface->name, method->name);
+        return NULL;
+    }
+
+    key.type = HASH_KEY_STRING;
+    key.str = name;
+
+    hret = hash_lookup(conn->stats, &key, &value);
+    if (hret == HASH_SUCCESS) {
+        return talloc_get_type(value.ptr, struct sbus_method_stats);
+    } else if (hret != HASH_ERROR_KEY_NOT_FOUND) {
+        DEBUG(SSSDBG_OP_FAILURE, "Unable to lookup method stats [%d]: %s\n",
+              hret, hash_error_string(hret));
+        return NULL;
+    }
+
+    stats = talloc_zero(conn->stats, struct sbus_method_stats);
+    if (stats == NULL) {
+        return NULL;
+    }
+
+    stats->name = talloc_strdup(stats, name);
+    if (stats->name == NULL) {
+        talloc_free(stats);
+        return NULL;
+    }
+
+    value.type = HASH_VALUE_PTR;
+    value.ptr = stats;
+
+    hret = hash_enter(conn->stats, &key, &value);
+    if (hret != HASH_SUCCESS) {
+        DEBUG(SSSDBG_OP_FAILURE, "Unable to store method stats [%d]: %s\n",
+              hret, hash_error_string(hret));
+        talloc_free(stats);
+        return NULL;
+    }
+
+    return stats;
+}
+
+void
+sbus_stats_record(struct sbus_method_stats *stats,
+                  struct timeval start,
+                  errno_t error)
+{
+    struct timeval now;
+    uint64_t usec;
+    unsigned int bucket;
+
+    now = tevent_timeval_current();
+    if (tevent_timeval_compare(&now, &start) < 0) {
+        usec = 0;
+    } else {
+        usec = (uint64_t)(now.tv_sec - start.tv_sec) * 1000000
+               + (now.tv_usec - start.tv_usec);
+    }
+
+    /* Bucket N holds calls that took [2^N, 2^(N+1)) microseconds. */
+    for (bucket = 0; usec > 1 && bucket < SBUS_STATS_BUCKETS - 1; bucket++) {
+        usec >>= 1;
+    }
+
+    stats->calls++;
+    stats->histogram[bucket]++;
+    if (error != EOK) {
+        stats->errors++;
+    }
+}
+
+errno_t
+sbus_stats_collect(TALLOC_CTX *mem_ctx,
+                   struct sbus_connection *conn,
+                   const char ***_members,
+                   uint64_t **_calls,
+                   uint64_t **_errors,
+                   uint64_t **_histogram)
+{
+    struct sbus_method_stats *stats;
+    hash_value_t *values;
+    const char **members;
+    uint64_t *calls;
+    uint64_t *errors;
+    uint64_t *histogram;
+    unsigned long count;
+    unsigned long i;
+    errno_t ret;
+    int hret;
+
+    hret = hash_values(conn->stats, &count, &values);
+    if (hret != HASH_SUCCESS) {
+        return ENOMEM;
+    }
+
+    members = talloc_zero_array(mem_ctx, const char *, count + 1);
+    calls = talloc_zero_array(mem_ctx, uint64_t, count);
+    errors = talloc_zero_array(mem_ctx, uint64_t, count);
+    histogram = talloc_zero_array(mem_ctx, uint64_t,
+                                  count * SBUS_STATS_BUCKETS);
+    if (members == NULL || calls == NULL || errors == NULL
+            || histogram == NULL) {
+        ret = ENOMEM;
+        goto done;
+    }
+
+    for (i = 0; i < count; i++) {
+        stats = talloc_get_type(values[i].ptr, struct sbus_method_stats);
+
+        members[i] = talloc_strdup(members, stats->name);
+        if (members[i] == NULL) {
+            ret = ENOMEM;
+            goto done;
+        }
+
+        calls[i] = stats->calls;
+        errors[i] = stats->errors;
+        memcpy(&histogram[i * SBUS_STATS_BUCKETS], stats->histogram,
+               sizeof(stats->histogram));
+    }
+
+    *_members = members;
+    *_calls = calls;
+    *_errors = errors;
+    *_histogram = histogram;
+
+    ret = EOK;
+
+done:
+    if (ret != EOK) {
+        talloc_free(members);
+        talloc_free(calls);
+        talloc_free(errors);
+        talloc_free(histogram);
+    }
+
+    talloc_free(values);
+
+    return ret;
+}
+
+static errno_t
+sbus_stats_get_method_stats(TALLOC_CTX *mem_ctx,
+                            struct sbus_request *sbus_req,
+                            struct sbus_connection *conn,
+                            const char ***_members,
+                            uint64_t **_calls,
+                            uint64_t **_errors,
+                            uint64_t **_histogram)
+{
+    return sbus_stats_collect(mem_ctx, conn, _members, _calls, _errors,
+                              _histogram);
+}
+
+errno_t
+sbus_connection_enable_stats(struct sbus_connection *conn)
+{
+    errno_t ret;
+
+    if (conn->stats != NULL) {
+        return EOK;
+    }
+
+    SBUS_INTERFACE(iface,
+        org_freedesktop_sssd_Stats,
+        SBUS_METHODS(
+            SBUS_SYNC(METHOD, org_freedesktop_sssd_Stats, GetMethodStats,
+                      sbus_stats_get_method_stats, conn)
+        ),
+        SBUS_WITHOUT_SIGNALS,
+        SBUS_WITHOUT_PROPERTIES
+    );
+
+    ret = sss_hash_create(conn, 0, &conn->stats);
+    if (ret != EOK) {
+        DEBUG(SSSDBG_CRIT_FAILURE, "Unable to create stats table [%d]: %s\n",
+              ret, sss_strerror(ret));
+        return ret;
+    }
+
+    ret = sbus_router_add_path(conn->router, "/", &iface);
+    if (ret != EOK) {
+        DEBUG(SSSDBG_CRIT_FAILURE,
+              "Unable to register org.freedesktop.sssd.Stats [%d]: %s\n",
+              ret, sss_strerror(ret));
+        talloc_zfree(conn->stats);
+        return ret;
+    }
+
+    return EOK;
+}
@@ -56,6 +56,65 @@ errno_t _sbus_dbus_invoker_write_as
     return EOK;
 }
 
+errno_t _sbus_dbus_invoker_read_asatatat
+   (TALLOC_CTX *mem_ctx,
+    DBusMessageIter *iter,
+    struct _sbus_dbus_invoker_args_asatatat *args)
+{
+    errno_t ret;
+
+    ret = sbus_iterator_read_as(mem_ctx, iter, &args->arg0);
+    if (ret != EOK) {
+        return ret;
+    }
+
+    ret = sbus_iterator_read_at(mem_ctx, iter, &args->arg1);
+    if (ret != EOK) {
+        return ret;
+    }
+
+    ret = sbus_iterator_read_at(mem_ctx, iter, &args->arg2);
+    if (ret != EOK) {
+        return ret;
+    }
+
+    ret = sbus_iterator_read_at(mem_ctx, iter, &args->arg3);
+    if (ret != EOK) {
+        return ret;
+    }
+
+    return EOK;
+}
+
+errno_t _sbus_dbus_invoker_write_asatatat
+   (DBusMessageIter *iter,
+    struct _sbus_dbus_invoker_args_asatatat *args)
+{
+    errno_t ret;
+
+    ret = sbus_iterator_write_as(iter, args->arg0);
+    if (ret != EOK) {
+        return ret;
+    }
+
+    ret = sbus_iterator_write_at(iter, args->arg1);
+    if (ret != EOK) {
+        return ret;
+    }
+
+    ret = sbus_iterator_write_at(iter, args->arg2);
+    if (ret != EOK) {
+        return ret;
+    }
+
+    ret = sbus_iterator_write_at(iter, args->arg3);
+    if (ret != EOK) {
+        return ret;
+    }
+
+    return EOK;
+}
+
 errno_t _sbus_dbus_invoker_read_b
    (TALLOC_CTX *mem_ctx,
     DBusMessageIter *iter,
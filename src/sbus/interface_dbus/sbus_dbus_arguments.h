@@ -42,6 +42,24 @@ _sbus_dbus_invoker_write_as
    (DBusMessageIter *iter,
     struct _sbus_dbus_invoker_args_as *args);
 
+struct _sbus_dbus_invoker_args_asatatat {
+    const char ** arg0;
+    uint64_t * arg1;
+    uint64_t * arg2;
+    uint64_t * arg3;
+};
+
+errno_t
+_sbus_dbus_invoker_read_asatatat
+   (TALLOC_CTX *mem_ctx,
+    DBusMessageIter *iter,
+    struct _sbus_dbus_invoker_args_asatatat *args);
+
+errno_t
+_sbus_dbus_invoker_write_asatatat
+   (DBusMessageIter *iter,
+    struct _sbus_dbus_invoker_args_asatatat *args);
+
 struct _sbus_dbus_invoker_args_b {
     bool arg0;
 };
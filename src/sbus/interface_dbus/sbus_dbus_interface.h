@@ -511,4 +511,32 @@
         (handler_send), (handler_recv), (data)); \
 })
 
+/* Interface: org.freedesktop.sssd.Stats */
+#define SBUS_IFACE_org_freedesktop_sssd_Stats(methods, signals, properties) ({ \
+    sbus_interface("org.freedesktop.sssd.Stats", NULL, \
+        (methods), (signals), (properties)); \
+})
+
+/* Method: org.freedesktop.sssd.Stats.GetMethodStats */
+#define SBUS_METHOD_SYNC_org_freedesktop_sssd_Stats_GetMethodStats(handler, data) ({ \
+    SBUS_CHECK_SYNC((handler), (data), const char ***, uint64_t **, uint64_t **, uint64_t **); \
+    sbus_method_sync("GetMethodStats", \
+        &_sbus_dbus_args_org_freedesktop_sssd_Stats_GetMethodStats, \
+        NULL, \
+        _sbus_dbus_invoke_in__out_asatatat_send, \
+        NULL, \
+        (handler), (data)); \
+})
+
+#define SBUS_METHOD_ASYNC_org_freedesktop_sssd_Stats_GetMethodStats(handler_send, handler_recv, data) ({ \
+    SBUS_CHECK_SEND((handler_send), (data)); \
+    SBUS_CHECK_RECV((handler_recv), const char ***, uint64_t **, uint64_t **, uint64_t **); \
+    sbus_method_async("GetMethodStats", \
+        &_sbus_dbus_args_org_freedesktop_sssd_Stats_GetMethodStats, \
+        NULL, \
+        _sbus_dbus_invoke_in__out_asatatat_send, \
+        NULL, \
+        (handler_send), (handler_recv), (data)); \
+})
+
 #endif /* _SBUS_DBUS_INTERFACE_H_ */
@@ -24,6 +24,7 @@
 
 #include "sbus/sbus_private.h"
 #include "sbus/sbus_interface_declarations.h"
+#include "sbus/interface/sbus_iterator_writers.h"
 #include "sbus/interface_dbus/sbus_dbus_arguments.h"
 #include "sbus/interface_dbus/sbus_dbus_invokers.h"
 
@@ -89,11 +90,10 @@ _sbus_dbus_invoke_in__out_as_send
     const struct sbus_handler *handler,
     DBusMessageIter *read_iterator,
     DBusMessageIter *write_iterator,
-    const char **_key)
+    struct sbus_request_key *key)
 {
     struct _sbus_dbus_invoke_in__out_as_state *state;
     struct tevent_req *req;
-    const char *key;
     errno_t ret;
 
     req = tevent_req_create(mem_ctx, &state, struct _sbus_dbus_invoke_in__out_as_state);
@@ -117,13 +117,11 @@ _sbus_dbus_invoke_in__out_as_send
         goto done;
     }
 
-    ret = sbus_request_key(state, keygen, sbus_req, NULL, &key);
-    if (ret != EOK) {
-        goto done;
-    }
-
-    if (_key != NULL) {
-        *_key = talloc_steal(mem_ctx, key);
+    if (key != NULL) {
+        ret = sbus_request_key(keygen, sbus_req, NULL, key);
+        if (ret != EOK) {
+            goto done;
+        }
     }
 
     ret = EAGAIN;
@@ -221,6 +219,170 @@ static void _sbus_dbus_invoke_in__out_as_done(struct tevent_req *subreq)
     return;
 }
 
+struct _sbus_dbus_invoke_in__out_asatatat_state {
+    struct _sbus_dbus_invoker_args_asatatat out;
+    struct {
+        enum sbus_handler_type type;
+        void *data;
+        errno_t (*sync)(TALLOC_CTX *, struct sbus_request *, void *, const char ***, uint64_t **, uint64_t **, uint64_t **);
+        struct tevent_req * (*send)(TALLOC_CTX *, struct tevent_context *, struct sbus_request *, void *);
+        errno_t (*recv)(TALLOC_CTX *, struct tevent_req *, const char ***, uint64_t **, uint64_t **, uint64_t **);
+    } handler;
+
+    struct sbus_request *sbus_req;
+    DBusMessageIter *read_iterator;
+    DBusMessageIter *write_iterator;
+};
+
+static void
+_sbus_dbus_invoke_in__out_asatatat_step
+    (struct tevent_context *ev,
+     struct tevent_timer *te,
+     struct timeval tv,
+     void *private_data);
+
+static void
+_sbus_dbus_invoke_in__out_asatatat_done
+   (struct tevent_req *subreq);
+
+struct tevent_req *
+_sbus_dbus_invoke_in__out_asatatat_send
+   (TALLOC_CTX *mem_ctx,
+    struct tevent_context *ev,
+    struct sbus_request *sbus_req,
+    sbus_invoker_keygen keygen,
+    const struct sbus_handler *handler,
+    DBusMessageIter *read_iterator,
+    DBusMessageIter *write_iterator,
+    struct sbus_request_key *key)
+{
+    struct _sbus_dbus_invoke_in__out_asatatat_state *state;
+    struct tevent_req *req;
+    errno_t ret;
+
+    req = tevent_req_create(mem_ctx, &state, struct _sbus_dbus_invoke_in__out_asatatat_state);
+    if (req == NULL) {
+        DEBUG(SSSDBG_CRIT_FAILURE, "Unable to create tevent request!\n");
+        return NULL;
+    }
+
+    state->handler.type = handler->type;
+    state->handler.data = handler->data;
+    state->handler.sync = handler->sync;
+    state->handler.send = handler->async_send;
+    state->handler.recv = handler->async_recv;
+
+    state->sbus_req = sbus_req;
+    state->read_iterator = read_iterator;
+    state->write_iterator = write_iterator;
+
+    ret = sbus_invoker_schedule(state, ev, _sbus_dbus_invoke_in__out_asatatat_step, req);
+    if (ret != EOK) {
+        goto done;
+    }
+
+    if (key != NULL) {
+        ret = sbus_request_key(keygen, sbus_req, NULL, key);
+        if (ret != EOK) {
+            goto done;
+        }
+    }
+
+    ret = EAGAIN;
+
+done:
+    if (ret != EAGAIN) {
+        tevent_req_error(req, ret);
+        tevent_req_post(req, ev);
+    }
+
+    return req;
+}
+
+static void _sbus_dbus_invoke_in__out_asatatat_step
+   (struct tevent_context *ev,
+    struct tevent_timer *te,
+    struct timeval tv,
+    void *private_data)
+{
+    struct _sbus_dbus_invoke_in__out_asatatat_state *state;
+    struct tevent_req *subreq;
+    struct tevent_req *req;
+    errno_t ret;
+
+    req = talloc_get_type(private_data, struct tevent_req);
+    state = tevent_req_data(req, struct _sbus_dbus_invoke_in__out_asatatat_state);
+
+    switch (state->handler.type) {
+    case SBUS_HANDLER_SYNC:
+        if (state->handler.sync == NULL) {
+            DEBUG(SSSDBG_CRIT_FAILURE, "Bug: sync handler is not specified!\n");
+            ret = ERR_INTERNAL;
+            goto done;
+        }
+
+        ret = state->handler.sync(state, state->sbus_req, state->handler.data, &state->out.arg0, &state->out.arg1, &state->out.arg2, &state->out.arg3);
+        if (ret != EOK) {
+            goto done;
+        }
+
+        ret = _sbus_dbus_invoker_write_asatatat(state->write_iterator, &state->out);
+        goto done;
+    case SBUS_HANDLER_ASYNC:
+        if (state->handler.send == NULL || state->handler.recv == NULL) {
+            DEBUG(SSSDBG_CRIT_FAILURE, "Bug: async handler is not specified!\n");
+            ret = ERR_INTERNAL;
+            goto done;
+        }
+
+        subreq = state->handler.send(state, ev, state->sbus_req, state->handler.data);
+        if (subreq == NULL) {
+            DEBUG(SSSDBG_CRIT_FAILURE, "Unable to create subrequest!\n");
+            ret = ENOMEM;
+            goto done;
+        }
+
+        tevent_req_set_callback(subreq, _sbus_dbus_invoke_in__out_asatatat_done, req);
+        ret = EAGAIN;
+        goto done;
+    }
+
+    ret = ERR_INTERNAL;
+
+done:
+    if (ret == EOK) {
+        tevent_req_done(req);
+    } else if (ret != EAGAIN) {
+        tevent_req_error(req, ret);
+    }
+}
+
+static void _sbus_dbus_invoke_in__out_asatatat_done(struct tevent_req *subreq)
+{
+    struct _sbus_dbus_invoke_in__out_asatatat_state *state;
+    struct tevent_req *req;
+    errno_t ret;
+
+    req = tevent_req_callback_data(subreq, struct tevent_req);
+    state = tevent_req_data(req, struct _sbus_dbus_invoke_in__out_asatatat_state);
+
+    ret = state->handler.recv(state, subreq, &state->out.arg0, &state->out.arg1, &state->out.arg2, &state->out.arg3);
+    talloc_zfree(subreq);
+    if (ret != EOK) {
+        tevent_req_error(req, ret);
+        return;
+    }
+
+    ret = _sbus_dbus_invoker_write_asatatat(state->write_iterator, &state->out);
+    if (ret != EOK) {
+        tevent_req_error(req, ret);
+        return;
+    }
+
+    tevent_req_done(req);
+    return;
+}
+
 struct _sbus_dbus_invoke_in__out_s_state {
     struct _sbus_dbus_invoker_args_s out;
     struct {
@@ -256,11 +418,10 @@ _sbus_dbus_invoke_in__out_s_send
     const struct sbus_handler *handler,
     DBusMessageIter *read_iterator,
     DBusMessageIter *write_iterator,
-    const char **_key)
+    struct sbus_request_key *key)
 {
     struct _sbus_dbus_invoke_in__out_s_state *state;
     struct tevent_req *req;
-    const char *key;
     errno_t ret;
 
     req = tevent_req_create(mem_ctx, &state, struct _sbus_dbus_invoke_in__out_s_state);
@@ -284,13 +445,11 @@ _sbus_dbus_invoke_in__out_s_send
         goto done;
     }
 
-    ret = sbus_request_key(state, keygen, sbus_req, NULL, &key);
-    if (ret != EOK) {
-        goto done;
-    }
-
-    if (_key != NULL) {
-        *_key = talloc_steal(mem_ctx, key);
+    if (key != NULL) {
+        ret = sbus_request_key(keygen, sbus_req, NULL, key);
+        if (ret != EOK) {
+            goto done;
+        }
     }
 
     ret = EAGAIN;
@@ -422,11 +581,10 @@ _sbus_dbus_invoke_in_raw_out__send
     const struct sbus_handler *handler,
     DBusMessageIter *read_iterator,
     DBusMessageIter *write_iterator,
-    const char **_key)
+    struct sbus_request_key *key)
 {
     struct _sbus_dbus_invoke_in_raw_out__state *state;
     struct tevent_req *req;
-    const char *key;
     errno_t ret;
 
     req = tevent_req_create(mem_ctx, &state, struct _sbus_dbus_invoke_in_raw_out__state);
@@ -450,13 +608,11 @@ _sbus_dbus_invoke_in_raw_out__send
         goto done;
     }
 
-    ret = sbus_request_key(state, keygen, sbus_req, NULL, &key);
-    if (ret != EOK) {
-        goto done;
-    }
-
-    if (_key != NULL) {
-        *_key = talloc_steal(mem_ctx, key);
+    if (key != NULL) {
+        ret = sbus_request_key(keygen, sbus_req, NULL, key);
+        if (ret != EOK) {
+            goto done;
+        }
     }
 
     ret = EAGAIN;
@@ -582,11 +738,10 @@ _sbus_dbus_invoke_in_s_out__send
     const struct sbus_handler *handler,
     DBusMessageIter *read_iterator,
     DBusMessageIter *write_iterator,
-    const char **_key)
+    struct sbus_request_key *key)
 {
     struct _sbus_dbus_invoke_in_s_out__state *state;
     struct tevent_req *req;
-    const char *key;
     errno_t ret;
 
     req = tevent_req_create(mem_ctx, &state, struct _sbus_dbus_invoke_in_s_out__state);
@@ -623,13 +778,11 @@ _sbus_dbus_invoke_in_s_out__send
         goto done;
     }
 
-    ret = sbus_request_key(state, keygen, sbus_req, state->in, &key);
-    if (ret != EOK) {
-        goto done;
-    }
-
-    if (_key != NULL) {
-        *_key = talloc_steal(mem_ctx, key);
+    if (key != NULL) {
+        ret = sbus_request_key(keygen, sbus_req, state->in, key);
+        if (ret != EOK) {
+            goto done;
+        }
     }
 
     ret = EAGAIN;
@@ -756,11 +909,10 @@ _sbus_dbus_invoke_in_s_out_as_send
     const struct sbus_handler *handler,
     DBusMessageIter *read_iterator,
     DBusMessageIter *write_iterator,
-    const char **_key)
+    struct sbus_request_key *key)
 {
     struct _sbus_dbus_invoke_in_s_out_as_state *state;
     struct tevent_req *req;
-    const char *key;
     errno_t ret;
 
     req = tevent_req_create(mem_ctx, &state, struct _sbus_dbus_invoke_in_s_out_as_state);
@@ -797,13 +949,11 @@ _sbus_dbus_invoke_in_s_out_as_send
         goto done;
     }
 
-    ret = sbus_request_key(state, keygen, sbus_req, state->in, &key);
-    if (ret != EOK) {
-        goto done;
-    }
-
-    if (_key != NULL) {
-        *_key = talloc_steal(mem_ctx, key);
+    if (key != NULL) {
+        ret = sbus_request_key(keygen, sbus_req, state->in, key);
+        if (ret != EOK) {
+            goto done;
+        }
     }
 
     ret = EAGAIN;
@@ -937,11 +1087,10 @@ _sbus_dbus_invoke_in_s_out_b_send
     const struct sbus_handler *handler,
     DBusMessageIter *read_iterator,
     DBusMessageIter *write_iterator,
-    const char **_key)
+    struct sbus_request_key *key)
 {
     struct _sbus_dbus_invoke_in_s_out_b_state *state;
     struct tevent_req *req;
-    const char *key;
     errno_t ret;
 
     req = tevent_req_create(mem_ctx, &state, struct _sbus_dbus_invoke_in_s_out_b_state);
@@ -978,13 +1127,11 @@ _sbus_dbus_invoke_in_s_out_b_send
         goto done;
     }
 
-    ret = sbus_request_key(state, keygen, sbus_req, state->in, &key);
-    if (ret != EOK) {
-        goto done;
-    }
-
-    if (_key != NULL) {
-        *_key = talloc_steal(mem_ctx, key);
+    if (key != NULL) {
+        ret = sbus_request_key(keygen, sbus_req, state->in, key);
+        if (ret != EOK) {
+            goto done;
+        }
     }
 
     ret = EAGAIN;
@@ -1117,11 +1264,10 @@ _sbus_dbus_invoke_in_s_out_raw_send
     const struct sbus_handler *handler,
     DBusMessageIter *read_iterator,
     DBusMessageIter *write_iterator,
-    const char **_key)
+    struct sbus_request_key *key)
 {
     struct _sbus_dbus_invoke_in_s_out_raw_state *state;
     struct tevent_req *req;
-    const char *key;
     errno_t ret;
 
     req = tevent_req_create(mem_ctx, &state, struct _sbus_dbus_invoke_in_s_out_raw_state);
@@ -1158,13 +1304,11 @@ _sbus_dbus_invoke_in_s_out_raw_send
         goto done;
     }
 
-    ret = sbus_request_key(state, keygen, sbus_req, state->in, &key);
-    if (ret != EOK) {
-        goto done;
-    }
-
-    if (_key != NULL) {
-        *_key = talloc_steal(mem_ctx, key);
+    if (key != NULL) {
+        ret = sbus_request_key(keygen, sbus_req, state->in, key);
+        if (ret != EOK) {
+            goto done;
+        }
     }
 
     ret = EAGAIN;
@@ -1291,11 +1435,10 @@ _sbus_dbus_invoke_in_s_out_s_send
     const struct sbus_handler *handler,
     DBusMessageIter *read_iterator,
     DBusMessageIter *write_iterator,
-    const char **_key)
+    struct sbus_request_key *key)
 {
     struct _sbus_dbus_invoke_in_s_out_s_state *state;
     struct tevent_req *req;
-    const char *key;
     errno_t ret;
 
     req = tevent_req_create(mem_ctx, &state, struct _sbus_dbus_invoke_in_s_out_s_state);
@@ -1332,13 +1475,11 @@ _sbus_dbus_invoke_in_s_out_s_send
         goto done;
     }
 
-    ret = sbus_request_key(state, keygen, sbus_req, state->in, &key);
-    if (ret != EOK) {
-        goto done;
-    }
-
-    if (_key != NULL) {
-        *_key = talloc_steal(mem_ctx, key);
+    if (key != NULL) {
+        ret = sbus_request_key(keygen, sbus_req, state->in, key);
+        if (ret != EOK) {
+            goto done;
+        }
     }
 
     ret = EAGAIN;
@@ -1472,11 +1613,10 @@ _sbus_dbus_invoke_in_s_out_u_send
     const struct sbus_handler *handler,
     DBusMessageIter *read_iterator,
     DBusMessageIter *write_iterator,
-    const char **_key)
+    struct sbus_request_key *key)
 {
     struct _sbus_dbus_invoke_in_s_out_u_state *state;
     struct tevent_req *req;
-    const char *key;
     errno_t ret;
 
     req = tevent_req_create(mem_ctx, &state, struct _sbus_dbus_invoke_in_s_out_u_state);
@@ -1513,13 +1653,11 @@ _sbus_dbus_invoke_in_s_out_u_send
         goto done;
     }
 
-    ret = sbus_request_key(state, keygen, sbus_req, state->in, &key);
-    if (ret != EOK) {
-        goto done;
-    }
-
-    if (_key != NULL) {
-        *_key = talloc_steal(mem_ctx, key);
+    if (key != NULL) {
+        ret = sbus_request_key(keygen, sbus_req, state->in, key);
+        if (ret != EOK) {
+            goto done;
+        }
     }
 
     ret = EAGAIN;
@@ -1652,11 +1790,10 @@ _sbus_dbus_invoke_in_ss_out_raw_send
     const struct sbus_handler *handler,
     DBusMessageIter *read_iterator,
     DBusMessageIter *write_iterator,
-    const char **_key)
+    struct sbus_request_key *key)
 {
     struct _sbus_dbus_invoke_in_ss_out_raw_state *state;
     struct tevent_req *req;
-    const char *key;
     errno_t ret;
 
     req = tevent_req_create(mem_ctx, &state, struct _sbus_dbus_invoke_in_ss_out_raw_state);
@@ -1693,13 +1830,11 @@ _sbus_dbus_invoke_in_ss_out_raw_send
         goto done;
     }
 
-    ret = sbus_request_key(state, keygen, sbus_req, state->in, &key);
-    if (ret != EOK) {
-        goto done;
-    }
-
-    if (_key != NULL) {
-        *_key = talloc_steal(mem_ctx, key);
+    if (key != NULL) {
+        ret = sbus_request_key(keygen, sbus_req, state->in, key);
+        if (ret != EOK) {
+            goto done;
+        }
     }
 
     ret = EAGAIN;
@@ -1825,11 +1960,10 @@ _sbus_dbus_invoke_in_sss_out__send
     const struct sbus_handler *handler,
     DBusMessageIter *read_iterator,
     DBusMessageIter *write_iterator,
-    const char **_key)
+    struct sbus_request_key *key)
 {
     struct _sbus_dbus_invoke_in_sss_out__state *state;
     struct tevent_req *req;
-    const char *key;
     errno_t ret;
 
     req = tevent_req_create(mem_ctx, &state, struct _sbus_dbus_invoke_in_sss_out__state);
@@ -1866,13 +2000,11 @@ _sbus_dbus_invoke_in_sss_out__send
         goto done;
     }
 
-    ret = sbus_request_key(state, keygen, sbus_req, state->in, &key);
-    if (ret != EOK) {
-        goto done;
-    }
-
-    if (_key != NULL) {
-        *_key = talloc_steal(mem_ctx, key);
+    if (key != NULL) {
+        ret = sbus_request_key(keygen, sbus_req, state->in, key);
+        if (ret != EOK) {
+            goto done;
+        }
     }
 
     ret = EAGAIN;
@@ -1999,11 +2131,10 @@ _sbus_dbus_invoke_in_su_out_u_send
     const struct sbus_handler *handler,
     DBusMessageIter *read_iterator,
     DBusMessageIter *write_iterator,
-    const char **_key)
+    struct sbus_request_key *key)
 {
     struct _sbus_dbus_invoke_in_su_out_u_state *state;
     struct tevent_req *req;
-    const char *key;
     errno_t ret;
 
     req = tevent_req_create(mem_ctx, &state, struct _sbus_dbus_invoke_in_su_out_u_state);
@@ -2040,13 +2171,11 @@ _sbus_dbus_invoke_in_su_out_u_send
         goto done;
     }
 
-    ret = sbus_request_key(state, keygen, sbus_req, state->in, &key);
-    if (ret != EOK) {
-        goto done;
-    }
-
-    if (_key != NULL) {
-        *_key = talloc_steal(mem_ctx, key);
+    if (key != NULL) {
+        ret = sbus_request_key(keygen, sbus_req, state->in, key);
+        if (ret != EOK) {
+            goto done;
+        }
     }
 
     ret = EAGAIN;
@@ -37,9 +37,10 @@
          const struct sbus_handler *handler,                              \
          DBusMessageIter *read_iterator,                                  \
          DBusMessageIter *write_iterator,                                 \
-         const char **_key)
+         struct sbus_request_key *key)
 
 _sbus_dbus_declare_invoker(, as);
+_sbus_dbus_declare_invoker(, asatatat);
 _sbus_dbus_declare_invoker(, s);
 _sbus_dbus_declare_invoker(raw, );
 _sbus_dbus_declare_invoker(s, );
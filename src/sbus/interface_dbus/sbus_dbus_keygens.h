@@ -20,31 +20,29 @@
 #ifndef _SBUS_DBUS_KEYGENS_H_
 #define _SBUS_DBUS_KEYGENS_H_
 
-#include <talloc.h>
-
 #include "sbus/sbus_request.h"
 #include "sbus/interface_dbus/sbus_dbus_arguments.h"
 
-const char *
+void
 _sbus_dbus_key_
-   (TALLOC_CTX *mem_ctx,
+   (struct sbus_request_key *key,
     struct sbus_request *sbus_req);
 
-const char *
+void
 _sbus_dbus_key_s_0
-   (TALLOC_CTX *mem_ctx,
+   (struct sbus_request_key *key,
     struct sbus_request *sbus_req,
     struct _sbus_dbus_invoker_args_s *args);
 
-const char *
+void
 _sbus_dbus_key_ss_0_1
-   (TALLOC_CTX *mem_ctx,
+   (struct sbus_request_key *key,
     struct sbus_request *sbus_req,
     struct _sbus_dbus_invoker_args_ss *args);
 
-const char *
+void
 _sbus_dbus_key_su_0
-   (TALLOC_CTX *mem_ctx,
+   (struct sbus_request_key *key,
     struct sbus_request *sbus_req,
     struct _sbus_dbus_invoker_args_su *args);
 
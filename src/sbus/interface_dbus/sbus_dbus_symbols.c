@@ -252,3 +252,17 @@ _sbus_dbus_args_org_freedesktop_DBus_Properties_Set = {
         {NULL}
     }
 };
+
+const struct sbus_method_arguments
+_sbus_dbus_args_org_freedesktop_sssd_Stats_GetMethodStats = {
+    .input = (const struct sbus_argument[]){
+        {NULL}
+    },
+    .output = (const struct sbus_argument[]){
+        {.type = "as", .name = "members"},
+        {.type = "at", .name = "calls"},
+        {.type = "at", .name = "errors"},
+        {.type = "at", .name = "histogram"},
+        {NULL}
+    }
+};
@@ -85,4 +85,7 @@ _sbus_dbus_args_org_freedesktop_DBus_Properties_GetAll;
 extern const struct sbus_method_arguments
 _sbus_dbus_args_org_freedesktop_DBus_Properties_Set;
 
+extern const struct sbus_method_arguments
+_sbus_dbus_args_org_freedesktop_sssd_Stats_GetMethodStats;
+
 #endif /* _SBUS_DBUS_SYMBOLS_H_ */
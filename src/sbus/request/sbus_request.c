@@ -39,6 +39,7 @@ struct sbus_active_requests *
 sbus_active_requests_init(TALLOC_CTX *mem_ctx)
 {
     struct sbus_active_requests *requests;
+    errno_t ret;
 
     requests = talloc_zero(mem_ctx, struct sbus_active_requests);
     if (requests == NULL) {
@@ -55,6 +56,11 @@ sbus_active_requests_init(TALLOC_CTX *mem_ctx)
         goto fail;
     }
 
+    ret = sss_hash_create(requests, 0, &requests->names);
+    if (ret != EOK) {
+        goto fail;
+    }
+
     return requests;
 
 fail:
@@ -220,8 +226,8 @@ done:
 }
 
 static void
-sbus_request_notify_error(hash_table_t *table,
-                          const char *key,
+sbus_request_notify_error(struct sbus_request_table *table,
+                          const struct sbus_request_key *key,
                           struct tevent_req *req,
                           errno_t error)
 {
@@ -268,8 +274,8 @@ sbus_request_notify_error(hash_table_t *table,
 }
 
 static void
-sbus_request_notify_success(hash_table_t *table,
-                            const char *key,
+sbus_request_notify_success(struct sbus_request_table *table,
+                            const struct sbus_request_key *key,
                             struct tevent_req *req,
                             sbus_request_messages_fn messages_fn,
                             DBusMessage *reply)
@@ -334,7 +340,7 @@ struct sbus_incoming_request_state {
     DBusMessageIter *read_iter;
     DBusMessage *reply;
     DBusMessage *msg;
-    const char *key;
+    struct sbus_request_key key;
 };
 
 static errno_t
@@ -493,7 +499,7 @@ static void sbus_incoming_request_sender_done(struct tevent_req *subreq)
      * Otherwise we add ourselves as the first request of this type and
      * set a tevent callback that is triggered when the method handler is done.
      */
-    ret = sbus_requests_add(state->conn->requests->incoming, state->key,
+    ret = sbus_requests_add(state->conn->requests->incoming, &state->key,
                             state->conn, req, true, &key_exists);
     if (ret != EOK || key_exists) {
         /* Cancel the sub request. Since there was either an error or the
@@ -533,12 +539,12 @@ static void sbus_incoming_request_done(struct tevent_req *subreq)
 
     if (ret != EOK) {
         sbus_request_notify_error(state->conn->requests->incoming,
-                                  state->key, req, ret);
+                                  &state->key, req, ret);
         return;
     }
 
     sbus_request_notify_success(state->conn->requests->incoming,
-                                state->key, req, sbus_request_messages,
+                                &state->key, req, sbus_request_messages,
                                 state->reply);
 }
 
@@ -573,7 +579,7 @@ sbus_incoming_request_recv(TALLOC_CTX *mem_ctx,
 }
 
 struct sbus_outgoing_request_state {
-    const char *key;
+    struct sbus_request_key key;
     struct sbus_connection *conn;
     DBusMessage *reply;
     uint64_t chain_id;
@@ -605,7 +611,7 @@ struct tevent_req *
 sbus_outgoing_request_send(TALLOC_CTX *mem_ctx,
                            struct tevent_context *ev,
                            struct sbus_connection *conn,
-                           const char *key,
+                           const struct sbus_request_key *key,
                            DBusMessage *msg)
 {
     struct sbus_outgoing_request_state *state;
@@ -630,13 +636,11 @@ sbus_outgoing_request_send(TALLOC_CTX *mem_ctx,
      */
     state->chain_id = sss_chain_id_get();
 
+    /* The caller's key buffer does not live as long as this request. */
     if (key != NULL) {
-        state->key = talloc_strdup(state, key);
-        if (state->key == NULL) {
-            DEBUG(SSSDBG_CRIT_FAILURE, "talloc_strdup() failed!\n");
-            ret = ENOMEM;
-            goto done;
-        }
+        state->key.hash = key->hash;
+        state->key.len = key->len;
+        memcpy(state->key.data, key->data, key->len);
     }
 
     /**
@@ -647,7 +651,7 @@ sbus_outgoing_request_send(TALLOC_CTX *mem_ctx,
      * Otherwise we add ourselves as the first request of this type and
      * set a tevent callback that is triggered when the method handler is done.
      */
-    ret = sbus_requests_add(conn->requests->outgoing, key,
+    ret = sbus_requests_add(conn->requests->outgoing, &state->key,
                             conn, req, true, &key_exists);
     if (ret != EOK) {
         goto done;
@@ -693,12 +697,12 @@ static void sbus_outgoing_request_done(struct tevent_req *subreq)
 
     if (ret != EOK) {
         sbus_request_notify_error(state->conn->requests->outgoing,
-                                  state->key, req, ret);
+                                  &state->key, req, ret);
         return;
     }
 
     sbus_request_notify_success(state->conn->requests->outgoing,
-                                state->key, req,
+                                &state->key, req,
                                 sbus_outgoing_request_messages,
                                 state->reply);
 }
@@ -742,8 +746,9 @@ sbus_request_await_send(TALLOC_CTX *mem_ctx,
 {
     struct sbus_request_await_state *state;
     struct sbus_request_list *list;
+    struct sbus_request_key key;
+    struct sbus_request sbus_req = {0};
     struct tevent_req *req;
-    const char *key;
     errno_t ret;
 
     req = tevent_req_create(mem_ctx, &state, struct sbus_request_await_state);
@@ -752,16 +757,24 @@ sbus_request_await_send(TALLOC_CTX *mem_ctx,
         return NULL;
     }
 
-    key = talloc_asprintf(state, "-:%u:%s.%s:%s%s%s",
-                          type, interface, member, object_path,
-                          additional_key == NULL ? "" : ":",
-                          additional_key == NULL ? "" : additional_key);
-    if (key == NULL) {
-        ret = ENOMEM;
+    /* Build the same key as the keygen of the outgoing request. */
+    sbus_req.conn = conn;
+    sbus_req.type = type;
+    sbus_req.interface = interface;
+    sbus_req.member = member;
+    sbus_req.path = object_path;
+
+    sbus_request_key_init(&key, &sbus_req);
+    if (additional_key != NULL) {
+        sbus_request_key_add_string(&key, additional_key);
+    }
+
+    ret = sbus_request_key_finish(&key);
+    if (ret != EOK) {
         goto done;
     }
 
-    list = sbus_requests_lookup(conn->requests->outgoing, key);
+    list = sbus_requests_lookup(conn->requests->outgoing, &key);
     if (list == NULL) {
         /* No active request with this key exists. */
         ret = EOK;
@@ -769,7 +782,7 @@ sbus_request_await_send(TALLOC_CTX *mem_ctx,
     }
 
     /* Otherwise attach to this request. */
-    ret = sbus_requests_add(conn->requests->outgoing, key, conn,
+    ret = sbus_requests_add(conn->requests->outgoing, &key, conn,
                             req, false, NULL);
     if (ret != EOK) {
         DEBUG(SSSDBG_CRIT_FAILURE, "Unable to attach to the request list "
@@ -45,7 +45,7 @@ sbus_call_method_send(TALLOC_CTX *mem_ctx,
     struct sbus_request *sbus_req;
     struct tevent_req *subreq;
     struct tevent_req *req;
-    const char *key = NULL;
+    struct sbus_request_key key;
     DBusMessage *msg;
     errno_t ret;
 
@@ -69,12 +69,12 @@ sbus_call_method_send(TALLOC_CTX *mem_ctx,
         goto done;
     }
 
-    ret = sbus_request_key(state, keygen, sbus_req, input, &key);
+    ret = sbus_request_key(keygen, sbus_req, input, &key);
     if (ret != EOK) {
         goto done;
     }
 
-    subreq = sbus_outgoing_request_send(state, conn->ev, conn, key, msg);
+    subreq = sbus_outgoing_request_send(state, conn->ev, conn, &key, msg);
     if (subreq == NULL) {
         DEBUG(SSSDBG_CRIT_FAILURE, "Unable to create subrequest!\n");
         ret = ENOMEM;
@@ -158,3 +158,119 @@ sbus_call_signal_send(struct sbus_connection *conn,
 
     sbus_emit_signal(conn, msg);
 }
+
+struct sbus_batch_state {
+    struct tevent_context *ev;
+    struct tevent_req **subreqs;
+    unsigned int count;
+    unsigned int pending;
+    bool sealed;
+};
+
+static void sbus_batch_done(struct tevent_req *subreq);
+
+struct tevent_req *
+sbus_batch_send(TALLOC_CTX *mem_ctx,
+                struct sbus_connection *conn)
+{
+    struct sbus_batch_state *state;
+    struct tevent_req *req;
+
+    req = tevent_req_create(mem_ctx, &state, struct sbus_batch_state);
+    if (req == NULL) {
+        DEBUG(SSSDBG_CRIT_FAILURE, "Unable to create tevent request!\n");
+        return NULL;
+    }
+
+    state->ev = conn->ev;
+
+    return req;
+}
+
+errno_t
+sbus_batch_add(struct tevent_req *req,
+               struct tevent_req *subreq)
+{
+    struct sbus_batch_state *state;
+    struct tevent_req **subreqs;
+
+    state = tevent_req_data(req, struct sbus_batch_state);
+
+    if (subreq == NULL) {
+        DEBUG(SSSDBG_CRIT_FAILURE, "Unable to create subrequest!\n");
+        goto fail;
+    }
+
+    subreqs = talloc_realloc(state, state->subreqs, struct tevent_req *,
+                             state->count + 1);
+    if (subreqs == NULL) {
+        talloc_free(subreq);
+        goto fail;
+    }
+
+    /* The subrequest is kept until the whole batch is freed so its output
+     * can be received later with the generated batch receive function. */
+    subreqs[state->count] = talloc_steal(state, subreq);
+    state->subreqs = subreqs;
+    state->count++;
+    state->pending++;
+
+    tevent_req_set_callback(subreq, sbus_batch_done, req);
+
+    return EOK;
+
+fail:
+    tevent_req_error(req, ENOMEM);
+    tevent_req_post(req, state->ev);
+    return ENOMEM;
+}
+
+void
+sbus_batch_seal(struct tevent_req *req)
+{
+    struct sbus_batch_state *state;
+
+    state = tevent_req_data(req, struct sbus_batch_state);
+    state->sealed = true;
+
+    if (state->pending == 0) {
+        tevent_req_done(req);
+        tevent_req_post(req, state->ev);
+    }
+}
+
+static void sbus_batch_done(struct tevent_req *subreq)
+{
+    struct sbus_batch_state *state;
+    struct tevent_req *req;
+
+    req = tevent_req_callback_data(subreq, struct tevent_req);
+    state = tevent_req_data(req, struct sbus_batch_state);
+
+    /* Output is received by the caller through sbus_batch_item(). */
+    state->pending--;
+
+    if (state->sealed && state->pending == 0) {
+        tevent_req_done(req);
+    }
+}
+
+errno_t
+sbus_batch_item(struct tevent_req *req,
+                unsigned int index,
+                struct tevent_req **_subreq)
+{
+    struct sbus_batch_state *state;
+
+    state = tevent_req_data(req, struct sbus_batch_state);
+
+    TEVENT_REQ_RETURN_ON_ERROR(req);
+
+    if (index >= state->count) {
+        return EINVAL;
+    }
+
+    *_subreq = state->subreqs[index];
+
+    return EOK;
+}
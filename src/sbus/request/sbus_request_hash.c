@@ -23,10 +23,12 @@
 
 #include "util/util.h"
 #include "util/dlinklist.h"
-#include "util/sss_ptr_hash.h"
 #include "sbus/sbus_request.h"
 #include "sbus/sbus_private.h"
 
+/* Initial number of buckets, must be a power of two. */
+#define SBUS_REQUESTS_TABLE_SIZE 64
+
 static void
 sbus_requests_disable_spies(struct sbus_request_list *item);
 
@@ -37,6 +39,25 @@ struct sbus_request_spy {
     struct sbus_request_list *item;
 };
 
+/**
+ * Requests are chained in a hash table keyed by binary request keys with
+ * precomputed hash. Each entry holds a copy of the key and the list of
+ * requests. It is allocated on the first item of the list, therefore
+ * freeing the first item will remove the list also from the table.
+ */
+struct sbus_request_entry {
+    struct sbus_request_table *table;
+    struct sbus_request_entry *next;
+    struct sbus_request_list *list;
+    struct sbus_request_key key;
+};
+
+struct sbus_request_table {
+    struct sbus_request_entry **buckets;
+    size_t size;
+    size_t count;
+};
+
 static int
 sbus_requests_spy_destructor(struct sbus_request_spy *spy)
 {
@@ -107,27 +128,219 @@ sbus_requests_disable_spies(struct sbus_request_list *item)
     talloc_zfree(item->spy.conn);
 }
 
-hash_table_t *
+static int
+sbus_requests_table_destructor(struct sbus_request_table *table)
+{
+    /* Entries are freed together with the table, there is no need
+     * to unlink them. */
+    table->buckets = NULL;
+
+    return 0;
+}
+
+struct sbus_request_table *
 sbus_requests_init(TALLOC_CTX *mem_ctx)
 {
-    return sss_ptr_hash_create(mem_ctx, NULL, NULL);
+    struct sbus_request_table *table;
+
+    table = talloc_zero(mem_ctx, struct sbus_request_table);
+    if (table == NULL) {
+        return NULL;
+    }
+
+    table->size = SBUS_REQUESTS_TABLE_SIZE;
+    table->buckets = talloc_zero_array(table, struct sbus_request_entry *,
+                                       table->size);
+    if (table->buckets == NULL) {
+        talloc_free(table);
+        return NULL;
+    }
+
+    talloc_set_destructor(table, sbus_requests_table_destructor);
+
+    return table;
+}
+
+errno_t
+sbus_requests_name_id(struct sbus_active_requests *requests,
+                      const char *name,
+                      uint32_t *_id)
+{
+    hash_key_t key;
+    hash_value_t value;
+    int hret;
+
+    if (name == NULL) {
+        *_id = 0;
+        return EOK;
+    }
+
+    key.type = HASH_KEY_STRING;
+    key.str = discard_const(name);
+
+    hret = hash_lookup(requests->names, &key, &value);
+    if (hret == HASH_SUCCESS) {
+        *_id = value.ul;
+        return EOK;
+    } else if (hret != HASH_ERROR_KEY_NOT_FOUND) {
+        DEBUG(SSSDBG_OP_FAILURE, "Unable to lookup name [%d]: %s\n",
+              hret, hash_error_string(hret));
+        return EIO;
+    }
+
+    /* Zero is reserved for no name. */
+    value.type = HASH_VALUE_ULONG;
+    value.ul = hash_count(requests->names) + 1;
+
+    hret = hash_enter(requests->names, &key, &value);
+    if (hret != HASH_SUCCESS) {
+        DEBUG(SSSDBG_OP_FAILURE, "Unable to intern name [%d]: %s\n",
+              hret, hash_error_string(hret));
+        return EIO;
+    }
+
+    *_id = value.ul;
+
+    return EOK;
+}
+
+static bool
+sbus_requests_key_equal(const struct sbus_request_key *a,
+                        const struct sbus_request_key *b)
+{
+    return a->hash == b->hash
+        && a->len == b->len
+        && memcmp(a->data, b->data, a->len) == 0;
+}
+
+static struct sbus_request_entry **
+sbus_requests_bucket(struct sbus_request_table *table,
+                     const struct sbus_request_key *key)
+{
+    return &table->buckets[key->hash & (table->size - 1)];
+}
+
+static struct sbus_request_entry *
+sbus_requests_find(struct sbus_request_table *table,
+                   const struct sbus_request_key *key)
+{
+    struct sbus_request_entry *entry;
+
+    for (entry = *sbus_requests_bucket(table, key);
+         entry != NULL;
+         entry = entry->next) {
+        if (sbus_requests_key_equal(&entry->key, key)) {
+            return entry;
+        }
+    }
+
+    return NULL;
+}
+
+static void
+sbus_requests_grow(struct sbus_request_table *table)
+{
+    struct sbus_request_entry **buckets;
+    struct sbus_request_entry **old;
+    struct sbus_request_entry *entry;
+    struct sbus_request_entry *next;
+    size_t old_size;
+    size_t i;
+
+    buckets = talloc_zero_array(table, struct sbus_request_entry *,
+                                table->size * 2);
+    if (buckets == NULL) {
+        /* This is ok, we will just have longer chains. */
+        return;
+    }
+
+    old = table->buckets;
+    old_size = table->size;
+
+    table->buckets = buckets;
+    table->size *= 2;
+
+    for (i = 0; i < old_size; i++) {
+        for (entry = old[i]; entry != NULL; entry = next) {
+            next = entry->next;
+            entry->next = *sbus_requests_bucket(table, &entry->key);
+            *sbus_requests_bucket(table, &entry->key) = entry;
+        }
+    }
+
+    talloc_free(old);
+}
+
+static int
+sbus_requests_entry_destructor(struct sbus_request_entry *entry)
+{
+    struct sbus_request_table *table = entry->table;
+    struct sbus_request_entry **link;
+
+    if (table->buckets == NULL) {
+        return 0;
+    }
+
+    for (link = sbus_requests_bucket(table, &entry->key);
+         *link != NULL;
+         link = &(*link)->next) {
+        if (*link == entry) {
+            *link = entry->next;
+            table->count--;
+            break;
+        }
+    }
+
+    return 0;
+}
+
+static errno_t
+sbus_requests_insert(struct sbus_request_table *table,
+                     const struct sbus_request_key *key,
+                     struct sbus_request_list *list)
+{
+    struct sbus_request_entry **bucket;
+    struct sbus_request_entry *entry;
+
+    if (table->count >= table->size) {
+        sbus_requests_grow(table);
+    }
+
+    entry = talloc_zero(list, struct sbus_request_entry);
+    if (entry == NULL) {
+        return ENOMEM;
+    }
+
+    entry->table = table;
+    entry->list = list;
+    entry->key.hash = key->hash;
+    entry->key.len = key->len;
+    memcpy(entry->key.data, key->data, key->len);
+
+    bucket = sbus_requests_bucket(table, key);
+    entry->next = *bucket;
+    *bucket = entry;
+    table->count++;
+
+    talloc_set_destructor(entry, sbus_requests_entry_destructor);
+
+    return EOK;
 }
 
 errno_t
-sbus_requests_add(hash_table_t *table,
-                  const char *key,
+sbus_requests_add(struct sbus_request_table *table,
+                  const struct sbus_request_key *key,
                   struct sbus_connection *conn,
                   struct tevent_req *req,
                   bool is_dbus,
                   bool *_key_exists)
 {
-    TALLOC_CTX *tmp_ctx;
-    struct sbus_request_list *list;
+    struct sbus_request_entry *entry;
     struct sbus_request_list *item;
     bool key_exists = false;
     errno_t ret;
 
-    if (key == NULL) {
+    if (key == NULL || key->len == 0) {
         /* This is ok, since not all request are supposed to be multicasted.
          * The caller will continue as this was a new request.
          * And it simplifies the code. */
@@ -135,18 +348,14 @@ sbus_requests_add(hash_table_t *table,
         return EOK;
     }
 
-    tmp_ctx = talloc_new(NULL);
-    if (tmp_ctx == NULL) {
+    /* This is done for every incoming and outgoing request so we allocate
+     * the item directly on the table and free it on failure. */
+    item = talloc_zero(table, struct sbus_request_list);
+    if (item == NULL) {
         DEBUG(SSSDBG_FATAL_FAILURE, "Out of memory!\n");
         return ENOMEM;
     }
 
-    item = talloc_zero(tmp_ctx, struct sbus_request_list);
-    if (item == NULL) {
-        ret = ENOMEM;
-        goto done;
-    }
-
     item->req = req;
     item->conn = conn;
     item->is_dbus = is_dbus;
@@ -159,45 +368,51 @@ sbus_requests_add(hash_table_t *table,
     /* First, check if the key already exist. If yes, check if the list
      * is valid and just append the item to the list if so. Otherwise,
      * the list is internally deleted and we can create a new one. */
-    list = sss_ptr_hash_lookup(table, key, struct sbus_request_list);
-    if (list != NULL) {
+    entry = sbus_requests_find(table, key);
+    if (entry != NULL) {
         key_exists = true;
-        DLIST_ADD_END(list, item, struct sbus_request_list *);
-        DEBUG(SSSDBG_TRACE_ALL, "Chaining request: %s\n", key);
+        DLIST_ADD_END(entry->list, item, struct sbus_request_list *);
+        DEBUG(SSSDBG_TRACE_ALL, "Chaining request with key hash %#x\n",
+              key->hash);
         ret = EOK;
         goto done;
     }
 
     /* Otherwise create new hash entry and new list. */
-    list = item;
-    ret = sss_ptr_hash_add(table, key, list, struct sbus_request_list);
+    ret = sbus_requests_insert(table, key, item);
 
 done:
-    if (ret == EOK) {
-        if (_key_exists != NULL) {
-            *_key_exists = key_exists;
-        }
-
-        talloc_steal(table, item);
+    if (ret != EOK) {
+        talloc_free(item);
+        return ret;
     }
 
-    talloc_free(tmp_ctx);
+    if (_key_exists != NULL) {
+        *_key_exists = key_exists;
+    }
 
-    return ret;
+    return EOK;
 }
 
 struct sbus_request_list *
-sbus_requests_lookup(hash_table_t *table,
-                     const char *key)
+sbus_requests_lookup(struct sbus_request_table *table,
+                     const struct sbus_request_key *key)
 {
-    if (key == NULL) {
+    struct sbus_request_entry *entry;
+
+    if (key == NULL || key->len == 0) {
         /* This is ok, since not all request are supposed to be multicasted.
          * The caller will have an empty list ot send notification to.
          * And it simplifies the code. */
         return NULL;
     }
 
-    return sss_ptr_hash_lookup(table, key, struct sbus_request_list);
+    entry = sbus_requests_find(table, key);
+    if (entry == NULL) {
+        return NULL;
+    }
+
+    return entry->list;
 }
 
 void
@@ -294,32 +509,41 @@ sbus_requests_finish(struct sbus_request_list *item,
 }
 
 void
-sbus_requests_terminate_all(hash_table_t *table,
+sbus_requests_terminate_all(struct sbus_request_table *table,
                             errno_t error)
 {
-    struct sbus_request_list *list;
+    struct sbus_request_entry *entry;
+    struct sbus_request_list **lists;
     struct sbus_request_list *item;
-    hash_value_t *values;
-    unsigned long int num;
-    unsigned long int i;
-    int hret;
+    size_t num = 0;
+    size_t i;
 
-    hret = hash_values(table, &num, &values);
-    if (hret != HASH_SUCCESS) {
-        DEBUG(SSSDBG_CRIT_FAILURE, "Unable to get list of active requests "
-              "[%d]: %s\n", hret, hash_error_string(hret));
+    if (table->count == 0) {
         return;
     }
 
-    for (i = 0; i < num; i++) {
-        list = sss_ptr_get_value(&values[i], struct sbus_request_list);
+    /* Take a snapshot first, the table is modified when the lists
+     * are deleted. */
+    lists = talloc_array(NULL, struct sbus_request_list *, table->count);
+    if (lists == NULL) {
+        DEBUG(SSSDBG_CRIT_FAILURE, "Unable to get list of active requests\n");
+        return;
+    }
 
-        DLIST_FOR_EACH(item, list) {
+    for (i = 0; i < table->size; i++) {
+        for (entry = table->buckets[i]; entry != NULL; entry = entry->next) {
+            lists[num] = entry->list;
+            num++;
+        }
+    }
+
+    for (i = 0; i < num; i++) {
+        DLIST_FOR_EACH(item, lists[i]) {
             sbus_requests_finish(item, error);
         }
 
-        sbus_requests_delete(list);
+        sbus_requests_delete(lists[i]);
     }
 
-    talloc_free(values);
+    talloc_free(lists);
 }
@@ -18,9 +18,11 @@
     along with this program.  If not, see <http://www.gnu.org/licenses/>.
 */
 
+#include <string.h>
 #include <tevent.h>
 #include <talloc.h>
 
+#include "shared/murmurhash3.h"
 #include "sbus/sbus_request.h"
 #include "sbus/sbus_private.h"
 
@@ -32,36 +34,124 @@ sbus_invoker_recv(struct tevent_req *req)
     return EOK;
 }
 
+void
+sbus_request_key_init(struct sbus_request_key *key,
+                      struct sbus_request *sbus_req)
+{
+    uint8_t has_sender = 0;
+    int64_t uid = 0;
+    uint32_t type;
+    uint32_t interface_id;
+    uint32_t member_id;
+    errno_t ret;
+
+    key->hash = 0;
+    key->error = EOK;
+    key->len = 0;
+
+    ret = sbus_requests_name_id(sbus_req->conn->requests,
+                                sbus_req->interface, &interface_id);
+    if (ret != EOK) {
+        key->error = ret;
+        return;
+    }
+
+    ret = sbus_requests_name_id(sbus_req->conn->requests,
+                                sbus_req->member, &member_id);
+    if (ret != EOK) {
+        key->error = ret;
+        return;
+    }
+
+    if (sbus_req->sender != NULL) {
+        has_sender = 1;
+        uid = sbus_req->sender->uid;
+    }
+
+    type = sbus_req->type;
+
+    sbus_request_key_add_value(key, has_sender);
+    sbus_request_key_add_value(key, uid);
+    sbus_request_key_add_value(key, type);
+    sbus_request_key_add_value(key, interface_id);
+    sbus_request_key_add_value(key, member_id);
+    sbus_request_key_add_string(key, sbus_req->path);
+}
+
+void
+sbus_request_key_add(struct sbus_request_key *key,
+                     const void *data,
+                     size_t len)
+{
+    if (key->error != EOK) {
+        return;
+    }
+
+    if (len > sizeof(key->data) - key->len) {
+        key->error = E2BIG;
+        return;
+    }
+
+    memcpy(key->data + key->len, data, len);
+    key->len += len;
+}
+
+void
+sbus_request_key_add_string(struct sbus_request_key *key,
+                            const char *str)
+{
+    uint8_t is_set;
+
+    /* Distinguish NULL from an empty string. */
+    is_set = str != NULL;
+    sbus_request_key_add_value(key, is_set);
+
+    if (str != NULL) {
+        sbus_request_key_add(key, str, strlen(str) + 1);
+    }
+}
+
+errno_t
+sbus_request_key_finish(struct sbus_request_key *key)
+{
+    if (key->error == E2BIG) {
+        DEBUG(SSSDBG_TRACE_FUNC, "Request key is too long, "
+              "this request will not be chained\n");
+        key->len = 0;
+        return EOK;
+    }
+
+    if (key->error != EOK) {
+        key->len = 0;
+        return key->error;
+    }
+
+    key->hash = murmurhash3((const char *)key->data, key->len, 0);
+
+    return EOK;
+}
+
 errno_t
-sbus_request_key(TALLOC_CTX *mem_ctx,
-                 sbus_invoker_keygen keygen,
+sbus_request_key(sbus_invoker_keygen keygen,
                  struct sbus_request *sbus_req,
                  void *input,
-                 const char **_key)
+                 struct sbus_request_key *key)
 {
-    const char *(*args_fn)(TALLOC_CTX *, struct sbus_request *, void *);
-    const char *(*noargs_fn)(TALLOC_CTX *, struct sbus_request *);
-    const char *key;
+    void (*args_fn)(struct sbus_request_key *, struct sbus_request *, void *);
+    void (*noargs_fn)(struct sbus_request_key *, struct sbus_request *);
 
     if (keygen == NULL) {
-        *_key = NULL;
+        key->len = 0;
         return EOK;
     }
 
     if (input == NULL) {
         noargs_fn = keygen;
-        key = noargs_fn(mem_ctx, sbus_req);
+        noargs_fn(key, sbus_req);
     } else {
         args_fn = keygen;
-        key = args_fn(mem_ctx, sbus_req, input);
+        args_fn(key, sbus_req, input);
     }
 
-    if (key == NULL) {
-        return ENOMEM;
-    }
-
-    *_key = key;
-
-    return EOK;
-
+    return sbus_request_key_finish(key);
 }
@@ -55,6 +55,8 @@ struct sbus_issue_request_state {
     DBusMessageIter message_iter;
     DBusMessage *message;
     enum sbus_request_type type;
+    struct sbus_method_stats *stats;
+    struct timeval start;
 };
 
 static void sbus_issue_request_done(struct tevent_req *subreq);
@@ -66,7 +68,8 @@ sbus_issue_request(TALLOC_CTX *mem_ctx,
                    DBusMessage *message,
                    enum sbus_request_type type,
                    const struct sbus_invoker *invoker,
-                   const struct sbus_handler *handler)
+                   const struct sbus_handler *handler,
+                   struct sbus_method_stats *stats)
 {
     struct sbus_issue_request_state *state;
     struct sbus_request *request;
@@ -81,6 +84,11 @@ sbus_issue_request(TALLOC_CTX *mem_ctx,
     state->conn = conn;
     state->message = dbus_message_ref(message);
     state->type = type;
+    state->stats = stats;
+
+    if (stats != NULL) {
+        state->start = tevent_timeval_current();
+    }
 
     ret = sbus_message_bound(state, state->message);
     if (ret != EOK) {
@@ -144,6 +152,10 @@ static void sbus_issue_request_done(struct tevent_req *subreq)
     ret = sbus_incoming_request_recv(state, subreq, &reply);
     talloc_zfree(subreq);
 
+    if (state->stats != NULL) {
+        sbus_stats_record(state->stats, state->start, ret);
+    }
+
     if (ret == EOK) {
         DEBUG(SSSDBG_TRACE_FUNC, "%s.%s: Success\n",
               meta.interface, meta.member);
@@ -227,7 +239,8 @@ sbus_method_handler(struct sbus_connection *conn,
     sbus_annotation_warn(iface, method);
 
     ret = sbus_issue_request(conn, meta, conn, message, SBUS_REQUEST_METHOD,
-                             &method->invoker, &method->handler);
+                             &method->invoker, &method->handler,
+                             sbus_stats_get(conn, iface, method));
     if (ret != EOK) {
         DEBUG(SSSDBG_CRIT_FAILURE, "Unable to issue request [%d]: %s\n",
               ret, sss_strerror(ret));
@@ -274,7 +287,8 @@ sbus_signal_handler(struct sbus_connection *conn,
         ret = sbus_issue_request(conn, meta, conn, message,
                                  SBUS_REQUEST_SIGNAL,
                                  &item->listener->invoker,
-                                 &item->listener->handler);
+                                 &item->listener->handler,
+                                 NULL);
         if (ret != EOK) {
             /* Nothing to do, try the next one. */
             DEBUG(SSSDBG_CRIT_FAILURE, "Unable to issue request [%d]: %s\n",
@@ -98,20 +98,162 @@ done:
     return ret;
 }
 
-hash_table_t *
+/**
+ * Object paths are kept in a hash table that is used to enumerate and check
+ * registered paths and in a trie of path components that is used to resolve
+ * incoming object paths. Each trie node represents one object path and
+ * contains interfaces registered with this path and with its subtree (path
+ * followed by slash and asterisk), therefore a message is resolved with one
+ * walk from the root without any allocation.
+ */
+struct sbus_router_paths_node {
+    const char *name;
+    size_t len;
+
+    struct sbus_interface_list *exact;
+    struct sbus_interface_list *subtree;
+
+    struct sbus_router_paths_node *children;
+    struct sbus_router_paths_node *next;
+    struct sbus_router_paths_node *prev;
+};
+
+struct sbus_router_paths {
+    hash_table_t *table;
+    struct sbus_router_paths_node *root;
+};
+
+struct sbus_router_paths *
 sbus_router_paths_init(TALLOC_CTX *mem_ctx)
 {
-    return sss_ptr_hash_create(mem_ctx, NULL, NULL);
+    struct sbus_router_paths *paths;
+
+    paths = talloc_zero(mem_ctx, struct sbus_router_paths);
+    if (paths == NULL) {
+        return NULL;
+    }
+
+    paths->table = sss_ptr_hash_create(paths, NULL, NULL);
+    if (paths->table == NULL) {
+        talloc_free(paths);
+        return NULL;
+    }
+
+    paths->root = talloc_zero(paths, struct sbus_router_paths_node);
+    if (paths->root == NULL) {
+        talloc_free(paths);
+        return NULL;
+    }
+
+    paths->root->name = "";
+
+    return paths;
+}
+
+/* Return length of the first component of @path, without leading slash. */
+static size_t
+sbus_router_paths_component(const char *path)
+{
+    const char *slash;
+
+    slash = strchr(path, '/');
+    if (slash == NULL) {
+        return strlen(path);
+    }
+
+    return slash - path;
+}
+
+static struct sbus_router_paths_node *
+sbus_router_paths_child(struct sbus_router_paths_node *node,
+                        const char *name,
+                        size_t len)
+{
+    struct sbus_router_paths_node *child;
+
+    DLIST_FOR_EACH(child, node->children) {
+        if (child->len == len && strncmp(child->name, name, len) == 0) {
+            return child;
+        }
+    }
+
+    return NULL;
+}
+
+/**
+ * Find trie node that belongs to @path, creating missing nodes. Set
+ * @_subtree to true if @path denotes a subtree.
+ */
+static struct sbus_router_paths_node *
+sbus_router_paths_node(struct sbus_router_paths *paths,
+                       const char *path,
+                       bool *_subtree)
+{
+    struct sbus_router_paths_node *node;
+    struct sbus_router_paths_node *child;
+    const char *component;
+    size_t len;
+
+    node = paths->root;
+    *_subtree = false;
+
+    if (path[0] != '/') {
+        return NULL;
+    }
+
+    /* Root path has no components. */
+    if (path[1] == '\0') {
+        return node;
+    }
+
+    component = path + 1;
+    while (true) {
+        len = sbus_router_paths_component(component);
+
+        /* Subtree is a trailing asterisk. */
+        if (len == 1 && component[0] == '*' && component[1] == '\0') {
+            *_subtree = true;
+            return node;
+        }
+
+        child = sbus_router_paths_child(node, component, len);
+        if (child == NULL) {
+            child = talloc_zero(node, struct sbus_router_paths_node);
+            if (child == NULL) {
+                return NULL;
+            }
+
+            child->name = talloc_strndup(child, component, len);
+            if (child->name == NULL) {
+                talloc_free(child);
+                return NULL;
+            }
+
+            child->len = len;
+            DLIST_ADD_END(node->children, child,
+                          struct sbus_router_paths_node *);
+        }
+
+        node = child;
+
+        if (component[len] == '\0') {
+            return node;
+        }
+
+        component += len + 1;
+    }
 }
 
 errno_t
-sbus_router_paths_add(hash_table_t *table,
+sbus_router_paths_add(struct sbus_router_paths *paths,
                       const char *path,
                       struct sbus_interface *iface)
 {
     TALLOC_CTX *tmp_ctx;
+    struct sbus_router_paths_node *node;
     struct sbus_interface_list *list;
     struct sbus_interface_list *item;
+    bool subtree;
     errno_t ret;
 
     tmp_ctx = talloc_new(NULL);
@@ -134,7 +276,7 @@ sbus_router_paths_add(hash_table_t *table,
 
     /* First, check if the path already exist and just append the interface
      * to the list if it does (but only if the interface does not exist). */
-    list = sss_ptr_hash_lookup(table, path, struct sbus_interface_list);
+    list = sss_ptr_hash_lookup(paths->table, path, struct sbus_interface_list);
     if (list != NULL) {
         if (sbus_interface_list_lookup(list, iface->name) != NULL) {
             DEBUG(SSSDBG_MINOR_FAILURE, "Trying to register the same interface"
@@ -149,13 +291,31 @@ sbus_router_paths_add(hash_table_t *table,
     }
 
     /* Otherwise create new hash entry and new list. */
+    node = sbus_router_paths_node(paths, path, &subtree);
+    if (node == NULL) {
+        DEBUG(SSSDBG_CRIT_FAILURE, "Unable to add object path %s\n", path);
+        ret = ENOMEM;
+        goto done;
+    }
+
     list = item;
 
-    ret = sss_ptr_hash_add(table, path, list, struct sbus_interface_list);
+    ret = sss_ptr_hash_add(paths->table, path, list,
+                           struct sbus_interface_list);
+    if (ret != EOK) {
+        goto done;
+    }
+
+    /* The trie shares the list with the hash table. */
+    if (subtree) {
+        node->subtree = list;
+    } else {
+        node->exact = list;
+    }
 
 done:
     if (ret == EOK) {
-        talloc_steal(table, item);
+        talloc_steal(paths->table, item);
     }
 
     talloc_free(tmp_ctx);
@@ -164,45 +324,94 @@ done:
 }
 
 /**
- * First @object_path is looked up in @table, if it is not found it steps up
- * in the path hierarchy and try to lookup the parent node. This continues
- * until the root is reached.
+ * Walk the trie along @object_path. Exact match of the path is preferred,
+ * otherwise the deepest subtree that implements the interface is used.
+ * This is the same order as stepping up the path hierarchy from the object
+ * path to the root.
  */
 struct sbus_interface *
-sbus_router_paths_lookup(hash_table_t *table,
+sbus_router_paths_lookup(struct sbus_router_paths *paths,
                          const char *path,
                          const char *iface_name)
 {
-    TALLOC_CTX *tmp_ctx;
-    struct sbus_interface_list *list;
+    struct sbus_router_paths_node *node;
+    struct sbus_interface *subtree;
     struct sbus_interface *iface;
-    const char *lookup_path;
+    const char *component;
+    size_t len;
 
-    tmp_ctx = talloc_new(NULL);
-    if (tmp_ctx == NULL) {
+    if (path == NULL || path[0] != '/') {
         return NULL;
     }
 
-    iface = NULL;
-    lookup_path = path;
-    while (lookup_path != NULL) {
-        list = sss_ptr_hash_lookup(table, lookup_path,
-                                   struct sbus_interface_list);
-        if (list != NULL) {
-            iface = sbus_interface_list_lookup(list, iface_name);
-            if (iface != NULL) {
-                goto done;
-            }
+    subtree = NULL;
+    node = paths->root;
+    component = path[1] == '\0' ? NULL : path + 1;
+    while (component != NULL) {
+        /* Subtree of this node contains the rest of the path. */
+        iface = sbus_interface_list_lookup(node->subtree, iface_name);
+        if (iface != NULL) {
+            subtree = iface;
+        }
+
+        len = sbus_router_paths_component(component);
+        node = sbus_router_paths_child(node, component, len);
+        if (node == NULL) {
+            return subtree;
         }
 
-        /* We will not free lookup path since it is freed with tmp_ctx
-         * and the object paths are supposed to be small. */
-        lookup_path = sbus_opath_subtree_parent(tmp_ctx, lookup_path);
+        component = component[len] == '\0' ? NULL : component + len + 1;
     }
 
-done:
-    talloc_free(tmp_ctx);
-    return iface;
+    iface = sbus_interface_list_lookup(node->exact, iface_name);
+    if (iface != NULL) {
+        return iface;
+    }
+
+    return subtree;
+}
+
+static errno_t
+sbus_router_paths_collect(TALLOC_CTX *mem_ctx,
+                          struct sbus_router_paths_node *node,
+                          const char *component,
+                          struct sbus_interface_list **_list)
+{
+    struct sbus_router_paths_node *child;
+    struct sbus_interface_list *list_copy;
+    size_t len;
+    errno_t ret;
+
+    if (component == NULL) {
+        ret = sbus_interface_list_copy(mem_ctx, node->exact, &list_copy);
+        if (ret != EOK) {
+            return ret;
+        }
+
+        DLIST_CONCATENATE(*_list, list_copy, struct sbus_interface_list *);
+        return EOK;
+    }
+
+    /* Children are more specific so their interfaces go first. */
+    len = sbus_router_paths_component(component);
+    child = sbus_router_paths_child(node, component, len);
+    if (child != NULL) {
+        ret = sbus_router_paths_collect(mem_ctx, child,
+                    component[len] == '\0' ? NULL : component + len + 1,
+                    _list);
+        if (ret != EOK) {
+            return ret;
+        }
+    }
+
+    ret = sbus_interface_list_copy(mem_ctx, node->subtree, &list_copy);
+    if (ret != EOK) {
+        return ret;
+    }
+
+    DLIST_CONCATENATE(*_list, list_copy, struct sbus_interface_list *);
+
+    return EOK;
 }
 
 /**
@@ -210,64 +419,44 @@ done:
  */
 errno_t
 sbus_router_paths_supported(TALLOC_CTX *mem_ctx,
-                            hash_table_t *table,
+                            struct sbus_router_paths *paths,
                             const char *path,
                             struct sbus_interface_list **_list)
 {
-    TALLOC_CTX *tmp_ctx;
     TALLOC_CTX *list_ctx;
-    struct sbus_interface_list *list;
-    struct sbus_interface_list *list_copy;
     struct sbus_interface_list *list_output;
-    const char *lookup_path;
     errno_t ret;
 
-    tmp_ctx = talloc_new(NULL);
-    if (tmp_ctx == NULL) {
-        return ENOMEM;
+    if (path == NULL || path[0] != '/') {
+        return EINVAL;
     }
 
-    list_ctx = talloc_new(tmp_ctx);
+    list_ctx = talloc_new(NULL);
     if (list_ctx == NULL) {
-        ret = ENOMEM;
-        goto done;
+        return ENOMEM;
     }
 
     /* Start with an empty list. */
     list_output = NULL;
-    lookup_path = path;
-    while (lookup_path != NULL) {
-        list = sss_ptr_hash_lookup(table, lookup_path,
-                                   struct sbus_interface_list);
-        if (list != NULL) {
-            ret = sbus_interface_list_copy(list_ctx, list, &list_copy);
-            if (ret != EOK) {
-                goto done;
-            }
-
-            DLIST_CONCATENATE(list_output, list_copy,
-                              struct sbus_interface_list *);
-        }
-
-        /* We will not free lookup path since it is freed with tmp_ctx
-         * and the object paths are supposed to be small. */
-        lookup_path = sbus_opath_subtree_parent(tmp_ctx, lookup_path);
+    ret = sbus_router_paths_collect(list_ctx, paths->root,
+                                    path[1] == '\0' ? NULL : path + 1,
+                                    &list_output);
+    if (ret != EOK) {
+        talloc_free(list_ctx);
+        return ret;
     }
 
     talloc_steal(mem_ctx, list_ctx);
     *_list = list_output;
-    ret = EOK;
 
-done:
-    talloc_free(tmp_ctx);
-    return ret;
+    return EOK;
 }
 
 const char **
 sbus_router_paths_nodes(TALLOC_CTX *mem_ctx,
-                        hash_table_t *table)
+                        struct sbus_router_paths *paths)
 {
-    const char **paths = NULL;
+    const char **nodes = NULL;
     hash_key_t *keys;
     unsigned long count;
     unsigned long i, j;
@@ -275,13 +464,13 @@ sbus_router_paths_nodes(TALLOC_CTX *mem_ctx,
     errno_t ret;
     int hret;
 
-    hret = hash_keys(table, &count, &keys);
+    hret = hash_keys(paths->table, &count, &keys);
     if (hret != HASH_SUCCESS) {
         return NULL;
     }
 
-    paths = talloc_zero_array(mem_ctx, const char *, count + 2);
-    if (paths == NULL) {
+    nodes = talloc_zero_array(mem_ctx, const char *, count + 2);
+    if (nodes == NULL) {
         ret = ENOMEM;
         goto done;
     }
@@ -290,13 +479,13 @@ sbus_router_paths_nodes(TALLOC_CTX *mem_ctx,
         /* Do not include subtree paths. The must have node factory. */
         basepath = keys[i].str;
         if (sbus_opath_is_subtree(basepath)) {
-            basepath = sbus_opath_subtree_base(paths, basepath);
+            basepath = sbus_opath_subtree_base(nodes, basepath);
             if (basepath == NULL) {
                 ret = ENOMEM;
                 goto done;
             }
 
-            if (sbus_router_paths_exist(table, basepath)) {
+            if (sbus_router_paths_exist(paths, basepath)) {
                 talloc_free(basepath);
                 continue;
             }
@@ -307,7 +496,7 @@ sbus_router_paths_nodes(TALLOC_CTX *mem_ctx,
         }
 
         /* All paths starts with / that is not part of the node name. */
-        paths[j] = basepath + 1;
+        nodes[j] = basepath + 1;
         j++;
     }
 
@@ -317,17 +506,17 @@ done:
     talloc_free(keys);
 
     if (ret != EOK) {
-        talloc_zfree(paths);
+        talloc_zfree(nodes);
     }
 
-    return paths;
+    return nodes;
 }
 
 bool
-sbus_router_paths_exist(hash_table_t *table,
+sbus_router_paths_exist(struct sbus_router_paths *paths,
                         const char *object_path)
 {
-    return sss_ptr_hash_has_key(table, object_path);
+    return sss_ptr_hash_has_key(paths->table, object_path);
 }
 
 static struct sbus_listener *
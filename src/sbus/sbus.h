@@ -389,6 +389,20 @@ errno_t
 sbus_connection_add_path_map(struct sbus_connection *conn,
                              struct sbus_path *map);
 
+/**
+ * Enable per-method call statistics on the connection.
+ *
+ * Every incoming method call is counted and its latency is recorded in
+ * a log2 histogram of microseconds. The statistics are available through
+ * org.freedesktop.sssd.Stats.GetMethodStats on the "/" object path.
+ *
+ * @param conn      An sbus connection.
+ *
+ * @return EOK or other error code on failure.
+ */
+errno_t
+sbus_connection_enable_stats(struct sbus_connection *conn);
+
 /**
  * Add new signal listener to the router.
  *
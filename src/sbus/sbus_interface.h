@@ -453,6 +453,63 @@ struct sbus_node;
 #define SBUS_LISTEN_ASYNC(iface, property, path, handler_send, handler_recv, data)   \
     SBUS_SIGNAL_ASYNC_ ## iface ## _ ## property(path, handler_send, handler_recv, data)
 
+/**
+ * Create a new sbus GetAll handler with synchronous handler. The handler
+ * is put into the interface properties and it is used instead of the
+ * property getters when all properties are requested at once. It is
+ * available only for interfaces annotated with codegen.GetAllHandler.
+ *
+ * @param iface        Name of the interface with dots replaced
+ *                     with underscore. (token, not a string)
+ * @param handler      Synchronous handler.
+ * @param data         Private data that are passed to the handler.
+ *
+ * Synchronous handler type for GetAll handler is:
+ * errno_t handler(TALLOC_CTX *mem_ctx,
+ *                 struct sbus_request *sbus_req,
+ *                 data_type private_data,
+ *                 struct sbus_getall_iface *_all)
+ *
+ * Set is_set and value of each property that should be returned.
+ *
+ * @example
+ *     SBUS_GETALL_SYNC(org_freedesktop_sssd, get_all, pvt_data)
+ *
+ * @see SBUS_PROPERTIES, SBUS_GETALL_ASYNC
+ */
+#define SBUS_GETALL_SYNC(iface, handler, data)                                \
+    SBUS_GETALL_SYNC_ ## iface(handler, data)
+
+/**
+ * Create a new sbus GetAll handler with asynchronous handler.
+ *
+ * @param iface        Name of the interface with dots replaced
+ *                     with underscore. (token, not a string)
+ * @param handler_send Handler for _send tevent function.
+ * @param handler_recv Handler for _recv tevent function.
+ * @param data         Private data that are passed to the handler.
+ *
+ * Asynchronous handler type for GetAll handler is:
+ * struct tevent_req * _send(TALLOC_CTX *mem_ctx,
+ *                           struct tevent_context *ev,
+ *                           struct sbus_request *sbus_req,
+ *                           data_type private_data)
+ *
+ * errno_t _recv(TALLOC_CTX *mem_ctx,
+ *               struct tevent_req *req,
+ *               struct sbus_getall_iface *_all)
+ *
+ * @example
+ *     SBUS_GETALL_ASYNC(org_freedesktop_sssd,
+ *                       get_all_send,
+ *                       get_all_recv,
+ *                       pvt_data)
+ *
+ * @see SBUS_PROPERTIES, SBUS_GETALL_SYNC
+ */
+#define SBUS_GETALL_ASYNC(iface, handler_send, handler_recv, data)            \
+    SBUS_GETALL_ASYNC_ ## iface(handler_send, handler_recv, data)
+
 /**
  * Add a signal that can be emitted into the sbus interface.
  *
@@ -70,8 +70,19 @@ enum sbus_property_access {
      * The property is writable.
      */
     SBUS_PROPERTY_WRITABLE = 2,
+
+    /**
+     * The entry is not a property but a handler that fills all readable
+     * properties of the interface at once.
+     */
+    SBUS_PROPERTY_GETALL = 4,
 };
 
+/**
+ * Name of the property entry that holds the GetAll handler.
+ */
+#define SBUS_PROPERTY_GETALL_NAME "GetAll"
+
 struct sbus_handler;
 struct sbus_invoker;
 
@@ -89,7 +100,7 @@ typedef struct tevent_req *
                       const struct sbus_handler *,
                       DBusMessageIter *read_iterator,
                       DBusMessageIter *write_iterator,
-                      const char **_key);
+                      struct sbus_request_key *key);
 
 struct sbus_invoker {
     sbus_invoker_issue issue;
@@ -249,6 +260,15 @@ struct sbus_interface {
      * Properties implemented on this interface.
      */
     const struct sbus_property *properties;
+
+    /**
+     * Methods and properties sorted by name so they can be looked up with
+     * binary search. Built by sbus_interface_copy(), NULL otherwise.
+     */
+    const struct sbus_method **sorted_methods;
+    size_t num_methods;
+    const struct sbus_property **sorted_properties;
+    size_t num_properties;
 };
 
 /**
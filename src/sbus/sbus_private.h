@@ -43,11 +43,13 @@ struct sbus_connection;
 struct sbus_reconnect;
 struct sbus_server;
 struct sbus_router;
+struct sbus_router_paths;
 struct sbus_watch;
 struct sbus_sender;
 struct sbus_listener;
 struct sbus_interface;
 struct sbus_active_requests;
+struct sbus_request_table;
 struct sbus_server_on_connection;
 
 enum sbus_connection_type {
@@ -108,6 +110,13 @@ struct sbus_connection {
     /* Pointer to a caller's last activity variable. The time is updated
      * each time the bus is active (when a method arrives). */
     time_t *last_activity;
+
+    /**
+     * Table of <interface.method, sbus_method_stats> pair. Contains
+     * per-method call statistics. NULL unless enabled with
+     * sbus_connection_enable_stats().
+     */
+    hash_table_t *stats;
 };
 
 struct sbus_server {
@@ -288,10 +297,10 @@ struct sbus_router {
     struct sbus_connection *conn;
 
     /**
-     * Table of <object-path, interface> pair. Contains description of
+     * Registry of <object-path, interface> pair. Contains description of
      * sbus interfaces that are implemented and supported on given path.
      */
-    hash_table_t *paths;
+    struct sbus_router_paths *paths;
 
     /**
      * Table of <object-path, node> pair. A node contains factory function
@@ -317,37 +326,37 @@ sbus_router_init(TALLOC_CTX *mem_ctx,
 errno_t
 sbus_router_reset(struct sbus_connection *conn);
 
-/* Initialize object paths hash table. */
-hash_table_t *
+/* Initialize object paths registry. */
+struct sbus_router_paths *
 sbus_router_paths_init(TALLOC_CTX *mem_ctx);
 
 /* Register an interface with an object path. */
 errno_t
-sbus_router_paths_add(hash_table_t *table,
+sbus_router_paths_add(struct sbus_router_paths *paths,
                       const char *path,
                       struct sbus_interface *iface);
 
 /* Lookup interface for given object path. */
 struct sbus_interface *
-sbus_router_paths_lookup(hash_table_t *table,
+sbus_router_paths_lookup(struct sbus_router_paths *paths,
                          const char *path,
                          const char *iface_name);
 
 /* Return list of all interfaces registered with given object path. */
 errno_t
 sbus_router_paths_supported(TALLOC_CTX *mem_ctx,
-                            hash_table_t *table,
+                            struct sbus_router_paths *paths,
                             const char *path,
                             struct sbus_interface_list **_list);
 
 /* Return all registered paths converted to node names. */
 const char **
 sbus_router_paths_nodes(TALLOC_CTX *mem_ctx,
-                        hash_table_t *table);
+                        struct sbus_router_paths *paths);
 
 /* Check if given object path is registered. */
 bool
-sbus_router_paths_exist(hash_table_t *table,
+sbus_router_paths_exist(struct sbus_router_paths *paths,
                         const char *object_path);
 
 /* Initialize signal listeners hash table. */
@@ -446,8 +455,11 @@ struct sbus_request_list {
 };
 
 struct sbus_active_requests {
-    hash_table_t *incoming;
-    hash_table_t *outgoing;
+    struct sbus_request_table *incoming;
+    struct sbus_request_table *outgoing;
+
+    /* Interface and member names interned for request keys. */
+    hash_table_t *names;
 };
 
 /* Initialize active requests structure. */
@@ -455,13 +467,19 @@ struct sbus_active_requests *
 sbus_active_requests_init(TALLOC_CTX *mem_ctx);
 
 /* Initialize request table. */
-hash_table_t *
+struct sbus_request_table *
 sbus_requests_init(TALLOC_CTX *mem_ctx);
 
+/* Return ID of an interned interface or member name. */
+errno_t
+sbus_requests_name_id(struct sbus_active_requests *requests,
+                      const char *name,
+                      uint32_t *_id);
+
 /* Add new active request into the table. */
 errno_t
-sbus_requests_add(hash_table_t *table,
-                  const char *key,
+sbus_requests_add(struct sbus_request_table *table,
+                  const struct sbus_request_key *key,
                   struct sbus_connection *conn,
                   struct tevent_req *req,
                   bool is_dbus,
@@ -469,8 +487,8 @@ sbus_requests_add(hash_table_t *table,
 
 /* Lookup active requests list. */
 struct sbus_request_list *
-sbus_requests_lookup(hash_table_t *table,
-                     const char *key);
+sbus_requests_lookup(struct sbus_request_table *table,
+                     const struct sbus_request_key *key);
 
 /* Delete active requests list. */
 void
@@ -483,7 +501,7 @@ sbus_requests_finish(struct sbus_request_list *item,
 
 /* Terminate all requests. */
 void
-sbus_requests_terminate_all(hash_table_t *table,
+sbus_requests_terminate_all(struct sbus_request_table *table,
                             errno_t error);
 
 /* Create new sbus request. */
@@ -513,12 +531,12 @@ sbus_incoming_request_recv(TALLOC_CTX *mem_ctx,
                            struct tevent_req *req,
                            DBusMessage **_reply);
 
-/* Issue a new outgoing request. */
+/* Issue a new outgoing request. The key is copied into the request. */
 struct tevent_req *
 sbus_outgoing_request_send(TALLOC_CTX *mem_ctx,
                            struct tevent_context *ev,
                            struct sbus_connection *conn,
-                           const char *key,
+                           const struct sbus_request_key *key,
                            DBusMessage *msg);
 
 errno_t
@@ -567,13 +585,12 @@ sbus_sender_resolve_recv(TALLOC_CTX *mem_ctx,
 errno_t
 sbus_invoker_recv(struct tevent_req *req);
 
-/* Build key of given request. */
+/* Build key of given request in the provided buffer. */
 errno_t
-sbus_request_key(TALLOC_CTX *mem_ctx,
-                 sbus_invoker_keygen keygen,
+sbus_request_key(sbus_invoker_keygen keygen,
                  struct sbus_request *sbus_req,
                  void *input,
-                 const char **_key);
+                 struct sbus_request_key *key);
 
 /**
  * Create copy of provided interface. It expects that the interface was
@@ -636,6 +653,60 @@ sbus_register_introspection(struct sbus_router *router);
 errno_t
 sbus_register_properties(struct sbus_router *router);
 
+/* Open GetAll dictionary entry of given property and its value variant. */
+errno_t
+sbus_property_open_entry(DBusMessageIter *dict,
+                         DBusMessageIter *entry,
+                         DBusMessageIter *variant,
+                         const char *name,
+                         const char *type);
+
+/* Close GetAll dictionary entry or abandon it if @status is not EOK. */
+errno_t
+sbus_property_close_entry(DBusMessageIter *dict,
+                          DBusMessageIter *entry,
+                          DBusMessageIter *variant,
+                          errno_t status);
+
+/* Generated writer of properties returned by GetAll handler. */
+typedef errno_t (*sbus_getall_writer)(DBusMessageIter *dict, void *all);
+
+/* Invoke GetAll handler and write its result into a dictionary. */
+struct tevent_req *
+sbus_invoke_getall_send(TALLOC_CTX *mem_ctx,
+                        struct tevent_context *ev,
+                        struct sbus_request *sbus_req,
+                        const struct sbus_handler *handler,
+                        DBusMessageIter *write_iterator,
+                        size_t size,
+                        sbus_getall_writer writer);
+
+/* Number of log2 latency histogram buckets in method statistics. */
+#define SBUS_STATS_BUCKETS 32
+
+struct sbus_method_stats;
+
+/* Get statistics of given method or NULL if they are not enabled. */
+struct sbus_method_stats *
+sbus_stats_get(struct sbus_connection *conn,
+               const struct sbus_interface *iface,
+               const struct sbus_method *method);
+
+/* Record finished method call that was started at @start. */
+void
+sbus_stats_record(struct sbus_method_stats *stats,
+                  struct timeval start,
+                  errno_t error);
+
+/* Copy the statistics of all methods, as returned by GetMethodStats. */
+errno_t
+sbus_stats_collect(TALLOC_CTX *mem_ctx,
+                   struct sbus_connection *conn,
+                   const char ***_members,
+                   uint64_t **_calls,
+                   uint64_t **_errors,
+                   uint64_t **_histogram);
+
 /* Register listeners for org.freedesktop.DBus signals. */
 errno_t
 sbus_register_standard_signals(struct sbus_connection *conn);
@@ -658,6 +729,26 @@ sbus_call_method_recv(TALLOC_CTX *mem_ctx,
                       struct tevent_req *req,
                       DBusMessage **_reply);
 
+/* Create a batch of method calls. Used in generated batch callers. */
+struct tevent_req *
+sbus_batch_send(TALLOC_CTX *mem_ctx,
+                struct sbus_connection *conn);
+
+/* Add a method call to the batch. On error, the batch request fails. */
+errno_t
+sbus_batch_add(struct tevent_req *req,
+               struct tevent_req *subreq);
+
+/* No more calls will be added, the batch finishes when all calls are done. */
+void
+sbus_batch_seal(struct tevent_req *req);
+
+/* Get finished method call on position @index of the batch. */
+errno_t
+sbus_batch_item(struct tevent_req *req,
+                unsigned int index,
+                struct tevent_req **_subreq);
+
 /* Send a D-Bus signal call. Used in generated callers. */
 void
 sbus_call_signal_send(struct sbus_connection *conn,
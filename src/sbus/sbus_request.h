@@ -116,6 +116,90 @@ struct sbus_request {
     const char *path;
 };
 
+/**
+ * Maximum length of a request key. Requests whose key does not fit
+ * are not chained with other requests.
+ */
+#define SBUS_REQUEST_KEY_MAX 512
+
+/**
+ * Binary key that identifies a request, so same requests that are issued
+ * while the first one is still in progress can be chained into one.
+ *
+ * The key contains the sender uid, request type, interned interface and
+ * member names, object path and values of the key arguments. It is filled
+ * in a caller supplied buffer by generated keygens.
+ */
+struct sbus_request_key {
+    /**
+     * Hash of the key data, computed once the key is finished.
+     */
+    uint32_t hash;
+
+    /**
+     * Error that occurred while building the key.
+     */
+    errno_t error;
+
+    /**
+     * Length of the key data. Zero if the request is not keyed.
+     */
+    size_t len;
+
+    uint8_t data[SBUS_REQUEST_KEY_MAX];
+};
+
+/**
+ * Start a new key for given request. This is used by generated keygens.
+ *
+ * @param key       Key buffer.
+ * @param sbus_req  An sbus request.
+ */
+void
+sbus_request_key_init(struct sbus_request_key *key,
+                      struct sbus_request *sbus_req);
+
+/**
+ * Append raw bytes to the key. This is used by generated keygens.
+ *
+ * @param key       Key buffer.
+ * @param data      Data to append.
+ * @param len       Length of the data.
+ */
+void
+sbus_request_key_add(struct sbus_request_key *key,
+                     const void *data,
+                     size_t len);
+
+/**
+ * Append a string to the key. This is used by generated keygens.
+ *
+ * @param key       Key buffer.
+ * @param str       String to append, may be NULL.
+ */
+void
+sbus_request_key_add_string(struct sbus_request_key *key,
+                            const char *str);
+
+/**
+ * Append a value of a fixed size type to the key.
+ */
+#define sbus_request_key_add_value(key, value) \
+    sbus_request_key_add((key), &(value), sizeof(value))
+
+/**
+ * Finish the key and compute its hash.
+ *
+ * If the key does not fit into the buffer, its length is set to zero
+ * and the request is not chained.
+ *
+ * @param key       Key buffer.
+ *
+ * @return EOK on success, other errno code on failure.
+ */
+errno_t
+sbus_request_key_finish(struct sbus_request_key *key);
+
 /**
  * Await a finish of an outgoing sbus request.
  *
@@ -130,7 +214,8 @@ struct sbus_request {
  * @param object_path       Object path on which the request is executed.
  * @param interface         Interface of the request.
  * @param member            Either method or property name, depends on @type.
- * @param additional_key    Additional key that identifies the request.
+ * @param additional_key    Value of the string key argument of the request
+ *                          or NULL if the request has no key arguments.
  *
  * @return Tevent request or NULL on error.
  */
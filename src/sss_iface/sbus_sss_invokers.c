@@ -24,6 +24,7 @@
 
 #include "sbus/sbus_private.h"
 #include "sbus/sbus_interface_declarations.h"
+#include "sbus/interface/sbus_iterator_writers.h"
 #include "sss_iface/sbus_sss_arguments.h"
 #include "sss_iface/sbus_sss_invokers.h"
 
@@ -88,11 +89,10 @@ _sbus_sss_invoke_in__out__send
     const struct sbus_handler *handler,
     DBusMessageIter *read_iterator,
     DBusMessageIter *write_iterator,
-    const char **_key)
+    struct sbus_request_key *key)
 {
     struct _sbus_sss_invoke_in__out__state *state;
     struct tevent_req *req;
-    const char *key;
     errno_t ret;
 
     req = tevent_req_create(mem_ctx, &state, struct _sbus_sss_invoke_in__out__state);
@@ -116,13 +116,11 @@ _sbus_sss_invoke_in__out__send
         goto done;
     }
 
-    ret = sbus_request_key(state, keygen, sbus_req, NULL, &key);
-    if (ret != EOK) {
-        goto done;
-    }
-
-    if (_key != NULL) {
-        *_key = talloc_steal(mem_ctx, key);
+    if (key != NULL) {
+        ret = sbus_request_key(keygen, sbus_req, NULL, key);
+        if (ret != EOK) {
+            goto done;
+        }
     }
 
     ret = EAGAIN;
@@ -248,11 +246,10 @@ _sbus_sss_invoke_in__out_u_send
     const struct sbus_handler *handler,
     DBusMessageIter *read_iterator,
     DBusMessageIter *write_iterator,
-    const char **_key)
+    struct sbus_request_key *key)
 {
     struct _sbus_sss_invoke_in__out_u_state *state;
     struct tevent_req *req;
-    const char *key;
     errno_t ret;
 
     req = tevent_req_create(mem_ctx, &state, struct _sbus_sss_invoke_in__out_u_state);
@@ -276,13 +273,11 @@ _sbus_sss_invoke_in__out_u_send
         goto done;
     }
 
-    ret = sbus_request_key(state, keygen, sbus_req, NULL, &key);
-    if (ret != EOK) {
-        goto done;
-    }
-
-    if (_key != NULL) {
-        *_key = talloc_steal(mem_ctx, key);
+    if (key != NULL) {
+        ret = sbus_request_key(keygen, sbus_req, NULL, key);
+        if (ret != EOK) {
+            goto done;
+        }
     }
 
     ret = EAGAIN;
@@ -416,11 +411,10 @@ _sbus_sss_invoke_in_pam_data_out_pam_response_send
     const struct sbus_handler *handler,
     DBusMessageIter *read_iterator,
     DBusMessageIter *write_iterator,
-    const char **_key)
+    struct sbus_request_key *key)
 {
     struct _sbus_sss_invoke_in_pam_data_out_pam_response_state *state;
     struct tevent_req *req;
-    const char *key;
     errno_t ret;
 
     req = tevent_req_create(mem_ctx, &state, struct _sbus_sss_invoke_in_pam_data_out_pam_response_state);
@@ -457,13 +451,11 @@ _sbus_sss_invoke_in_pam_data_out_pam_response_send
         goto done;
     }
 
-    ret = sbus_request_key(state, keygen, sbus_req, state->in, &key);
-    if (ret != EOK) {
-        goto done;
-    }
-
-    if (_key != NULL) {
-        *_key = talloc_steal(mem_ctx, key);
+    if (key != NULL) {
+        ret = sbus_request_key(keygen, sbus_req, state->in, key);
+        if (ret != EOK) {
+            goto done;
+        }
     }
 
     ret = EAGAIN;
@@ -596,11 +588,10 @@ _sbus_sss_invoke_in_raw_out_qus_send
     const struct sbus_handler *handler,
     DBusMessageIter *read_iterator,
     DBusMessageIter *write_iterator,
-    const char **_key)
+    struct sbus_request_key *key)
 {
     struct _sbus_sss_invoke_in_raw_out_qus_state *state;
     struct tevent_req *req;
-    const char *key;
     errno_t ret;
 
     req = tevent_req_create(mem_ctx, &state, struct _sbus_sss_invoke_in_raw_out_qus_state);
@@ -624,13 +615,11 @@ _sbus_sss_invoke_in_raw_out_qus_send
         goto done;
     }
 
-    ret = sbus_request_key(state, keygen, sbus_req, NULL, &key);
-    if (ret != EOK) {
-        goto done;
-    }
-
-    if (_key != NULL) {
-        *_key = talloc_steal(mem_ctx, key);
+    if (key != NULL) {
+        ret = sbus_request_key(keygen, sbus_req, NULL, key);
+        if (ret != EOK) {
+            goto done;
+        }
     }
 
     ret = EAGAIN;
@@ -763,11 +752,10 @@ _sbus_sss_invoke_in_s_out__send
     const struct sbus_handler *handler,
     DBusMessageIter *read_iterator,
     DBusMessageIter *write_iterator,
-    const char **_key)
+    struct sbus_request_key *key)
 {
     struct _sbus_sss_invoke_in_s_out__state *state;
     struct tevent_req *req;
-    const char *key;
     errno_t ret;
 
     req = tevent_req_create(mem_ctx, &state, struct _sbus_sss_invoke_in_s_out__state);
@@ -804,13 +792,11 @@ _sbus_sss_invoke_in_s_out__send
         goto done;
     }
 
-    ret = sbus_request_key(state, keygen, sbus_req, state->in, &key);
-    if (ret != EOK) {
-        goto done;
-    }
-
-    if (_key != NULL) {
-        *_key = talloc_steal(mem_ctx, key);
+    if (key != NULL) {
+        ret = sbus_request_key(keygen, sbus_req, state->in, key);
+        if (ret != EOK) {
+            goto done;
+        }
     }
 
     ret = EAGAIN;
@@ -937,11 +923,10 @@ _sbus_sss_invoke_in_s_out_as_send
     const struct sbus_handler *handler,
     DBusMessageIter *read_iterator,
     DBusMessageIter *write_iterator,
-    const char **_key)
+    struct sbus_request_key *key)
 {
     struct _sbus_sss_invoke_in_s_out_as_state *state;
     struct tevent_req *req;
-    const char *key;
     errno_t ret;
 
     req = tevent_req_create(mem_ctx, &state, struct _sbus_sss_invoke_in_s_out_as_state);
@@ -978,13 +963,11 @@ _sbus_sss_invoke_in_s_out_as_send
         goto done;
     }
 
-    ret = sbus_request_key(state, keygen, sbus_req, state->in, &key);
-    if (ret != EOK) {
-        goto done;
-    }
-
-    if (_key != NULL) {
-        *_key = talloc_steal(mem_ctx, key);
+    if (key != NULL) {
+        ret = sbus_request_key(keygen, sbus_req, state->in, key);
+        if (ret != EOK) {
+            goto done;
+        }
     }
 
     ret = EAGAIN;
@@ -1118,11 +1101,10 @@ _sbus_sss_invoke_in_s_out_b_send
     const struct sbus_handler *handler,
     DBusMessageIter *read_iterator,
     DBusMessageIter *write_iterator,
-    const char **_key)
+    struct sbus_request_key *key)
 {
     struct _sbus_sss_invoke_in_s_out_b_state *state;
     struct tevent_req *req;
-    const char *key;
     errno_t ret;
 
     req = tevent_req_create(mem_ctx, &state, struct _sbus_sss_invoke_in_s_out_b_state);
@@ -1159,13 +1141,11 @@ _sbus_sss_invoke_in_s_out_b_send
         goto done;
     }
 
-    ret = sbus_request_key(state, keygen, sbus_req, state->in, &key);
-    if (ret != EOK) {
-        goto done;
-    }
-
-    if (_key != NULL) {
-        *_key = talloc_steal(mem_ctx, key);
+    if (key != NULL) {
+        ret = sbus_request_key(keygen, sbus_req, state->in, key);
+        if (ret != EOK) {
+            goto done;
+        }
     }
 
     ret = EAGAIN;
@@ -1299,11 +1279,10 @@ _sbus_sss_invoke_in_s_out_qus_send
     const struct sbus_handler *handler,
     DBusMessageIter *read_iterator,
     DBusMessageIter *write_iterator,
-    const char **_key)
+    struct sbus_request_key *key)
 {
     struct _sbus_sss_invoke_in_s_out_qus_state *state;
     struct tevent_req *req;
-    const char *key;
     errno_t ret;
 
     req = tevent_req_create(mem_ctx, &state, struct _sbus_sss_invoke_in_s_out_qus_state);
@@ -1340,13 +1319,11 @@ _sbus_sss_invoke_in_s_out_qus_send
         goto done;
     }
 
-    ret = sbus_request_key(state, keygen, sbus_req, state->in, &key);
-    if (ret != EOK) {
-        goto done;
-    }
-
-    if (_key != NULL) {
-        *_key = talloc_steal(mem_ctx, key);
+    if (key != NULL) {
+        ret = sbus_request_key(keygen, sbus_req, state->in, key);
+        if (ret != EOK) {
+            goto done;
+        }
     }
 
     ret = EAGAIN;
@@ -1480,11 +1457,10 @@ _sbus_sss_invoke_in_s_out_s_send
     const struct sbus_handler *handler,
     DBusMessageIter *read_iterator,
     DBusMessageIter *write_iterator,
-    const char **_key)
+    struct sbus_request_key *key)
 {
     struct _sbus_sss_invoke_in_s_out_s_state *state;
     struct tevent_req *req;
-    const char *key;
     errno_t ret;
 
     req = tevent_req_create(mem_ctx, &state, struct _sbus_sss_invoke_in_s_out_s_state);
@@ -1521,13 +1497,11 @@ _sbus_sss_invoke_in_s_out_s_send
         goto done;
     }
 
-    ret = sbus_request_key(state, keygen, sbus_req, state->in, &key);
-    if (ret != EOK) {
-        goto done;
-    }
-
-    if (_key != NULL) {
-        *_key = talloc_steal(mem_ctx, key);
+    if (key != NULL) {
+        ret = sbus_request_key(keygen, sbus_req, state->in, key);
+        if (ret != EOK) {
+            goto done;
+        }
     }
 
     ret = EAGAIN;
@@ -1661,11 +1635,10 @@ _sbus_sss_invoke_in_sqq_out_q_send
     const struct sbus_handler *handler,
     DBusMessageIter *read_iterator,
     DBusMessageIter *write_iterator,
-    const char **_key)
+    struct sbus_request_key *key)
 {
     struct _sbus_sss_invoke_in_sqq_out_q_state *state;
     struct tevent_req *req;
-    const char *key;
     errno_t ret;
 
     req = tevent_req_create(mem_ctx, &state, struct _sbus_sss_invoke_in_sqq_out_q_state);
@@ -1702,13 +1675,11 @@ _sbus_sss_invoke_in_sqq_out_q_send
         goto done;
     }
 
-    ret = sbus_request_key(state, keygen, sbus_req, state->in, &key);
-    if (ret != EOK) {
-        goto done;
-    }
-
-    if (_key != NULL) {
-        *_key = talloc_steal(mem_ctx, key);
+    if (key != NULL) {
+        ret = sbus_request_key(keygen, sbus_req, state->in, key);
+        if (ret != EOK) {
+            goto done;
+        }
     }
 
     ret = EAGAIN;
@@ -1842,11 +1813,10 @@ _sbus_sss_invoke_in_ss_out_o_send
     const struct sbus_handler *handler,
     DBusMessageIter *read_iterator,
     DBusMessageIter *write_iterator,
-    const char **_key)
+    struct sbus_request_key *key)
 {
     struct _sbus_sss_invoke_in_ss_out_o_state *state;
     struct tevent_req *req;
-    const char *key;
     errno_t ret;
 
     req = tevent_req_create(mem_ctx, &state, struct _sbus_sss_invoke_in_ss_out_o_state);
@@ -1883,13 +1853,11 @@ _sbus_sss_invoke_in_ss_out_o_send
         goto done;
     }
 
-    ret = sbus_request_key(state, keygen, sbus_req, state->in, &key);
-    if (ret != EOK) {
-        goto done;
-    }
-
-    if (_key != NULL) {
-        *_key = talloc_steal(mem_ctx, key);
+    if (key != NULL) {
+        ret = sbus_request_key(keygen, sbus_req, state->in, key);
+        if (ret != EOK) {
+            goto done;
+        }
     }
 
     ret = EAGAIN;
@@ -2022,11 +1990,10 @@ _sbus_sss_invoke_in_ssau_out__send
     const struct sbus_handler *handler,
     DBusMessageIter *read_iterator,
     DBusMessageIter *write_iterator,
-    const char **_key)
+    struct sbus_request_key *key)
 {
     struct _sbus_sss_invoke_in_ssau_out__state *state;
     struct tevent_req *req;
-    const char *key;
     errno_t ret;
 
     req = tevent_req_create(mem_ctx, &state, struct _sbus_sss_invoke_in_ssau_out__state);
@@ -2063,13 +2030,11 @@ _sbus_sss_invoke_in_ssau_out__send
         goto done;
     }
 
-    ret = sbus_request_key(state, keygen, sbus_req, state->in, &key);
-    if (ret != EOK) {
-        goto done;
-    }
-
-    if (_key != NULL) {
-        *_key = talloc_steal(mem_ctx, key);
+    if (key != NULL) {
+        ret = sbus_request_key(keygen, sbus_req, state->in, key);
+        if (ret != EOK) {
+            goto done;
+        }
     }
 
     ret = EAGAIN;
@@ -2195,11 +2160,10 @@ _sbus_sss_invoke_in_u_out__send
     const struct sbus_handler *handler,
     DBusMessageIter *read_iterator,
     DBusMessageIter *write_iterator,
-    const char **_key)
+    struct sbus_request_key *key)
 {
     struct _sbus_sss_invoke_in_u_out__state *state;
     struct tevent_req *req;
-    const char *key;
     errno_t ret;
 
     req = tevent_req_create(mem_ctx, &state, struct _sbus_sss_invoke_in_u_out__state);
@@ -2236,13 +2200,11 @@ _sbus_sss_invoke_in_u_out__send
         goto done;
     }
 
-    ret = sbus_request_key(state, keygen, sbus_req, state->in, &key);
-    if (ret != EOK) {
-        goto done;
-    }
-
-    if (_key != NULL) {
-        *_key = talloc_steal(mem_ctx, key);
+    if (key != NULL) {
+        ret = sbus_request_key(keygen, sbus_req, state->in, key);
+        if (ret != EOK) {
+            goto done;
+        }
     }
 
     ret = EAGAIN;
@@ -2368,11 +2330,10 @@ _sbus_sss_invoke_in_usq_out__send
     const struct sbus_handler *handler,
     DBusMessageIter *read_iterator,
     DBusMessageIter *write_iterator,
-    const char **_key)
+    struct sbus_request_key *key)
 {
     struct _sbus_sss_invoke_in_usq_out__state *state;
     struct tevent_req *req;
-    const char *key;
     errno_t ret;
 
     req = tevent_req_create(mem_ctx, &state, struct _sbus_sss_invoke_in_usq_out__state);
@@ -2409,13 +2370,11 @@ _sbus_sss_invoke_in_usq_out__send
         goto done;
     }
 
-    ret = sbus_request_key(state, keygen, sbus_req, state->in, &key);
-    if (ret != EOK) {
-        goto done;
-    }
-
-    if (_key != NULL) {
-        *_key = talloc_steal(mem_ctx, key);
+    if (key != NULL) {
+        ret = sbus_request_key(keygen, sbus_req, state->in, key);
+        if (ret != EOK) {
+            goto done;
+        }
     }
 
     ret = EAGAIN;
@@ -2541,11 +2500,10 @@ _sbus_sss_invoke_in_ussu_out__send
     const struct sbus_handler *handler,
     DBusMessageIter *read_iterator,
     DBusMessageIter *write_iterator,
-    const char **_key)
+    struct sbus_request_key *key)
 {
     struct _sbus_sss_invoke_in_ussu_out__state *state;
     struct tevent_req *req;
-    const char *key;
     errno_t ret;
 
     req = tevent_req_create(mem_ctx, &state, struct _sbus_sss_invoke_in_ussu_out__state);
@@ -2582,13 +2540,11 @@ _sbus_sss_invoke_in_ussu_out__send
         goto done;
     }
 
-    ret = sbus_request_key(state, keygen, sbus_req, state->in, &key);
-    if (ret != EOK) {
-        goto done;
-    }
-
-    if (_key != NULL) {
-        *_key = talloc_steal(mem_ctx, key);
+    if (key != NULL) {
+        ret = sbus_request_key(keygen, sbus_req, state->in, key);
+        if (ret != EOK) {
+            goto done;
+        }
     }
 
     ret = EAGAIN;
@@ -2715,11 +2671,10 @@ _sbus_sss_invoke_in_ussu_out_qus_send
     const struct sbus_handler *handler,
     DBusMessageIter *read_iterator,
     DBusMessageIter *write_iterator,
-    const char **_key)
+    struct sbus_request_key *key)
 {
     struct _sbus_sss_invoke_in_ussu_out_qus_state *state;
     struct tevent_req *req;
-    const char *key;
     errno_t ret;
 
     req = tevent_req_create(mem_ctx, &state, struct _sbus_sss_invoke_in_ussu_out_qus_state);
@@ -2756,13 +2711,11 @@ _sbus_sss_invoke_in_ussu_out_qus_send
         goto done;
     }
 
-    ret = sbus_request_key(state, keygen, sbus_req, state->in, &key);
-    if (ret != EOK) {
-        goto done;
-    }
-
-    if (_key != NULL) {
-        *_key = talloc_steal(mem_ctx, key);
+    if (key != NULL) {
+        ret = sbus_request_key(keygen, sbus_req, state->in, key);
+        if (ret != EOK) {
+            goto done;
+        }
     }
 
     ret = EAGAIN;
@@ -2895,11 +2848,10 @@ _sbus_sss_invoke_in_usu_out__send
     const struct sbus_handler *handler,
     DBusMessageIter *read_iterator,
     DBusMessageIter *write_iterator,
-    const char **_key)
+    struct sbus_request_key *key)
 {
     struct _sbus_sss_invoke_in_usu_out__state *state;
     struct tevent_req *req;
-    const char *key;
     errno_t ret;
 
     req = tevent_req_create(mem_ctx, &state, struct _sbus_sss_invoke_in_usu_out__state);
@@ -2936,13 +2888,11 @@ _sbus_sss_invoke_in_usu_out__send
         goto done;
     }
 
-    ret = sbus_request_key(state, keygen, sbus_req, state->in, &key);
-    if (ret != EOK) {
-        goto done;
-    }
-
-    if (_key != NULL) {
-        *_key = talloc_steal(mem_ctx, key);
+    if (key != NULL) {
+        ret = sbus_request_key(keygen, sbus_req, state->in, key);
+        if (ret != EOK) {
+            goto done;
+        }
     }
 
     ret = EAGAIN;
@@ -3069,11 +3019,10 @@ _sbus_sss_invoke_in_uusssu_out_qus_send
     const struct sbus_handler *handler,
     DBusMessageIter *read_iterator,
     DBusMessageIter *write_iterator,
-    const char **_key)
+    struct sbus_request_key *key)
 {
     struct _sbus_sss_invoke_in_uusssu_out_qus_state *state;
     struct tevent_req *req;
-    const char *key;
     errno_t ret;
 
     req = tevent_req_create(mem_ctx, &state, struct _sbus_sss_invoke_in_uusssu_out_qus_state);
@@ -3110,13 +3059,11 @@ _sbus_sss_invoke_in_uusssu_out_qus_send
         goto done;
     }
 
-    ret = sbus_request_key(state, keygen, sbus_req, state->in, &key);
-    if (ret != EOK) {
-        goto done;
-    }
-
-    if (_key != NULL) {
-        *_key = talloc_steal(mem_ctx, key);
+    if (key != NULL) {
+        ret = sbus_request_key(keygen, sbus_req, state->in, key);
+        if (ret != EOK) {
+            goto done;
+        }
     }
 
     ret = EAGAIN;
@@ -3250,11 +3197,10 @@ _sbus_sss_invoke_in_uusu_out_qus_send
     const struct sbus_handler *handler,
     DBusMessageIter *read_iterator,
     DBusMessageIter *write_iterator,
-    const char **_key)
+    struct sbus_request_key *key)
 {
     struct _sbus_sss_invoke_in_uusu_out_qus_state *state;
     struct tevent_req *req;
-    const char *key;
     errno_t ret;
 
     req = tevent_req_create(mem_ctx, &state, struct _sbus_sss_invoke_in_uusu_out_qus_state);
@@ -3291,13 +3237,11 @@ _sbus_sss_invoke_in_uusu_out_qus_send
         goto done;
     }
 
-    ret = sbus_request_key(state, keygen, sbus_req, state->in, &key);
-    if (ret != EOK) {
-        goto done;
-    }
-
-    if (_key != NULL) {
-        *_key = talloc_steal(mem_ctx, key);
+    if (key != NULL) {
+        ret = sbus_request_key(keygen, sbus_req, state->in, key);
+        if (ret != EOK) {
+            goto done;
+        }
     }
 
     ret = EAGAIN;
@@ -3431,11 +3375,10 @@ _sbus_sss_invoke_in_uuusu_out_qus_send
     const struct sbus_handler *handler,
     DBusMessageIter *read_iterator,
     DBusMessageIter *write_iterator,
-    const char **_key)
+    struct sbus_request_key *key)
 {
     struct _sbus_sss_invoke_in_uuusu_out_qus_state *state;
     struct tevent_req *req;
-    const char *key;
     errno_t ret;
 
     req = tevent_req_create(mem_ctx, &state, struct _sbus_sss_invoke_in_uuusu_out_qus_state);
@@ -3472,13 +3415,11 @@ _sbus_sss_invoke_in_uuusu_out_qus_send
         goto done;
     }
 
-    ret = sbus_request_key(state, keygen, sbus_req, state->in, &key);
-    if (ret != EOK) {
-        goto done;
-    }
-
-    if (_key != NULL) {
-        *_key = talloc_steal(mem_ctx, key);
+    if (key != NULL) {
+        ret = sbus_request_key(keygen, sbus_req, state->in, key);
+        if (ret != EOK) {
+            goto done;
+        }
     }
 
     ret = EAGAIN;
@@ -37,7 +37,7 @@
          const struct sbus_handler *handler,                              \
          DBusMessageIter *read_iterator,                                  \
          DBusMessageIter *write_iterator,                                 \
-         const char **_key)
+         struct sbus_request_key *key)
 
 _sbus_sss_declare_invoker(, );
 _sbus_sss_declare_invoker(, u);
@@ -17,159 +17,112 @@
     along with this program.  If not, see <http://www.gnu.org/licenses/>.
 */
 
-#include <inttypes.h>
-#include <talloc.h>
-
 #include "sbus/sbus_request.h"
 #include "sss_iface/sbus_sss_arguments.h"
 #include "sss_iface/sbus_sss_keygens.h"
 
-const char *
+void
 _sbus_sss_key_
-   (TALLOC_CTX *mem_ctx,
+   (struct sbus_request_key *key,
     struct sbus_request *sbus_req)
 {
-    if (sbus_req->sender == NULL) {
-        return talloc_asprintf(mem_ctx, "-:%u:%s.%s:%s",
-            sbus_req->type, sbus_req->interface, sbus_req->member, sbus_req->path);
-    }
-
-    return talloc_asprintf(mem_ctx, "%"PRIi64":%u:%s.%s:%s",
-        sbus_req->sender->uid, sbus_req->type, sbus_req->interface, sbus_req->member, sbus_req->path);
+    sbus_request_key_init(key, sbus_req);
 }
 
-const char *
+void
 _sbus_sss_key_s_0
-   (TALLOC_CTX *mem_ctx,
+   (struct sbus_request_key *key,
     struct sbus_request *sbus_req,
     struct _sbus_sss_invoker_args_s *args)
 {
-    if (sbus_req->sender == NULL) {
-        return talloc_asprintf(mem_ctx, "-:%u:%s.%s:%s:%s",
-            sbus_req->type, sbus_req->interface, sbus_req->member,
-            sbus_req->path, args->arg0);
-    }
-
-    return talloc_asprintf(mem_ctx, "%"PRIi64":%u:%s.%s:%s:%s",
-        sbus_req->sender->uid, sbus_req->type, sbus_req->interface, sbus_req->member,
-        sbus_req->path, args->arg0);
+    sbus_request_key_init(key, sbus_req);
+    sbus_request_key_add_string(key, args->arg0);
 }
 
-const char *
+void
 _sbus_sss_key_u_0
-   (TALLOC_CTX *mem_ctx,
+   (struct sbus_request_key *key,
     struct sbus_request *sbus_req,
     struct _sbus_sss_invoker_args_u *args)
 {
-    if (sbus_req->sender == NULL) {
-        return talloc_asprintf(mem_ctx, "-:%u:%s.%s:%s:%" PRIu32 "",
-            sbus_req->type, sbus_req->interface, sbus_req->member,
-            sbus_req->path, args->arg0);
-    }
-
-    return talloc_asprintf(mem_ctx, "%"PRIi64":%u:%s.%s:%s:%" PRIu32 "",
-        sbus_req->sender->uid, sbus_req->type, sbus_req->interface, sbus_req->member,
-        sbus_req->path, args->arg0);
+    sbus_request_key_init(key, sbus_req);
+    sbus_request_key_add_value(key, args->arg0);
 }
 
-const char *
+void
 _sbus_sss_key_ussu_0_1
-   (TALLOC_CTX *mem_ctx,
+   (struct sbus_request_key *key,
     struct sbus_request *sbus_req,
     struct _sbus_sss_invoker_args_ussu *args)
 {
-    if (sbus_req->sender == NULL) {
-        return talloc_asprintf(mem_ctx, "-:%u:%s.%s:%s:%" PRIu32 ":%s",
-            sbus_req->type, sbus_req->interface, sbus_req->member,
-            sbus_req->path, args->arg0, args->arg1);
-    }
-
-    return talloc_asprintf(mem_ctx, "%"PRIi64":%u:%s.%s:%s:%" PRIu32 ":%s",
-        sbus_req->sender->uid, sbus_req->type, sbus_req->interface, sbus_req->member,
-        sbus_req->path, args->arg0, args->arg1);
+    sbus_request_key_init(key, sbus_req);
+    sbus_request_key_add_value(key, args->arg0);
+    sbus_request_key_add_string(key, args->arg1);
 }
 
-const char *
+void
 _sbus_sss_key_ussu_0_1_2_3
-   (TALLOC_CTX *mem_ctx,
+   (struct sbus_request_key *key,
     struct sbus_request *sbus_req,
     struct _sbus_sss_invoker_args_ussu *args)
 {
-    if (sbus_req->sender == NULL) {
-        return talloc_asprintf(mem_ctx, "-:%u:%s.%s:%s:%" PRIu32 ":%s:%s:%" PRIu32 "",
-            sbus_req->type, sbus_req->interface, sbus_req->member,
-            sbus_req->path, args->arg0, args->arg1, args->arg2, args->arg3);
-    }
-
-    return talloc_asprintf(mem_ctx, "%"PRIi64":%u:%s.%s:%s:%" PRIu32 ":%s:%s:%" PRIu32 "",
-        sbus_req->sender->uid, sbus_req->type, sbus_req->interface, sbus_req->member,
-        sbus_req->path, args->arg0, args->arg1, args->arg2, args->arg3);
+    sbus_request_key_init(key, sbus_req);
+    sbus_request_key_add_value(key, args->arg0);
+    sbus_request_key_add_string(key, args->arg1);
+    sbus_request_key_add_string(key, args->arg2);
+    sbus_request_key_add_value(key, args->arg3);
 }
 
-const char *
+void
 _sbus_sss_key_usu_0_1_2
-   (TALLOC_CTX *mem_ctx,
+   (struct sbus_request_key *key,
     struct sbus_request *sbus_req,
     struct _sbus_sss_invoker_args_usu *args)
 {
-    if (sbus_req->sender == NULL) {
-        return talloc_asprintf(mem_ctx, "-:%u:%s.%s:%s:%" PRIu32 ":%s:%" PRIu32 "",
-            sbus_req->type, sbus_req->interface, sbus_req->member,
-            sbus_req->path, args->arg0, args->arg1, args->arg2);
-    }
-
-    return talloc_asprintf(mem_ctx, "%"PRIi64":%u:%s.%s:%s:%" PRIu32 ":%s:%" PRIu32 "",
-        sbus_req->sender->uid, sbus_req->type, sbus_req->interface, sbus_req->member,
-        sbus_req->path, args->arg0, args->arg1, args->arg2);
+    sbus_request_key_init(key, sbus_req);
+    sbus_request_key_add_value(key, args->arg0);
+    sbus_request_key_add_string(key, args->arg1);
+    sbus_request_key_add_value(key, args->arg2);
 }
 
-const char *
+void
 _sbus_sss_key_uusssu_0_1_2_3_4_5
-   (TALLOC_CTX *mem_ctx,
+   (struct sbus_request_key *key,
     struct sbus_request *sbus_req,
     struct _sbus_sss_invoker_args_uusssu *args)
 {
-    if (sbus_req->sender == NULL) {
-        return talloc_asprintf(mem_ctx, "-:%u:%s.%s:%s:%" PRIu32 ":%" PRIu32 ":%s:%s:%s:%" PRIu32 "",
-            sbus_req->type, sbus_req->interface, sbus_req->member,
-            sbus_req->path, args->arg0, args->arg1, args->arg2, args->arg3, args->arg4, args->arg5);
-    }
-
-    return talloc_asprintf(mem_ctx, "%"PRIi64":%u:%s.%s:%s:%" PRIu32 ":%" PRIu32 ":%s:%s:%s:%" PRIu32 "",
-        sbus_req->sender->uid, sbus_req->type, sbus_req->interface, sbus_req->member,
-        sbus_req->path, args->arg0, args->arg1, args->arg2, args->arg3, args->arg4, args->arg5);
+    sbus_request_key_init(key, sbus_req);
+    sbus_request_key_add_value(key, args->arg0);
+    sbus_request_key_add_value(key, args->arg1);
+    sbus_request_key_add_string(key, args->arg2);
+    sbus_request_key_add_string(key, args->arg3);
+    sbus_request_key_add_string(key, args->arg4);
+    sbus_request_key_add_value(key, args->arg5);
 }
 
-const char *
+void
 _sbus_sss_key_uusu_0_1_2_3
-   (TALLOC_CTX *mem_ctx,
+   (struct sbus_request_key *key,
     struct sbus_request *sbus_req,
     struct _sbus_sss_invoker_args_uusu *args)
 {
-    if (sbus_req->sender == NULL) {
-        return talloc_asprintf(mem_ctx, "-:%u:%s.%s:%s:%" PRIu32 ":%" PRIu32 ":%s:%" PRIu32 "",
-            sbus_req->type, sbus_req->interface, sbus_req->member,
-            sbus_req->path, args->arg0, args->arg1, args->arg2, args->arg3);
-    }
-
-    return talloc_asprintf(mem_ctx, "%"PRIi64":%u:%s.%s:%s:%" PRIu32 ":%" PRIu32 ":%s:%" PRIu32 "",
-        sbus_req->sender->uid, sbus_req->type, sbus_req->interface, sbus_req->member,
-        sbus_req->path, args->arg0, args->arg1, args->arg2, args->arg3);
+    sbus_request_key_init(key, sbus_req);
+    sbus_request_key_add_value(key, args->arg0);
+    sbus_request_key_add_value(key, args->arg1);
+    sbus_request_key_add_string(key, args->arg2);
+    sbus_request_key_add_value(key, args->arg3);
 }
 
-const char *
+void
 _sbus_sss_key_uuusu_0_1_2_3_4
-   (TALLOC_CTX *mem_ctx,
+   (struct sbus_request_key *key,
     struct sbus_request *sbus_req,
     struct _sbus_sss_invoker_args_uuusu *args)
 {
-    if (sbus_req->sender == NULL) {
-        return talloc_asprintf(mem_ctx, "-:%u:%s.%s:%s:%" PRIu32 ":%" PRIu32 ":%" PRIu32 ":%s:%" PRIu32 "",
-            sbus_req->type, sbus_req->interface, sbus_req->member,
-            sbus_req->path, args->arg0, args->arg1, args->arg2, args->arg3, args->arg4);
-    }
-
-    return talloc_asprintf(mem_ctx, "%"PRIi64":%u:%s.%s:%s:%" PRIu32 ":%" PRIu32 ":%" PRIu32 ":%s:%" PRIu32 "",
-        sbus_req->sender->uid, sbus_req->type, sbus_req->interface, sbus_req->member,
-        sbus_req->path, args->arg0, args->arg1, args->arg2, args->arg3, args->arg4);
+    sbus_request_key_init(key, sbus_req);
+    sbus_request_key_add_value(key, args->arg0);
+    sbus_request_key_add_value(key, args->arg1);
+    sbus_request_key_add_value(key, args->arg2);
+    sbus_request_key_add_string(key, args->arg3);
+    sbus_request_key_add_value(key, args->arg4);
 }
@@ -20,61 +20,59 @@
 #ifndef _SBUS_SSS_KEYGENS_H_
 #define _SBUS_SSS_KEYGENS_H_
 
-#include <talloc.h>
-
 #include "sbus/sbus_request.h"
 #include "sss_iface/sbus_sss_arguments.h"
 
-const char *
+void
 _sbus_sss_key_
-   (TALLOC_CTX *mem_ctx,
+   (struct sbus_request_key *key,
     struct sbus_request *sbus_req);
 
-const char *
+void
 _sbus_sss_key_s_0
-   (TALLOC_CTX *mem_ctx,
+   (struct sbus_request_key *key,
     struct sbus_request *sbus_req,
     struct _sbus_sss_invoker_args_s *args);
 
-const char *
+void
 _sbus_sss_key_u_0
-   (TALLOC_CTX *mem_ctx,
+   (struct sbus_request_key *key,
     struct sbus_request *sbus_req,
     struct _sbus_sss_invoker_args_u *args);
 
-const char *
+void
 _sbus_sss_key_ussu_0_1
-   (TALLOC_CTX *mem_ctx,
+   (struct sbus_request_key *key,
     struct sbus_request *sbus_req,
     struct _sbus_sss_invoker_args_ussu *args);
 
-const char *
+void
 _sbus_sss_key_ussu_0_1_2_3
-   (TALLOC_CTX *mem_ctx,
+   (struct sbus_request_key *key,
     struct sbus_request *sbus_req,
     struct _sbus_sss_invoker_args_ussu *args);
 
-const char *
+void
 _sbus_sss_key_usu_0_1_2
-   (TALLOC_CTX *mem_ctx,
+   (struct sbus_request_key *key,
     struct sbus_request *sbus_req,
     struct _sbus_sss_invoker_args_usu *args);
 
-const char *
+void
 _sbus_sss_key_uusssu_0_1_2_3_4_5
-   (TALLOC_CTX *mem_ctx,
+   (struct sbus_request_key *key,
     struct sbus_request *sbus_req,
     struct _sbus_sss_invoker_args_uusssu *args);
 
-const char *
+void
 _sbus_sss_key_uusu_0_1_2_3
-   (TALLOC_CTX *mem_ctx,
+   (struct sbus_request_key *key,
     struct sbus_request *sbus_req,
     struct _sbus_sss_invoker_args_uusu *args);
 
-const char *
+void
 _sbus_sss_key_uuusu_0_1_2_3_4
-   (TALLOC_CTX *mem_ctx,
+   (struct sbus_request_key *key,
     struct sbus_request *sbus_req,
     struct _sbus_sss_invoker_args_uuusu *args);
 
@@ -0,0 +1,302 @@
+/*
+    Copyright (C) 2026 Red Hat
+
+    This program is free software; you can redistribute it and/or modify
+    it under the terms of the GNU General Public License as published by
+    the Free Software Foundation; either version 3 of the License, or
+    (at your option) any later version.
+
+    This program is distributed in the hope that it will be useful,
+    but WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+    GNU General Public License for more details.
+
+    You should have received a copy of the GNU General Public License
+    along with this program.  If not, see <http://www.gnu.org/licenses/>.
+*/
+
+#include "config.h"
+
+#include <talloc.h>
+#include <tevent.h>
+#include <errno.h>
+#include <popt.h>
+#include <dbus/dbus.h>
+
+#include "util/util.h"
+#include "sbus/sbus_private.h"
+#include "responder/ifp/ifp_iface/sbus_ifp_client_async.h"
+#include "tests/cmocka/common_mock.h"
+#include "tests/common.h"
+
+#define TEST_BUS "org.freedesktop.sssd.infopipe"
+#define TEST_PATH "/org/freedesktop/sssd/infopipe"
+#define TEST_IFACE "org.freedesktop.sssd.infopipe"
+#define TEST_UNKNOWN_USER "nobody"
+#define TEST_MAX_CALLS 10
+
+struct test_ctx {
+    struct sbus_connection *conn;
+
+    /* Object paths and users the generated code sent, in order. */
+    const char *paths[TEST_MAX_CALLS];
+    const char *users[TEST_MAX_CALLS];
+    unsigned int num_calls;
+};
+
+static struct test_ctx *global_test_ctx;
+
+struct test_call_state {
+    DBusMessage *reply;
+};
+
+/* Answer each method call without a D-Bus connection. The method call is
+ * built with the writer of the generated code, the reply is a list of the
+ * user name and "users", or an error for an unknown user. */
+struct tevent_req *
+__wrap_sbus_call_method_send(TALLOC_CTX *mem_ctx,
+                             struct sbus_connection *conn,
+                             DBusMessage *raw_message,
+                             sbus_invoker_keygen keygen,
+                             sbus_invoker_writer_fn writer,
+                             const char *bus,
+                             const char *path,
+                             const char *iface,
+                             const char *method,
+                             void *input)
+{
+    struct test_ctx *test_ctx = global_test_ctx;
+    struct test_call_state *state;
+    struct tevent_req *req;
+    const char *groups[2];
+    const char **groups_ptr = groups;
+    const char *user;
+    DBusMessage *msg;
+    dbus_bool_t bret;
+    errno_t ret;
+
+    req = tevent_req_create(mem_ctx, &state, struct test_call_state);
+    assert_non_null(req);
+
+    assert_string_equal(bus, TEST_BUS);
+    assert_string_equal(iface, TEST_IFACE);
+    assert_string_equal(method, "GetUserGroups");
+
+    msg = sbus_create_method_call(state, raw_message, writer, bus, path,
+                                  iface, method, input);
+    assert_non_null(msg);
+
+    bret = dbus_message_get_args(msg, NULL, DBUS_TYPE_STRING, &user,
+                                 DBUS_TYPE_INVALID);
+    assert_true(bret);
+
+    assert_true(test_ctx->num_calls < TEST_MAX_CALLS);
+    test_ctx->paths[test_ctx->num_calls] = talloc_strdup(test_ctx, path);
+    test_ctx->users[test_ctx->num_calls] = talloc_strdup(test_ctx, user);
+    test_ctx->num_calls++;
+
+    if (strcmp(user, TEST_UNKNOWN_USER) == 0) {
+        tevent_req_error(req, ENOENT);
+        tevent_req_post(req, conn->ev);
+        return req;
+    }
+
+    dbus_message_set_serial(msg, test_ctx->num_calls);
+    state->reply = dbus_message_new_method_return(msg);
+    assert_non_null(state->reply);
+
+    ret = sbus_message_bound(state, state->reply);
+    assert_int_equal(ret, EOK);
+
+    groups[0] = user;
+    groups[1] = "users";
+    bret = dbus_message_append_args(state->reply,
+                                    DBUS_TYPE_ARRAY, DBUS_TYPE_STRING,
+                                    &groups_ptr, 2,
+                                    DBUS_TYPE_INVALID);
+    assert_true(bret);
+
+    tevent_req_done(req);
+    tevent_req_post(req, conn->ev);
+
+    return req;
+}
+
+errno_t
+__wrap_sbus_call_method_recv(TALLOC_CTX *mem_ctx,
+                             struct tevent_req *req,
+                             DBusMessage **_reply)
+{
+    struct test_call_state *state;
+    errno_t ret;
+
+    state = tevent_req_data(req, struct test_call_state);
+
+    TEVENT_REQ_RETURN_ON_ERROR(req);
+
+    ret = sbus_message_bound_steal(mem_ctx, state->reply);
+    if (ret != EOK) {
+        return ret;
+    }
+
+    *_reply = state->reply;
+
+    return EOK;
+}
+
+static int test_batch_setup(void **state)
+{
+    struct test_ctx *test_ctx;
+
+    assert_true(leak_check_setup());
+
+    test_ctx = talloc_zero(global_talloc_context, struct test_ctx);
+    assert_non_null(test_ctx);
+
+    test_ctx->conn = talloc_zero(test_ctx, struct sbus_connection);
+    assert_non_null(test_ctx->conn);
+
+    test_ctx->conn->ev = tevent_context_init(test_ctx->conn);
+    assert_non_null(test_ctx->conn->ev);
+
+    check_leaks_push(test_ctx);
+    global_test_ctx = test_ctx;
+    *state = test_ctx;
+
+    return 0;
+}
+
+static int test_batch_teardown(void **state)
+{
+    struct test_ctx *test_ctx;
+    unsigned int i;
+
+    test_ctx = talloc_get_type_abort(*state, struct test_ctx);
+
+    for (i = 0; i < test_ctx->num_calls; i++) {
+        talloc_zfree(test_ctx->paths[i]);
+        talloc_zfree(test_ctx->users[i]);
+    }
+
+    assert_true(check_leaks_pop(test_ctx));
+    talloc_free(test_ctx);
+    global_test_ctx = NULL;
+
+    assert_true(leak_check_teardown());
+    return 0;
+}
+
+static void test_sbus_batch_args(void **state)
+{
+    struct test_ctx *test_ctx;
+    TALLOC_CTX *tmp_ctx;
+    struct tevent_req *req;
+    const char *paths[] = {TEST_PATH, TEST_PATH, TEST_PATH};
+    const char *users[] = {"alice", TEST_UNKNOWN_USER, "bob"};
+    const char **groups;
+    bool bret;
+    errno_t ret;
+
+    test_ctx = talloc_get_type_abort(*state, struct test_ctx);
+
+    tmp_ctx = talloc_new(NULL);
+    assert_non_null(tmp_ctx);
+
+    req = sbus_call_ifp_GetUserGroups_batch_send(tmp_ctx, test_ctx->conn,
+                                                 TEST_BUS, 3, paths, users);
+    assert_non_null(req);
+
+    bret = tevent_req_poll(req, test_ctx->conn->ev);
+    assert_true(bret);
+
+    /* Every call was sent with its own arguments. */
+    assert_int_equal(test_ctx->num_calls, 3);
+    assert_string_equal(test_ctx->paths[0], TEST_PATH);
+    assert_string_equal(test_ctx->users[0], "alice");
+    assert_string_equal(test_ctx->users[1], TEST_UNKNOWN_USER);
+    assert_string_equal(test_ctx->users[2], "bob");
+
+    ret = sbus_call_ifp_GetUserGroups_batch_recv(tmp_ctx, req, 0, &groups);
+    assert_int_equal(ret, EOK);
+    assert_string_equal(groups[0], "alice");
+    assert_string_equal(groups[1], "users");
+    assert_null(groups[2]);
+
+    /* A failed call does not fail the others. */
+    ret = sbus_call_ifp_GetUserGroups_batch_recv(tmp_ctx, req, 1, &groups);
+    assert_int_equal(ret, ENOENT);
+
+    ret = sbus_call_ifp_GetUserGroups_batch_recv(tmp_ctx, req, 2, &groups);
+    assert_int_equal(ret, EOK);
+    assert_string_equal(groups[0], "bob");
+    assert_string_equal(groups[1], "users");
+    assert_null(groups[2]);
+
+    ret = sbus_call_ifp_GetUserGroups_batch_recv(tmp_ctx, req, 3, &groups);
+    assert_int_equal(ret, EINVAL);
+
+    talloc_free(tmp_ctx);
+}
+
+static void test_sbus_batch_empty(void **state)
+{
+    struct test_ctx *test_ctx;
+    struct tevent_req *req;
+    const char **groups;
+    bool bret;
+    errno_t ret;
+
+    test_ctx = talloc_get_type_abort(*state, struct test_ctx);
+
+    req = sbus_call_ifp_GetUserGroups_batch_send(test_ctx, test_ctx->conn,
+                                                 TEST_BUS, 0, NULL, NULL);
+    assert_non_null(req);
+
+    bret = tevent_req_poll(req, test_ctx->conn->ev);
+    assert_true(bret);
+    assert_int_equal(test_ctx->num_calls, 0);
+
+    ret = sbus_call_ifp_GetUserGroups_batch_recv(test_ctx, req, 0, &groups);
+    assert_int_equal(ret, EINVAL);
+
+    talloc_free(req);
+}
+
+int main(int argc, const char *argv[])
+{
+    poptContext pc;
+    int opt;
+    struct poptOption long_options[] = {
+        POPT_AUTOHELP
+        SSSD_DEBUG_OPTS
+        POPT_TABLEEND
+    };
+
+    const struct CMUnitTest tests[] = {
+        cmocka_unit_test_setup_teardown(test_sbus_batch_args,
+                                        test_batch_setup,
+                                        test_batch_teardown),
+        cmocka_unit_test_setup_teardown(test_sbus_batch_empty,
+                                        test_batch_setup,
+                                        test_batch_teardown)
+    };
+
+    /* Set debug level to invalid value so we can decide if -d 0 was used. */
+    debug_level = SSSDBG_INVALID;
+
+    pc = poptGetContext(argv[0], argc, argv, long_options, 0);
+    while((opt = poptGetNextOpt(pc)) != -1) {
+        switch(opt) {
+        default:
+            fprintf(stderr, "\nInvalid option %s: %s\n\n",
+                    poptBadOption(pc, 0), poptStrerror(opt));
+            poptPrintUsage(pc, stderr, 0);
+            return 1;
+        }
+    }
+    poptFreeContext(pc);
+
+    DEBUG_CLI_INIT(debug_level);
+
+    return cmocka_run_group_tests(tests, NULL, NULL);
+}
@@ -0,0 +1,293 @@
+/*
+    Copyright (C) 2026 Red Hat
+
+    This program is free software; you can redistribute it and/or modify
+    it under the terms of the GNU General Public License as published by
+    the Free Software Foundation; either version 3 of the License, or
+    (at your option) any later version.
+
+    This program is distributed in the hope that it will be useful,
+    but WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+    GNU General Public License for more details.
+
+    You should have received a copy of the GNU General Public License
+    along with this program.  If not, see <http://www.gnu.org/licenses/>.
+*/
+
+#include "config.h"
+
+#include <talloc.h>
+#include <tevent.h>
+#include <errno.h>
+#include <string.h>
+#include <popt.h>
+
+#include "util/util.h"
+#include "sbus/sbus_private.h"
+#include "sss_iface/sbus_sss_keygens.h"
+#include "tests/cmocka/common_mock.h"
+#include "tests/common.h"
+
+#define TEST_IFACE "org.freedesktop.sssd.test"
+#define TEST_METHOD "Method"
+#define TEST_PATH "/org/freedesktop/sssd/test"
+
+struct test_ctx {
+    struct sbus_connection *conn;
+    struct sbus_request sbus_req;
+};
+
+static int test_key_setup(void **state)
+{
+    struct test_ctx *test_ctx;
+    uint32_t id;
+    errno_t ret;
+
+    assert_true(leak_check_setup());
+
+    test_ctx = talloc_zero(global_talloc_context, struct test_ctx);
+    assert_non_null(test_ctx);
+
+    test_ctx->conn = talloc_zero(test_ctx, struct sbus_connection);
+    assert_non_null(test_ctx->conn);
+
+    test_ctx->conn->requests = sbus_active_requests_init(test_ctx->conn);
+    assert_non_null(test_ctx->conn->requests);
+
+    test_ctx->sbus_req.conn = test_ctx->conn;
+    test_ctx->sbus_req.type = SBUS_REQUEST_METHOD;
+    test_ctx->sbus_req.interface = TEST_IFACE;
+    test_ctx->sbus_req.member = TEST_METHOD;
+    test_ctx->sbus_req.path = TEST_PATH;
+
+    /* Names are interned for the lifetime of the connection. */
+    ret = sbus_requests_name_id(test_ctx->conn->requests, TEST_IFACE, &id);
+    assert_int_equal(ret, EOK);
+
+    ret = sbus_requests_name_id(test_ctx->conn->requests, TEST_METHOD, &id);
+    assert_int_equal(ret, EOK);
+
+    check_leaks_push(test_ctx);
+    *state = test_ctx;
+
+    return 0;
+}
+
+static int test_key_teardown(void **state)
+{
+    struct test_ctx *test_ctx;
+
+    test_ctx = talloc_get_type_abort(*state, struct test_ctx);
+
+    assert_true(check_leaks_pop(test_ctx));
+    talloc_free(test_ctx);
+
+    assert_true(leak_check_teardown());
+    return 0;
+}
+
+static void test_key_ussu(struct test_ctx *test_ctx,
+                          uint32_t uid,
+                          const char *name,
+                          struct sbus_request_key *key)
+{
+    struct _sbus_sss_invoker_args_ussu args = {uid, name, "ignored", 0};
+    errno_t ret;
+
+    ret = sbus_request_key(_sbus_sss_key_ussu_0_1, &test_ctx->sbus_req,
+                           &args, key);
+    assert_int_equal(ret, EOK);
+}
+
+static void assert_key_equal(struct sbus_request_key *a,
+                             struct sbus_request_key *b)
+{
+    assert_int_equal(a->hash, b->hash);
+    assert_int_equal(a->len, b->len);
+    assert_memory_equal(a->data, b->data, a->len);
+}
+
+static bool key_equal(struct sbus_request_key *a,
+                      struct sbus_request_key *b)
+{
+    return a->len == b->len && memcmp(a->data, b->data, a->len) == 0;
+}
+
+static void test_sbus_request_key_args(void **state)
+{
+    struct test_ctx *test_ctx;
+    struct sbus_request_key key1;
+    struct sbus_request_key key2;
+
+    test_ctx = talloc_get_type_abort(*state, struct test_ctx);
+
+    /* Only the key arguments are part of the key. */
+    test_key_ussu(test_ctx, 1, "user", &key1);
+    test_key_ussu(test_ctx, 1, "user", &key2);
+    assert_int_not_equal(key1.len, 0);
+    assert_key_equal(&key1, &key2);
+
+    test_key_ussu(test_ctx, 2, "user", &key2);
+    assert_false(key_equal(&key1, &key2));
+
+    test_key_ussu(test_ctx, 1, "user2", &key2);
+    assert_false(key_equal(&key1, &key2));
+
+    /* NULL and empty string are different values. */
+    test_key_ussu(test_ctx, 1, NULL, &key1);
+    test_key_ussu(test_ctx, 1, "", &key2);
+    assert_false(key_equal(&key1, &key2));
+
+    /* So are the request paths. */
+    test_key_ussu(test_ctx, 1, "user", &key1);
+    test_ctx->sbus_req.path = TEST_PATH "/other";
+    test_key_ussu(test_ctx, 1, "user", &key2);
+    assert_false(key_equal(&key1, &key2));
+}
+
+static void test_sbus_request_key_await(void **state)
+{
+    struct test_ctx *test_ctx;
+    struct _sbus_sss_invoker_args_s args = {"domain"};
+    struct sbus_request_key key1;
+    struct sbus_request_key key2;
+    errno_t ret;
+
+    test_ctx = talloc_get_type_abort(*state, struct test_ctx);
+
+    ret = sbus_request_key(_sbus_sss_key_s_0, &test_ctx->sbus_req,
+                           &args, &key1);
+    assert_int_equal(ret, EOK);
+
+    /* This is how sbus_request_await_send() builds the key. */
+    sbus_request_key_init(&key2, &test_ctx->sbus_req);
+    sbus_request_key_add_string(&key2, "domain");
+    ret = sbus_request_key_finish(&key2);
+    assert_int_equal(ret, EOK);
+
+    assert_key_equal(&key1, &key2);
+}
+
+static void test_sbus_request_key_too_long(void **state)
+{
+    struct test_ctx *test_ctx;
+    struct sbus_request_key key;
+    char name[SBUS_REQUEST_KEY_MAX + 1];
+
+    test_ctx = talloc_get_type_abort(*state, struct test_ctx);
+
+    memset(name, 'a', sizeof(name) - 1);
+    name[sizeof(name) - 1] = '\0';
+
+    /* The request is still issued, it is only not chained. */
+    test_key_ussu(test_ctx, 1, name, &key);
+    assert_int_equal(key.len, 0);
+}
+
+static void test_sbus_request_key_chain(void **state)
+{
+    struct test_ctx *test_ctx;
+    struct sbus_request_table *table;
+    struct sbus_request_list *list;
+    struct sbus_request_key key1;
+    struct sbus_request_key key2;
+    struct tevent_req *req[3];
+    void *req_state;
+    bool exists;
+    errno_t ret;
+    int i;
+
+    test_ctx = talloc_get_type_abort(*state, struct test_ctx);
+    table = test_ctx->conn->requests->outgoing;
+
+    for (i = 0; i < 3; i++) {
+        req[i] = tevent_req_create(test_ctx, &req_state, int);
+        assert_non_null(req[i]);
+    }
+
+    test_key_ussu(test_ctx, 1, "user", &key1);
+    test_key_ussu(test_ctx, 2, "user", &key2);
+
+    ret = sbus_requests_add(table, &key1, test_ctx->conn, req[0],
+                            true, &exists);
+    assert_int_equal(ret, EOK);
+    assert_false(exists);
+
+    ret = sbus_requests_add(table, &key1, test_ctx->conn, req[1],
+                            true, &exists);
+    assert_int_equal(ret, EOK);
+    assert_true(exists);
+
+    ret = sbus_requests_add(table, &key2, test_ctx->conn, req[2],
+                            true, &exists);
+    assert_int_equal(ret, EOK);
+    assert_false(exists);
+
+    list = sbus_requests_lookup(table, &key1);
+    assert_non_null(list);
+    assert_ptr_equal(list->req, req[0]);
+    assert_non_null(list->next);
+    assert_ptr_equal(list->next->req, req[1]);
+    assert_null(list->next->next);
+
+    list = sbus_requests_lookup(table, &key2);
+    assert_non_null(list);
+    assert_ptr_equal(list->req, req[2]);
+    assert_null(list->next);
+
+    sbus_requests_delete(list);
+    assert_null(sbus_requests_lookup(table, &key2));
+
+    sbus_requests_terminate_all(table, ERR_TERMINATED);
+    assert_null(sbus_requests_lookup(table, &key1));
+
+    for (i = 0; i < 3; i++) {
+        talloc_free(req[i]);
+    }
+}
+
+int main(int argc, const char *argv[])
+{
+    poptContext pc;
+    int opt;
+    struct poptOption long_options[] = {
+        POPT_AUTOHELP
+        SSSD_DEBUG_OPTS
+        POPT_TABLEEND
+    };
+
+    const struct CMUnitTest tests[] = {
+        cmocka_unit_test_setup_teardown(test_sbus_request_key_args,
+                                        test_key_setup,
+                                        test_key_teardown),
+        cmocka_unit_test_setup_teardown(test_sbus_request_key_await,
+                                        test_key_setup,
+                                        test_key_teardown),
+        cmocka_unit_test_setup_teardown(test_sbus_request_key_too_long,
+                                        test_key_setup,
+                                        test_key_teardown),
+        cmocka_unit_test_setup_teardown(test_sbus_request_key_chain,
+                                        test_key_setup,
+                                        test_key_teardown)
+    };
+
+    /* Set debug level to invalid value so we can decide if -d 0 was used. */
+    debug_level = SSSDBG_INVALID;
+
+    pc = poptGetContext(argv[0], argc, argv, long_options, 0);
+    while((opt = poptGetNextOpt(pc)) != -1) {
+        switch(opt) {
+        default:
+            fprintf(stderr, "\nInvalid option %s: %s\n\n",
+                    poptBadOption(pc, 0), poptStrerror(opt));
+            poptPrintUsage(pc, stderr, 0);
+            return 1;
+        }
+    }
+    poptFreeContext(pc);
+
+    DEBUG_CLI_INIT(debug_level);
+
+    return cmocka_run_group_tests(tests, NULL, NULL);
+}
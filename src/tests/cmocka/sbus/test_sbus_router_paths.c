@@ -0,0 +1,345 @@
+/*
+    Copyright (C) 2026 Red Hat
+
+    This program is free software; you can redistribute it and/or modify
+    it under the terms of the GNU General Public License as published by
+    the Free Software Foundation; either version 3 of the License, or
+    (at your option) any later version.
+
+    This program is distributed in the hope that it will be useful,
+    but WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+    GNU General Public License for more details.
+
+    You should have received a copy of the GNU General Public License
+    along with this program.  If not, see <http://www.gnu.org/licenses/>.
+*/
+
+#include "config.h"
+
+#include <talloc.h>
+#include <tevent.h>
+#include <errno.h>
+#include <popt.h>
+
+#include "util/util.h"
+#include "sbus/sbus_private.h"
+#include "tests/cmocka/common_mock.h"
+#include "tests/common.h"
+
+#define TEST_IFACE "org.freedesktop.sssd.test"
+#define TEST_IFACE_OTHER "org.freedesktop.sssd.test.Other"
+
+#define BENCH_PATH_USERS "/org/freedesktop/sssd/infopipe/Users"
+#define BENCH_PATH_GROUPS "/org/freedesktop/sssd/infopipe/Groups"
+#define BENCH_NUM_OBJECTS 1000
+#define BENCH_NUM_LOOKUPS 1000000
+
+static const struct sbus_method test_methods[] = SBUS_WITHOUT_METHODS;
+static const struct sbus_signal test_signals[] = SBUS_WITHOUT_SIGNALS;
+static const struct sbus_property test_properties[] = SBUS_WITHOUT_PROPERTIES;
+
+static struct sbus_interface *
+test_add(struct sbus_router_paths *paths,
+         const char *path,
+         const char *name)
+{
+    struct sbus_interface iface;
+    errno_t ret;
+
+    iface = sbus_interface(name, NULL, test_methods, test_signals,
+                           test_properties);
+
+    ret = sbus_router_paths_add(paths, path, &iface);
+    assert_int_equal(ret, EOK);
+
+    return sbus_router_paths_lookup(paths, path, name);
+}
+
+static void test_sbus_router_paths_exact(void **state)
+{
+    struct sbus_router_paths *paths;
+    struct sbus_interface *iface;
+    struct sbus_interface *found;
+
+    paths = sbus_router_paths_init(global_talloc_context);
+    assert_non_null(paths);
+
+    iface = test_add(paths, "/org/freedesktop/sssd", TEST_IFACE);
+    assert_non_null(iface);
+    assert_string_equal(iface->name, TEST_IFACE);
+
+    found = sbus_router_paths_lookup(paths, "/org/freedesktop/sssd",
+                                     TEST_IFACE);
+    assert_ptr_equal(found, iface);
+
+    found = sbus_router_paths_lookup(paths, "/org/freedesktop/sssd",
+                                     TEST_IFACE_OTHER);
+    assert_null(found);
+
+    found = sbus_router_paths_lookup(paths, "/org/freedesktop", TEST_IFACE);
+    assert_null(found);
+
+    found = sbus_router_paths_lookup(paths, "/org/freedesktop/sssd/child",
+                                     TEST_IFACE);
+    assert_null(found);
+
+    found = sbus_router_paths_lookup(paths, "/org/freedesktop/sss",
+                                     TEST_IFACE);
+    assert_null(found);
+
+    assert_true(sbus_router_paths_exist(paths, "/org/freedesktop/sssd"));
+    assert_false(sbus_router_paths_exist(paths, "/org/freedesktop"));
+
+    talloc_free(paths);
+}
+
+static void test_sbus_router_paths_subtree(void **state)
+{
+    struct sbus_router_paths *paths;
+    struct sbus_interface *iface;
+    struct sbus_interface *found;
+
+    paths = sbus_router_paths_init(global_talloc_context);
+    assert_non_null(paths);
+
+    iface = test_add(paths, "/org/freedesktop/sssd/*", TEST_IFACE);
+    assert_non_null(iface);
+
+    found = sbus_router_paths_lookup(paths, "/org/freedesktop/sssd/a",
+                                     TEST_IFACE);
+    assert_ptr_equal(found, iface);
+
+    found = sbus_router_paths_lookup(paths, "/org/freedesktop/sssd/a/b/c",
+                                     TEST_IFACE);
+    assert_ptr_equal(found, iface);
+
+    /* Subtree does not contain the node itself. */
+    found = sbus_router_paths_lookup(paths, "/org/freedesktop/sssd",
+                                     TEST_IFACE);
+    assert_null(found);
+
+    found = sbus_router_paths_lookup(paths, "/org/freedesktop/sssdx/a",
+                                     TEST_IFACE);
+    assert_null(found);
+
+    talloc_free(paths);
+}
+
+static void test_sbus_router_paths_deepest(void **state)
+{
+    struct sbus_router_paths *paths;
+    struct sbus_interface *root;
+    struct sbus_interface *subtree;
+    struct sbus_interface *exact;
+    struct sbus_interface *found;
+
+    paths = sbus_router_paths_init(global_talloc_context);
+    assert_non_null(paths);
+
+    root = test_add(paths, "/*", TEST_IFACE);
+    subtree = test_add(paths, "/org/freedesktop/*", TEST_IFACE);
+    exact = test_add(paths, "/org/freedesktop/sssd", TEST_IFACE);
+    assert_non_null(root);
+    assert_non_null(subtree);
+    assert_non_null(exact);
+    assert_ptr_not_equal(root, subtree);
+    assert_ptr_not_equal(subtree, exact);
+
+    found = sbus_router_paths_lookup(paths, "/org/freedesktop/sssd",
+                                     TEST_IFACE);
+    assert_ptr_equal(found, exact);
+
+    found = sbus_router_paths_lookup(paths, "/org/freedesktop/sssd/a",
+                                     TEST_IFACE);
+    assert_ptr_equal(found, subtree);
+
+    found = sbus_router_paths_lookup(paths, "/org/freedesktop/other",
+                                     TEST_IFACE);
+    assert_ptr_equal(found, subtree);
+
+    found = sbus_router_paths_lookup(paths, "/org/freedesktop",
+                                     TEST_IFACE);
+    assert_ptr_equal(found, root);
+
+    found = sbus_router_paths_lookup(paths, "/com", TEST_IFACE);
+    assert_ptr_equal(found, root);
+
+    talloc_free(paths);
+}
+
+static void test_sbus_router_paths_root(void **state)
+{
+    struct sbus_router_paths *paths;
+    struct sbus_interface *iface;
+    struct sbus_interface *found;
+
+    paths = sbus_router_paths_init(global_talloc_context);
+    assert_non_null(paths);
+
+    iface = test_add(paths, "/", TEST_IFACE);
+    assert_non_null(iface);
+
+    found = sbus_router_paths_lookup(paths, "/", TEST_IFACE);
+    assert_ptr_equal(found, iface);
+
+    /* Root path is not a subtree. */
+    found = sbus_router_paths_lookup(paths, "/org", TEST_IFACE);
+    assert_null(found);
+
+    found = sbus_router_paths_lookup(paths, "org", TEST_IFACE);
+    assert_null(found);
+
+    talloc_free(paths);
+}
+
+static void test_sbus_router_paths_supported(void **state)
+{
+    TALLOC_CTX *tmp_ctx;
+    struct sbus_router_paths *paths;
+    struct sbus_interface_list *list;
+    struct sbus_interface_list *item;
+    struct sbus_interface *expected[3];
+    int i;
+    errno_t ret;
+
+    tmp_ctx = talloc_new(global_talloc_context);
+    assert_non_null(tmp_ctx);
+
+    paths = sbus_router_paths_init(tmp_ctx);
+    assert_non_null(paths);
+
+    test_add(paths, "/org/unrelated", TEST_IFACE);
+    expected[2] = test_add(paths, "/*", TEST_IFACE);
+    expected[1] = test_add(paths, "/org/*", TEST_IFACE_OTHER);
+    expected[0] = test_add(paths, "/org/freedesktop", TEST_IFACE);
+
+    ret = sbus_router_paths_supported(tmp_ctx, paths, "/org/freedesktop",
+                                      &list);
+    assert_int_equal(ret, EOK);
+
+    /* Exact match first, then subtrees from the deepest one. */
+    i = 0;
+    DLIST_FOR_EACH(item, list) {
+        assert_true(i < 3);
+        assert_ptr_equal(item->interface, expected[i]);
+        i++;
+    }
+    assert_int_equal(i, 3);
+
+    ret = sbus_router_paths_supported(tmp_ctx, paths, "/com", &list);
+    assert_int_equal(ret, EOK);
+    assert_non_null(list);
+    assert_ptr_equal(list->interface, expected[2]);
+    assert_null(list->next);
+
+    talloc_free(tmp_ctx);
+}
+
+/* Not a correctness test. It measures lookup of InfoPipe-like object paths
+ * so changes to the registry can be compared. Run with -d 0x0400 to see the
+ * results. */
+static void test_sbus_router_paths_benchmark(void **state)
+{
+    TALLOC_CTX *tmp_ctx;
+    struct sbus_router_paths *paths;
+    struct sbus_interface *found;
+    const char **objects;
+    struct timeval start;
+    struct timeval end;
+    uint64_t usec;
+    int i;
+
+    tmp_ctx = talloc_new(global_talloc_context);
+    assert_non_null(tmp_ctx);
+
+    paths = sbus_router_paths_init(tmp_ctx);
+    assert_non_null(paths);
+
+    test_add(paths, "/", TEST_IFACE);
+    test_add(paths, "/org/freedesktop/sssd/infopipe", TEST_IFACE);
+    test_add(paths, BENCH_PATH_USERS, TEST_IFACE);
+    test_add(paths, BENCH_PATH_USERS "/*", TEST_IFACE);
+    test_add(paths, BENCH_PATH_USERS "/*", TEST_IFACE_OTHER);
+    test_add(paths, BENCH_PATH_GROUPS, TEST_IFACE);
+    test_add(paths, BENCH_PATH_GROUPS "/*", TEST_IFACE);
+
+    objects = talloc_zero_array(tmp_ctx, const char *, BENCH_NUM_OBJECTS);
+    assert_non_null(objects);
+
+    for (i = 0; i < BENCH_NUM_OBJECTS; i++) {
+        objects[i] = talloc_asprintf(objects, "%s/ipa_2etest/%d",
+                                     i % 2 ? BENCH_PATH_USERS
+                                           : BENCH_PATH_GROUPS,
+                                     100000 + i);
+        assert_non_null(objects[i]);
+    }
+
+    start = tevent_timeval_current();
+    for (i = 0; i < BENCH_NUM_LOOKUPS; i++) {
+        found = sbus_router_paths_lookup(paths, objects[i % BENCH_NUM_OBJECTS],
+                                         TEST_IFACE);
+        assert_non_null(found);
+    }
+    end = tevent_timeval_current();
+
+    usec = (uint64_t)(end.tv_sec - start.tv_sec) * 1000000
+           + (end.tv_usec - start.tv_usec);
+
+    DEBUG(SSSDBG_TRACE_FUNC, "%d path lookups took %"PRIu64" us "
+          "(%"PRIu64" ns per lookup)\n", BENCH_NUM_LOOKUPS, usec,
+          usec * 1000 / BENCH_NUM_LOOKUPS);
+
+    talloc_free(tmp_ctx);
+}
+
+static int test_setup(void **state)
+{
+    assert_true(leak_check_setup());
+    return 0;
+}
+
+static int test_teardown(void **state)
+{
+    assert_true(leak_check_teardown());
+    return 0;
+}
+
+int main(int argc, const char *argv[])
+{
+    poptContext pc;
+    int opt;
+    struct poptOption long_options[] = {
+        POPT_AUTOHELP
+        SSSD_DEBUG_OPTS
+        POPT_TABLEEND
+    };
+
+    const struct CMUnitTest tests[] = {
+        cmocka_unit_test(test_sbus_router_paths_exact),
+        cmocka_unit_test(test_sbus_router_paths_subtree),
+        cmocka_unit_test(test_sbus_router_paths_deepest),
+        cmocka_unit_test(test_sbus_router_paths_root),
+        cmocka_unit_test(test_sbus_router_paths_supported),
+        cmocka_unit_test(test_sbus_router_paths_benchmark)
+    };
+
+    /* Set debug level to invalid value so we can decide if -d 0 was used. */
+    debug_level = SSSDBG_INVALID;
+
+    pc = poptGetContext(argv[0], argc, argv, long_options, 0);
+    while((opt = poptGetNextOpt(pc)) != -1) {
+        switch(opt) {
+        default:
+            fprintf(stderr, "\nInvalid option %s: %s\n\n",
+                    poptBadOption(pc, 0), poptStrerror(opt));
+            poptPrintUsage(pc, stderr, 0);
+            return 1;
+        }
+    }
+    poptFreeContext(pc);
+
+    DEBUG_CLI_INIT(debug_level);
+
+    return cmocka_run_group_tests(tests, test_setup, test_teardown);
+}
@@ -0,0 +1,216 @@
+/*
+    Copyright (C) 2026 Red Hat
+
+    This program is free software; you can redistribute it and/or modify
+    it under the terms of the GNU General Public License as published by
+    the Free Software Foundation; either version 3 of the License, or
+    (at your option) any later version.
+
+    This program is distributed in the hope that it will be useful,
+    but WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+    GNU General Public License for more details.
+
+    You should have received a copy of the GNU General Public License
+    along with this program.  If not, see <http://www.gnu.org/licenses/>.
+*/
+
+#include "config.h"
+
+#include <talloc.h>
+#include <tevent.h>
+#include <errno.h>
+#include <popt.h>
+
+#include "util/util.h"
+#include "sbus/sbus_private.h"
+#include "tests/cmocka/common_mock.h"
+#include "tests/common.h"
+
+#define TEST_IFACE "org.freedesktop.sssd.test"
+#define TEST_METHOD "Method"
+
+static const struct sbus_method test_methods[] = {
+    {.name = TEST_METHOD},
+    {NULL}
+};
+static const struct sbus_signal test_signals[] = SBUS_WITHOUT_SIGNALS;
+static const struct sbus_property test_properties[] = SBUS_WITHOUT_PROPERTIES;
+
+struct test_ctx {
+    struct sbus_connection *conn;
+    struct sbus_router_paths *paths;
+};
+
+static int test_stats_setup(void **state)
+{
+    struct test_ctx *test_ctx;
+    struct sbus_interface iface;
+    errno_t ret;
+
+    assert_true(leak_check_setup());
+
+    test_ctx = talloc_zero(global_talloc_context, struct test_ctx);
+    assert_non_null(test_ctx);
+
+    test_ctx->conn = talloc_zero(test_ctx, struct sbus_connection);
+    assert_non_null(test_ctx->conn);
+
+    test_ctx->paths = sbus_router_paths_init(test_ctx);
+    assert_non_null(test_ctx->paths);
+
+    /* The router keeps a copy of the interface for each path. */
+    iface = sbus_interface(TEST_IFACE, NULL, test_methods, test_signals,
+                           test_properties);
+
+    ret = sbus_router_paths_add(test_ctx->paths, "/org/freedesktop/a",
+                                &iface);
+    assert_int_equal(ret, EOK);
+
+    ret = sbus_router_paths_add(test_ctx->paths, "/org/freedesktop/b",
+                                &iface);
+    assert_int_equal(ret, EOK);
+
+    check_leaks_push(test_ctx);
+    *state = test_ctx;
+
+    return 0;
+}
+
+static int test_stats_teardown(void **state)
+{
+    struct test_ctx *test_ctx;
+
+    test_ctx = talloc_get_type_abort(*state, struct test_ctx);
+
+    talloc_zfree(test_ctx->conn->stats);
+    assert_true(check_leaks_pop(test_ctx));
+    talloc_free(test_ctx);
+
+    assert_true(leak_check_teardown());
+    return 0;
+}
+
+/* Resolve the method the same way sbus_method_handler() does. */
+static void test_lookup(struct test_ctx *test_ctx,
+                        const char *path,
+                        struct sbus_interface **_iface,
+                        const struct sbus_method **_method)
+{
+    *_iface = sbus_router_paths_lookup(test_ctx->paths, path, TEST_IFACE);
+    assert_non_null(*_iface);
+
+    *_method = sbus_interface_find_method(*_iface, TEST_METHOD);
+    assert_non_null(*_method);
+}
+
+static void test_sbus_stats_disabled(void **state)
+{
+    struct test_ctx *test_ctx;
+    struct sbus_interface *iface;
+    const struct sbus_method *method;
+
+    test_ctx = talloc_get_type_abort(*state, struct test_ctx);
+
+    test_lookup(test_ctx, "/org/freedesktop/a", &iface, &method);
+    assert_null(sbus_stats_get(test_ctx->conn, iface, method));
+}
+
+static void test_sbus_stats_counters(void **state)
+{
+    TALLOC_CTX *tmp_ctx;
+    struct test_ctx *test_ctx;
+    struct sbus_interface *iface_a;
+    struct sbus_interface *iface_b;
+    const struct sbus_method *method_a;
+    const struct sbus_method *method_b;
+    struct sbus_method_stats *stats_a;
+    struct sbus_method_stats *stats_b;
+    struct timeval start;
+    const char **members;
+    uint64_t *calls;
+    uint64_t *errors;
+    uint64_t *histogram;
+    uint64_t sum;
+    errno_t ret;
+    int i;
+
+    test_ctx = talloc_get_type_abort(*state, struct test_ctx);
+
+    ret = sss_hash_create(test_ctx->conn, 0, &test_ctx->conn->stats);
+    assert_int_equal(ret, EOK);
+
+    test_lookup(test_ctx, "/org/freedesktop/a", &iface_a, &method_a);
+    test_lookup(test_ctx, "/org/freedesktop/b", &iface_b, &method_b);
+    assert_ptr_not_equal(method_a, method_b);
+
+    /* Both copies of the method share the same counters. */
+    stats_a = sbus_stats_get(test_ctx->conn, iface_a, method_a);
+    stats_b = sbus_stats_get(test_ctx->conn, iface_b, method_b);
+    assert_non_null(stats_a);
+    assert_ptr_equal(stats_a, stats_b);
+
+    start = tevent_timeval_current();
+    sbus_stats_record(stats_a, start, EOK);
+    sbus_stats_record(stats_b, start, EOK);
+    sbus_stats_record(stats_b, start, EIO);
+
+    tmp_ctx = talloc_new(NULL);
+    assert_non_null(tmp_ctx);
+
+    ret = sbus_stats_collect(tmp_ctx, test_ctx->conn, &members, &calls,
+                             &errors, &histogram);
+    assert_int_equal(ret, EOK);
+
+    assert_string_equal(members[0], TEST_IFACE "." TEST_METHOD);
+    assert_null(members[1]);
+    assert_int_equal(calls[0], 3);
+    assert_int_equal(errors[0], 1);
+
+    sum = 0;
+    for (i = 0; i < SBUS_STATS_BUCKETS; i++) {
+        sum += histogram[i];
+    }
+    assert_int_equal(sum, 3);
+
+    talloc_free(tmp_ctx);
+}
+
+int main(int argc, const char *argv[])
+{
+    poptContext pc;
+    int opt;
+    struct poptOption long_options[] = {
+        POPT_AUTOHELP
+        SSSD_DEBUG_OPTS
+        POPT_TABLEEND
+    };
+
+    const struct CMUnitTest tests[] = {
+        cmocka_unit_test_setup_teardown(test_sbus_stats_disabled,
+                                        test_stats_setup,
+                                        test_stats_teardown),
+        cmocka_unit_test_setup_teardown(test_sbus_stats_counters,
+                                        test_stats_setup,
+                                        test_stats_teardown)
+    };
+
+    /* Set debug level to invalid value so we can decide if -d 0 was used. */
+    debug_level = SSSDBG_INVALID;
+
+    pc = poptGetContext(argv[0], argc, argv, long_options, 0);
+    while((opt = poptGetNextOpt(pc)) != -1) {
+        switch(opt) {
+        default:
+            fprintf(stderr, "\nInvalid option %s: %s\n\n",
+                    poptBadOption(pc, 0), poptStrerror(opt));
+            poptPrintUsage(pc, stderr, 0);
+            return 1;
+        }
+    }
+    poptFreeContext(pc);
+
+    DEBUG_CLI_INIT(debug_level);
+
+    return cmocka_run_group_tests(tests, NULL, NULL);
+}
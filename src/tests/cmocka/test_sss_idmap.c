@@ -713,6 +713,136 @@ void test_sss_idmap_calculate_range_slice_collision(void **state)
     assert_int_equal(err, IDMAP_SUCCESS);
 }
 
+#define TEST_MANY_DOMAINS 1000
+#define TEST_MANY_DOM_SID_FMT "S-1-5-21-1-2-%d"
+
+void test_map_id_many_domains(void **state)
+{
+    struct test_ctx *test_ctx;
+    enum idmap_error_code err;
+    struct sss_idmap_range range;
+    char name[64];
+    char dom_sid[64];
+    char test_sid[64];
+    uint32_t id;
+    char *sid = NULL;
+    id_t slice_num;
+    int c;
+    int i;
+
+    test_ctx = talloc_get_type(*state, struct test_ctx);
+
+    assert_non_null(test_ctx);
+
+    /* Add the domains out of order of their ranges */
+    for (c = 0; c < TEST_MANY_DOMAINS; c++) {
+        i = (c * 7) % TEST_MANY_DOMAINS;
+
+        snprintf(name, sizeof(name), "dom%d.test", i);
+        snprintf(dom_sid, sizeof(dom_sid), TEST_MANY_DOM_SID_FMT, i);
+        range.min = TEST_RANGE_MIN + i * 200000;
+        range.max = range.min + 199999;
+
+        err = sss_idmap_add_domain_ex(test_ctx->idmap_ctx, name, dom_sid,
+                                      &range, NULL, 0, false);
+        assert_int_equal(err, IDMAP_SUCCESS);
+    }
+
+    for (i = 0; i < TEST_MANY_DOMAINS; i++) {
+        snprintf(test_sid, sizeof(test_sid), TEST_MANY_DOM_SID_FMT"-%d", i,
+                 i + 500);
+
+        err = sss_idmap_sid_to_unix(test_ctx->idmap_ctx, test_sid, &id);
+        assert_int_equal(err, IDMAP_SUCCESS);
+        assert_int_equal(id, TEST_RANGE_MIN + i * 200000 + i + 500);
+
+        err = sss_idmap_unix_to_sid(test_ctx->idmap_ctx, id, &sid);
+        assert_int_equal(err, IDMAP_SUCCESS);
+        assert_string_equal(sid, test_sid);
+        sss_idmap_free_sid(test_ctx->idmap_ctx, sid);
+    }
+
+    snprintf(test_sid, sizeof(test_sid), TEST_MANY_DOM_SID_FMT"-%d", 5,
+             200000);
+    err = sss_idmap_sid_to_unix(test_ctx->idmap_ctx, test_sid, &id);
+    assert_int_equal(err, IDMAP_NO_RANGE);
+
+    snprintf(test_sid, sizeof(test_sid), TEST_MANY_DOM_SID_FMT"-%d",
+             TEST_MANY_DOMAINS, 500);
+    err = sss_idmap_sid_to_unix(test_ctx->idmap_ctx, test_sid, &id);
+    assert_int_equal(err, IDMAP_NO_DOMAIN);
+
+    err = sss_idmap_sid_to_unix(test_ctx->idmap_ctx, "S-1-5-21-1-2-5-x", &id);
+    assert_int_equal(err, IDMAP_SID_INVALID);
+
+    err = sss_idmap_unix_to_sid(test_ctx->idmap_ctx, TEST_RANGE_MIN - 1, &sid);
+    assert_int_equal(err, IDMAP_NO_DOMAIN);
+
+    err = sss_idmap_unix_to_sid(test_ctx->idmap_ctx,
+                                TEST_RANGE_MIN + TEST_MANY_DOMAINS * 200000,
+                                &sid);
+    assert_int_equal(err, IDMAP_NO_DOMAIN);
+
+    slice_num = 123;
+    err = sss_idmap_calculate_range(test_ctx->idmap_ctx, NULL, &slice_num,
+                                    &range);
+    assert_int_equal(err, IDMAP_COLLISION);
+
+    slice_num = TEST_MANY_DOMAINS;
+    err = sss_idmap_calculate_range(test_ctx->idmap_ctx, NULL, &slice_num,
+                                    &range);
+    assert_int_equal(err, IDMAP_SUCCESS);
+    assert_int_equal(range.min, TEST_RANGE_MIN + TEST_MANY_DOMAINS * 200000);
+}
+
+void test_map_id_overlapping_ranges(void **state)
+{
+    struct test_ctx *test_ctx;
+    enum idmap_error_code err;
+    struct sss_idmap_range range;
+    char *sid = NULL;
+
+    test_ctx = talloc_get_type(*state, struct test_ctx);
+
+    assert_non_null(test_ctx);
+
+    range.min = 200000;
+    range.max = 399999;
+    err = sss_idmap_add_domain_ex(test_ctx->idmap_ctx, TEST_DOM_NAME,
+                                  TEST_DOM_SID, &range, NULL, 0, false);
+    assert_int_equal(err, IDMAP_SUCCESS);
+
+    /* Ranges with external mapping may overlap other ranges, the most
+     * recently added domain is used. */
+    range.min = 300000;
+    range.max = 499999;
+    err = sss_idmap_add_domain_ex(test_ctx->idmap_ctx, TEST_2_DOM_NAME,
+                                  TEST_2_DOM_SID, &range, NULL, 0, true);
+    assert_int_equal(err, IDMAP_SUCCESS);
+
+    range.min = 400000;
+    range.max = 599999;
+    err = sss_idmap_add_domain_ex(test_ctx->idmap_ctx, TEST_DOM_NAME,
+                                  TEST_DOM_SID, &range, NULL, 200000, false);
+    assert_int_equal(err, IDMAP_SUCCESS);
+
+    err = sss_idmap_unix_to_sid(test_ctx->idmap_ctx, 250000, &sid);
+    assert_int_equal(err, IDMAP_SUCCESS);
+    assert_string_equal(sid, TEST_DOM_SID"-50000");
+    sss_idmap_free_sid(test_ctx->idmap_ctx, sid);
+
+    err = sss_idmap_unix_to_sid(test_ctx->idmap_ctx, 350000, &sid);
+    assert_int_equal(err, IDMAP_EXTERNAL);
+
+    err = sss_idmap_unix_to_sid(test_ctx->idmap_ctx, 450000, &sid);
+    assert_int_equal(err, IDMAP_SUCCESS);
+    assert_string_equal(sid, TEST_DOM_SID"-250000");
+    sss_idmap_free_sid(test_ctx->idmap_ctx, sid);
+
+    err = sss_idmap_unix_to_sid(test_ctx->idmap_ctx, 600000, &sid);
+    assert_int_equal(err, IDMAP_NO_DOMAIN);
+}
+
 int main(int argc, const char *argv[])
 {
     poptContext pc;
@@ -756,6 +886,12 @@ int main(int argc, const char *argv[])
         cmocka_unit_test_setup_teardown(test_sss_idmap_calculate_range_slice_collision,
                                         test_sss_idmap_setup,
                                         test_sss_idmap_teardown),
+        cmocka_unit_test_setup_teardown(test_map_id_many_domains,
+                                        test_sss_idmap_setup,
+                                        test_sss_idmap_teardown),
+        cmocka_unit_test_setup_teardown(test_map_id_overlapping_ranges,
+                                        test_sss_idmap_setup,
+                                        test_sss_idmap_teardown),
     };
 
     /* Set debug level to invalid value so we can decide if -d 0 was used. */
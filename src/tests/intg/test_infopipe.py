@@ -205,6 +205,7 @@ def format_basic_conf(ldap_conn, schema, config):
         debug_level         = 0xffff
         user_attributes = +extraName
         ca_db               = {config.PAM_CERT_DB_PATH}
+        method_stats        = true
 
         [domain/LDAP]
         {schema_conf}
@@ -459,6 +460,44 @@ def test_ping_raw(dbus_system_bus, ldap_conn, simple_rfc2307):
     assert ret == "PONG"
 
 
+def test_method_stats(dbus_system_bus, ldap_conn, simple_rfc2307):
+    sssd_obj = dbus_system_bus.get_object('org.freedesktop.sssd.infopipe',
+                                          '/org/freedesktop/sssd/infopipe',
+                                          introspect=False)
+    sssd_interface = dbus.Interface(sssd_obj, 'org.freedesktop.sssd.infopipe')
+
+    assert sssd_interface.Ping('ping') == "PONG"
+    assert sssd_interface.Ping('ping') == "PONG"
+    with pytest.raises(dbus.exceptions.DBusException):
+        sssd_interface.Ping('test')
+
+    # The same method on two object paths is counted once
+    for path in ['/org/freedesktop/sssd/infopipe',
+                 '/org/freedesktop/sssd/infopipe/Users']:
+        obj = dbus_system_bus.get_object('org.freedesktop.sssd.infopipe',
+                                         path, introspect=False)
+        dbus.Interface(obj, 'org.freedesktop.DBus.Introspectable').Introspect()
+
+    stats_obj = dbus_system_bus.get_object('org.freedesktop.sssd.infopipe',
+                                           '/', introspect=False)
+    stats_interface = dbus.Interface(stats_obj, 'org.freedesktop.sssd.Stats')
+    members, calls, errors, histogram = stats_interface.GetMethodStats()
+
+    assert len(members) == len(set(members))
+    assert len(calls) == len(members)
+    assert len(errors) == len(members)
+    assert len(histogram) == 32 * len(members)
+
+    i = list(members).index('org.freedesktop.sssd.infopipe.Ping')
+    assert calls[i] == 3
+    assert errors[i] == 1
+    assert sum(histogram[i * 32:(i + 1) * 32]) == 3
+
+    i = list(members).index('org.freedesktop.DBus.Introspectable.Introspect')
+    assert calls[i] == 2
+    assert errors[i] == 0
+
+
 def test_ping_introspection(dbus_system_bus, ldap_conn, simple_rfc2307):
     sssd_obj = dbus_system_bus.get_object('org.freedesktop.sssd.infopipe',
                                           '/org/freedesktop/sssd/infopipe')
@@ -681,6 +720,41 @@ def test_get_extra_attributes_empty(dbus_system_bus,
     assert extra_attrs['extraName'][0] == 'user1'
 
 
+def test_get_all_user_properties(dbus_system_bus,
+                                 ldap_conn,
+                                 sanity_rfc2307):
+    """
+    Make sure GetAll returns the same properties as Get, including the
+    groups and extraAttributes properties
+    """
+    users_obj = dbus_system_bus.get_object('org.freedesktop.sssd.infopipe',
+                                           '/org/freedesktop/sssd/infopipe/Users')
+    users_iface = dbus.Interface(users_obj,
+                                 "org.freedesktop.sssd.infopipe.Users")
+
+    user_path = users_iface.FindByName('user1')
+    user_object = dbus_system_bus.get_object('org.freedesktop.sssd.infopipe',
+                                             user_path)
+    prop_iface = dbus.Interface(user_object, 'org.freedesktop.DBus.Properties')
+
+    res = prop_iface.GetAll('org.freedesktop.sssd.infopipe.Users.User')
+
+    assert res['name'] == 'user1'
+    assert res['uidNumber'] == 1001
+    assert res['gidNumber'] == 2001
+    assert res['homeDirectory'] == '/home/user1'
+    assert res['extraAttributes']['extraName'][0] == 'user1'
+    assert len(res['groups']) >= 2
+
+    for prop in res:
+        value = prop_iface.Get('org.freedesktop.sssd.infopipe.Users.User',
+                               prop)
+        if prop == 'groups':
+            assert sorted(res[prop]) == sorted(value)
+        else:
+            assert res[prop] == value
+
+
 def test_sssctl_domain_list_app_domain(dbus_system_bus,
                                        ldap_conn,
                                        sanity_rfc2307):
@@ -31,6 +31,7 @@ import subprocess
 import time
 import pytest
 import pysss_murmur
+import pysss_nss_mc
 
 import ds_openldap
 import ldap_ent
@@ -984,6 +985,27 @@ def test_colliding_hashes(ldap_conn, sanity_rfc2307):
              gecos='5001', shell='/bin/bash'))
 
 
+def test_pysss_nss_mc(ldap_conn, sanity_rfc2307):
+    """
+    pysss_nss_mc reads the memory cache files written by the responder
+    """
+    user = pwd.getpwnam('user1')
+    group = grp.getgrnam('group1')
+    assert_initgroups_equal("user1", 2001, [2000, 2001])
+    stop_sssd()
+
+    # sssd is stopped, the entries can only come from the memory cache
+    assert pysss_nss_mc.getpwnam('user1', fallback=False) == user
+    assert pysss_nss_mc.getpwuid(1001, fallback=False) == user
+    assert pysss_nss_mc.getgrnam('group1', fallback=False) == group
+    assert pysss_nss_mc.getgrgid(2001, fallback=False) == group
+    gids = pysss_nss_mc.initgroups('user1', fallback=False)
+    assert set(gids) | {2001} == {2000, 2001}
+
+    with pytest.raises(KeyError):
+        pysss_nss_mc.getpwnam('user2', fallback=False)
+
+
 def test_removed_mc(ldap_conn, sanity_rfc2307):
     """
     Regression test for ticket:
@@ -245,6 +245,27 @@ def test_user_operations(ldap_conn, simple_ad):
     assert output[pysss_nss_idmap.TYPE_KEY] == pysss_nss_idmap.ID_USER
     assert output[pysss_nss_idmap.NAME_KEY] == user
 
+    unknown_sid = 'S-1-5-21-1305200397-2901131868-73388776-1'
+
+    output = pysss_nss_idmap.getsidbyname_many([user, 'nonexistent'])
+    assert output == ([user_sid, None], [pysss_nss_idmap.ID_USER, None])
+
+    output = pysss_nss_idmap.getsidbyuid_many([user_id, str(user_id), -1])
+    assert output == ([user_sid, user_sid, None],
+                      [pysss_nss_idmap.ID_USER, pysss_nss_idmap.ID_USER, None])
+
+    output = pysss_nss_idmap.getidbysid_many((user_sid, unknown_sid))
+    assert output == ([user_id, None], [pysss_nss_idmap.ID_USER, None])
+
+    output = pysss_nss_idmap.getnamebysid_many([user_sid])
+    assert output == ([user], [pysss_nss_idmap.ID_USER])
+
+    output = pysss_nss_idmap.getidbysid_many([])
+    assert output == ([], [])
+
+    with pytest.raises(ValueError):
+        pysss_nss_idmap.getidbysid_many(user_sid)
+
 
 def test_group_operations(ldap_conn, simple_ad):
     group = 'group1_dom1-19661'
@@ -281,6 +302,16 @@ def test_group_operations(ldap_conn, simple_ad):
     assert output[pysss_nss_idmap.TYPE_KEY] == pysss_nss_idmap.ID_GROUP
     assert output[pysss_nss_idmap.NAME_KEY] == group
 
+    output = pysss_nss_idmap.getsidbygroupname_many([group, group])
+    assert output == ([group_sid, group_sid],
+                      [pysss_nss_idmap.ID_GROUP, pysss_nss_idmap.ID_GROUP])
+
+    output = pysss_nss_idmap.getsidbygid_many([group_id])
+    assert output == ([group_sid], [pysss_nss_idmap.ID_GROUP])
+
+    output = pysss_nss_idmap.getsidbyuid_many([group_id])
+    assert output == ([None], [None])
+
 
 def test_case_insensitive(ldap_conn, simple_ad):
     # resolve group and also member of this group
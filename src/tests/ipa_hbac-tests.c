@@ -862,6 +862,203 @@ START_TEST(ipa_hbac_test_incomplete)
 }
 END_TEST
 
+static void check_ruleset(struct hbac_rule **rules,
+                          struct hbac_eval_req *eval_req,
+                          enum hbac_eval_result expected,
+                          const char *expected_rule)
+{
+    enum hbac_eval_result result;
+    enum hbac_error_code code;
+    struct hbac_ruleset *ruleset = NULL;
+    struct hbac_info *info = NULL;
+
+    /* The compiled rule set must give the same answer as hbac_evaluate() */
+    result = hbac_evaluate(rules, eval_req, &info);
+    ck_assert_msg(result == expected,
+                  "Expected [%s], got [%s]",
+                  hbac_result_string(expected),
+                  hbac_result_string(result));
+    hbac_free_info(info);
+    info = NULL;
+
+    code = hbac_ruleset_compile(rules, &ruleset);
+    ck_assert_msg(code == HBAC_SUCCESS, "hbac_ruleset_compile failed");
+
+    result = hbac_ruleset_evaluate(ruleset, eval_req, &info);
+    ck_assert_msg(result == expected,
+                  "Expected [%s], got [%s]; "
+                  "Error: [%s]",
+                  hbac_result_string(expected),
+                  hbac_result_string(result),
+                  info ? hbac_error_string(info->code):"Unknown");
+    if (expected_rule == NULL) {
+        ck_assert_msg(info->rule_name == NULL,
+                      "Unexpected rule [%s]", info->rule_name);
+    } else {
+        ck_assert_msg(info->rule_name != NULL, "Missing rule name");
+        ck_assert_str_eq(info->rule_name, expected_rule);
+    }
+
+    hbac_free_info(info);
+    hbac_ruleset_free(ruleset);
+}
+
+/* Check that the compiled rule set gives the same result and rule name as
+ * hbac_evaluate() where the expected result depends on how libunistring
+ * handles invalid input. */
+static void check_ruleset_same(struct hbac_rule **rules,
+                               struct hbac_eval_req *eval_req)
+{
+    enum hbac_eval_result expected;
+    enum hbac_eval_result result;
+    enum hbac_error_code code;
+    struct hbac_ruleset *ruleset = NULL;
+    struct hbac_info *expected_info = NULL;
+    struct hbac_info *info = NULL;
+
+    expected = hbac_evaluate(rules, eval_req, &expected_info);
+
+    code = hbac_ruleset_compile(rules, &ruleset);
+    ck_assert_msg(code == HBAC_SUCCESS, "hbac_ruleset_compile failed");
+
+    result = hbac_ruleset_evaluate(ruleset, eval_req, &info);
+    ck_assert_msg(result == expected,
+                  "Expected [%s], got [%s]",
+                  hbac_result_string(expected),
+                  hbac_result_string(result));
+    ck_assert_msg(info->code == expected_info->code,
+                  "Expected error [%s], got [%s]",
+                  hbac_error_string(expected_info->code),
+                  hbac_error_string(info->code));
+    if (expected_info->rule_name == NULL) {
+        ck_assert_msg(info->rule_name == NULL,
+                      "Unexpected rule [%s]", info->rule_name);
+    } else {
+        ck_assert_msg(info->rule_name != NULL, "Missing rule name");
+        ck_assert_str_eq(info->rule_name, expected_info->rule_name);
+    }
+
+    hbac_free_info(expected_info);
+    hbac_free_info(info);
+    hbac_ruleset_free(ruleset);
+}
+
+START_TEST(ipa_hbac_test_ruleset)
+{
+    TALLOC_CTX *test_ctx;
+    struct hbac_rule **rules;
+    struct hbac_rule *incomplete;
+    struct hbac_eval_req *eval_req;
+
+    test_ctx = talloc_new(global_talloc_context);
+
+    /* Create a request */
+    eval_req = talloc_zero(test_ctx, struct hbac_eval_req);
+    sss_ck_fail_if_msg(eval_req == NULL, "Failed to allocate memory");
+
+    get_test_user(eval_req, &eval_req->user);
+    get_test_service(eval_req, &eval_req->service);
+    get_test_srchost(eval_req, &eval_req->srchost);
+
+    /* Create the rules to evaluate against */
+    rules = talloc_zero_array(test_ctx, struct hbac_rule *, 4);
+    sss_ck_fail_if_msg(rules == NULL, "Failed to allocate memory");
+
+    get_allow_all_rule(rules, &rules[0]);
+    rules[0]->name = "Disabled";
+    rules[0]->enabled = false;
+
+    /* Groups are compared case-insensitively */
+    get_allow_all_rule(rules, &rules[1]);
+    rules[1]->name = "Allow group";
+    rules[1]->users->category = HBAC_CATEGORY_NULL;
+    rules[1]->users->groups = talloc_zero_array(rules[1], const char *, 3);
+    sss_ck_fail_if_msg(rules[1]->users->groups == NULL,
+                       "Failed to allocate memory");
+    rules[1]->users->groups[0] = HBAC_TEST_INVALID_GROUP;
+    rules[1]->users->groups[1] = "TestGroup2";
+    rules[1]->services->category = HBAC_CATEGORY_NULL;
+    rules[1]->services->names = talloc_zero_array(rules[1], const char *, 2);
+    sss_ck_fail_if_msg(rules[1]->services->names == NULL,
+                       "Failed to allocate memory");
+    rules[1]->services->names[0] = HBAC_TEST_SERVICE;
+
+    get_allow_all_rule(rules, &rules[2]);
+    rules[2]->name = "Allow all";
+
+    /* The first matching rule wins */
+    check_ruleset(rules, eval_req, HBAC_EVAL_ALLOW, "Allow group");
+
+    eval_req->service->name = HBAC_TEST_INVALID_SERVICE;
+    check_ruleset(rules, eval_req, HBAC_EVAL_ALLOW, "Allow all");
+
+    rules[2]->users->category = HBAC_CATEGORY_NULL;
+    check_ruleset(rules, eval_req, HBAC_EVAL_DENY, NULL);
+
+    /* A rule that can not be evaluated stops the evaluation */
+    incomplete = talloc_zero(rules, struct hbac_rule);
+    sss_ck_fail_if_msg(incomplete == NULL, "Failed to allocate memory");
+    incomplete->name = "Incomplete";
+    incomplete->enabled = true;
+    rules[2] = incomplete;
+    check_ruleset(rules, eval_req, HBAC_EVAL_ERROR, "Incomplete");
+
+    eval_req->service->name = HBAC_TEST_SERVICE;
+    check_ruleset(rules, eval_req, HBAC_EVAL_ALLOW, "Allow group");
+
+    talloc_free(test_ctx);
+}
+END_TEST
+
+START_TEST(ipa_hbac_test_ruleset_invalid_utf8)
+{
+    TALLOC_CTX *test_ctx;
+    struct hbac_rule **rules;
+    struct hbac_eval_req *eval_req;
+
+    test_ctx = talloc_new(global_talloc_context);
+
+    /* Create a request */
+    eval_req = talloc_zero(test_ctx, struct hbac_eval_req);
+    sss_ck_fail_if_msg(eval_req == NULL, "Failed to allocate memory");
+
+    get_test_user(eval_req, &eval_req->user);
+    get_test_service(eval_req, &eval_req->service);
+    get_test_srchost(eval_req, &eval_req->srchost);
+
+    /* Create the rules to evaluate against */
+    rules = talloc_zero_array(test_ctx, struct hbac_rule *, 3);
+    sss_ck_fail_if_msg(rules == NULL, "Failed to allocate memory");
+
+    /* A user name that is not valid UTF-8 */
+    get_allow_all_rule(rules, &rules[0]);
+    rules[0]->name = "Invalid user";
+    rules[0]->users->category = HBAC_CATEGORY_NULL;
+    rules[0]->users->names = talloc_zero_array(rules[0], const char *, 2);
+    sss_ck_fail_if_msg(rules[0]->users->names == NULL,
+                       "Failed to allocate memory");
+    rules[0]->users->names[0] = "inv\xc3\x28lid";
+
+    get_allow_all_rule(rules, &rules[1]);
+    rules[1]->name = "Allow all";
+
+    check_ruleset_same(rules, eval_req);
+
+    rules[1]->users->category = HBAC_CATEGORY_NULL;
+    check_ruleset_same(rules, eval_req);
+
+    /* The request is not valid UTF-8 */
+    eval_req->user->name = "\xff\xfe";
+    check_ruleset_same(rules, eval_req);
+
+    rules[0]->users->category = HBAC_CATEGORY_ALL;
+    rules[1]->users->category = HBAC_CATEGORY_ALL;
+    check_ruleset_same(rules, eval_req);
+
+    talloc_free(test_ctx);
+}
+END_TEST
+
 Suite *hbac_test_suite (void)
 {
     Suite *s = suite_create ("HBAC");
@@ -880,6 +1077,8 @@ Suite *hbac_test_suite (void)
     tcase_add_test(tc_hbac, ipa_hbac_test_allow_srchostgroup);
     tcase_add_test(tc_hbac, ipa_hbac_test_allow_utf8);
     tcase_add_test(tc_hbac, ipa_hbac_test_incomplete);
+    tcase_add_test(tc_hbac, ipa_hbac_test_ruleset);
+    tcase_add_test(tc_hbac, ipa_hbac_test_ruleset_invalid_utf8);
 
     suite_add_tcase(s, tc_hbac);
     return s;
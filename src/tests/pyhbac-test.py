@@ -493,6 +493,84 @@ class PyHbacRequestTest(unittest.TestCase):
         self.assertRaises(TypeError, req.evaluate, (allow_rule, None))
 
 
+class PyHbacRuleSetTest(unittest.TestCase):
+    def _rule(self, name, user, enabled=True):
+        rule = pyhbac.HbacRule(name, enabled=enabled)
+        rule.users.names = [user]
+        rule.services.names = ["ssh"]
+        rule.srchosts.category.add(pyhbac.HBAC_CATEGORY_ALL)
+        rule.targethosts.category.add(pyhbac.HBAC_CATEGORY_ALL)
+        return rule
+
+    def _request(self, user):
+        req = pyhbac.HbacRequest()
+        req.user.name = user
+        req.service.name = "ssh"
+        req.srchost.name = "host1"
+        req.targethost.name = "host2"
+        return req
+
+    def testInstantiate(self):
+        rules = [self._rule("allowUser1", "user1"),
+                 self._rule("allowUser2", "user2"),
+                 self._rule("disabled", "user3", enabled=False)]
+
+        ruleset = pyhbac.HbacRuleSet(rules)
+        self.assertEqual(len(ruleset), 2)
+        self.assertEqual(len(pyhbac.HbacRuleSet([])), 0)
+
+        self.assertRaises(TypeError, pyhbac.HbacRuleSet)
+        self.assertRaises(TypeError, pyhbac.HbacRuleSet, None)
+        self.assertRaises(TypeError, pyhbac.HbacRuleSet, (rules[0], None))
+
+    def testEvaluate(self):
+        rule = self._rule("allowUser1", "user1")
+        ruleset = pyhbac.HbacRuleSet((rule,))
+
+        req = self._request("user1")
+        self.assertEqual(ruleset.evaluate(req), pyhbac.HBAC_EVAL_ALLOW)
+        self.assertEqual(req.rule_name, "allowUser1")
+
+        req.user.name = "user2"
+        self.assertEqual(ruleset.evaluate(req), pyhbac.HBAC_EVAL_DENY)
+        self.assertEqual(req.rule_name, None)
+
+        # The rule set keeps its own copy of the rules
+        rule.users.names = ["user2"]
+        self.assertEqual(ruleset.evaluate(req), pyhbac.HBAC_EVAL_DENY)
+        self.assertEqual(req.evaluate((rule,)), pyhbac.HBAC_EVAL_ALLOW)
+
+        self.assertRaises(TypeError, ruleset.evaluate, None)
+        self.assertRaises(TypeError, ruleset.evaluate, rule)
+
+    def testEvaluateMany(self):
+        ruleset = pyhbac.HbacRuleSet((self._rule("allowUser1", "user1"),
+                                      self._rule("allowUser2", "user2"),
+                                      self._rule("allowUser3", "user3",
+                                                 enabled=False)))
+
+        reqs = [self._request(user)
+                for user in ("user1", "user2", "user3", "user4")]
+        res = ruleset.evaluate_many(reqs)
+        self.assertEqual(res, [pyhbac.HBAC_EVAL_ALLOW,
+                               pyhbac.HBAC_EVAL_ALLOW,
+                               pyhbac.HBAC_EVAL_DENY,
+                               pyhbac.HBAC_EVAL_DENY])
+        self.assertEqual([req.rule_name for req in reqs],
+                         ["allowUser1", "allowUser2", None, None])
+
+        # Results must match evaluation of single requests
+        for req, expected in zip(reqs, res):
+            self.assertEqual(ruleset.evaluate(req), expected)
+
+        # Any iterable of requests is accepted
+        self.assertEqual(ruleset.evaluate_many(iter(reqs)), res)
+
+        self.assertEqual(ruleset.evaluate_many(()), [])
+        self.assertRaises(TypeError, ruleset.evaluate_many, None)
+        self.assertRaises(TypeError, ruleset.evaluate_many, (reqs[0], None))
+
+
 class PyHbacModuleTest(unittest.TestCase):
     @classmethod
     def tearDownClass(cls):
@@ -578,6 +656,11 @@ if __name__ == "__main__":
     if not res.wasSuccessful():
         error |= 0x5
 
+    suite = loadTestsFromTestCase(PyHbacRuleSetTest)
+    res = unittest.TextTestRunner().run(suite)
+    if not res.wasSuccessful():
+        error |= 0x7
+
     suite = loadTestsFromTestCase(PyHbacModuleTest)
     res = unittest.TextTestRunner().run(suite)
     if not res.wasSuccessful():
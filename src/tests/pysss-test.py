@@ -23,7 +23,10 @@ from __future__ import print_function
 import unittest
 import sys
 import os
+import grp
+import pwd
 import tempfile
+import time
 
 BUILD_DIR = os.getenv('builddir') or "."
 TEST_DIR = os.path.realpath(os.getenv('SSS_TEST_DIR') or ".")
@@ -75,6 +78,103 @@ class PysssEncryptTest(unittest.TestCase):
         self.assertNotEqual(val1, val2)
 
 
+class PysssGetgrouplistTest(unittest.TestCase):
+    def setUp(self):
+        self.user = pwd.getpwuid(os.getuid())
+        self.groups = tuple(grp.getgrgid(gid).gr_name
+                            for gid in os.getgrouplist(self.user.pw_name,
+                                                       self.user.pw_gid))
+
+    def tearDown(self):
+        pysss.set_group_cache_ttl(0)
+
+    def test_getgrouplist(self):
+        groups = pysss.getgrouplist(self.user.pw_name)
+        self.assertEqual(groups, self.groups)
+
+    def other_user(self):
+        """ A user none of whose groups the test user belongs to """
+        gids = set(os.getgrouplist(self.user.pw_name, self.user.pw_gid))
+        for user in pwd.getpwall():
+            try:
+                other_gids = set(os.getgrouplist(user.pw_name, user.pw_gid))
+                for gid in other_gids:
+                    grp.getgrgid(gid)
+            except (KeyError, OSError):
+                continue
+            if other_gids and not other_gids & gids:
+                return user
+        self.skipTest("no user with other groups")
+
+    def assertReused(self, groups, cached):
+        """ Cached names are returned as the same objects """
+        self.assertEqual(groups, cached)
+        for name, cached_name in zip(groups, cached):
+            self.assertIs(name, cached_name)
+
+    def assertResolved(self, groups, cached):
+        """ Names which are resolved again are new objects """
+        self.assertEqual(groups, cached)
+        for name, cached_name in zip(groups, cached):
+            # one character names are shared by the interpreter
+            if len(name) > 1:
+                self.assertIsNot(name, cached_name)
+
+    def test_getgrouplist_no_cache(self):
+        groups = pysss.getgrouplist(self.user.pw_name)
+        self.assertResolved(pysss.getgrouplist(self.user.pw_name), groups)
+
+    def test_getgrouplist_cache(self):
+        groups = pysss.getgrouplist(self.user.pw_name, 60)
+        self.assertEqual(groups, self.groups)
+        self.assertReused(pysss.getgrouplist(self.user.pw_name, 60), groups)
+
+        pysss.set_group_cache_ttl(60)
+        self.assertReused(pysss.getgrouplist(self.user.pw_name), groups)
+
+    def test_getgrouplist_cache_cleared(self):
+        pysss.set_group_cache_ttl(60)
+        groups = pysss.getgrouplist(self.user.pw_name)
+
+        pysss.clear_group_cache()
+        cached = pysss.getgrouplist(self.user.pw_name)
+        self.assertResolved(cached, groups)
+        self.assertReused(pysss.getgrouplist(self.user.pw_name), cached)
+
+        pysss.set_group_cache_ttl(0)
+        self.assertResolved(pysss.getgrouplist(self.user.pw_name, 60),
+                            cached)
+
+    def test_getgrouplist_cache_expired(self):
+        groups = pysss.getgrouplist(self.user.pw_name, 0.01)
+        self.assertEqual(groups, self.groups)
+
+        # Expired names are resolved again
+        time.sleep(0.02)
+        self.assertResolved(pysss.getgrouplist(self.user.pw_name, 0.01),
+                            groups)
+
+    def test_getgrouplist_cache_max_size(self):
+        other = self.other_user()
+        pysss.set_group_cache_ttl(60, len(self.groups))
+        groups = pysss.getgrouplist(self.user.pw_name)
+        self.assertReused(pysss.getgrouplist(self.user.pw_name), groups)
+
+        # The names of the other user do not fit, none has expired so all
+        # names are dropped to make room for them
+        other_groups = pysss.getgrouplist(other.pw_name)
+        self.assertResolved(pysss.getgrouplist(self.user.pw_name), groups)
+        self.assertResolved(pysss.getgrouplist(other.pw_name), other_groups)
+
+    def test_getgrouplist_invalid(self):
+        self.assertRaises(KeyError, pysss.getgrouplist,
+                          "no_such_user_for_pysss_test")
+        self.assertRaises(ValueError, pysss.getgrouplist,
+                          self.user.pw_name, -1)
+        self.assertRaises(ValueError, pysss.set_group_cache_ttl, -1)
+        self.assertRaises(ValueError, pysss.set_group_cache_ttl, 60, 0)
+
+
 if __name__ == "__main__":
     error = 0
 
@@ -97,4 +197,9 @@ if __name__ == "__main__":
     if not res.wasSuccessful():
         error |= 0x2
 
+    suite = loadTestsFromTestCase(PysssGetgrouplistTest)
+    res = unittest.TextTestRunner().run(suite)
+    if not res.wasSuccessful():
+        error |= 0x4
+
     sys.exit(error)
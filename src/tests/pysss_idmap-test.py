@@ -0,0 +1,221 @@
+#!/usr/bin/env python
+#  SSSD
+#
+#  Unit tests for pysss_idmap
+#
+#  Copyright (C) 2026 Red Hat
+#
+#  This program is free software; you can redistribute it and/or modify
+#  it under the terms of the GNU General Public License as published by
+#  the Free Software Foundation; either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public License
+#  along with this program.  If not, see <http://www.gnu.org/licenses/>.
+from __future__ import print_function
+
+import array
+import unittest
+import sys
+import os
+import tempfile
+
+BUILD_DIR = os.getenv('builddir') or "."
+TEST_DIR = os.path.realpath(os.getenv('SSS_TEST_DIR') or ".")
+MODPATH = tempfile.mkdtemp(prefix="tp_pysss_idmap_", dir=TEST_DIR)
+
+DOM_NAME = "test.example"
+DOM_SID = "S-1-5-21-2153326666-2176343378-3404031434"
+
+
+class PySssIdmapImport(unittest.TestCase):
+    def setUp(self):
+        " Make sure we load the in-tree module "
+        self.system_path = sys.path[:]
+        sys.path = [MODPATH]
+
+    def tearDown(self):
+        " Restore the system path "
+        sys.path = self.system_path
+
+    def testImport(self):
+        " Import the module and assert it comes from tree "
+        try:
+            dest_module_path = MODPATH + "/pysss_idmap.so"
+
+            if sys.version_info[0] > 2:
+                src_module_path = BUILD_DIR + "/.libs/_py3sss_idmap.so"
+            else:
+                src_module_path = BUILD_DIR + "/.libs/_py2sss_idmap.so"
+
+            src_module_path = os.path.abspath(src_module_path)
+            os.symlink(src_module_path, dest_module_path)
+
+            import pysss_idmap
+        except ImportError as e:
+            print("Could not load the pysss_idmap module. "
+                  "Please check if it is compiled", file=sys.stderr)
+            raise e
+        self.assertEqual(os.path.realpath(pysss_idmap.__file__),
+                         os.path.realpath(MODPATH + "/pysss_idmap.so"))
+
+
+class PySssIdmapTestNeg(unittest.TestCase):
+    def test_invalid_ranges(self):
+        self.assertRaises(ValueError, pysss_idmap.IdmapContext,
+                          range_size=0)
+        self.assertRaises(ValueError, pysss_idmap.IdmapContext,
+                          range_min=1000, range_max=1000)
+        self.assertRaises(ValueError, pysss_idmap.IdmapContext,
+                          range_min=1000, range_max=2000, range_size=2000)
+
+    def test_no_domain(self):
+        ctx = pysss_idmap.IdmapContext()
+
+        with self.assertRaises(pysss_idmap.IdmapError) as cm:
+            ctx.sid_to_unix(DOM_SID + "-500")
+        self.assertEqual(cm.exception.args[0], pysss_idmap.IDMAP_NO_DOMAIN)
+
+        # Bulk functions report unknown domains per item
+        self.assertEqual(ctx.sids_to_unix([DOM_SID + "-500"]), [None])
+        self.assertEqual(ctx.unix_to_sids([200500]), [None])
+
+    def test_invalid_arguments(self):
+        ctx = pysss_idmap.IdmapContext(default_domain_sid=DOM_SID)
+
+        self.assertRaises(ValueError, ctx.unix_to_sid, -1)
+        self.assertRaises(ValueError, ctx.unix_to_sids, [2 ** 32])
+        self.assertRaises(TypeError, ctx.sids_to_unix, DOM_SID + "-500")
+        self.assertRaises(TypeError, ctx.sids_to_unix, [500])
+        self.assertRaises(ValueError, ctx.add_domain, "other",
+                          "S-1-5-21-1-2-3", 20000)
+
+    def test_collision(self):
+        ctx = pysss_idmap.IdmapContext()
+        ctx.add_domain(DOM_NAME, DOM_SID, 0)
+
+        with self.assertRaises(pysss_idmap.IdmapError) as cm:
+            ctx.add_domain("other", "S-1-5-21-1-2-3", 0)
+        self.assertEqual(cm.exception.args[0], pysss_idmap.IDMAP_COLLISION)
+
+
+class PySssIdmapTestPos(unittest.TestCase):
+    @classmethod
+    def tearDownClass(cls):
+        os.unlink(MODPATH + "/pysss_idmap.so")
+        os.rmdir(MODPATH)
+
+    def test_calculate_range(self):
+        ctx = pysss_idmap.IdmapContext()
+
+        self.assertEqual(ctx.calculate_range(DOM_SID, 0),
+                         (0, 200000, 399999))
+        self.assertEqual(ctx.calculate_range(DOM_SID, slice=3),
+                         (3, 800000, 999999))
+
+        # The same slice is selected for the same SID
+        self.assertEqual(ctx.calculate_range(DOM_SID),
+                         ctx.calculate_range(DOM_SID))
+
+    def test_default_domain(self):
+        ctx = pysss_idmap.IdmapContext(default_domain=DOM_NAME,
+                                       default_domain_sid=DOM_SID)
+
+        self.assertEqual(ctx.sid_to_unix(DOM_SID + "-500"), 200500)
+        self.assertEqual(ctx.unix_to_sid(200500), DOM_SID + "-500")
+
+    def test_add_domain(self):
+        ctx = pysss_idmap.IdmapContext(range_min=10000, range_max=110000,
+                                       range_size=10000, helper_table_size=0)
+
+        self.assertEqual(ctx.add_domain(DOM_NAME, DOM_SID, 2), 2)
+        self.assertEqual(ctx.sid_to_unix(DOM_SID + "-1000"), 31000)
+
+        slice_num = ctx.add_domain("other", "S-1-5-21-1-2-3")
+        self.assertNotEqual(slice_num, 2)
+        self.assertEqual(ctx.sid_to_unix("S-1-5-21-1-2-3-5"),
+                         10000 + slice_num * 10000 + 5)
+
+    def test_add_range(self):
+        ctx = pysss_idmap.IdmapContext()
+
+        ctx.add_range(DOM_NAME, DOM_SID, 1000000, 1199999,
+                      range_id="range1", first_rid=1000)
+        self.assertEqual(ctx.sid_to_unix(DOM_SID + "-1005"), 1000005)
+        self.assertEqual(ctx.unix_to_sid(1000005), DOM_SID + "-1005")
+
+        ctx.add_range("external", "S-1-5-21-1-2-3", 2000000, 2199999,
+                      external=True)
+        with self.assertRaises(pysss_idmap.IdmapError) as cm:
+            ctx.sid_to_unix("S-1-5-21-1-2-3-1005")
+        self.assertEqual(cm.exception.args[0], pysss_idmap.IDMAP_EXTERNAL)
+
+    def test_bulk(self):
+        ctx = pysss_idmap.IdmapContext(default_domain_sid=DOM_SID)
+
+        sids = [DOM_SID + "-%d" % rid for rid in range(500, 600)]
+        ids = ctx.sids_to_unix(sids)
+        self.assertEqual(ids, list(range(200500, 200600)))
+        self.assertEqual(ctx.unix_to_sids(ids), sids)
+        self.assertEqual(ctx.unix_to_sids(array.array('I', ids)), sids)
+        self.assertEqual(ctx.unix_to_sids(tuple(ids)), sids)
+
+        self.assertEqual(ctx.sids_to_unix([]), [])
+        self.assertEqual(ctx.unix_to_sids([]), [])
+
+    def test_bulk_unmappable(self):
+        ctx = pysss_idmap.IdmapContext(default_domain_sid=DOM_SID)
+
+        ids = ctx.sids_to_unix([DOM_SID + "-500", "S-1-5-32-544",
+                                "S-1-5-21-1-2-3-500", "invalid"])
+        self.assertEqual(ids, [200500, None, None, None])
+
+        sids = ctx.unix_to_sids([200500, 100])
+        self.assertEqual(sids, [DOM_SID + "-500", None])
+
+    def test_bulk_buffer(self):
+        ctx = pysss_idmap.IdmapContext(default_domain_sid=DOM_SID)
+
+        buf = ("%s-500\n%s-501\r\n\n  %s-502 S-1-5-32-544\n" %
+               (DOM_SID, DOM_SID, DOM_SID)).encode('utf-8')
+        self.assertEqual(ctx.sids_to_unix(buf),
+                         [200500, 200501, 200502, None])
+        self.assertEqual(ctx.sids_to_unix(b""), [])
+
+    def test_error_string(self):
+        self.assertEqual(
+            pysss_idmap.idmap_error_string(pysss_idmap.IDMAP_SUCCESS),
+            "IDMAP operation successful")
+
+
+if __name__ == "__main__":
+    error = 0
+
+    suite = unittest.TestLoader().loadTestsFromTestCase(PySssIdmapImport)
+    res = unittest.TextTestRunner().run(suite)
+    if not res.wasSuccessful():
+        error |= 0x1
+        # need to bail out here because pysss_idmap could not be imported
+        sys.exit(error)
+
+    # import the pysss_idmap module into the global namespace, but make sure
+    # it's the one in tree
+    sys.path.insert(0, MODPATH)
+    import pysss_idmap
+
+    suite = unittest.TestLoader().loadTestsFromTestCase(PySssIdmapTestNeg)
+    res = unittest.TextTestRunner().run(suite)
+    if not res.wasSuccessful():
+        error |= 0x2
+
+    suite = unittest.TestLoader().loadTestsFromTestCase(PySssIdmapTestPos)
+    res = unittest.TextTestRunner().run(suite)
+    if not res.wasSuccessful():
+        error |= 0x4
+
+    sys.exit(error)
@@ -19,6 +19,7 @@
 #  along with this program.  If not, see <http://www.gnu.org/licenses/>.
 from __future__ import print_function
 
+import array
 import unittest
 import sys
 import os
@@ -80,6 +81,32 @@ class PySssMurmurTestNeg(unittest.TestCase):
         self.assertRaises(ValueError, pysss_murmur.murmurhash3, "test",
                           0xffffffffff, seed)
 
+    def test_many_invalid_arguments(self):
+        seed = 12345
+
+        self.assertRaises(TypeError, pysss_murmur.murmurhash3_many,
+                          "test", seed)
+        self.assertRaises(TypeError, pysss_murmur.murmurhash3_many,
+                          ["test", 1], seed)
+        self.assertRaises(ValueError, pysss_murmur.murmurhash3_many,
+                          ["test"], 0xffffffffff)
+
+    def test_many_invalid_offsets(self):
+        seed = 12345
+
+        self.assertRaises(ValueError, pysss_murmur.murmurhash3_many,
+                          b"test", seed, [])
+        self.assertRaises(ValueError, pysss_murmur.murmurhash3_many,
+                          b"test", seed, [0, 5])
+        self.assertRaises(ValueError, pysss_murmur.murmurhash3_many,
+                          b"test", seed, [2, 1])
+        self.assertRaises(ValueError, pysss_murmur.murmurhash3_many,
+                          b"test", seed, [0, -1])
+        self.assertRaises(ValueError, pysss_murmur.murmurhash3_many,
+                          b"test", seed, array.array('I', [0, 2, 5]))
+        self.assertRaises(TypeError, pysss_murmur.murmurhash3_many,
+                          b"test", seed, array.array('H', [0, 2]))
+
 
 class PySssMurmurTestPos(unittest.TestCase):
     @classmethod
@@ -110,6 +137,50 @@ class PySssMurmurTestPos(unittest.TestCase):
                                            input_len + 5, seed)
         self.assertEqual(val_bin, 2917868047)
 
+    def test_many(self):
+        seed = 0xdeadbeef
+        keys = ["S-1-5-21-2153326666-2176343378-3404031434",
+                "", "test_user1\0", "a" * 1000]
+        expected = [pysss_murmur.murmurhash3(key, len(key), seed)
+                    for key in keys]
+
+        hashes = pysss_murmur.murmurhash3_many(keys, seed)
+        self.assertEqual(hashes.typecode, 'I')
+        self.assertEqual(list(hashes), expected)
+        self.assertEqual(hashes[0], 93103853)
+
+        hashes = pysss_murmur.murmurhash3_many(
+            [key.encode('utf-8') for key in keys], seed)
+        self.assertEqual(list(hashes), expected)
+
+        self.assertEqual(list(pysss_murmur.murmurhash3_many([], seed)), [])
+
+    def test_many_offsets(self):
+        seed = 0xbeefdead
+        keys = ["test_user1\0", "test_user2\0", "", "test_group\0"]
+        expected = [pysss_murmur.murmurhash3(key, len(key), seed)
+                    for key in keys]
+
+        data = "".join(keys).encode('utf-8')
+        offsets = [0]
+        for key in keys:
+            offsets.append(offsets[-1] + len(key))
+
+        hashes = pysss_murmur.murmurhash3_many(data, seed, offsets)
+        self.assertEqual(list(hashes), expected)
+        self.assertEqual(hashes[0], 1198610880)
+
+        hashes = pysss_murmur.murmurhash3_many(bytearray(data), seed,
+                                               array.array('I', offsets))
+        self.assertEqual(list(hashes), expected)
+
+        # Keys do not have to start at the beginning of the buffer
+        hashes = pysss_murmur.murmurhash3_many(data, seed, offsets[2:])
+        self.assertEqual(list(hashes), expected[2:])
+
+        self.assertEqual(
+            list(pysss_murmur.murmurhash3_many(data, seed, [0])), [])
+
 
 if __name__ == "__main__":
     error = 0
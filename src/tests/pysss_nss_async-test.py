@@ -0,0 +1,408 @@
+#!/usr/bin/env python3
+#  SSSD
+#
+#  Unit tests for pysss_nss_async
+#
+#  Copyright (C) 2026 Red Hat
+#
+#  This program is free software; you can redistribute it and/or modify
+#  it under the terms of the GNU General Public License as published by
+#  the Free Software Foundation; either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public License
+#  along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+import asyncio
+import errno
+import gc
+import unittest
+import struct
+import sys
+import os
+import tempfile
+import weakref
+
+BUILD_DIR = os.getenv('builddir') or "."
+TEST_DIR = os.path.realpath(os.getenv('SSS_TEST_DIR') or ".")
+MODPATH = tempfile.mkdtemp(prefix="tp_pysss_nss_async_", dir=TEST_DIR)
+SOCKET_PATH = MODPATH + "/nss"
+
+DOM_SID = "S-1-5-21-2153326666-2176343378-3404031434"
+
+USERS = {
+    "user1": (10001, 20001, "User One", "/home/user1", "/bin/bash"),
+    "user2": (10002, 20002, "User Two", "/home/user2", "/bin/sh"),
+}
+GROUPS = {
+    "group1": (20001, ["user1", "user2"]),
+    "group2": (20002, []),
+}
+INITGROUPS = {
+    "user1": [20001, 20002],
+    "user2": [20001],
+}
+SIDS = {
+    "user1": (DOM_SID + "-1001", 1, 10001),
+    "group1": (DOM_SID + "-2001", 2, 20001),
+}
+
+
+class FakeResponder(object):
+    """Minimal NSS responder answering from the tables above"""
+
+    def __init__(self, delay=0, version=1):
+        self.delay = delay
+        self.version = version
+        self.connections = 0
+        self.busy = 0
+        self.max_busy = 0
+        self.server = None
+        self.handlers = []
+
+    async def start(self):
+        self.server = await asyncio.start_unix_server(self.handle,
+                                                      path=SOCKET_PATH)
+
+    async def stop(self):
+        self.server.close()
+        await self.server.wait_closed()
+        for handler in self.handlers:
+            handler.cancel()
+        await asyncio.gather(*self.handlers, return_exceptions=True)
+        os.unlink(SOCKET_PATH)
+
+    async def handle(self, reader, writer):
+        self.connections += 1
+        self.handlers.append(asyncio.current_task())
+        try:
+            while True:
+                header = await reader.readexactly(16)
+                length, cmd, _, _ = struct.unpack("=4I", header)
+                data = await reader.readexactly(length - 16)
+
+                self.busy += 1
+                self.max_busy = max(self.max_busy, self.busy)
+                if self.delay and cmd != 0x0001:
+                    await asyncio.sleep(self.delay)
+                status, body = self.reply(cmd, data)
+                self.busy -= 1
+
+                writer.write(struct.pack("=4I", 16 + len(body), cmd, status,
+                                         0) + body)
+                await writer.drain()
+        except (asyncio.IncompleteReadError, asyncio.CancelledError,
+                ConnectionError):
+            pass
+        finally:
+            writer.close()
+
+    def reply(self, cmd, data):
+        empty = struct.pack("=2I", 0, 0)
+        found = struct.pack("=2I", 1, 0)
+
+        if cmd == 0x0001:
+            return 0, struct.pack("=I", self.version)
+
+        if cmd in (0x0011, 0x0012):
+            for name, (uid, gid, gecos, home, shell) in USERS.items():
+                if ((cmd == 0x0011 and data == name.encode() + b"\0")
+                        or (cmd == 0x0012 and data == struct.pack("=I", uid))):
+                    strings = [name, "*", gecos, home, shell]
+                    return 0, (found + struct.pack("=2I", uid, gid)
+                               + b"".join(s.encode() + b"\0" for s in strings))
+            return 0, empty
+
+        if cmd in (0x0021, 0x0022):
+            for name, (gid, members) in GROUPS.items():
+                if ((cmd == 0x0021 and data == name.encode() + b"\0")
+                        or (cmd == 0x0022 and data == struct.pack("=I", gid))):
+                    strings = [name, "*"] + members
+                    return 0, (found + struct.pack("=2I", gid, len(members))
+                               + b"".join(s.encode() + b"\0" for s in strings))
+            return 0, empty
+
+        if cmd == 0x0026:
+            gids = INITGROUPS.get(data[:-1].decode(), [])
+            return 0, (struct.pack("=2I", len(gids), 0)
+                       + struct.pack("=%dI" % len(gids), *gids))
+
+        if cmd == 0x0111:
+            if data == b"error\0":
+                return errno.EIO, b""
+            entry = SIDS.get(data[:-1].decode())
+            if entry is None:
+                return 0, empty
+            return 0, (found + struct.pack("=I", entry[1])
+                       + entry[0].encode() + b"\0")
+
+        if cmd in (0x0113, 0x0114):
+            for name, (sid, id_type, posix_id) in SIDS.items():
+                if data == sid.encode() + b"\0":
+                    if cmd == 0x0113:
+                        return 0, (found + struct.pack("=I", id_type)
+                                   + name.encode() + b"\0")
+                    return 0, found + struct.pack("=2I", id_type, posix_id)
+            return 0, empty
+
+        return errno.ENOSYS, b""
+
+
+def run(coro):
+    loop = asyncio.new_event_loop()
+    try:
+        return loop.run_until_complete(coro)
+    finally:
+        loop.close()
+
+
+def run_with_responder(coro_func, **kwargs):
+    async def run_responder():
+        responder = FakeResponder(**kwargs)
+        await responder.start()
+        try:
+            async with pysss_nss_async.NssClient(SOCKET_PATH) as client:
+                return await coro_func(client, responder)
+        finally:
+            await responder.stop()
+
+    return run(run_responder())
+
+
+class PysssNssAsyncImport(unittest.TestCase):
+    def setUp(self):
+        " Make sure we load the in-tree module "
+        self.system_path = sys.path[:]
+        sys.path = [MODPATH] + self.system_path
+
+    def tearDown(self):
+        " Restore the system path "
+        sys.path = self.system_path
+
+    def testImport(self):
+        " Import the module and assert it comes from tree "
+        try:
+            dest_module_path = MODPATH + "/pysss_nss_async.py"
+            src_module_path = BUILD_DIR + "/src/python/pysss_nss_async.py"
+
+            src_module_path = os.path.abspath(src_module_path)
+            os.symlink(src_module_path, dest_module_path)
+            os.symlink(os.path.abspath(BUILD_DIR
+                                       + "/src/python/pysss_nss_protocol.py"),
+                       MODPATH + "/pysss_nss_protocol.py")
+
+            import pysss_nss_async
+        except ImportError as e:
+            print("Could not load the pysss_nss_async module. "
+                  "Please check if it is generated", file=sys.stderr)
+            raise e
+        self.assertEqual(os.path.realpath(pysss_nss_async.__file__),
+                         os.path.realpath(src_module_path))
+
+
+class PysssNssAsyncTestNeg(unittest.TestCase):
+    def test_not_found(self):
+        async def lookups(client, responder):
+            with self.assertRaises(KeyError):
+                await client.getpwnam("nosuchuser")
+            with self.assertRaises(KeyError):
+                await client.getpwuid(99999)
+            with self.assertRaises(KeyError):
+                await client.getgrnam("nosuchgroup")
+            with self.assertRaises(KeyError):
+                await client.getsidbyname("nosuchuser")
+            with self.assertRaises(KeyError):
+                await client.getidbysid(DOM_SID + "-9999")
+            self.assertEqual(await client.initgroups("nosuchuser"), [])
+
+        run_with_responder(lookups)
+
+    def test_invalid_arguments(self):
+        async def lookups(client, responder):
+            with self.assertRaises(ValueError):
+                await client.getpwnam("")
+            with self.assertRaises(ValueError):
+                await client.getpwnam("a" * 256)
+            with self.assertRaises(ValueError):
+                await client.getpwnam("user\0")
+            with self.assertRaises(ValueError):
+                await client.getpwuid(-1)
+            with self.assertRaises(ValueError):
+                await client.getgrgid(2 ** 32)
+            with self.assertRaises(ValueError):
+                await client.getnamebysid("not-a-sid")
+
+        run_with_responder(lookups)
+
+    def test_responder_error(self):
+        async def lookups(client, responder):
+            with self.assertRaises(OSError) as cm:
+                await client.getsidbyname("error")
+            self.assertEqual(cm.exception.errno, errno.EIO)
+
+            # The client recovers with a new connection
+            sid = await client.getsidbyname("user1")
+            self.assertEqual(sid, (DOM_SID + "-1001", 1))
+            self.assertEqual(responder.connections, 2)
+
+        run_with_responder(lookups)
+
+    def test_protocol_version(self):
+        async def lookups(client, responder):
+            with self.assertRaises(OSError) as cm:
+                await client.getpwnam("user1")
+            self.assertEqual(cm.exception.errno, errno.EPROTONOSUPPORT)
+
+        run_with_responder(lookups, version=2)
+
+    def test_no_responder(self):
+        async def lookups():
+            client = pysss_nss_async.NssClient(MODPATH + "/missing")
+            with self.assertRaises(OSError):
+                await client.getpwnam("user1")
+
+        run(lookups())
+
+    def test_timeout(self):
+        async def lookups(client, responder):
+            client.timeout = 0.1
+            with self.assertRaises(OSError) as cm:
+                await client.getpwnam("user1")
+            self.assertEqual(cm.exception.errno, errno.ETIME)
+
+        run_with_responder(lookups, delay=1)
+
+
+class PysssNssAsyncTestPos(unittest.TestCase):
+    @classmethod
+    def tearDownClass(cls):
+        os.unlink(MODPATH + "/pysss_nss_async.py")
+        os.unlink(MODPATH + "/pysss_nss_protocol.py")
+        os.rmdir(MODPATH)
+
+    def test_passwd(self):
+        async def lookups(client, responder):
+            pw = await client.getpwnam("user1")
+            self.assertEqual(tuple(pw), ("user1", "*", 10001, 20001,
+                                         "User One", "/home/user1",
+                                         "/bin/bash"))
+            self.assertEqual(pw.pw_dir, "/home/user1")
+
+            pw = await client.getpwuid(10002)
+            self.assertEqual(pw.pw_name, "user2")
+            self.assertEqual(pw.pw_shell, "/bin/sh")
+
+        run_with_responder(lookups)
+
+    def test_group(self):
+        async def lookups(client, responder):
+            gr = await client.getgrnam("group1")
+            self.assertEqual(tuple(gr), ("group1", "*", 20001,
+                                         ["user1", "user2"]))
+
+            gr = await client.getgrgid(20002)
+            self.assertEqual(gr.gr_name, "group2")
+            self.assertEqual(gr.gr_mem, [])
+
+        run_with_responder(lookups)
+
+    def test_initgroups(self):
+        async def lookups(client, responder):
+            self.assertEqual(await client.initgroups("user1"), [20001, 20002])
+            self.assertEqual(await client.initgroups("user2"), [20001])
+
+        run_with_responder(lookups)
+
+    def test_idmap(self):
+        async def lookups(client, responder):
+            self.assertEqual(await client.getsidbyname("group1"),
+                             (DOM_SID + "-2001", pysss_nss_async.ID_GROUP))
+            self.assertEqual(await client.getnamebysid(DOM_SID + "-1001"),
+                             ("user1", pysss_nss_async.ID_USER))
+            self.assertEqual(await client.getidbysid(DOM_SID + "-2001"),
+                             (20001, pysss_nss_async.ID_GROUP))
+
+        run_with_responder(lookups)
+
+    def test_multiplexing(self):
+        async def lookups(client, responder):
+            client.max_connections = 4
+            names = ["user1", "user2"] * 10
+
+            result = await asyncio.gather(*(client.getpwnam(name)
+                                            for name in names))
+            self.assertEqual([pw.pw_name for pw in result], names)
+            self.assertEqual(responder.max_busy, 4)
+            self.assertEqual(responder.connections, 4)
+
+            # Idle connections are reused
+            await client.getpwnam("user1")
+            self.assertEqual(responder.connections, 4)
+
+        run_with_responder(lookups, delay=0.05)
+
+    def test_module_lookups(self):
+        async def lookups():
+            responder = FakeResponder()
+            await responder.start()
+            try:
+                pw = await pysss_nss_async.getpwnam("user1")
+                self.assertEqual(pw.pw_uid, 10001)
+                gr = await pysss_nss_async.getgrgid(20002)
+                self.assertEqual(gr.gr_name, "group2")
+                self.assertEqual(responder.connections, 2)
+
+                # The connections are closed once the lookups are done
+                await asyncio.gather(*responder.handlers)
+            finally:
+                await responder.stop()
+
+        socket_name = pysss_nss_async.SSS_NSS_SOCKET_NAME
+        pysss_nss_async.SSS_NSS_SOCKET_NAME = SOCKET_PATH
+        try:
+            loop = asyncio.new_event_loop()
+            try:
+                loop.run_until_complete(lookups())
+            finally:
+                loop.close()
+        finally:
+            pysss_nss_async.SSS_NSS_SOCKET_NAME = socket_name
+
+        # Nothing keeps the closed event loop alive
+        loop_ref = weakref.ref(loop)
+        del loop
+        gc.collect()
+        self.assertIsNone(loop_ref())
+
+
+if __name__ == "__main__":
+    error = 0
+
+    suite = unittest.TestLoader().loadTestsFromTestCase(PysssNssAsyncImport)
+    res = unittest.TextTestRunner().run(suite)
+    if not res.wasSuccessful():
+        error |= 0x1
+        # need to bail out here because pysss_nss_async could not be imported
+        sys.exit(error)
+
+    # import the pysss_nss_async module into the global namespace, but make
+    # sure it's the one in tree
+    sys.path.insert(0, MODPATH)
+    import pysss_nss_async
+
+    suite = unittest.TestLoader().loadTestsFromTestCase(PysssNssAsyncTestNeg)
+    res = unittest.TextTestRunner().run(suite)
+    if not res.wasSuccessful():
+        error |= 0x2
+
+    suite = unittest.TestLoader().loadTestsFromTestCase(PysssNssAsyncTestPos)
+    res = unittest.TextTestRunner().run(suite)
+    if not res.wasSuccessful():
+        error |= 0x4
+
+    sys.exit(error)
@@ -0,0 +1,474 @@
+#!/usr/bin/env python3
+#  SSSD
+#
+#  Unit tests for pysss_nss_mc
+#
+#  Copyright (C) 2026 Red Hat
+#
+#  This program is free software; you can redistribute it and/or modify
+#  it under the terms of the GNU General Public License as published by
+#  the Free Software Foundation; either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public License
+#  along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+import unittest
+import socket
+import struct
+import sys
+import os
+import tempfile
+import threading
+import time
+
+BUILD_DIR = os.getenv('builddir') or "."
+TEST_DIR = os.path.realpath(os.getenv('SSS_TEST_DIR') or ".")
+MODPATH = tempfile.mkdtemp(prefix="tp_pysss_nss_mc_", dir=TEST_DIR)
+MCPATH = MODPATH + "/mc"
+SOCKET_PATH = MODPATH + "/nss"
+
+DOM_SID = "S-1-5-21-2153326666-2176343378-3404031434"
+
+MC_SLOT_SIZE = 40
+MC_HEADER_SIZE = 56
+MC_INVALID_VAL = 0xFFFFFFFF
+BARRIER = 0xf0000001
+
+
+class McWriter(object):
+    """Writes memory cache files the way the NSS responder does"""
+
+    def __init__(self, name, seed=0x5eed, ht_elems=64, slots=256):
+        self.path = MCPATH + "/" + name
+        self.seed = seed
+        self.ht_elems = ht_elems
+        self.slots = slots
+        self.dt_size = slots * MC_SLOT_SIZE
+        self.data_table = bytearray(self.dt_size)
+        self.hash_table = [MC_INVALID_VAL] * ht_elems
+        self.next_slot = 0
+        self.status = 1
+        self.major = 1
+
+    def hash(self, key):
+        return (pysss_murmur.murmurhash3(key, len(key), self.seed) %
+                self.ht_elems)
+
+    def _rec_field(self, slot, offset, fmt, value=None):
+        pos = slot * MC_SLOT_SIZE + offset
+        if value is None:
+            return struct.unpack_from(fmt, self.data_table, pos)[0]
+        struct.pack_into(fmt, self.data_table, pos, value)
+
+    def _chain(self, slot, hash_val):
+        cur = self.hash_table[hash_val]
+        if cur == MC_INVALID_VAL:
+            self.hash_table[hash_val] = slot
+            return
+
+        while True:
+            if cur == slot:
+                return
+            if self._rec_field(cur, 24, "=I") == hash_val:
+                next_off = 16
+            else:
+                next_off = 20
+            nxt = self._rec_field(cur, next_off, "=I")
+            if nxt == MC_INVALID_VAL:
+                self._rec_field(cur, next_off, "=I", slot)
+                return
+            cur = nxt
+
+    def add(self, key1, key2, data, ttl=300):
+        slot = self.next_slot
+        length = MC_SLOT_SIZE + len(data)
+        self.next_slot += (length + MC_SLOT_SIZE - 1) // MC_SLOT_SIZE
+
+        hash1 = self.hash(key1)
+        hash2 = self.hash(key2)
+        struct.pack_into("=IIQIIIIII", self.data_table, slot * MC_SLOT_SIZE,
+                         BARRIER, length, int(time.time()) + ttl,
+                         MC_INVALID_VAL, MC_INVALID_VAL, hash1, hash2, 0,
+                         BARRIER)
+        start = slot * MC_SLOT_SIZE + MC_SLOT_SIZE
+        self.data_table[start:start + len(data)] = data
+
+        self._chain(slot, hash1)
+        self._chain(slot, hash2)
+        return slot
+
+    def add_passwd(self, name, uid, gid, **kwargs):
+        strs = b"".join(s.encode() + b"\0" for s in
+                        [name, "x", "gecos " + name, "/home/" + name,
+                         "/bin/sh"])
+        data = struct.pack("=4I", 16, uid, gid, len(strs)) + strs
+        return self.add(name.encode() + b"\0", b"%d\0" % uid, data, **kwargs)
+
+    def add_group(self, name, gid, members, **kwargs):
+        strs = b"".join(s.encode() + b"\0" for s in [name, "x"] + members)
+        data = struct.pack("=4I", 16, gid, len(members), len(strs)) + strs
+        return self.add(name.encode() + b"\0", b"%d\0" % gid, data, **kwargs)
+
+    def add_initgr(self, name, gids, **kwargs):
+        strs = name.encode() + b"\0" + name.encode() + b"@test\0"
+        gid_data = struct.pack("=%dI" % len(gids), *gids)
+        strs_ptr = 24 + len(gid_data)
+        data = struct.pack("=6I", strs_ptr + len(name) + 1, strs_ptr,
+                           strs_ptr, len(strs), len(gid_data) + len(strs),
+                           len(gids)) + gid_data + strs
+        return self.add(name.encode() + b"\0",
+                        name.encode() + b"@test\0", data, **kwargs)
+
+    def add_sid(self, sid, posix_id, id_type, populated_by=0, **kwargs):
+        sid_str = sid.encode() + b"\0"
+        data = struct.pack("=5I", 20, id_type, posix_id, populated_by,
+                           len(sid_str)) + sid_str
+        key_type = 2 if id_type == 2 else 1
+        return self.add(sid_str, b"%d-%d\0" % (key_type, posix_id), data,
+                        **kwargs)
+
+    def write(self):
+        ft_size = self.slots // 8
+        data_table = MC_HEADER_SIZE
+        free_table = data_table + self.dt_size
+        hash_table = free_table + ft_size
+        header = struct.pack("=13I", BARRIER, self.major, 1, self.status,
+                             self.seed, self.dt_size, ft_size,
+                             self.ht_elems * 4, data_table, free_table,
+                             hash_table, 0, BARRIER)
+        header += b"\0" * (MC_HEADER_SIZE - len(header))
+        content = (header + bytes(self.data_table) + b"\0" * ft_size
+                   + struct.pack("=%dI" % self.ht_elems, *self.hash_table))
+
+        # the responder replaces the file when it is recreated
+        tmp_path = self.path + ".tmp"
+        with open(tmp_path, "wb") as f:
+            f.write(content)
+        os.rename(tmp_path, self.path)
+
+    def corrupt_barrier(self, slot):
+        self._rec_field(slot, 36, "=I", BARRIER + 1)
+
+
+class FakeResponder(threading.Thread):
+    """NSS responder answering every lookup by name with one user"""
+
+    def __init__(self):
+        super(FakeResponder, self).__init__()
+        self.daemon = True
+        self.requests = []
+        self.sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        self.sock.bind(SOCKET_PATH)
+        self.sock.listen(5)
+
+    def recv(self, conn, length):
+        data = b""
+        while len(data) < length:
+            chunk = conn.recv(length - len(data))
+            if not chunk:
+                raise EOFError()
+            data += chunk
+        return data
+
+    def run(self):
+        while True:
+            try:
+                conn, _ = self.sock.accept()
+            except OSError:
+                return
+            with conn:
+                try:
+                    while True:
+                        self.serve(conn)
+                except (EOFError, OSError):
+                    pass
+
+    def serve(self, conn):
+        length, cmd, _, _ = struct.unpack("=4I", self.recv(conn, 16))
+        data = self.recv(conn, length - 16)
+        if cmd == 0x0001:
+            body = struct.pack("=I", 1)
+        else:
+            self.requests.append((cmd, data))
+            name = data[:-1].decode()
+            if name == "responder":
+                strs = b"".join(s.encode() + b"\0" for s in
+                                [name, "x", "", "/", "/bin/sh"])
+                body = struct.pack("=4I", 1, 0, 30000, 30000) + strs
+            else:
+                body = struct.pack("=2I", 0, 0)
+        conn.sendall(struct.pack("=4I", 16 + len(body), cmd, 0, 0) + body)
+
+    def stop(self):
+        self.sock.shutdown(socket.SHUT_RDWR)
+        self.sock.close()
+        os.unlink(SOCKET_PATH)
+
+
+def use_mcache_dir(path):
+    for cache in (pysss_nss_mc._passwd_mc, pysss_nss_mc._group_mc,
+                  pysss_nss_mc._initgr_mc, pysss_nss_mc._sid_mc):
+        cache.close()
+        cache.path = os.path.join(path, os.path.basename(cache.path))
+
+
+class PysssNssMcImport(unittest.TestCase):
+    def setUp(self):
+        " Make sure we load the in-tree modules "
+        self.system_path = sys.path[:]
+        sys.path = [MODPATH] + self.system_path
+
+    def tearDown(self):
+        " Restore the system path "
+        sys.path = self.system_path
+
+    def testImport(self):
+        " Import the module and assert it comes from tree "
+        try:
+            os.symlink(os.path.abspath(BUILD_DIR + "/.libs/_py3sss_murmur.so"),
+                       MODPATH + "/pysss_murmur.so")
+            for name in ("pysss_nss_protocol.py", "pysss_nss_mc.py"):
+                os.symlink(os.path.abspath(BUILD_DIR + "/src/python/" + name),
+                           MODPATH + "/" + name)
+
+            import pysss_nss_mc
+        except ImportError as e:
+            print("Could not load the pysss_nss_mc module. "
+                  "Please check if it is generated", file=sys.stderr)
+            raise e
+        self.assertEqual(os.path.realpath(pysss_nss_mc.__file__),
+                         os.path.realpath(BUILD_DIR
+                                          + "/src/python/pysss_nss_mc.py"))
+
+
+class PysssNssMcTestNeg(unittest.TestCase):
+    def setUp(self):
+        os.mkdir(MCPATH)
+        use_mcache_dir(MCPATH)
+
+    def tearDown(self):
+        use_mcache_dir(MCPATH)
+        for name in os.listdir(MCPATH):
+            os.unlink(os.path.join(MCPATH, name))
+        os.rmdir(MCPATH)
+
+    def test_no_cache(self):
+        self.assertIsNone(pysss_nss_mc.mc_getpwnam("user1"))
+        with self.assertRaises(KeyError):
+            pysss_nss_mc.getpwnam("user1", fallback=False)
+
+    def test_miss(self):
+        writer = McWriter("passwd")
+        writer.add_passwd("user1", 10001, 20001)
+        writer.write()
+
+        self.assertIsNone(pysss_nss_mc.mc_getpwnam("user2"))
+        self.assertIsNone(pysss_nss_mc.mc_getpwuid(10002))
+        with self.assertRaises(KeyError):
+            pysss_nss_mc.getpwuid(10002, fallback=False)
+
+    def test_expired(self):
+        writer = McWriter("passwd")
+        writer.add_passwd("user1", 10001, 20001, ttl=-10)
+        writer.write()
+
+        self.assertIsNone(pysss_nss_mc.mc_getpwnam("user1"))
+
+    def test_inconsistent_record(self):
+        writer = McWriter("passwd")
+        slot = writer.add_passwd("user1", 10001, 20001)
+        writer.corrupt_barrier(slot)
+        writer.write()
+
+        self.assertIsNone(pysss_nss_mc.mc_getpwnam("user1"))
+
+    def test_invalid_header(self):
+        writer = McWriter("passwd")
+        writer.add_passwd("user1", 10001, 20001)
+        writer.major = 2
+        writer.write()
+        self.assertIsNone(pysss_nss_mc.mc_getpwnam("user1"))
+
+        writer.major = 1
+        writer.status = 2
+        writer.write()
+        self.assertIsNone(pysss_nss_mc.mc_getpwnam("user1"))
+
+    def test_replaced_cache(self):
+        writer = McWriter("passwd")
+        writer.add_passwd("user1", 10001, 20001)
+        writer.write()
+        self.assertEqual(pysss_nss_mc.mc_getpwnam("user1").pw_uid, 10001)
+
+        # a new file with a new seed is picked up by the next lookup
+        writer = McWriter("passwd", seed=0xbeef)
+        writer.add_passwd("user1", 10005, 20005)
+        writer.write()
+        self.assertIsNone(pysss_nss_mc.mc_getpwnam("user1"))
+        self.assertEqual(pysss_nss_mc.mc_getpwnam("user1").pw_uid, 10005)
+
+    def test_disabled(self):
+        writer = McWriter("passwd")
+        writer.add_passwd("user1", 10001, 20001)
+        writer.write()
+
+        os.environ["SSS_NSS_USE_MEMCACHE"] = "NO"
+        try:
+            self.assertIsNone(pysss_nss_mc.mc_getpwnam("user1"))
+        finally:
+            del os.environ["SSS_NSS_USE_MEMCACHE"]
+        self.assertIsNotNone(pysss_nss_mc.mc_getpwnam("user1"))
+
+    def test_invalid_arguments(self):
+        self.assertRaises(ValueError, pysss_nss_mc.mc_getpwnam, "")
+        self.assertRaises(ValueError, pysss_nss_mc.mc_getpwuid, -1)
+        self.assertRaises(ValueError, pysss_nss_mc.mc_getidbysid, "1-2-3")
+
+
+class PysssNssMcTestPos(unittest.TestCase):
+    @classmethod
+    def tearDownClass(cls):
+        for name in ("pysss_murmur.so", "pysss_nss_protocol.py",
+                     "pysss_nss_mc.py"):
+            os.unlink(MODPATH + "/" + name)
+        os.rmdir(MODPATH)
+
+    def setUp(self):
+        os.mkdir(MCPATH)
+        use_mcache_dir(MCPATH)
+
+    def tearDown(self):
+        use_mcache_dir(MCPATH)
+        for name in os.listdir(MCPATH):
+            os.unlink(os.path.join(MCPATH, name))
+        os.rmdir(MCPATH)
+
+    def test_passwd(self):
+        writer = McWriter("passwd")
+        writer.add_passwd("user1", 10001, 20001)
+        writer.add_passwd("user2", 10002, 20002)
+        writer.write()
+
+        pw = pysss_nss_mc.getpwnam("user1", fallback=False)
+        self.assertEqual(tuple(pw), ("user1", "x", 10001, 20001,
+                                     "gecos user1", "/home/user1",
+                                     "/bin/sh"))
+        pw = pysss_nss_mc.getpwuid(10002, fallback=False)
+        self.assertEqual(pw.pw_name, "user2")
+
+    def test_collisions(self):
+        # a single hash bucket chains all names and IDs
+        writer = McWriter("passwd", ht_elems=1)
+        for i in range(20):
+            writer.add_passwd("user%d" % i, 10000 + i, 20000 + i)
+        writer.write()
+
+        for i in range(20):
+            self.assertEqual(pysss_nss_mc.mc_getpwnam("user%d" % i).pw_uid,
+                             10000 + i)
+            self.assertEqual(pysss_nss_mc.mc_getpwuid(10000 + i).pw_name,
+                             "user%d" % i)
+        self.assertIsNone(pysss_nss_mc.mc_getpwnam("user20"))
+
+    def test_group(self):
+        writer = McWriter("group")
+        writer.add_group("group1", 20001, ["user1", "user2"])
+        writer.add_group("group2", 20002, [])
+        writer.write()
+
+        gr = pysss_nss_mc.getgrnam("group1", fallback=False)
+        self.assertEqual(tuple(gr), ("group1", "x", 20001,
+                                     ["user1", "user2"]))
+        gr = pysss_nss_mc.getgrgid(20002, fallback=False)
+        self.assertEqual(gr.gr_name, "group2")
+        self.assertEqual(gr.gr_mem, [])
+
+    def test_initgroups(self):
+        writer = McWriter("initgroups")
+        writer.add_initgr("user1", [20001, 20002, 20003])
+        writer.write()
+
+        self.assertEqual(pysss_nss_mc.initgroups("user1", fallback=False),
+                         [20001, 20002, 20003])
+        self.assertIsNone(pysss_nss_mc.mc_initgroups("user2"))
+
+    def test_sid(self):
+        writer = McWriter("sid")
+        writer.add_sid(DOM_SID + "-1001", 10001, 1)
+        writer.add_sid(DOM_SID + "-2001", 20001, 2)
+        writer.add_sid(DOM_SID + "-2002", 20002, 2, populated_by=1)
+        writer.write()
+
+        self.assertEqual(pysss_nss_mc.getidbysid(DOM_SID + "-1001",
+                                                 fallback=False),
+                         (10001, 1))
+        self.assertEqual(pysss_nss_mc.mc_getsidbyuid(10001),
+                         (DOM_SID + "-1001", 1))
+        self.assertEqual(pysss_nss_mc.mc_getsidbygid(20001),
+                         (DOM_SID + "-2001", 2))
+        self.assertEqual(pysss_nss_mc.mc_getsidbyid(10001),
+                         (DOM_SID + "-1001", 1))
+        self.assertEqual(pysss_nss_mc.mc_getsidbyid(20001),
+                         (DOM_SID + "-2001", 2))
+
+        # Cached by a lookup by GID, a user with the ID might exist
+        self.assertEqual(pysss_nss_mc.mc_getsidbygid(20002),
+                         (DOM_SID + "-2002", 2))
+        self.assertIsNone(pysss_nss_mc.mc_getsidbyid(20002))
+
+    def test_fallback(self):
+        writer = McWriter("passwd")
+        writer.add_passwd("user1", 10001, 20001)
+        writer.write()
+
+        responder = FakeResponder()
+        responder.start()
+        pysss_nss_mc._responder.path = SOCKET_PATH
+        try:
+            self.assertEqual(pysss_nss_mc.getpwnam("user1").pw_uid, 10001)
+            self.assertEqual(responder.requests, [])
+
+            self.assertEqual(pysss_nss_mc.getpwnam("responder").pw_uid, 30000)
+            with self.assertRaises(KeyError):
+                pysss_nss_mc.getpwnam("nosuchuser")
+            self.assertEqual(responder.requests,
+                             [(0x0011, b"responder\0"),
+                              (0x0011, b"nosuchuser\0")])
+        finally:
+            pysss_nss_mc._responder.close()
+            responder.stop()
+
+
+if __name__ == "__main__":
+    error = 0
+
+    suite = unittest.TestLoader().loadTestsFromTestCase(PysssNssMcImport)
+    res = unittest.TextTestRunner().run(suite)
+    if not res.wasSuccessful():
+        error |= 0x1
+        # need to bail out here because pysss_nss_mc could not be imported
+        sys.exit(error)
+
+    # import the modules into the global namespace, but make sure they are
+    # the ones in tree
+    sys.path.insert(0, MODPATH)
+    import pysss_murmur
+    import pysss_nss_mc
+
+    suite = unittest.TestLoader().loadTestsFromTestCase(PysssNssMcTestNeg)
+    res = unittest.TextTestRunner().run(suite)
+    if not res.wasSuccessful():
+        error |= 0x2
+
+    suite = unittest.TestLoader().loadTestsFromTestCase(PysssNssMcTestPos)
+    res = unittest.TextTestRunner().run(suite)
+    if not res.wasSuccessful():
+        error |= 0x4
+
+    sys.exit(error)
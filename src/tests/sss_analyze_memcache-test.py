@@ -0,0 +1,344 @@
+#!/usr/bin/env python3
+#  SSSD
+#
+#  Unit tests for the memcache module of sss_analyze
+#
+#  Copyright (C) 2026 Red Hat
+#
+#  This program is free software; you can redistribute it and/or modify
+#  it under the terms of the GNU General Public License as published by
+#  the Free Software Foundation; either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public License
+#  along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+import unittest
+import shutil
+import struct
+import sys
+import os
+import tempfile
+import time
+
+BUILD_DIR = os.getenv('builddir') or "."
+SRC_DIR = os.getenv('ABS_TOP_SRCDIR') or "."
+TEST_DIR = os.path.realpath(os.getenv('SSS_TEST_DIR') or ".")
+MODPATH = tempfile.mkdtemp(prefix="tp_sss_analyze_memcache_", dir=TEST_DIR)
+MCPATH = MODPATH + "/mc"
+COPYPATH = MODPATH + "/copy"
+
+MC_SLOT_SIZE = 40
+MC_HEADER_SIZE = 56
+MC_INVALID_VAL = 0xFFFFFFFF
+BARRIER = 0xf0000001
+
+
+class McWriter(object):
+    """Writes memory cache files the way the NSS responder does"""
+
+    def __init__(self, path, seed=0x5eed, ht_elems=64, slots=256):
+        self.path = path
+        self.seed = seed
+        self.ht_elems = ht_elems
+        self.slots = slots
+        self.dt_size = slots * MC_SLOT_SIZE
+        self.data_table = bytearray(self.dt_size)
+        self.free_table = bytearray(slots // 8)
+        self.hash_table = [MC_INVALID_VAL] * ht_elems
+        self.next_slot = 0
+
+    def hash(self, key):
+        return (pysss_murmur.murmurhash3(key, len(key), self.seed) %
+                self.ht_elems)
+
+    def _rec_field(self, slot, offset, fmt, value=None):
+        pos = slot * MC_SLOT_SIZE + offset
+        if value is None:
+            return struct.unpack_from(fmt, self.data_table, pos)[0]
+        struct.pack_into(fmt, self.data_table, pos, value)
+
+    def _chain(self, slot, hash_val):
+        cur = self.hash_table[hash_val]
+        if cur == MC_INVALID_VAL:
+            self.hash_table[hash_val] = slot
+            return
+
+        while True:
+            if cur == slot:
+                return
+            if self._rec_field(cur, 24, "=I") == hash_val:
+                next_off = 16
+            else:
+                next_off = 20
+            nxt = self._rec_field(cur, next_off, "=I")
+            if nxt == MC_INVALID_VAL:
+                self._rec_field(cur, next_off, "=I", slot)
+                return
+            cur = nxt
+
+    def use_slots(self, slot, count):
+        for i in range(slot, slot + count):
+            self.free_table[i // 8] |= 0x80 >> (i % 8)
+
+    def add(self, key1, key2, data, expire):
+        slot = self.next_slot
+        length = MC_SLOT_SIZE + len(data)
+        count = (length + MC_SLOT_SIZE - 1) // MC_SLOT_SIZE
+        self.next_slot += count
+
+        hash1 = self.hash(key1)
+        hash2 = self.hash(key2)
+        struct.pack_into("=IIQIIIIII", self.data_table, slot * MC_SLOT_SIZE,
+                         BARRIER, length, expire,
+                         MC_INVALID_VAL, MC_INVALID_VAL, hash1, hash2, 0,
+                         BARRIER)
+        start = slot * MC_SLOT_SIZE + MC_SLOT_SIZE
+        self.data_table[start:start + len(data)] = data
+        self.use_slots(slot, count)
+
+        self._chain(slot, hash1)
+        self._chain(slot, hash2)
+        return slot
+
+    def add_passwd(self, name, uid, gid, expire):
+        strs = b"".join(s.encode() + b"\0" for s in
+                        [name, "x", "gecos " + name, "/home/" + name,
+                         "/bin/sh"])
+        data = struct.pack("=4I", 16, uid, gid, len(strs)) + strs
+        return self.add(name.encode() + b"\0", b"%d\0" % uid, data, expire)
+
+    def add_sid(self, sid, posix_id, id_type, expire):
+        sid_str = sid.encode() + b"\0"
+        data = struct.pack("=5I", 20, id_type, posix_id, 0,
+                           len(sid_str)) + sid_str
+        key_type = 2 if id_type == 2 else 1
+        return self.add(sid_str, b"%d-%d\0" % (key_type, posix_id), data,
+                        expire)
+
+    def write(self, mtime=None):
+        ft_size = len(self.free_table)
+        data_table = MC_HEADER_SIZE
+        free_table = data_table + self.dt_size
+        hash_table = free_table + ft_size
+        header = struct.pack("=13I", BARRIER, 1, 1, 1, self.seed,
+                             self.dt_size, ft_size, self.ht_elems * 4,
+                             data_table, free_table, hash_table, 0, BARRIER)
+        header += b"\0" * (MC_HEADER_SIZE - len(header))
+        with open(self.path, "wb") as f:
+            f.write(header + bytes(self.data_table)
+                    + bytes(self.free_table)
+                    + struct.pack("=%dI" % self.ht_elems, *self.hash_table))
+        if mtime is not None:
+            os.utime(self.path, (mtime, mtime))
+
+    def corrupt_barrier(self, slot):
+        self._rec_field(slot, 36, "=I", BARRIER + 1)
+
+
+class SssAnalyzeMemcacheImport(unittest.TestCase):
+    def setUp(self):
+        " Make sure we load the in-tree modules "
+        self.system_path = sys.path[:]
+        sys.path = [MODPATH] + self.system_path
+
+    def tearDown(self):
+        " Restore the system path "
+        sys.path = self.system_path
+
+    def testImport(self):
+        " Import the modules and assert they come from tree "
+        try:
+            os.symlink(os.path.abspath(BUILD_DIR + "/.libs/_py3sss_murmur.so"),
+                       MODPATH + "/pysss_murmur.so")
+            os.symlink(os.path.abspath(SRC_DIR + "/src/tools/analyzer"),
+                       MODPATH + "/sssd")
+
+            import pysss_murmur
+            from sssd import memcache_file
+            from sssd.modules import memcache
+        except ImportError as e:
+            print("Could not load the analyzer modules. "
+                  "Please check if pysss_murmur is built", file=sys.stderr)
+            raise e
+        self.assertEqual(os.path.realpath(pysss_murmur.__file__),
+                         os.path.realpath(BUILD_DIR
+                                          + "/.libs/_py3sss_murmur.so"))
+        for module in (memcache_file, memcache):
+            self.assertTrue(os.path.realpath(module.__file__).startswith(
+                os.path.realpath(SRC_DIR + "/src/tools/analyzer/")))
+
+
+class MemcacheFileTest(unittest.TestCase):
+    def setUp(self):
+        os.mkdir(MCPATH)
+        self.now = int(time.time())
+
+    def tearDown(self):
+        shutil.rmtree(MCPATH)
+
+    def testRecords(self):
+        " Records are found in the used slots "
+        mcw = McWriter(MCPATH + "/passwd")
+        slot1 = mcw.add_passwd("user1", 1001, 1001, self.now + 300)
+        slot2 = mcw.add_passwd("user2", 1002, 1002, self.now - 300)
+        mcw.write()
+
+        mcf = memcache_file.MemcacheFile(mcw.path)
+        self.assertEqual(mcf.mc_type, "passwd")
+        self.assertEqual(mcf.slots, mcw.slots)
+        self.assertEqual(mcf.buckets, mcw.ht_elems)
+        self.assertEqual(mcf.inconsistent, 0)
+        self.assertEqual([(rec.slot, rec.key) for rec in mcf.records],
+                         [(slot1, b"user1"), (slot2, b"user2")])
+        self.assertEqual(mcf.records[0].expire, self.now + 300)
+        self.assertEqual(mcf.records[1].expire, self.now - 300)
+        self.assertEqual(sum(rec.slots for rec in mcf.records),
+                         mcw.next_slot)
+        self.assertEqual(mcf.free_runs(), [mcw.slots - mcw.next_slot])
+
+        # every record is chained under its name and its UID
+        lengths, broken = mcf.chain_lengths()
+        self.assertEqual(broken, 0)
+        self.assertEqual(sum(lengths), 4)
+
+    def testSidRecords(self):
+        " The ID type of sid records is read "
+        mcw = McWriter(MCPATH + "/sid")
+        mcw.add_sid("S-1-5-21-1-2-3-1001", 1001, 1, self.now + 300)
+        mcw.add_sid("S-1-5-21-1-2-3-2001", 2001, 2, self.now + 300)
+        mcw.write()
+
+        mcf = memcache_file.MemcacheFile(mcw.path)
+        self.assertEqual(mcf.mc_type, "sid")
+        self.assertEqual([(rec.key, rec.id_type) for rec in mcf.records],
+                         [(b"S-1-5-21-1-2-3-1001", 1),
+                          (b"S-1-5-21-1-2-3-2001", 2)])
+
+    def testInconsistent(self):
+        " Used slots which do not start a record are counted "
+        mcw = McWriter(MCPATH + "/passwd")
+        slot = mcw.add_passwd("user1", 1001, 1001, self.now + 300)
+        mcw.add_passwd("user2", 1002, 1002, self.now + 300)
+        mcw.corrupt_barrier(slot)
+        mcw.write()
+
+        mcf = memcache_file.MemcacheFile(mcw.path)
+        self.assertEqual([rec.key for rec in mcf.records], [b"user2"])
+        self.assertEqual(mcf.inconsistent, mcf.records[0].slot - slot)
+        self.assertEqual(mcf.chain_lengths()[1], 2)
+
+    def testBadHeader(self):
+        " Files which are not memory caches are rejected "
+        with open(MCPATH + "/passwd", "wb") as f:
+            f.write(b"\0" * 16)
+        self.assertRaises(ValueError, memcache_file.MemcacheFile,
+                          MCPATH + "/passwd")
+
+        with open(MCPATH + "/passwd", "wb") as f:
+            f.write(b"\0" * 4096)
+        self.assertRaises(ValueError, memcache_file.MemcacheFile,
+                          MCPATH + "/passwd")
+
+    def testNow(self):
+        " Expiration is checked at the modification time by default "
+        mcw = McWriter(MCPATH + "/passwd.copy")
+        mcw.add_passwd("user1", 1001, 1001, self.now - 300)
+        mcw.write(mtime=self.now - 600)
+
+        mcf = memcache_file.MemcacheFile(mcw.path)
+        self.assertEqual(mcf.mc_type, "passwd")
+        self.assertEqual(mcf.mtime, self.now - 600)
+        self.assertEqual(mcf.now, self.now - 600)
+
+        mcf = memcache_file.MemcacheFile(mcw.path, now=self.now)
+        self.assertEqual(mcf.now, self.now)
+
+
+class MemcacheAnalyzerTest(unittest.TestCase):
+    def setUp(self):
+        os.mkdir(MCPATH)
+        os.mkdir(COPYPATH)
+        self.mc_dir = memcache.MC_DIR
+        memcache.MC_DIR = MCPATH + "/"
+        self.analyzer = memcache.MemcacheAnalyzer()
+        self.now = int(time.time())
+
+    def tearDown(self):
+        memcache.MC_DIR = self.mc_dir
+        shutil.rmtree(MCPATH)
+        shutil.rmtree(COPYPATH)
+
+    def testLiveFile(self):
+        " Records of live files are checked at the current time "
+        mcw = McWriter(MCPATH + "/passwd")
+        mcw.add_passwd("user1", 1001, 1001, self.now - 300)
+        mcw.write(mtime=self.now - 600)
+        shutil.copy2(mcw.path, COPYPATH + "/passwd")
+
+        mcf = self.analyzer.load(mcw.path)
+        self.assertGreaterEqual(mcf.now, self.now)
+
+        # the copy was taken before the record expired
+        mcf = self.analyzer.load(COPYPATH + "/passwd")
+        self.assertEqual(mcf.now, self.now - 600)
+
+    def testLostEntries(self):
+        " Valid entries missing in the current file are lost "
+        prev = McWriter(COPYPATH + "/passwd")
+        prev.add_passwd("user1", 1001, 1001, self.now + 300)
+        prev.add_passwd("user2", 1002, 1002, self.now + 300)
+        prev.add_passwd("user3", 1003, 1003, self.now - 300)
+        prev.add_passwd("user4", 1004, 1004, self.now - 30)
+        prev.write(mtime=self.now - 60)
+
+        mcw = McWriter(MCPATH + "/passwd")
+        mcw.add_passwd("user1", 1001, 1001, self.now + 300)
+        mcw.write(mtime=self.now - 60)
+
+        mcf = self.analyzer.load(mcw.path)
+        lost = self.analyzer.lost_entries(
+            mcf, self.analyzer.load(prev.path, mcf.mc_type))
+        # user3 had expired in the copy, user4 expired since then
+        self.assertEqual([rec.key for rec in lost], [b"user2"])
+
+        recreated = McWriter(COPYPATH + "/passwd", seed=0x1234)
+        recreated.write()
+        self.assertIsNone(self.analyzer.lost_entries(
+            mcf, self.analyzer.load(recreated.path, mcf.mc_type)))
+
+
+if __name__ == "__main__":
+    error = 0
+
+    suite = unittest.TestLoader().loadTestsFromTestCase(
+        SssAnalyzeMemcacheImport)
+    res = unittest.TextTestRunner().run(suite)
+    if not res.wasSuccessful():
+        error |= 0x1
+        # need to bail out here because the modules could not be imported
+        sys.exit(error)
+
+    # import the modules into the global namespace, but make sure they are
+    # the ones in tree
+    sys.path.insert(0, MODPATH)
+    import pysss_murmur
+    from sssd import memcache_file
+    from sssd.modules import memcache
+
+    suite = unittest.TestLoader().loadTestsFromTestCase(MemcacheFileTest)
+    res = unittest.TextTestRunner().run(suite)
+    if not res.wasSuccessful():
+        error |= 0x2
+
+    suite = unittest.TestLoader().loadTestsFromTestCase(MemcacheAnalyzerTest)
+    res = unittest.TextTestRunner().run(suite)
+    if not res.wasSuccessful():
+        error |= 0x4
+
+    sys.exit(error)
@@ -0,0 +1,231 @@
+import os
+import struct
+
+# Layout definitions from src/util/mmap_cache.h
+MC_MAJOR_VNO = 1
+MC_SLOT_SIZE = 40
+MC_HEADER_SIZE = 56
+MC_INVALID_VAL = 0xffffffff
+
+MC_HEADER_UNINIT = 0
+MC_HEADER_ALIVE = 1
+MC_HEADER_RECYCLED = 2
+
+MC_TYPES = ['passwd', 'group', 'initgroups', 'sid']
+
+_HEADER = struct.Struct('=13I')
+_RECORD = struct.Struct('=2IQ6I')
+_UINT32 = struct.Struct('=I')
+
+
+def valid_barrier(val):
+    return (val & 0xff000000) == 0xf0000000
+
+
+class MemcacheRecord:
+    """
+    A single record found in the data table
+
+    Args:
+        slot (int): First slot occupied by the record
+        length (int): Record length in bytes, including the header
+        expire (int): Expiration time of the record
+        hash1 (int): Hash table bucket of the first key
+        hash2 (int): Hash table bucket of the second key
+        key (bytes): Name (or SID) the record was stored under
+        id_type (int): ID type of sid records, None otherwise
+    """
+    def __init__(self, slot, length, expire, hash1, hash2, key, id_type):
+        self.slot = slot
+        self.length = length
+        self.expire = expire
+        self.hash1 = hash1
+        self.hash2 = hash2
+        self.key = key
+        self.id_type = id_type
+
+    @property
+    def slots(self):
+        return (self.length + MC_SLOT_SIZE - 1) // MC_SLOT_SIZE
+
+
+class MemcacheFile:
+    """
+    A memory cache file read from disk, see src/util/mmap_cache.h
+    for the format. The whole file is read at once so both a live
+    cache file and a copy of it can be inspected.
+
+    Args:
+        path -- path to the cache file
+        mc_type -- one of MC_TYPES, guessed from the file name if None
+        now -- time the expiration of the records is checked against,
+            the modification time of the file if None
+    """
+    def __init__(self, path, mc_type=None, now=None):
+        self.path = path
+        self.mc_type = mc_type or self.guess_type(path)
+
+        with open(path, 'rb') as file:
+            stat = os.fstat(file.fileno())
+            self.buf = file.read()
+        self.mtime = int(stat.st_mtime)
+        self.now = self.mtime if now is None else now
+
+        self.parse_header()
+
+        self.records = []
+        self.inconsistent = 0
+        self.scan_records()
+
+    def guess_type(self, path):
+        """ Cache type from the file name, copies may carry a suffix """
+        name = os.path.basename(path)
+        for mc_type in sorted(MC_TYPES, key=len, reverse=True):
+            if name.startswith(mc_type):
+                return mc_type
+        return None
+
+    def parse_header(self):
+        """ Validate the file header and locate the tables """
+        if len(self.buf) < MC_HEADER_SIZE:
+            raise ValueError(f'{self.path}: file is too short')
+
+        (b1, self.major, self.minor, self.status, self.seed,
+         self.dt_size, self.ft_size, self.ht_size, self.data_table,
+         self.free_table, self.hash_table, _, b2) = _HEADER.unpack_from(
+            self.buf)
+
+        if not valid_barrier(b1) or b1 != b2:
+            raise ValueError(f'{self.path}: header is being updated or '
+                             'corrupted')
+        if self.major != MC_MAJOR_VNO:
+            raise ValueError(f'{self.path}: unsupported version '
+                             f'{self.major}.{self.minor}')
+        if self.status == MC_HEADER_UNINIT:
+            raise ValueError(f'{self.path}: cache is not initialized')
+
+        for offset, size in ((self.data_table, self.dt_size),
+                             (self.free_table, self.ft_size),
+                             (self.hash_table, self.ht_size)):
+            if offset + size > len(self.buf):
+                raise ValueError(f'{self.path}: table exceeds file size')
+
+        self.slots = min(self.dt_size // MC_SLOT_SIZE, self.ft_size * 8)
+        self.buckets = self.ht_size // 4
+
+    def slot_used(self, slot):
+        byte = self.buf[self.free_table + slot // 8]
+        return bool(byte & (0x80 >> (slot % 8)))
+
+    def read_string(self, offset, end):
+        """ NUL terminated string at offset, None if it is not """
+        if offset >= end:
+            return None
+        nul = self.buf.find(b'\0', offset, end)
+        if nul == -1:
+            return None
+        return self.buf[offset:nul]
+
+    def read_record(self, slot):
+        """
+        Decode the record starting at slot
+
+        Returns:
+            MemcacheRecord, None if the slot does not start a
+            complete record
+        """
+        offset = self.data_table + slot * MC_SLOT_SIZE
+        (b1, length, expire, _, _, hash1, hash2, _,
+         b2) = _RECORD.unpack_from(self.buf, offset)
+
+        if not valid_barrier(b1) or b1 != b2:
+            return None
+        if (length < MC_HEADER_SIZE or length == MC_INVALID_VAL
+                or slot * MC_SLOT_SIZE + length > self.dt_size):
+            return None
+
+        base = offset + _RECORD.size
+        end = offset + length
+        # initgroups records start with the unique name, the name the
+        # entry was requested by comes second
+        name_field = 4 if self.mc_type == 'initgroups' else 0
+        name_ptr, = _UINT32.unpack_from(self.buf, base + name_field)
+        key = self.read_string(base + name_ptr, end)
+        if key is None:
+            return None
+
+        id_type = None
+        if self.mc_type == 'sid':
+            id_type, = _UINT32.unpack_from(self.buf, base + 4)
+
+        return MemcacheRecord(slot, length, expire, hash1, hash2, key,
+                              id_type)
+
+    def scan_records(self):
+        """ Walk the data table collecting records from used slots """
+        slot = 0
+        while slot < self.slots:
+            if not self.slot_used(slot):
+                slot += 1
+                continue
+
+            rec = self.read_record(slot)
+            if rec is None:
+                self.inconsistent += 1
+                slot += 1
+                continue
+
+            self.records.append(rec)
+            slot += rec.slots
+
+    def free_runs(self):
+        """
+        Returns:
+            List of lengths of consecutive free slot runs
+        """
+        runs = []
+        run = 0
+        for slot in range(self.slots):
+            if self.slot_used(slot):
+                if run:
+                    runs.append(run)
+                run = 0
+            else:
+                run += 1
+        if run:
+            runs.append(run)
+        return runs
+
+    def chain_lengths(self):
+        """
+        Follow every hash table chain
+
+        Returns:
+            Tuple of the list of chain lengths per bucket and the
+            number of chains that ended on a broken record
+        """
+        lengths = []
+        broken = 0
+        for bucket in range(self.buckets):
+            slot, = _UINT32.unpack_from(self.buf, self.hash_table + bucket * 4)
+            length = 0
+            while slot != MC_INVALID_VAL:
+                if slot >= self.slots or length > self.slots:
+                    broken += 1
+                    break
+                offset = self.data_table + slot * MC_SLOT_SIZE
+                (b1, _, _, next1, next2, hash1, hash2, _,
+                 b2) = _RECORD.unpack_from(self.buf, offset)
+                if not valid_barrier(b1) or b1 != b2:
+                    broken += 1
+                    break
+                length += 1
+                if hash1 == bucket:
+                    slot = next1
+                elif hash2 == bucket:
+                    slot = next2
+                else:
+                    broken += 1
+                    break
+            lengths.append(length)
+        return lengths, broken
@@ -0,0 +1,310 @@
+import os
+import math
+import time
+import logging
+from collections import Counter
+
+from sssd.memcache_file import MemcacheFile, MC_TYPES, MC_SLOT_SIZE
+from sssd.memcache_file import MC_HEADER_RECYCLED
+from sssd.parser import SubparsersAction
+from sssd.parser import Option
+
+logger = logging.getLogger()
+
+MC_DIR = '/var/lib/sss/mc/'
+MB = 1024 * 1024
+
+# sss_id_type values stored in sid records
+ID_TYPES = {
+    0: 'not specified',
+    1: 'user',
+    2: 'group',
+    3: 'user and group',
+}
+
+
+class MemcacheAnalyzer:
+    """
+    A memory cache analyzer module, reports how the slots, hash table
+    and free space of the NSS memory cache files are used.
+    """
+    module_parser = None
+    stats_opts = [
+        Option('--file', 'Memory cache file or copy of it to inspect '
+               f'(default: all files in {MC_DIR}), records of copies '
+               'are checked for expiration at their modification time', str),
+        Option('--previous', 'Earlier copy of the cache file, or a '
+               'directory of copies when --file is not used, to count '
+               'valid entries lost since then', str),
+    ]
+
+    def print_module_help(self, args):
+        """
+        Print the module parser help output
+
+        Args:
+            args (Namespace): argparse parsed arguments
+        """
+        self.module_parser.print_help()
+
+    def setup_args(self, parser_grp, cli):
+        """
+        Setup module parser, subcommands, and options
+
+        Args:
+            parser_grp (argparse.Action): Parser group to nest
+               module and subcommands under
+        """
+        desc = "Analyze memory cache module"
+        self.module_parser = parser_grp.add_parser('memcache',
+                                                   description=desc,
+                                                   help='Memory cache usage')
+
+        subparser = self.module_parser.add_subparsers(title=None,
+                                                      dest='subparser',
+                                                      action=SubparsersAction,
+                                                      metavar='COMMANDS')
+
+        subcmd_grp = subparser.add_parser_group('Operation Modes')
+        cli.add_subcommand(subcmd_grp, 'stats',
+                           'Show memory cache usage statistics',
+                           self.print_stats, self.stats_opts)
+
+        self.module_parser.set_defaults(func=self.print_module_help)
+
+        return self.module_parser
+
+    def is_live(self, path):
+        """
+        Whether path is a cache file the responder is using
+
+        Args:
+            path (str): Path to the cache file
+        """
+        return (os.path.realpath(os.path.dirname(path))
+                == os.path.realpath(MC_DIR))
+
+    def load(self, path, mc_type=None):
+        """
+        Read a cache file. Records of live files are checked for
+        expiration at the current time, the modification time of a live
+        file does not change when its records expire. Records of copies
+        are checked at the time the copy was made.
+
+        Args:
+            path (str): Path to the cache file
+            mc_type (str): Cache type, guessed from the file name if None
+
+        Returns:
+            MemcacheFile object, None if the file cannot be used
+        """
+        now = int(time.time()) if self.is_live(path) else None
+        try:
+            mcf = MemcacheFile(path, mc_type, now)
+        except (OSError, ValueError) as err:
+            logger.error(err)
+            return None
+
+        if mcf.mc_type is None:
+            logger.warning(f"{path}: unknown cache type, assuming a "
+                           "passwd-like record layout")
+        if mcf.status == MC_HEADER_RECYCLED:
+            logger.warning(f"{path}: file was recycled by the responder, "
+                           "statistics may be stale")
+        return mcf
+
+    def histogram(self, values, bounds):
+        """
+        Count values into buckets
+
+        Args:
+            values (list of int): Values to count
+            bounds (list of int): Lower bounds of the buckets, the last
+                bucket is open ended
+
+        Returns:
+            List of (label, count) tuples
+        """
+        counts = [0] * len(bounds)
+        for val in values:
+            for i in range(len(bounds) - 1, -1, -1):
+                if val >= bounds[i]:
+                    counts[i] += 1
+                    break
+
+        result = []
+        for i, low in enumerate(bounds):
+            if i == len(bounds) - 1:
+                label = f'{low}+'
+            elif bounds[i + 1] - 1 == low:
+                label = f'{low}'
+            else:
+                label = f'{low}-{bounds[i + 1] - 1}'
+            result.append((label, counts[i]))
+        return result
+
+    def print_histogram(self, title, hist):
+        print(f'  {title}:')
+        for label, count in hist:
+            print(f'    {label:>8}: {count}')
+
+    def lost_entries(self, mcf, prev):
+        """
+        Find entries that were valid in an earlier copy of the cache,
+        had not expired yet when the current file was read, but are
+        no longer stored. They were evicted to make room for new
+        entries (or explicitly invalidated).
+
+        Args:
+            mcf (MemcacheFile): Current cache file
+            prev (MemcacheFile): Earlier copy of the same cache file
+
+        Returns:
+            List of lost records, None if the files cannot be compared
+        """
+        if (prev.seed != mcf.seed or prev.dt_size != mcf.dt_size
+                or prev.mc_type != mcf.mc_type):
+            return None
+
+        present = set(rec.key for rec in mcf.records)
+        return [rec for rec in prev.records
+                if rec.expire > prev.now and rec.expire > mcf.now
+                and rec.key not in present]
+
+    def print_file_stats(self, mcf, prev):
+        """
+        Print usage statistics of a single cache file
+
+        Args:
+            mcf (MemcacheFile): Cache file to report on
+            prev (MemcacheFile): Earlier copy of the file or None
+        """
+        now = mcf.now
+        valid = [rec for rec in mcf.records if rec.expire > now]
+        expired = [rec for rec in mcf.records if rec.expire <= now]
+        rec_slots = sum(rec.slots for rec in mcf.records)
+        valid_slots = sum(rec.slots for rec in valid)
+        used_slots = sum(1 for slot in range(mcf.slots)
+                         if mcf.slot_used(slot))
+
+        def pct(part, whole):
+            return f'{100.0 * part / whole:.1f}%' if whole else '-'
+
+        print(f'******** {mcf.path} ********')
+        print(f'  Type: {mcf.mc_type or "unknown"}, version '
+              f'{mcf.major}.{mcf.minor}, checked at '
+              f'{time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(now))}')
+        print(f'  Data table: {mcf.dt_size} bytes ({mcf.slots} slots, '
+              f'about {mcf.dt_size / MB:.0f} MB configured), '
+              f'{mcf.buckets} hash buckets')
+
+        print('  Slot utilization:')
+        print(f'    used:          {used_slots} '
+              f'({pct(used_slots, mcf.slots)})')
+        print(f'    valid records: {valid_slots} '
+              f'({pct(valid_slots, mcf.slots)})')
+        print(f'    expired:       {rec_slots - valid_slots} '
+              f'({pct(rec_slots - valid_slots, mcf.slots)})')
+        print(f'    free:          {mcf.slots - used_slots} '
+              f'({pct(mcf.slots - used_slots, mcf.slots)})')
+        if used_slots > rec_slots:
+            print(f'    inconsistent:  {used_slots - rec_slots} marked used '
+                  f'outside of records ({mcf.inconsistent} damaged or '
+                  'being written)')
+
+        print(f'  Records: {len(mcf.records)} ({len(valid)} valid, '
+              f'{len(expired)} expired)')
+        if mcf.records:
+            print(f'    average size: {rec_slots / len(mcf.records):.2f} '
+                  'slots')
+        if mcf.mc_type == 'sid':
+            types = Counter(rec.id_type for rec in mcf.records)
+            for id_type, count in sorted(types.items()):
+                name = ID_TYPES.get(id_type, f'type {id_type}')
+                print(f'    {name}: {count}')
+        self.print_histogram('Record size (slots)', self.histogram(
+            [rec.slots for rec in mcf.records], [2, 3, 4, 5, 6, 8, 16]))
+
+        lengths, broken = mcf.chain_lengths()
+        chained = [length for length in lengths if length]
+        print('  Hash chains:')
+        print(f'    empty buckets: {len(lengths) - len(chained)} '
+              f'({pct(len(lengths) - len(chained), len(lengths))})')
+        print(f'    load factor:   {pct(sum(chained), len(lengths))}')
+        if chained:
+            print(f'    mean length:   '
+                  f'{sum(chained) / len(chained):.2f} (non-empty buckets)')
+            print(f'    max length:    {max(chained)}')
+        if broken:
+            print(f'    broken chains: {broken}')
+        self.print_histogram('Chain length', self.histogram(
+            chained, [1, 2, 3, 4, 5, 9, 17]))
+
+        runs = mcf.free_runs()
+        print('  Free space:')
+        print(f'    free runs:     {len(runs)}')
+        print(f'    largest run:   {max(runs) if runs else 0} slots')
+        if mcf.records:
+            typical = sorted(rec.slots for rec in mcf.records)
+            typical = typical[len(typical) // 2]
+            fit = sum(run // typical for run in runs)
+            print(f'    room for:      {fit} more records of '
+                  f'{typical} slots')
+            if fit == 0:
+                print('    cache is full, new entries evict older ones')
+        self.print_histogram('Free run length (slots)', self.histogram(
+            runs, [1, 2, 3, 4, 8, 16, 64]))
+
+        lost = []
+        if prev is not None:
+            lost = self.lost_entries(mcf, prev)
+            print(f'  Compared to {prev.path}:')
+            if lost is None:
+                print('    cache was recreated in between, entries cannot '
+                      'be compared')
+                lost = []
+            else:
+                print(f'    valid entries lost: {len(lost)} '
+                      f'({sum(rec.slots for rec in lost)} slots)')
+
+        # Expired records keep their slots until they are overwritten, so
+        # size for every stored entry and keep a quarter of the table free
+        # for new records to find contiguous slots
+        needed = rec_slots + sum(rec.slots for rec in lost)
+        size = max(1, math.ceil(needed * MC_SLOT_SIZE * 4 / 3 / MB))
+        option = f'memcache_size_{mcf.mc_type or "passwd"}'
+        print(f'  Stored entries need {needed} slots, suggested '
+              f'{option} = {size}')
+        print('')
+
+    def print_stats(self, args):
+        """
+        Print memory cache usage statistics
+
+        Args:
+            args (Namespace):  populated argparse namespace
+        """
+        if args.file:
+            pairs = [(args.file, args.previous)]
+        else:
+            pairs = []
+            for mc_type in MC_TYPES:
+                prev = None
+                if args.previous:
+                    prev = os.path.join(args.previous, mc_type)
+                pairs.append((os.path.join(MC_DIR, mc_type), prev))
+
+        for path, prev_path in pairs:
+            if not args.file and not os.path.exists(path):
+                logger.info(f"{path} does not exist, skipping")
+                continue
+
+            mcf = self.load(path)
+            if mcf is None:
+                continue
+
+            prev = None
+            if prev_path is not None:
+                prev = self.load(prev_path, mcf.mc_type)
+
+            self.print_file_stats(mcf, prev)
@@ -1,5 +1,6 @@
 import argparse
 
+from sssd.modules import memcache
 from sssd.modules import request
 from sssd.parser import SubparsersAction
 
@@ -43,6 +44,9 @@ class Analyzer:
             if opt.opt_type is int:
                 parser.add_argument(opt.name, help=opt.help_msg,
                                     type=int)
+            if opt.opt_type is str:
+                parser.add_argument(opt.name, help=opt.help_msg,
+                                    type=str)
 
     def load_modules(self, parser, parser_grp):
         """
@@ -53,11 +57,12 @@ class Analyzer:
             parser_grp (argparse.Action): Parser group that can have
                 additional parsers attached.
         """
-        # Currently only the 'request' module exists
         req = request.RequestAnalyzer()
+        mc = memcache.MemcacheAnalyzer()
         cli = Analyzer()
 
         req.setup_args(parser_grp, cli)
+        mc.setup_args(parser_grp, cli)
 
     def setup_args(self):
         """
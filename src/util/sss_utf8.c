@@ -71,6 +71,12 @@ errno_t sss_utf8_case_eq(const uint8_t *s1, const uint8_t *s2)
     return ENOMATCH;
 }
 
+uint8_t *sss_utf8_casefold(const uint8_t *s, uint8_t *buf, size_t *_len)
+{
+    /* Use the same folding as u8_casecmp() in sss_utf8_case_eq(). */
+    return u8_casefold(s, u8_strlen(s), NULL, NULL, buf, _len);
+}
+
 bool sss_string_equal(bool cs, const char *s1, const char *s2)
 {
     if (cs) {
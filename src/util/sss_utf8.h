@@ -40,5 +40,14 @@ bool sss_utf8_check(const uint8_t *s, size_t n);
  */
 errno_t sss_utf8_case_eq(const uint8_t *s1, const uint8_t *s2);
 
+/* Returns case folded form of s that is not NULL terminated and can be
+ * compared bytewise, two strings are equal according to sss_utf8_case_eq()
+ * if their folded forms are equal. The result is stored in buf if it is not
+ * NULL and the result fits into *_len bytes, otherwise it is allocated with
+ * malloc() and must be freed by the caller. *_len is set to the length of
+ * the result. Returns NULL and sets errno on failure.
+ */
+uint8_t *sss_utf8_casefold(const uint8_t *s, uint8_t *buf, size_t *_len);
+
 
 #endif /* SSS_UTF8_H_ */